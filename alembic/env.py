@@ -18,8 +18,11 @@ load_dotenv()
 
 # Import your models
 from src.infrastructure.database.connection import Base
+from src.infrastructure.database.models.idempotency_key_model import IdempotencyKeyModel
+from src.infrastructure.database.models.outbox_event_model import OutboxEventModel
 from src.infrastructure.database.models.task_list_model import TaskListModel
 from src.infrastructure.database.models.task_model import TaskModel
+from src.infrastructure.database.models.tombstone_model import TombstoneModel
 from src.infrastructure.database.models.user_model import UserModel
 
 # this is the Alembic Config object, which provides
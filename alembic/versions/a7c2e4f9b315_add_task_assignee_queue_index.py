@@ -0,0 +1,28 @@
+"""add task assignee queue index
+
+Revision ID: a7c2e4f9b315
+Revises: f3b8c1d7e602
+Create Date: 2026-10-19 18:27:33.561730
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c2e4f9b315'
+down_revision: Union[str, None] = 'f3b8c1d7e602'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_tasks_assignee_queue', 'tasks', ['assigned_user_id', 'status', sa.text('priority DESC'), 'due_date', 'id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_assignee_queue', table_name='tasks')
@@ -0,0 +1,34 @@
+"""add task claim queue index
+
+Revision ID: b2d6f8a1c947
+Revises: a7c2e4f9b315
+Create Date: 2026-10-19 19:05:12.840377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2d6f8a1c947'
+down_revision: Union[str, None] = 'a7c2e4f9b315'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PENDING_TASK_SQL = "status = 'PENDING' AND is_active"
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_tasks_pending_claim_queue',
+        'tasks',
+        ['task_list_id', sa.text('priority DESC'), 'created_at', 'id'],
+        unique=False,
+        postgresql_where=sa.text(PENDING_TASK_SQL),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_pending_claim_queue', table_name='tasks')
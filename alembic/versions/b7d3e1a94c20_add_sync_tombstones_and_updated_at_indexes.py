@@ -0,0 +1,39 @@
+"""add sync tombstones and updated_at indexes
+
+Revision ID: b7d3e1a94c20
+Revises: 60ef8755a570
+Create Date: 2026-10-19 09:12:44.318205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d3e1a94c20'
+down_revision: Union[str, None] = '60ef8755a570'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('sync_tombstones',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('entity_type', sa.Enum('TASK', 'TASK_LIST', name='syncentitytype'), nullable=False),
+    sa.Column('entity_id', sa.Integer(), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_sync_tombstones_deleted_at_id', 'sync_tombstones', ['deleted_at', 'id'], unique=False)
+    op.create_index('ix_tasks_updated_at_id', 'tasks', ['updated_at', 'id'], unique=False)
+    op.create_index('ix_task_lists_updated_at_id', 'task_lists', ['updated_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_task_lists_updated_at_id', table_name='task_lists')
+    op.drop_index('ix_tasks_updated_at_id', table_name='tasks')
+    op.drop_index('ix_sync_tombstones_deleted_at_id', table_name='sync_tombstones')
+    op.drop_table('sync_tombstones')
+    sa.Enum(name='syncentitytype').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,27 @@
+"""add owner scoping indexes
+
+Revision ID: c9e1a3d5f274
+Revises: b2d6f8a1c947
+Create Date: 2026-10-19 19:48:26.305914
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9e1a3d5f274'
+down_revision: Union[str, None] = 'b2d6f8a1c947'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_task_lists_user_active_id', 'task_lists', ['user_id', 'is_active', 'id'], unique=False)
+    op.create_index('ix_tasks_assigned_user_task_list', 'tasks', ['assigned_user_id', 'task_list_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_assigned_user_task_list', table_name='tasks')
+    op.drop_index('ix_task_lists_user_active_id', table_name='task_lists')
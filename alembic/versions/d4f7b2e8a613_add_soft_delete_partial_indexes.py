@@ -0,0 +1,64 @@
+"""add soft delete partial indexes
+
+Revision ID: d4f7b2e8a613
+Revises: c9e1a3d5f274
+Create Date: 2026-10-19 20:41:07.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4f7b2e8a613'
+down_revision: Union[str, None] = 'c9e1a3d5f274'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ACTIVE_SQL = "is_active"
+INACTIVE_SQL = "NOT is_active"
+
+
+def upgrade() -> None:
+    # Reads only see active rows; recreate their indexes without the soft-deleted ones
+    op.drop_index('ix_tasks_updated_at_id', table_name='tasks')
+    op.create_index('ix_tasks_updated_at_id', 'tasks', ['updated_at', 'id'], unique=False, postgresql_where=sa.text(ACTIVE_SQL))
+    op.drop_index('ix_task_lists_updated_at_id', table_name='task_lists')
+    op.create_index('ix_task_lists_updated_at_id', 'task_lists', ['updated_at', 'id'], unique=False, postgresql_where=sa.text(ACTIVE_SQL))
+    op.drop_index('ix_tasks_assignee_queue', table_name='tasks')
+    op.create_index(
+        'ix_tasks_assignee_queue',
+        'tasks',
+        ['assigned_user_id', 'status', sa.text('priority DESC'), 'due_date', 'id'],
+        unique=False,
+        postgresql_where=sa.text(ACTIVE_SQL),
+    )
+    op.drop_index('ix_tasks_assigned_user_task_list', table_name='tasks')
+    op.create_index(
+        'ix_tasks_assigned_user_task_list', 'tasks', ['assigned_user_id', 'task_list_id'], unique=False, postgresql_where=sa.text(ACTIVE_SQL)
+    )
+    op.create_index('ix_tasks_active_task_list_id', 'tasks', ['task_list_id', 'id'], unique=False, postgresql_where=sa.text(ACTIVE_SQL))
+
+    # The purge job walks inactive rows oldest first
+    op.create_index('ix_tasks_inactive_updated_at_id', 'tasks', ['updated_at', 'id'], unique=False, postgresql_where=sa.text(INACTIVE_SQL))
+    op.create_index(
+        'ix_task_lists_inactive_updated_at_id', 'task_lists', ['updated_at', 'id'], unique=False, postgresql_where=sa.text(INACTIVE_SQL)
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_task_lists_inactive_updated_at_id', table_name='task_lists')
+    op.drop_index('ix_tasks_inactive_updated_at_id', table_name='tasks')
+    op.drop_index('ix_tasks_active_task_list_id', table_name='tasks')
+    op.drop_index('ix_tasks_assigned_user_task_list', table_name='tasks')
+    op.create_index('ix_tasks_assigned_user_task_list', 'tasks', ['assigned_user_id', 'task_list_id'], unique=False)
+    op.drop_index('ix_tasks_assignee_queue', table_name='tasks')
+    op.create_index(
+        'ix_tasks_assignee_queue', 'tasks', ['assigned_user_id', 'status', sa.text('priority DESC'), 'due_date', 'id'], unique=False
+    )
+    op.drop_index('ix_task_lists_updated_at_id', table_name='task_lists')
+    op.create_index('ix_task_lists_updated_at_id', 'task_lists', ['updated_at', 'id'], unique=False)
+    op.drop_index('ix_tasks_updated_at_id', table_name='tasks')
+    op.create_index('ix_tasks_updated_at_id', 'tasks', ['updated_at', 'id'], unique=False)
@@ -0,0 +1,32 @@
+"""add open task due date indexes
+
+Revision ID: f3b8c1d7e602
+Revises: e5f2a9c4b831
+Create Date: 2026-10-19 17:42:51.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b8c1d7e602'
+down_revision: Union[str, None] = 'e5f2a9c4b831'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+OPEN_TASK_SQL = "status <> 'COMPLETED' AND is_active"
+
+
+def upgrade() -> None:
+    op.create_index('ix_tasks_open_due_date', 'tasks', ['due_date'], unique=False, postgresql_where=sa.text(OPEN_TASK_SQL))
+    op.create_index(
+        'ix_tasks_open_assignee_due_date', 'tasks', ['assigned_user_id', 'due_date'], unique=False, postgresql_where=sa.text(OPEN_TASK_SQL)
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_open_assignee_due_date', table_name='tasks')
+    op.drop_index('ix_tasks_open_due_date', table_name='tasks')
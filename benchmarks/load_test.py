@@ -0,0 +1,327 @@
+"""Load generator and regression check for the REST and GraphQL APIs.
+
+Drives a weighted mix of scenarios either against the in-process ASGI app from ``main.py``
+(no server needed; combine with ``REPOSITORY_BACKEND=memory`` to leave the database out) or
+against a running deployment, and prints a JSON report with p50/p95/p99 latency and throughput
+per scenario:
+
+    REPOSITORY_BACKEND=memory python -m benchmarks.load_test --duration 20 --concurrency 32
+    python -m benchmarks.load_test --url http://localhost:8000 --users 20 --lists 5 --tasks 50 --output report.json
+    python -m benchmarks.load_test --baseline benchmarks/baseline.json --tolerance 0.15
+
+With ``--baseline`` the run is compared against a stored report and exits with status 1 when a
+scenario regressed; ``--save-baseline`` stores the current report as the new baseline.
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+import uuid
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence
+
+import httpx
+
+PASSWORD = "benchmark-password"
+STATUSES = ("pending", "in_progress", "completed")
+PRIORITIES = ("low", "medium", "high")
+DEFAULT_MIX = {"login": 1, "list_with_tasks": 4, "filter": 3, "status_change": 2, "graphql_nested": 2}
+
+GRAPHQL_NESTED_QUERY = """
+query($id: Int!) {
+  taskListWithTasks(id: $id) {
+    id title completionPercentage totalTasks completedTasks
+    tasks { id title status priority assignedUserId dueDate }
+  }
+}
+"""
+
+
+@dataclass
+class SeededUser:
+    email: str
+    headers: Dict[str, str]
+    task_list_ids: List[int] = field(default_factory=list)
+    task_ids: List[int] = field(default_factory=list)
+
+
+Scenario = Callable[[httpx.AsyncClient, SeededUser, random.Random], Awaitable[httpx.Response]]
+
+
+async def scenario_login(client: httpx.AsyncClient, user: SeededUser, rng: random.Random) -> httpx.Response:
+    return await client.post("/api/auth/login", json={"email": user.email, "password": PASSWORD})
+
+
+async def scenario_list_with_tasks(client: httpx.AsyncClient, user: SeededUser, rng: random.Random) -> httpx.Response:
+    return await client.get(f"/api/task-lists/{rng.choice(user.task_list_ids)}/tasks", headers=user.headers)
+
+
+async def scenario_filter(client: httpx.AsyncClient, user: SeededUser, rng: random.Random) -> httpx.Response:
+    params = {"status": rng.choice(STATUSES), "priority": rng.choice(PRIORITIES)}
+    return await client.get(f"/api/task-lists/{rng.choice(user.task_list_ids)}/tasks", params=params, headers=user.headers)
+
+
+async def scenario_status_change(client: httpx.AsyncClient, user: SeededUser, rng: random.Random) -> httpx.Response:
+    return await client.patch(f"/api/tasks/{rng.choice(user.task_ids)}/status", json={"status": rng.choice(STATUSES)}, headers=user.headers)
+
+
+async def scenario_graphql_nested(client: httpx.AsyncClient, user: SeededUser, rng: random.Random) -> httpx.Response:
+    payload = {"query": GRAPHQL_NESTED_QUERY, "variables": {"id": rng.choice(user.task_list_ids)}}
+    response = await client.post("/graphql", json=payload, headers=user.headers)
+    if response.status_code == 200 and response.json().get("errors"):
+        # GraphQL reports failures with a 200; count them as errors
+        response.status_code = 500
+    return response
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "login": scenario_login,
+    "list_with_tasks": scenario_list_with_tasks,
+    "filter": scenario_filter,
+    "status_change": scenario_status_change,
+    "graphql_nested": scenario_graphql_nested,
+}
+
+
+def _checked(response: httpx.Response) -> dict:
+    if response.status_code >= 400:
+        raise RuntimeError(f"Seeding failed: {response.request.method} {response.request.url} -> {response.status_code} {response.text}")
+    return response.json()
+
+
+async def seed_user(client: httpx.AsyncClient, lists: int, tasks: int, run_id: str, index: int) -> SeededUser:
+    email = f"bench-{run_id}-{index}@example.com"
+    _checked(await client.post("/api/auth/register", json={"email": email, "username": f"bench_{run_id}_{index}", "password": PASSWORD}))
+    token = _checked(await client.post("/api/auth/login", json={"email": email, "password": PASSWORD}))["access_token"]
+    user = SeededUser(email=email, headers={"Authorization": f"Bearer {token}"})
+
+    rng = random.Random(index)
+    for list_index in range(lists):
+        task_list = _checked(await client.post("/api/task-lists/", json={"title": f"Benchmark list {list_index}"}, headers=user.headers))
+        user.task_list_ids.append(task_list["id"])
+        for task_index in range(tasks):
+            task = {
+                "title": f"Benchmark task {task_index}",
+                "task_list_id": task_list["id"],
+                "status": rng.choice(STATUSES),
+                "priority": rng.choice(PRIORITIES),
+            }
+            user.task_ids.append(_checked(await client.post("/api/tasks/", json=task, headers=user.headers))["id"])
+    return user
+
+
+async def seed(client: httpx.AsyncClient, users: int, lists: int, tasks: int, concurrency: int = 8) -> List[SeededUser]:
+    """Create ``users`` users, each owning ``lists`` lists of ``tasks`` tasks, through the public API."""
+    run_id = uuid.uuid4().hex[:8]
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def seed_one(index: int) -> SeededUser:
+        async with semaphore:
+            return await seed_user(client, lists, tasks, run_id, index)
+
+    return list(await asyncio.gather(*(seed_one(index) for index in range(users))))
+
+
+class LatencyRecorder:
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Counter = Counter()
+        self.status_codes: Dict[str, Counter] = defaultdict(Counter)
+
+    def record(self, scenario: str, seconds: float, status_code: Optional[int]) -> None:
+        self.samples[scenario].append(seconds)
+        self.status_codes[scenario][str(status_code) if status_code else "exception"] += 1
+        if status_code is None or status_code >= 400:
+            self.errors[scenario] += 1
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    users: Sequence[SeededUser],
+    mix: Dict[str, float],
+    concurrency: int,
+    duration: Optional[float] = None,
+    total_requests: Optional[int] = None,
+    seed_value: int = 0,
+) -> LatencyRecorder:
+    """Run ``concurrency`` closed-loop workers until the duration or request budget is exhausted."""
+    recorder = LatencyRecorder()
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    deadline = time.perf_counter() + duration if duration else None
+    remaining = [total_requests] if total_requests else None
+
+    async def worker(worker_id: int) -> None:
+        rng = random.Random(seed_value * 1000 + worker_id)
+        while True:
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
+            if remaining is not None:
+                if remaining[0] <= 0:
+                    return
+                remaining[0] -= 1
+
+            name = rng.choices(names, weights)[0]
+            user = rng.choice(users)
+            started = time.perf_counter()
+            try:
+                response = await SCENARIOS[name](client, user, rng)
+                status_code = response.status_code
+            except httpx.HTTPError:
+                status_code = None
+            recorder.record(name, time.perf_counter() - started, status_code)
+
+    await asyncio.gather(*(worker(worker_id) for worker_id in range(concurrency)))
+    return recorder
+
+
+def percentile(sorted_samples: Sequence[float], q: float) -> Optional[float]:
+    """Nearest-rank percentile of already sorted samples."""
+    if not sorted_samples:
+        return None
+    rank = max(1, int(-(-q * len(sorted_samples) // 1)))
+    return sorted_samples[min(rank, len(sorted_samples)) - 1]
+
+
+def summarize(samples: Sequence[float], errors: int, elapsed: float) -> dict:
+    ordered = sorted(samples)
+
+    def ms(value: Optional[float]) -> Optional[float]:
+        return round(value * 1000, 3) if value is not None else None
+
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "error_rate": round(errors / len(ordered), 4) if ordered else 0.0,
+        "throughput_rps": round(len(ordered) / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": {
+            "p50": ms(percentile(ordered, 0.50)),
+            "p95": ms(percentile(ordered, 0.95)),
+            "p99": ms(percentile(ordered, 0.99)),
+            "mean": ms(sum(ordered) / len(ordered)) if ordered else None,
+            "max": ms(ordered[-1]) if ordered else None,
+        },
+    }
+
+
+def build_report(recorder: LatencyRecorder, elapsed: float, config: dict) -> dict:
+    scenarios = {}
+    for name, samples in sorted(recorder.samples.items()):
+        scenarios[name] = summarize(samples, recorder.errors[name], elapsed)
+        scenarios[name]["status_codes"] = dict(recorder.status_codes[name])
+    all_samples = [sample for samples in recorder.samples.values() for sample in samples]
+    return {
+        "config": config,
+        "elapsed_seconds": round(elapsed, 3),
+        "overall": summarize(all_samples, sum(recorder.errors.values()), elapsed),
+        "scenarios": scenarios,
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float = 0.15, error_rate_margin: float = 0.01) -> List[str]:
+    """List regressions of ``report`` against ``baseline``; an empty list means the run passed."""
+    regressions = []
+    for name, before in baseline.get("scenarios", {}).items():
+        after = report.get("scenarios", {}).get(name)
+        if after is None:
+            continue
+        for quantile in ("p95", "p99"):
+            old, new = before["latency_ms"].get(quantile), after["latency_ms"].get(quantile)
+            if old and new and new > old * (1 + tolerance):
+                regressions.append(f"{name}: {quantile} {old:.1f}ms -> {new:.1f}ms (+{(new / old - 1) * 100:.0f}%)")
+        old_rps, new_rps = before.get("throughput_rps"), after.get("throughput_rps")
+        if old_rps and new_rps is not None and new_rps < old_rps * (1 - tolerance):
+            regressions.append(f"{name}: throughput {old_rps:.1f} -> {new_rps:.1f} req/s")
+        if after.get("error_rate", 0) > before.get("error_rate", 0) + error_rate_margin:
+            regressions.append(f"{name}: error rate {before.get('error_rate', 0):.2%} -> {after['error_rate']:.2%}")
+    return regressions
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in SCENARIOS:
+            raise argparse.ArgumentTypeError(f"unknown scenario '{name}', expected one of {', '.join(SCENARIOS)}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def create_client(url: Optional[str], timeout: float) -> httpx.AsyncClient:
+    if url:
+        return httpx.AsyncClient(base_url=url, timeout=timeout)
+    from main import app
+
+    return httpx.AsyncClient(app=app, base_url="http://benchmark", timeout=timeout)
+
+
+async def run(args: argparse.Namespace) -> dict:
+    async with create_client(args.url, args.timeout) as client:
+        users = await seed(client, args.users, args.lists, args.tasks)
+        if args.warmup:
+            await run_load(client, users, args.mix, args.concurrency, duration=args.warmup, seed_value=args.seed + 1)
+        started = time.perf_counter()
+        duration = None if args.requests else args.duration
+        recorder = await run_load(client, users, args.mix, args.concurrency, duration=duration, total_requests=args.requests, seed_value=args.seed)
+        elapsed = time.perf_counter() - started
+
+    config = {
+        "target": args.url or "asgi",
+        "users": args.users,
+        "lists_per_user": args.lists,
+        "tasks_per_list": args.tasks,
+        "concurrency": args.concurrency,
+        "duration": args.duration,
+        "requests": args.requests,
+        "mix": args.mix,
+    }
+    return build_report(recorder, elapsed, config)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Load test the task API and report latency percentiles as JSON")
+    parser.add_argument("--url", help="Base URL of a running API; defaults to the in-process ASGI app")
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--lists", type=int, default=3, help="Task lists per user")
+    parser.add_argument("--tasks", type=int, default=20, help="Tasks per list")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to run (ignored when --requests is set)")
+    parser.add_argument("--requests", type=int, help="Stop after this many requests instead of after --duration")
+    parser.add_argument("--warmup", type=float, default=1.0, help="Seconds of unmeasured load before the run")
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX, help="Weights, e.g. login=1,list_with_tasks=4,graphql_nested=2")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--output", help="Write the report to this file instead of stdout")
+    parser.add_argument("--baseline", help="Compare against this stored report and exit 1 on regressions")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="Allowed relative p95/p99/throughput change")
+    parser.add_argument("--save-baseline", help="Store this run's report as a baseline")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run(args))
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as handle:
+            regressions = compare(report, json.load(handle), args.tolerance)
+        report["regressions"] = regressions
+        exit_code = 1 if regressions else 0
+
+    rendered = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(rendered + "\n")
+    else:
+        print(rendered)
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as handle:
+            handle.write(rendered + "\n")
+    if exit_code:
+        print("Regressions against baseline:\n  " + "\n  ".join(report["regressions"]), file=sys.stderr)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""Outbox relay throughput benchmark.
+
+Inserts N events into the outbox, drains them with K concurrent relays and reports
+events/sec and whether any event was delivered twice. Run against a scratch database that
+has the migrations applied, since every pending outbox row is consumed:
+
+    python -m benchmarks.outbox_relay --events 20000 --relays 4 --batch-size 200
+"""
+import argparse
+import asyncio
+import json
+import time
+from collections import Counter
+
+from sqlalchemy import delete
+
+from src.domain.entities.outbox_event import OutboxEvent
+from src.infrastructure.database.connection import get_session_factory
+from src.infrastructure.database.models.outbox_event_model import OutboxEventModel
+from src.infrastructure.outbox.event_bus import EventBus
+from src.infrastructure.outbox.recorder import outbox_row, record_events
+from src.infrastructure.outbox.relay import OutboxRelay
+
+AGGREGATE = "benchmark"
+
+
+async def seed(session_factory, events: int, chunk: int = 1000) -> None:
+    async with session_factory() as session:
+        for start in range(0, events, chunk):
+            rows = [outbox_row(AGGREGATE, i, "created", {"n": i}) for i in range(start, min(start + chunk, events))]
+            await record_events(session, rows)
+        await session.commit()
+
+
+async def drain(relay: OutboxRelay) -> None:
+    while await relay.relay_batch():
+        pass
+
+
+async def run(events: int, relays: int, batch_size: int) -> dict:
+    session_factory = get_session_factory()
+    delivered: Counter = Counter()
+
+    async def handler(event: OutboxEvent) -> None:
+        delivered[event.id] += 1
+
+    bus = EventBus()
+    bus.subscribe(f"{AGGREGATE}.*", handler)
+
+    await seed(session_factory, events)
+    started = time.perf_counter()
+    await asyncio.gather(*(drain(OutboxRelay(session_factory, bus, batch_size=batch_size)) for _ in range(relays)))
+    elapsed = time.perf_counter() - started
+
+    async with session_factory() as session:
+        await session.execute(delete(OutboxEventModel).where(OutboxEventModel.aggregate_type == AGGREGATE))
+        await session.commit()
+
+    return {
+        "events": events,
+        "relays": relays,
+        "batch_size": batch_size,
+        "delivered": len(delivered),
+        "duplicates": sum(count - 1 for count in delivered.values() if count > 1),
+        "seconds": round(elapsed, 3),
+        "events_per_second": round(len(delivered) / elapsed, 1) if elapsed else None,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=10000)
+    parser.add_argument("--relays", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=100)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args.events, args.relays, args.batch_size)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Micro-benchmarks for the per-entity conversions on every request path.
+
+Each case converts a batch of 1, 100 and 100k prebuilt inputs and reports ns/op (best of
+``--repeat`` runs, GC disabled) plus memory per op measured with tracemalloc: net allocated
+blocks and bytes retained by the results, and the peak traced memory of the batch.
+
+    python -m benchmarks.serialization
+    python -m benchmarks.serialization --sizes 1,1000 --cases task_from_row,task_to_domain --output serialization.json
+"""
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.domain.entities.task import Task, TaskPriority, TaskStatus
+from src.domain.entities.task_list import TaskList
+from src.infrastructure.database.mappers import TASK_COLUMNS, TASK_LIST_COLUMNS, TaskListMapper, TaskMapper, user_to_domain
+from src.infrastructure.database.models.task_list_model import TaskListModel
+from src.infrastructure.database.models.task_model import TaskModel
+from src.infrastructure.database.models.user_model import UserModel
+from src.presentation.graphql.types.task_list_types import task_list_to_graphql, task_to_graphql
+from src.presentation.rest.dtos.task_list_schemas import TaskListResponseSchema
+from src.presentation.rest.dtos.task_schemas import TaskResponseSchema
+
+NOW = datetime(2026, 1, 1, 12, 0, 0)
+STATUSES = list(TaskStatus)
+PRIORITIES = list(TaskPriority)
+
+
+def task_row(i: int) -> Tuple:
+    # Same order as TASK_COLUMNS
+    return (f"Task {i}", i % 100 + 1, i + 1, "description", STATUSES[i % 3], PRIORITIES[i % 3], None, NOW, True, NOW, NOW)
+
+
+def task_list_row(i: int) -> Tuple:
+    # Same order as TASK_LIST_COLUMNS
+    return (f"List {i}", i + 1, "description", i % 10 + 1, True, NOW, NOW)
+
+
+def task_model(i: int) -> TaskModel:
+    return TaskModel(**{column.key: value for column, value in zip(TASK_COLUMNS, task_row(i))})
+
+
+def task_list_model(i: int) -> TaskListModel:
+    return TaskListModel(**{column.key: value for column, value in zip(TASK_LIST_COLUMNS, task_list_row(i))})
+
+
+def user_model(i: int) -> UserModel:
+    return UserModel(id=i + 1, email=f"user{i}@example.com", username=f"user{i}", hashed_password="x", is_active=True, created_at=NOW, updated_at=NOW)
+
+
+# name -> (input factory, conversion)
+CASES: Dict[str, Tuple[Callable[[int], Any], Callable[[Any], Any]]] = {
+    "task_to_domain": (task_model, TaskMapper.to_domain),
+    "task_from_row": (task_row, TaskMapper.from_row),
+    "task_list_to_domain": (task_list_model, TaskListMapper.to_domain),
+    "task_list_from_row": (task_list_row, TaskListMapper.from_row),
+    "user_to_domain": (user_model, user_to_domain),
+    "task_to_graphql": (lambda i: Task(*task_row(i)), task_to_graphql),
+    "task_list_to_graphql": (lambda i: TaskList(*task_list_row(i)), task_list_to_graphql),
+    "task_response_model_validate": (lambda i: Task(*task_row(i)), TaskResponseSchema.model_validate),
+    "task_list_response_model_validate": (lambda i: TaskList(*task_list_row(i)), TaskListResponseSchema.model_validate),
+    "task_row_to_response": (task_row, lambda row: TaskResponseSchema.model_validate(TaskMapper.from_row(row))),
+}
+
+
+def time_batch(convert: Callable[[Any], Any], inputs: List[Any], repeat: int, min_ops: int = 100000) -> float:
+    """Best-of-``repeat`` nanoseconds per conversion; small batches loop until ``min_ops`` conversions."""
+    loops = max(1, min_ops // len(inputs))
+    best = float("inf")
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            started = time.perf_counter_ns()
+            for _ in range(loops):
+                for item in inputs:
+                    convert(item)
+            best = min(best, (time.perf_counter_ns() - started) / (loops * len(inputs)))
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return best
+
+
+def measure_memory(convert: Callable[[Any], Any], inputs: List[Any]) -> Dict[str, float]:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        results = [convert(item) for item in inputs]
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    stats = after.compare_to(before, "lineno")
+    blocks = sum(stat.count_diff for stat in stats if stat.count_diff > 0)
+    size = sum(stat.size_diff for stat in stats if stat.size_diff > 0)
+    del results
+    return {
+        "allocs_per_op": round(blocks / len(inputs), 2),
+        "bytes_per_op": round(size / len(inputs), 1),
+        "tracemalloc_peak_bytes": peak - baseline,
+    }
+
+
+def run(cases: Sequence[str], sizes: Sequence[int], repeat: int) -> dict:
+    results: Dict[str, Dict[str, dict]] = {}
+    for name in cases:
+        make_input, convert = CASES[name]
+        results[name] = {}
+        for size in sizes:
+            inputs = [make_input(i) for i in range(size)]
+            entry = {"ns_per_op": round(time_batch(convert, inputs, repeat), 1)}
+            entry.update(measure_memory(convert, inputs))
+            results[name][str(size)] = entry
+    return {"python": sys.version.split()[0], "repeat": repeat, "results": results}
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark mapper and serialization conversions")
+    parser.add_argument("--sizes", default="1,100,100000", help="Comma separated batch sizes")
+    parser.add_argument("--cases", default=",".join(CASES), help=f"Comma separated subset of: {', '.join(CASES)}")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    cases = [case.strip() for case in args.cases.split(",") if case.strip()]
+    unknown = [case for case in cases if case not in CASES]
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(unknown)}")
+
+    report = run(cases, [int(size) for size in args.sizes.split(",")], args.repeat)
+    rendered = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(rendered + "\n")
+    else:
+        print(rendered)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
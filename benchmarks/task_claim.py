@@ -0,0 +1,139 @@
+"""Task claim contention benchmark.
+
+Fills one task list with N pending tasks, then lets C concurrent workers claim batches until
+the list is drained, and reports claims/sec, claim latency percentiles, claims that came back
+empty while work remained, and whether any task was claimed twice. Compare the SKIP LOCKED claim
+with plain FOR UPDATE, where claimers queue behind each other's row locks:
+
+    python -m benchmarks.task_claim --tasks 20000 --workers 200 --batch 1
+    python -m benchmarks.task_claim --tasks 20000 --workers 200 --batch 1 --no-skip-locked --hold-ms 5
+
+Creates and removes its own user, list and tasks, so any database with the migrations applied works.
+"""
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+import uuid
+from collections import Counter
+from typing import Dict, List
+
+from sqlalchemy import delete, insert
+
+from src.domain.entities.task import TaskPriority, TaskStatus
+from src.infrastructure.database.connection import dispose_engine, get_session_factory
+from src.infrastructure.database.models.task_list_model import TaskListModel
+from src.infrastructure.database.models.task_model import TaskModel
+from src.infrastructure.database.models.user_model import UserModel
+from src.infrastructure.repositories.sqlalchemy_task_repository import SQLAlchemyTaskRepository
+from src.infrastructure.utils.datetime_utils import utc_now
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    return {
+        "p50_ms": round(statistics.median(samples) * 1000, 2),
+        "p95_ms": round(percentile(samples, 0.95) * 1000, 2),
+        "p99_ms": round(percentile(samples, 0.99) * 1000, 2),
+        "max_ms": round(max(samples) * 1000, 2),
+    }
+
+
+async def seed(session_factory, tasks: int, chunk: int = 5000) -> tuple:
+    rng = random.Random(0)
+    async with session_factory() as session:
+        suffix = uuid.uuid4().hex[:12]
+        user = insert(UserModel).values(email=f"claim-{suffix}@example.com", username=f"claim-{suffix}").returning(UserModel.id)
+        user_id = (await session.execute(user)).scalar_one()
+        task_list = insert(TaskListModel).values(title="Claim benchmark", user_id=user_id).returning(TaskListModel.id)
+        task_list_id = (await session.execute(task_list)).scalar_one()
+        now = utc_now()
+        for start in range(0, tasks, chunk):
+            rows = [
+                {
+                    "title": f"Claimable #{index}",
+                    "task_list_id": task_list_id,
+                    "status": TaskStatus.PENDING,
+                    "priority": rng.choice(list(TaskPriority)),
+                    "is_active": True,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for index in range(start, min(start + chunk, tasks))
+            ]
+            await session.execute(insert(TaskModel), rows)
+        await session.commit()
+    return user_id, task_list_id
+
+
+async def worker(session_factory, task_list_id: int, user_id: int, batch: int, skip_locked: bool, hold: float, stats: dict) -> None:
+    while True:
+        started = time.perf_counter()
+        async with session_factory() as session:
+            result = await session.execute(SQLAlchemyTaskRepository.claim_statement(task_list_id, user_id, batch, skip_locked))
+            claimed = [row.id for row in result.all()]
+            if hold:
+                # Stands in for the work between the claim and the commit (request handling, network)
+                await asyncio.sleep(hold)
+            await session.commit()
+        stats["latencies"].append(time.perf_counter() - started)
+        stats["claimed"].update(claimed)
+        if not claimed:
+            if len(stats["claimed"]) >= stats["tasks"]:
+                return
+            # Plain FOR UPDATE re-checks the locked row after the holder commits, finds it claimed and returns nothing
+            stats["empty"] += 1
+
+
+async def run(tasks: int, workers: int, batch: int, skip_locked: bool, hold_ms: float) -> dict:
+    session_factory = get_session_factory()
+    try:
+        user_id, task_list_id = await seed(session_factory, tasks)
+        stats = {"latencies": [], "claimed": Counter(), "empty": 0, "tasks": tasks}
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(session_factory, task_list_id, user_id, batch, skip_locked, hold_ms / 1000, stats) for _ in range(workers)))
+        elapsed = time.perf_counter() - started
+
+        async with session_factory() as session:
+            await session.execute(delete(TaskModel).where(TaskModel.task_list_id == task_list_id))
+            await session.execute(delete(TaskListModel).where(TaskListModel.id == task_list_id))
+            await session.execute(delete(UserModel).where(UserModel.id == user_id))
+            await session.commit()
+    finally:
+        await dispose_engine()
+
+    claimed = stats["claimed"]
+    return {
+        "tasks": tasks,
+        "workers": workers,
+        "batch": batch,
+        "skip_locked": skip_locked,
+        "hold_ms": hold_ms,
+        "claimed": len(claimed),
+        "duplicates": sum(count - 1 for count in claimed.values() if count > 1),
+        "empty_claims_while_work_remained": stats["empty"],
+        "seconds": round(elapsed, 3),
+        "claims_per_second": round(len(claimed) / elapsed, 1) if elapsed else None,
+        "claim_latency": summarize(stats["latencies"]),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=10000)
+    parser.add_argument("--workers", type=int, default=100)
+    parser.add_argument("--batch", type=int, default=1, help="Tasks per claim, like ?n= on the endpoint")
+    parser.add_argument("--no-skip-locked", dest="skip_locked", action="store_false", help="Claim with plain FOR UPDATE for comparison")
+    parser.add_argument("--hold-ms", type=float, default=0.0, help="Delay between the claim and its commit")
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args.tasks, args.workers, args.batch, args.skip_locked, args.hold_ms)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
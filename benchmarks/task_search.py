@@ -0,0 +1,120 @@
+"""Task search latency benchmark.
+
+Runs a mix of search queries (selective, broad, multi-word, prefix, misspelled, filtered)
+against the tasks table and reports first-page and deep-page latency percentiles plus the
+indexes each plan used. Load a realistic table first with the seed script, e.g. 10M tasks:
+
+    python -m src.infrastructure.database.seed --users 100000 --lists 500000 --tasks 10000000 --workers 8
+    python -m benchmarks.task_search --runs 20 --limit 20 --deep-pages 5
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+
+from src.domain.entities.task import TaskStatus
+from src.infrastructure.database.connection import dispose_engine, get_session_factory
+from src.infrastructure.repositories.sqlalchemy_task_repository import SQLAlchemyTaskRepository
+
+# Seeded titles look like "Review report #123"; descriptions are "Generated by the seed script" or empty
+QUERIES = [
+    {"name": "selective_number", "query": "4242"},
+    {"name": "broad_word", "query": "report"},
+    {"name": "two_words", "query": "fix dashboard"},
+    {"name": "prefix", "query": "deplo"},
+    {"name": "misspelled", "query": "dashbord"},
+    {"name": "description_only", "query": "generated seed"},
+    {"name": "broad_filtered", "query": "report", "status": TaskStatus.PENDING, "task_list_id": 1},
+]
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    return {
+        "p50_ms": round(statistics.median(samples) * 1000, 2),
+        "p95_ms": round(percentile(samples, 0.95) * 1000, 2),
+        "max_ms": round(max(samples) * 1000, 2),
+    }
+
+
+def plan_indexes(plan: dict) -> List[str]:
+    found = [plan["Index Name"]] if "Index Name" in plan else []
+    for child in plan.get("Plans", ()):
+        found.extend(plan_indexes(child))
+    return found
+
+
+async def explain(session, case: dict, limit: int) -> dict:
+    statement = SQLAlchemyTaskRepository.search_statement(
+        case["query"], case.get("task_list_id"), case.get("status"), case.get("priority"), limit=limit
+    )
+    # Inline the parameters with the driver's own dialect and bypass text() parsing of the ::casts
+    sql = str(statement.compile(dialect=session.bind.dialect, compile_kwargs={"literal_binds": True}))
+    connection = await session.connection()
+    result = await connection.exec_driver_sql(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}")
+    plan = result.scalar()
+    plan = (json.loads(plan) if isinstance(plan, str) else plan)[0]
+    return {"indexes": sorted(set(plan_indexes(plan["Plan"]))), "execution_ms": plan["Execution Time"]}
+
+
+async def run_case(session_factory, case: dict, runs: int, limit: int, deep_pages: int) -> dict:
+    first_page: List[float] = []
+    deep_page: List[float] = []
+    hits = 0
+    for _ in range(runs):
+        async with session_factory() as session:
+            repository = SQLAlchemyTaskRepository(session)
+            after_rank: Optional[float] = None
+            after_id = 0
+            for page in range(deep_pages):
+                started = time.perf_counter()
+                page_hits = await repository.search(
+                    case["query"], case.get("task_list_id"), case.get("status"), case.get("priority"), after_rank, after_id, limit
+                )
+                elapsed = time.perf_counter() - started
+                (first_page if page == 0 else deep_page).append(elapsed)
+                if page == 0:
+                    hits = len(page_hits)
+                if len(page_hits) < limit:
+                    break
+                after_rank, after_id = page_hits[-1].rank, page_hits[-1].task.id
+
+    async with session_factory() as session:
+        plan = await explain(session, case, limit)
+
+    report = {"name": case["name"], "query": case["query"], "first_page_hits": hits, "first_page": summarize(first_page), "plan": plan}
+    if deep_page:
+        report["later_pages"] = summarize(deep_page)
+    return report
+
+
+async def run(runs: int, limit: int, deep_pages: int) -> dict:
+    session_factory = get_session_factory()
+    try:
+        async with session_factory() as session:
+            tasks = (await session.execute(text("SELECT count(*) FROM tasks"))).scalar()
+        cases = [await run_case(session_factory, case, runs, limit, deep_pages) for case in QUERIES]
+    finally:
+        await dispose_engine()
+    return {"tasks": tasks, "runs": runs, "limit": limit, "deep_pages": deep_pages, "queries": cases}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--deep-pages", type=int, default=5, help="Pages fetched per run by following the cursor")
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args.runs, args.limit, args.deep_pages)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
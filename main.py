@@ -1,22 +1,113 @@
-from fastapi import FastAPI
+import logging
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from strawberry.fastapi import GraphQLRouter
 
+from src.domain.exceptions.concurrency_exceptions import CoalescedReadTimeoutException
+from src.infrastructure.config.settings import settings
+from src.infrastructure.database.connection import dispose_engine
+from src.infrastructure.idempotency.purger import get_idempotency_purger
+from src.infrastructure.jobs.cascade_delete import get_cascade_delete_runner
+from src.infrastructure.notifications.dispatcher import get_notification_dispatcher
+from src.infrastructure.notifications.outbox import NotificationEventHandler
+from src.infrastructure.observability.loop_monitor import get_loop_monitor
+from src.infrastructure.observability.structured_logging import configure_logging, shutdown_logging
+from src.infrastructure.observability.tracing import tracer
+from src.infrastructure.outbox.purger import get_outbox_purger
+from src.infrastructure.outbox.relay import get_outbox_relay
+from src.infrastructure.retention.purger import get_soft_delete_purger
 from src.presentation.graphql.context import get_graphql_context
 from src.presentation.graphql.schema import schema
+from src.presentation.rest.controllers.admin_controller import router as admin_router
 from src.presentation.rest.controllers.auth_controller import router as auth_router
+from src.presentation.rest.controllers.metrics_controller import router as metrics_router
+from src.presentation.rest.controllers.sync_controller import router as sync_router
 from src.presentation.rest.controllers.task_controller import router as task_router
 from src.presentation.rest.controllers.task_list_controller import (
     router as task_list_router,
 )
 from src.presentation.rest.controllers.user_controller import router as user_router
+from src.presentation.rest.middleware.admission_control import AdmissionControlMiddleware
+from src.presentation.rest.middleware.profiler import ProfilerMiddleware
+from src.presentation.rest.middleware.request_context import RequestContextMiddleware
+from src.presentation.rest.middleware.tracing import TracingMiddleware
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start and stop background workers with the application."""
+    configure_logging()
+    loop_monitor = get_loop_monitor()
+    if loop_monitor:
+        await loop_monitor.start()
+    notification_dispatcher = get_notification_dispatcher()
+    if notification_dispatcher:
+        await notification_dispatcher.start()
+    # The in-memory repository backend runs without a database, so skip the database-backed workers
+    uses_database = settings.repository_backend.lower() != "memory"
+    outbox_relay = get_outbox_relay() if uses_database else None
+    notification_events = NotificationEventHandler(notification_dispatcher) if outbox_relay and notification_dispatcher else None
+    if notification_events:
+        notification_events.subscribe(outbox_relay.bus)
+    if outbox_relay:
+        await outbox_relay.start()
+    outbox_purger = get_outbox_purger() if uses_database else None
+    if outbox_purger:
+        await outbox_purger.start()
+    idempotency_purger = get_idempotency_purger() if uses_database else None
+    if idempotency_purger:
+        await idempotency_purger.start()
+    soft_delete_purger = get_soft_delete_purger() if uses_database else None
+    if soft_delete_purger:
+        await soft_delete_purger.start()
+    yield
+    if soft_delete_purger:
+        await soft_delete_purger.stop()
+    if idempotency_purger:
+        await idempotency_purger.stop()
+    if outbox_purger:
+        await outbox_purger.stop()
+    if outbox_relay:
+        await outbox_relay.stop()
+    if notification_events:
+        notification_events.unsubscribe(outbox_relay.bus)
+    if notification_dispatcher:
+        await notification_dispatcher.stop()
+    await get_cascade_delete_runner().stop()
+    await dispose_engine()
+    tracer.shutdown()
+    if loop_monitor:
+        await loop_monitor.stop()
+    shutdown_logging()
+
 
 app = FastAPI(
     title="Task Management API",
     description="API for managing task lists and tasks with dual controllers (REST + GraphQL)",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
+# Load shedding: added before CORS so rejected requests still carry CORS headers
+if settings.admission_control_enabled:
+    app.add_middleware(AdmissionControlMiddleware)
+
+# Request id and access log; inside the server span so records carry its trace id
+app.add_middleware(RequestContextMiddleware)
+
+# Server span per request; wraps admission control so queueing time is part of the trace
+if settings.tracing_enabled:
+    app.add_middleware(TracingMiddleware)
+
+# On-demand request profiling (X-Profile header or sampled)
+if settings.profiler_enabled:
+    app.add_middleware(ProfilerMiddleware)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -26,11 +117,22 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.exception_handler(CoalescedReadTimeoutException)
+async def coalesced_read_timeout_handler(request: Request, exc: CoalescedReadTimeoutException) -> JSONResponse:
+    """A read waited too long on an identical one in flight; the client may retry."""
+    logger.warning("Timed out waiting for a coalesced read", extra={"method": exc.label, "path": request.url.path})
+    return JSONResponse(status_code=status.HTTP_504_GATEWAY_TIMEOUT, content={"detail": str(exc)})
+
+
 # Include REST routers
 app.include_router(auth_router, prefix="/api")
 app.include_router(task_list_router, prefix="/api")
 app.include_router(task_router, prefix="/api")
 app.include_router(user_router, prefix="/api")
+app.include_router(sync_router, prefix="/api")
+app.include_router(metrics_router, prefix="/api")
+app.include_router(admin_router, prefix="/api")
 
 # Include GraphQL router
 graphql_app = GraphQLRouter(schema, context_getter=get_graphql_context)
@@ -0,0 +1,9 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict
+
+
+@dataclass
+class IdempotentResult:
+    status_code: int
+    body: Dict[str, Any] = field(default_factory=dict)
+    replayed: bool = False
@@ -0,0 +1,31 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+from src.domain.entities.task import Task
+from src.domain.entities.task_list import TaskList
+from src.domain.entities.tombstone import Tombstone
+
+
+@dataclass
+class SyncCursor:
+    timestamp: Optional[datetime] = None
+    id: int = 0
+
+
+@dataclass
+class SyncWatermark:
+    tasks: SyncCursor = field(default_factory=SyncCursor)
+    task_lists: SyncCursor = field(default_factory=SyncCursor)
+    tombstones: SyncCursor = field(default_factory=SyncCursor)
+    # When the current catch-up run (a series of has_more pages) began; None between runs
+    scan_started: Optional[datetime] = None
+
+
+@dataclass
+class SyncChangesDTO:
+    tasks: List[Task]
+    task_lists: List[TaskList]
+    tombstones: List[Tombstone]
+    watermark: str
+    has_more: bool
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import List, Optional
 
 from pydantic import BaseModel
@@ -9,6 +10,9 @@ class TaskFiltersDTO(BaseModel):
     task_list_id: Optional[int] = None
     status: Optional[TaskStatus] = None
     priority: Optional[TaskPriority] = None
+    due_before: Optional[datetime] = None
+    due_after: Optional[datetime] = None
+    overdue: bool = False
 
 
 class TaskListWithCompletionDTO(BaseModel):
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass
+class TaskListDeletionDTO:
+    """Progress of a chunked cascade delete running in the background."""
+
+    task_list_id: int
+    status: str  # running | completed | failed
+    tasks_total: int
+    tasks_deleted: int = 0
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
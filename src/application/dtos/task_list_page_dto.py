@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+from src.domain.entities.task_list import TaskList
+
+
+@dataclass
+class TaskListPageDTO:
+    task_lists: List[TaskList]
+    next_cursor: Optional[str]
+    has_more: bool
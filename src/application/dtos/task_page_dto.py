@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+from src.domain.entities.task import Task
+
+
+@dataclass
+class TaskPageDTO:
+    tasks: List[Task]
+    next_cursor: Optional[str]
+    has_more: bool
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+from src.domain.entities.task import TaskSearchHit
+
+
+@dataclass
+class TaskSearchPageDTO:
+    hits: List[TaskSearchHit]
+    next_cursor: Optional[str]
+    has_more: bool
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -7,8 +8,10 @@ from passlib.context import CryptContext
 from src.domain.entities.user import User
 from src.domain.repositories.user_repository import UserRepository
 from src.infrastructure.config.settings import settings
+from src.infrastructure.observability.tracing import trace_methods
 
 
+@trace_methods
 class AuthService:
     def __init__(self, user_repository: UserRepository):
         self.user_repository = user_repository
@@ -27,7 +30,8 @@ class AuthService:
         user = await self.user_repository.get_by_email(email)
         if not user or not user.hashed_password:
             return None
-        if not self.verify_password(password, user.hashed_password):
+        # bcrypt is deliberately slow; keep it off the event loop
+        if not await asyncio.to_thread(self.verify_password, password, user.hashed_password):
             return None
         return user
 
@@ -57,7 +61,7 @@ class AuthService:
 
     async def register_user(self, email: str, username: str, password: str) -> User:
         """Register a new user with hashed password."""
-        hashed_password = self.get_password_hash(password)
+        hashed_password = await asyncio.to_thread(self.get_password_hash, password)
 
         user = User(email=email, username=username, hashed_password=hashed_password)
 
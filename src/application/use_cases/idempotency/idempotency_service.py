@@ -0,0 +1,94 @@
+import hashlib
+import json
+from datetime import timedelta
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from src.application.dtos.idempotency_dto import IdempotentResult
+from src.application.utils.single_flight import SingleFlight
+from src.domain.entities.idempotency_record import IdempotencyRecord
+from src.domain.exceptions.concurrency_exceptions import CoalescedReadTimeoutException
+from src.domain.exceptions.idempotency_exceptions import IdempotencyKeyInProgressException, IdempotencyKeyReusedException
+from src.domain.outputs.idempotency_repository import IdempotencyRepository
+from src.infrastructure.config.settings import settings
+from src.infrastructure.observability.metrics import metrics
+from src.infrastructure.utils.datetime_utils import utc_now
+
+Handler = Callable[[], Awaitable[Dict[str, Any]]]
+
+# In-flight requests per (user, key) in this worker; duplicates wait for the first execution
+write_group = SingleFlight(timeout=settings.idempotency_wait_timeout_seconds)
+
+
+def request_fingerprint(scope: str, payload: Any) -> str:
+    raw = json.dumps([scope, payload], sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+class IdempotencyService:
+    def __init__(self, repository: IdempotencyRepository, group: SingleFlight = write_group, ttl_seconds: Optional[float] = None):
+        self.repository = repository
+        self.group = group
+        self.ttl = timedelta(seconds=ttl_seconds if ttl_seconds is not None else settings.idempotency_ttl_seconds)
+
+    async def execute(self, user_id: int, key: Optional[str], scope: str, payload: Any, handler: Handler, status_code: int = 201) -> IdempotentResult:
+        """Run a write at most once per idempotency key and replay its stored response on retries.
+
+        ``handler`` must perform the write on the same session as the repository and return a
+        JSON-serializable body, so the response is stored in the same transaction as the write.
+        With a key that transaction is committed here, before duplicates waiting in this worker
+        are handed the response. Without a key the handler simply runs.
+        """
+        if not key:
+            return IdempotentResult(status_code=status_code, body=await handler())
+
+        fingerprint = request_fingerprint(scope, payload)
+        executed = False
+
+        async def run_once() -> Tuple[IdempotencyRecord, bool]:
+            nonlocal executed
+            executed = True
+            return await self._run_once(user_id, key, scope, fingerprint, handler, status_code)
+
+        try:
+            record, replayed = await self.group.do((user_id, key), run_once, label=scope)
+        except CoalescedReadTimeoutException:
+            raise IdempotencyKeyInProgressException(key)
+
+        if record.request_hash != fingerprint:
+            metrics.counter("idempotency_conflicts_total", scope=scope).inc()
+            raise IdempotencyKeyReusedException(key)
+
+        replayed = replayed or not executed
+        if replayed:
+            metrics.counter("idempotency_replays_total", scope=scope).inc()
+        return IdempotentResult(status_code=record.status_code, body=record.response_body, replayed=replayed)
+
+    async def _run_once(
+        self, user_id: int, key: str, scope: str, fingerprint: str, handler: Handler, status_code: int
+    ) -> Tuple[IdempotencyRecord, bool]:
+        now = utc_now()
+        stored = await self.repository.get(user_id, key, now)
+        if stored:
+            return stored, True
+
+        body = await handler()
+        record = IdempotencyRecord(
+            user_id=user_id,
+            key=key,
+            scope=scope,
+            request_hash=fingerprint,
+            status_code=status_code,
+            response_body=body,
+            created_at=now,
+            expires_at=now + self.ttl,
+        )
+        if not await self.repository.save(record):
+            # Another worker stored the key first; the save waited for its commit, so its response is readable now
+            await self.repository.rollback()
+            stored = await self.repository.get(user_id, key, now)
+            if stored is None:
+                raise IdempotencyKeyInProgressException(key)
+            return stored, True
+        # Waiters get the response only once it is durable; a failed commit reaches them as an error instead
+        await self.repository.commit()
+        return record, False
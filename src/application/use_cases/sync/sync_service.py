@@ -0,0 +1,87 @@
+import base64
+import binascii
+import json
+from datetime import datetime, timedelta
+from typing import Any, List, Optional
+
+from src.application.dtos.sync_dto import SyncChangesDTO, SyncCursor, SyncWatermark
+from src.domain.exceptions.sync_exceptions import InvalidWatermarkException
+from src.domain.outputs.sync_repository import SyncRepository
+from src.infrastructure.config.settings import settings
+from src.infrastructure.utils.datetime_utils import utc_now
+
+
+class SyncService:
+    def __init__(self, repository: SyncRepository, rescan_seconds: Optional[float] = None):
+        self.repository = repository
+        self.rescan_window = timedelta(seconds=rescan_seconds if rescan_seconds is not None else settings.sync_rescan_seconds)
+
+    async def get_changes(self, since: Optional[str] = None, limit: int = 500) -> SyncChangesDTO:
+        """Get tasks, task lists and tombstones changed after the given watermark.
+
+        Each stream is paginated independently on (updated_at, id); clients keep calling
+        with the returned watermark while ``has_more`` is true.
+
+        Timestamps are set before commit, so a row can become visible after a run has paged past
+        its position. Once a stream is caught up its watermark steps back to ``rescan_window``
+        before the run began, and the next call reads that window again; rows may therefore
+        repeat across calls and clients apply them by id.
+        """
+        watermark = self.decode_watermark(since) if since else SyncWatermark()
+        scan_started = watermark.scan_started or utc_now()
+
+        tasks = await self.repository.get_tasks_changed_since(watermark.tasks.timestamp, watermark.tasks.id, limit)
+        task_lists = await self.repository.get_task_lists_changed_since(watermark.task_lists.timestamp, watermark.task_lists.id, limit)
+        tombstones = await self.repository.get_tombstones_since(watermark.tombstones.timestamp, watermark.tombstones.id, limit)
+
+        has_more = any(len(page) == limit for page in (tasks, task_lists, tombstones))
+        next_watermark = SyncWatermark(
+            tasks=self._next_cursor(watermark.tasks, tasks, "updated_at", limit, scan_started),
+            task_lists=self._next_cursor(watermark.task_lists, task_lists, "updated_at", limit, scan_started),
+            tombstones=self._next_cursor(watermark.tombstones, tombstones, "deleted_at", limit, scan_started),
+            scan_started=scan_started if has_more else None,
+        )
+
+        return SyncChangesDTO(
+            tasks=tasks,
+            task_lists=task_lists,
+            tombstones=tombstones,
+            watermark=self.encode_watermark(next_watermark),
+            has_more=has_more,
+        )
+
+    def _next_cursor(self, cursor: SyncCursor, page: List[Any], timestamp_field: str, limit: int, scan_started: datetime) -> SyncCursor:
+        last = SyncCursor(getattr(page[-1], timestamp_field), page[-1].id) if page else cursor
+        if len(page) == limit or last.timestamp is None:
+            return last
+        # A write still uncommitted when this run passed it is stamped no earlier than rescan_window before the run began
+        rescan_from = scan_started - self.rescan_window
+        return last if last.timestamp < rescan_from else SyncCursor(rescan_from, 0)
+
+    @staticmethod
+    def encode_watermark(watermark: SyncWatermark) -> str:
+        """Encode a watermark as an opaque URL-safe token."""
+        payload = {
+            name: [cursor.timestamp.isoformat() if cursor.timestamp else None, cursor.id]
+            for name, cursor in (("t", watermark.tasks), ("l", watermark.task_lists), ("d", watermark.tombstones))
+        }
+        if watermark.scan_started:
+            payload["s"] = watermark.scan_started.isoformat()
+        raw = json.dumps(payload, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @staticmethod
+    def decode_watermark(token: str) -> SyncWatermark:
+        """Decode a token produced by ``encode_watermark``."""
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            payload = json.loads(raw)
+            cursors = {}
+            for name in ("t", "l", "d"):
+                timestamp, cursor_id = payload[name]
+                cursors[name] = SyncCursor(datetime.fromisoformat(timestamp) if timestamp else None, int(cursor_id))
+            scan_started = datetime.fromisoformat(payload["s"]) if payload.get("s") else None
+        except (binascii.Error, ValueError, TypeError, KeyError):
+            raise InvalidWatermarkException(token)
+
+        return SyncWatermark(tasks=cursors["t"], task_lists=cursors["l"], tombstones=cursors["d"], scan_started=scan_started)
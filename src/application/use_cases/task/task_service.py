@@ -1,21 +1,41 @@
-from typing import List, Optional
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import List, Optional, Tuple
 
 from src.application.dtos.task_dto import TaskFiltersDTO
-from src.domain.entities.task import Task, TaskStatus
+from src.application.dtos.task_page_dto import TaskPageDTO
+from src.application.dtos.task_search_dto import TaskSearchPageDTO
+from src.application.utils.single_flight import coalesce
+from src.domain.entities.notification import NotificationType, TaskNotification
+from src.domain.entities.task import Task, TaskChanges, TaskPriority, TaskStatus
+from src.domain.exceptions.task_exceptions import InvalidSearchCursorException, InvalidTaskCursorException
 from src.domain.inputs.task_use_cases import TaskUseCases
+from src.domain.outputs.notification_publisher import NotificationPublisher
 from src.domain.outputs.task_repository import TaskRepository
+from src.infrastructure.observability.tracing import trace_methods
 
 
+@trace_methods
 class TaskService(TaskUseCases):
-    def __init__(self, repository: TaskRepository):
+    def __init__(self, repository: TaskRepository, notifier: Optional[NotificationPublisher] = None):
         self.repository = repository
+        self.notifier = notifier
 
     async def create(self, task: Task) -> Task:
-        return await self.repository.create(task)
+        created_task = await self.repository.create(task)
+        self._notify_changes(None, created_task)
+        return created_task
 
+    @coalesce()
     async def get(self, task_id: int) -> Optional[Task]:
         return await self.repository.get_by_id(task_id)
 
+    async def get_by_ids(self, task_ids: List[int]) -> List[Optional[Task]]:
+        """Tasks in ``task_ids`` order, None where a task does not exist."""
+        return await self.repository.get_by_ids(task_ids)
+
     async def update(self, task_id: int, task: Task) -> Task:
         # Get current task to preserve unmodified fields
         current_task = await self.repository.get_by_id(task_id)
@@ -37,11 +57,27 @@ class TaskService(TaskUseCases):
             updated_at=current_task.updated_at,
         )
 
-        return await self.repository.update(updated_task)
+        result = await self.repository.update(updated_task)
+        self._notify_changes(current_task, result)
+        return result
+
+    async def bulk_update(self, changes: TaskChanges, task_ids: Optional[List[int]] = None, filters: Optional[TaskFiltersDTO] = None) -> List[Task]:
+        """Apply ``changes`` to the tasks in ``task_ids`` and/or matching ``filters`` in one repository call.
+
+        Returns the tasks that changed, by id; each one is notified as if it had been updated on its own.
+        """
+        filters = filters or TaskFiltersDTO()
+        changed = await self.repository.bulk_update(
+            changes, task_ids, filters.task_list_id, filters.status, filters.priority, filters.due_before, filters.due_after, filters.overdue
+        )
+        for previous, current in changed:
+            self._notify_changes(previous, current)
+        return [current for _, current in changed]
 
     async def delete(self, task_id: int) -> bool:
         return await self.repository.delete(task_id)
 
+    @coalesce()
     async def list_all(self) -> List[Task]:
         return await self.repository.list_all()
 
@@ -50,11 +86,83 @@ class TaskService(TaskUseCases):
         if not task:
             raise ValueError(f"Task with id {task_id} not found")
 
+        previous_status = task.status
         task.status = status
-        return await self.repository.update(task)
+        result = await self.repository.update(task)
+        if previous_status != result.status:
+            self._notify(NotificationType.TASK_STATUS_CHANGED, result)
+        return result
+
+    async def claim(self, task_list_id: int, user_id: int, count: int = 1) -> List[Task]:
+        """Take the next ``count`` pending tasks of a list for ``user_id`` (highest priority, then oldest).
+
+        No assignment notifications: the claimer is the assignee and gets the tasks in the response.
+        """
+        return await self.repository.claim(task_list_id, user_id, count)
 
     async def get_by_filters(self, filters: TaskFiltersDTO) -> List[Task]:
-        return await self.repository.get_tasks_by_filters(filters.task_list_id, filters.status, filters.priority)
+        return await self.repository.get_tasks_by_filters(
+            filters.task_list_id, filters.status, filters.priority, filters.due_before, filters.due_after, filters.overdue
+        )
+
+    async def get_overdue(self, user_id: int, limit: int = 100) -> List[Task]:
+        """Open tasks assigned to ``user_id`` that are past their due date, most overdue first."""
+        return await self.repository.get_overdue(user_id, limit)
+
+    async def get_assigned(
+        self, user_id: int, statuses: Optional[List[TaskStatus]] = None, cursor: Optional[str] = None, limit: int = 20
+    ) -> TaskPageDTO:
+        """Tasks assigned to ``user_id``: highest priority first, then soonest due, one keyset page at a time."""
+        after = self.decode_queue_cursor(cursor) if cursor else (None, None, 0)
+        tasks = await self.repository.get_assigned(user_id, statuses, *after, limit + 1)
+        page, has_more = tasks[:limit], len(tasks) > limit
+        next_cursor = self.encode_queue_cursor(page[-1]) if has_more else None
+        return TaskPageDTO(tasks=page, next_cursor=next_cursor, has_more=has_more)
+
+    @staticmethod
+    def encode_queue_cursor(task: Task) -> str:
+        """Encode the (priority, due_date, id) position of ``task`` as an opaque URL-safe token."""
+        position = [task.priority.value, task.due_date.isoformat() if task.due_date else None, task.id]
+        raw = json.dumps(position, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @staticmethod
+    def decode_queue_cursor(token: str) -> Tuple[TaskPriority, Optional[datetime], int]:
+        """Decode a token produced by ``encode_queue_cursor``."""
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            priority, due_date, task_id = json.loads(raw)
+            return TaskPriority(priority), datetime.fromisoformat(due_date) if due_date else None, int(task_id)
+        except (binascii.Error, ValueError, TypeError):
+            raise InvalidTaskCursorException(token)
+
+    async def search(self, query: str, filters: TaskFiltersDTO, cursor: Optional[str] = None, limit: int = 20) -> TaskSearchPageDTO:
+        """Tasks matching ``query``, best match first, one keyset page at a time.
+
+        Pages continue from the (rank, id) of the previous page's last hit, so deep pages cost
+        the same as the first; clients pass ``next_cursor`` back while ``has_more`` is true.
+        """
+        after_rank, after_id = self.decode_search_cursor(cursor) if cursor else (None, 0)
+        hits = await self.repository.search(query, filters.task_list_id, filters.status, filters.priority, after_rank, after_id, limit + 1)
+        page, has_more = hits[:limit], len(hits) > limit
+        next_cursor = self.encode_search_cursor(page[-1].rank, page[-1].task.id) if has_more else None
+        return TaskSearchPageDTO(hits=page, next_cursor=next_cursor, has_more=has_more)
+
+    @staticmethod
+    def encode_search_cursor(rank: float, task_id: int) -> str:
+        """Encode a search position as an opaque URL-safe token (``repr`` keeps the float exact)."""
+        raw = json.dumps([rank, task_id], separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @staticmethod
+    def decode_search_cursor(token: str) -> Tuple[float, int]:
+        """Decode a token produced by ``encode_search_cursor``."""
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            rank, task_id = json.loads(raw)
+            return float(rank), int(task_id)
+        except (binascii.Error, ValueError, TypeError):
+            raise InvalidSearchCursorException(token)
 
     async def calculate_completion_percentage(self, task_list_id: int) -> float:
         tasks = await self.repository.get_by_task_list_id(task_list_id)
@@ -63,3 +171,22 @@ class TaskService(TaskUseCases):
 
         completed_tasks = [task for task in tasks if task.status == TaskStatus.COMPLETED]
         return (len(completed_tasks) / len(tasks)) * 100
+
+    def _notify_changes(self, previous: Optional[Task], current: Task) -> None:
+        if previous is None or previous.assigned_user_id != current.assigned_user_id:
+            self._notify(NotificationType.TASK_ASSIGNED, current)
+        elif previous.status != current.status:
+            self._notify(NotificationType.TASK_STATUS_CHANGED, current)
+
+    def _notify(self, notification_type: NotificationType, task: Task) -> None:
+        if self.notifier is None or task.assigned_user_id is None:
+            return
+        self.notifier.publish(
+            TaskNotification(
+                type=notification_type,
+                recipient_user_id=task.assigned_user_id,
+                task_id=task.id,
+                task_title=task.title,
+                status=task.status,
+            )
+        )
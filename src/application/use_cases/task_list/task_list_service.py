@@ -1,15 +1,23 @@
+import base64
+import binascii
+import json
+from datetime import datetime, timedelta
 from typing import List, Optional
 
+from src.application.dtos.task_list_page_dto import TaskListPageDTO
 from src.application.dtos.task_list_with_tasks_dto import TaskListWithTasksDTO
+from src.application.utils.single_flight import coalesce
 from src.domain.entities.task import TaskPriority, TaskStatus
-from src.domain.entities.task_list import TaskList
-from src.domain.exceptions.task_list_exceptions import InvalidUserException
+from src.domain.entities.task_list import TaskList, TaskListClone
+from src.domain.exceptions.task_list_exceptions import InvalidTaskListCursorException, InvalidUserException
 from src.domain.inputs.task_list_use_cases import TaskListUseCases
 from src.domain.outputs.task_list_repository import TaskListRepository
 from src.domain.outputs.task_repository import TaskRepository
 from src.domain.repositories.user_repository import UserRepository
+from src.infrastructure.observability.tracing import trace_methods
 
 
+@trace_methods
 class TaskListService(TaskListUseCases):
     def __init__(self, repository: TaskListRepository, task_repository: TaskRepository, user_repository: UserRepository):
         self.repository = repository
@@ -25,9 +33,17 @@ class TaskListService(TaskListUseCases):
         
         return await self.repository.create(task_list)
 
+    @coalesce()
     async def get(self, task_list_id: int) -> Optional[TaskList]:
         return await self.repository.get_by_id(task_list_id)
 
+    async def get_by_ids(self, task_list_ids: List[int], user_id: Optional[int] = None) -> List[Optional[TaskList]]:
+        """Lists in ``task_list_ids`` order, None where a list does not exist (or, given ``user_id``, is owned by someone else)."""
+        task_lists = await self.repository.get_by_ids(task_list_ids)
+        if user_id is None:
+            return task_lists
+        return [task_list if task_list and task_list.user_id == user_id else None for task_list in task_lists]
+
     async def update(self, task_list_id: int, task_list: TaskList) -> TaskList:
         # Get current task list to preserve unmodified fields
         current_task_list = await self.repository.get_by_id(task_list_id)
@@ -57,14 +73,82 @@ class TaskListService(TaskListUseCases):
     async def delete(self, task_list_id: int) -> bool:
         return await self.repository.delete(task_list_id)
 
+    async def delete_cascade(self, task_list_id: int) -> Optional[int]:
+        """Delete the list together with all its tasks, in the caller's transaction.
+
+        Returns the number of tasks deleted, or None when the list does not exist.
+        """
+        if not await self.repository.get_by_id(task_list_id):
+            return None
+        deleted = await self.task_repository.delete_by_task_list_id(task_list_id)
+        await self.repository.delete(task_list_id)
+        return deleted
+
+    async def delete_tasks(self, task_list_id: int, limit: Optional[int] = None) -> int:
+        """Delete up to ``limit`` of the list's tasks (all when None), leaving the list itself."""
+        return await self.task_repository.delete_by_task_list_id(task_list_id, limit)
+
+    async def count_tasks(self, task_list_id: int) -> int:
+        return await self.task_repository.count_by_task_list_id(task_list_id)
+
+    async def clone(
+        self,
+        task_list_id: int,
+        task_list: TaskList,
+        reset_status: bool = False,
+        due_date_shift: Optional[timedelta] = None,
+        assigned_user_id: Optional[int] = None,
+        unassign: bool = False,
+    ) -> Optional[TaskListClone]:
+        """Copy the list and all its tasks server-side; None when the source list does not exist."""
+        # Check referenced users once up front rather than failing the copy on a foreign key
+        for user_id in (task_list.user_id, assigned_user_id):
+            if user_id is not None and not await self.user_repository.get(user_id):
+                raise InvalidUserException(user_id)
+        return await self.repository.clone(task_list_id, task_list, reset_status, due_date_shift, assigned_user_id, unassign)
+
+    @coalesce()
     async def list_all(self) -> List[TaskList]:
         return await self.repository.list_all()
 
+    @coalesce()
+    async def list_for_user(self, user_id: int) -> List[TaskList]:
+        """Active lists the user owns, plus lists with tasks assigned to them."""
+        return await self.repository.list_for_user(user_id)
+
+    async def list_page(self, cursor: Optional[str] = None, limit: int = 100) -> TaskListPageDTO:
+        """Every task list in id order, one keyset page at a time (admin listing)."""
+        after_id = self.decode_page_cursor(cursor) if cursor else 0
+        task_lists = await self.repository.list_page(after_id, limit + 1)
+        page, has_more = task_lists[:limit], len(task_lists) > limit
+        next_cursor = self.encode_page_cursor(page[-1].id) if has_more else None
+        return TaskListPageDTO(task_lists=page, next_cursor=next_cursor, has_more=has_more)
+
+    @staticmethod
+    def encode_page_cursor(task_list_id: int) -> str:
+        """Encode a listing position as an opaque URL-safe token."""
+        raw = json.dumps([task_list_id], separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @staticmethod
+    def decode_page_cursor(token: str) -> int:
+        """Decode a token produced by ``encode_page_cursor``."""
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            (task_list_id,) = json.loads(raw)
+            return int(task_list_id)
+        except (binascii.Error, ValueError, TypeError):
+            raise InvalidTaskListCursorException(token)
+
+    @coalesce()
     async def get_tasks_with_completion(
         self,
         task_list_id: int,
         status: Optional[TaskStatus] = None,
         priority: Optional[TaskPriority] = None,
+        due_before: Optional[datetime] = None,
+        due_after: Optional[datetime] = None,
+        overdue: bool = False,
     ) -> TaskListWithTasksDTO:
         """Get tasks for a task list with filters and completion percentage."""
         # Verify task list exists
@@ -73,10 +157,10 @@ class TaskListService(TaskListUseCases):
             raise ValueError("Task list not found")
 
         # Get filtered tasks
-        filtered_tasks = await self.task_repository.get_tasks_by_filters(task_list_id, status, priority)
+        filtered_tasks = await self.task_repository.get_tasks_by_filters(task_list_id, status, priority, due_before, due_after, overdue)
 
         # If no filters applied, use filtered_tasks for completion calculation
-        if status is None and priority is None:
+        if status is None and priority is None and due_before is None and due_after is None and not overdue:
             all_tasks = filtered_tasks
         else:
             # Only get all tasks if filters were applied
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 
 from src.domain.entities.user import User
 from src.domain.repositories.user_repository import UserRepository
@@ -15,3 +15,7 @@ class UserService:
         if user_id <= 0:
             raise ValueError("User ID must be positive")
         return await self.user_repository.get(user_id)
+
+    async def get_by_ids(self, user_ids: List[int]) -> List[Optional[User]]:
+        """Users in ``user_ids`` order, None where a user does not exist."""
+        return await self.user_repository.get_by_ids(user_ids)
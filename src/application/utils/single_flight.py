@@ -0,0 +1,104 @@
+import asyncio
+import functools
+import inspect
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+from src.domain.exceptions.concurrency_exceptions import CoalescedReadTimeoutException
+from src.infrastructure.config.settings import settings
+from src.infrastructure.database.write_tracking import has_uncommitted_writes
+from src.infrastructure.observability.metrics import metrics
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Collapse concurrent identical async calls into one in-flight execution.
+
+    The first caller for a key (the leader) runs the call; callers arriving while it is
+    still running wait for the same result or exception instead of running it again.
+    Results are shared between waiters, so they must be treated as read-only. A waiter
+    that gives up after ``timeout`` gets ``CoalescedReadTimeoutException``.
+    """
+
+    def __init__(self, timeout: Optional[float] = None):
+        self.timeout = timeout
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]], label: str = "default") -> T:
+        while True:
+            future = self._in_flight.get(key)
+            if future is None:
+                return await self._lead(key, fn, label)
+
+            metrics.counter("singleflight_coalesced_total", method=label).inc()
+            try:
+                # Shield so a waiter timing out or being cancelled never cancels the leader
+                return await asyncio.wait_for(asyncio.shield(future), self.timeout)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The leader was cancelled (e.g. client disconnected); retry as a new leader
+            except asyncio.TimeoutError as e:
+                metrics.counter("singleflight_timeouts_total", method=label).inc()
+                raise CoalescedReadTimeoutException(label) from e
+
+    async def _lead(self, key: Hashable, fn: Callable[[], Awaitable[T]], label: str) -> T:
+        future = asyncio.get_running_loop().create_future()
+        # Waiters may all have gone away; retrieve the exception so it is never reported as unhandled
+        future.add_done_callback(lambda done: done.cancelled() or done.exception())
+        self._in_flight[key] = future
+        metrics.counter("singleflight_executions_total", method=label).inc()
+
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            metrics.counter("singleflight_errors_total", method=label).inc()
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+
+# Shared group for service reads in this worker process
+read_group = SingleFlight(timeout=settings.single_flight_timeout_seconds)
+
+
+def coalesce(group: SingleFlight = read_group) -> Callable:
+    """Decorator for read-only service methods, keyed by method and bound arguments (``self`` excluded).
+
+    Only reads outside a write transaction are shared: once the caller's session holds uncommitted
+    writes it must see them, so its reads run on their own.
+    """
+
+    def decorator(method: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        signature = inspect.signature(method)
+        label = method.__qualname__
+
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            if not settings.single_flight_enabled or has_uncommitted_writes():
+                return await method(self, *args, **kwargs)
+
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            key = (label, tuple(bound.arguments.values())[1:])
+            try:
+                hash(key)
+            except TypeError:
+                return await method(self, *args, **kwargs)
+
+            return await group.do(key, lambda: method(self, *args, **kwargs), label)
+
+        return wrapper
+
+    return decorator
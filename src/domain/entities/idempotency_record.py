@@ -0,0 +1,15 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class IdempotencyRecord:
+    user_id: int
+    key: str
+    scope: str
+    request_hash: str
+    status_code: int
+    response_body: Dict[str, Any] = field(default_factory=dict)
+    expires_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None
@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+
+from src.domain.entities.task import TaskStatus
+
+
+class NotificationType(Enum):
+    TASK_ASSIGNED = "task_assigned"
+    TASK_STATUS_CHANGED = "task_status_changed"
+
+
+@dataclass
+class TaskNotification:
+    type: NotificationType
+    recipient_user_id: int
+    task_id: int
+    task_title: str
+    status: Optional[TaskStatus] = None
+    created_at: Optional[datetime] = None
+
+
+@dataclass
+class EmailMessage:
+    to: str
+    subject: str
+    body: str
+    sender: Optional[str] = None
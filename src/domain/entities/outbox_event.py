@@ -0,0 +1,14 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class OutboxEvent:
+    aggregate_type: str
+    aggregate_id: int
+    event_type: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+    id: Optional[int] = None
+    created_at: Optional[datetime] = None
+    processed_at: Optional[datetime] = None
@@ -1,7 +1,7 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Dict, Optional, Union
 
 
 class TaskStatus(Enum):
@@ -16,6 +16,19 @@ class TaskPriority(Enum):
     HIGH = "high"
 
 
+class Unset(Enum):
+    """Type of ``UNSET``, a field left out of a change, as opposed to one set to None."""
+
+    UNSET = "unset"
+
+
+UNSET = Unset.UNSET
+
+
+# Lowest to highest; the same order as the taskpriority enum that PostgreSQL sorts by
+PRIORITY_RANK = {TaskPriority.LOW: 0, TaskPriority.MEDIUM: 1, TaskPriority.HIGH: 2}
+
+
 @dataclass
 class Task:
     title: str
@@ -29,3 +42,23 @@ class Task:
     is_active: bool = True
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+
+
+@dataclass
+class TaskSearchHit:
+    task: Task
+    rank: float
+
+
+@dataclass
+class TaskChanges:
+    """Fields a bulk update sets on every matched task; UNSET leaves a field as it is, None clears the nullable ones."""
+
+    task_list_id: Union[int, Unset] = UNSET
+    status: Union[TaskStatus, Unset] = UNSET
+    priority: Union[TaskPriority, Unset] = UNSET
+    assigned_user_id: Union[int, None, Unset] = UNSET
+    due_date: Union[datetime, None, Unset] = UNSET
+
+    def values(self) -> Dict[str, object]:
+        return {field.name: getattr(self, field.name) for field in fields(self) if getattr(self, field.name) is not UNSET}
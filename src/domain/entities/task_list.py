@@ -12,3 +12,9 @@ class TaskList:
     is_active: bool = True
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+
+
+@dataclass
+class TaskListClone:
+    task_list: TaskList
+    tasks_copied: int
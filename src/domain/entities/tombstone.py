@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+
+
+class SyncEntityType(Enum):
+    TASK = "task"
+    TASK_LIST = "task_list"
+
+
+@dataclass
+class Tombstone:
+    entity_type: SyncEntityType
+    entity_id: int
+    id: Optional[int] = None
+    deleted_at: Optional[datetime] = None
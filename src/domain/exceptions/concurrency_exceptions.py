@@ -0,0 +1,12 @@
+class ConcurrencyException(Exception):
+    """Base exception for concurrent request handling"""
+
+    pass
+
+
+class CoalescedReadTimeoutException(ConcurrencyException):
+    """Exception raised when a call waited too long for an identical call already in flight"""
+
+    def __init__(self, label: str):
+        self.label = label
+        super().__init__("Timed out waiting for a concurrent identical request")
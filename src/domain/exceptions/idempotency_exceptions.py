@@ -0,0 +1,20 @@
+class IdempotencyException(Exception):
+    """Base exception for idempotent request handling"""
+
+    pass
+
+
+class IdempotencyKeyReusedException(IdempotencyException):
+    """Exception raised when an idempotency key is replayed with a different request"""
+
+    def __init__(self, key: str):
+        self.key = key
+        super().__init__(f"Idempotency key '{key}' was already used for a different request")
+
+
+class IdempotencyKeyInProgressException(IdempotencyException):
+    """Exception raised when the original request for an idempotency key has not finished yet"""
+
+    def __init__(self, key: str):
+        self.key = key
+        super().__init__(f"A request with idempotency key '{key}' is still being processed")
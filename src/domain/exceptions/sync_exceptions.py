@@ -0,0 +1,12 @@
+class SyncException(Exception):
+    """Base exception for sync operations"""
+
+    pass
+
+
+class InvalidWatermarkException(SyncException):
+    """Exception raised when a sync watermark cannot be decoded"""
+
+    def __init__(self, watermark: str):
+        self.watermark = watermark
+        super().__init__(f"Invalid sync watermark '{watermark}'")
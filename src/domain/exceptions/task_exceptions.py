@@ -26,3 +26,19 @@ class InvalidUserException(TaskException):
     def __init__(self, user_id: int):
         self.user_id = user_id
         super().__init__(f"User {user_id} does not exist")
+
+
+class InvalidSearchCursorException(TaskException):
+    """Exception raised when a search cursor cannot be decoded"""
+
+    def __init__(self, cursor: str):
+        self.cursor = cursor
+        super().__init__(f"Invalid search cursor '{cursor}'")
+
+
+class InvalidTaskCursorException(TaskException):
+    """Exception raised when a task page cursor cannot be decoded"""
+
+    def __init__(self, cursor: str):
+        self.cursor = cursor
+        super().__init__(f"Invalid task cursor '{cursor}'")
@@ -26,3 +26,11 @@ class InvalidUserException(TaskListException):
     def __init__(self, user_id: int):
         self.user_id = user_id
         super().__init__(f"User {user_id} does not exist")
+
+
+class InvalidTaskListCursorException(TaskListException):
+    """Exception raised when a task list page cursor cannot be decoded"""
+
+    def __init__(self, cursor: str):
+        self.cursor = cursor
+        super().__init__(f"Invalid task list cursor '{cursor}'")
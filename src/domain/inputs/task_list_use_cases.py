@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
+from datetime import timedelta
 from typing import List, Optional
 
-from src.domain.entities.task_list import TaskList
+from src.domain.entities.task_list import TaskList, TaskListClone
 
 
 class TaskListUseCases(ABC):
@@ -13,6 +14,10 @@ class TaskListUseCases(ABC):
     async def get(self, task_list_id: int) -> Optional[TaskList]:
         pass
 
+    @abstractmethod
+    async def get_by_ids(self, task_list_ids: List[int]) -> List[Optional[TaskList]]:
+        pass
+
     @abstractmethod
     async def update(self, task_list_id: int, task_list: TaskList) -> TaskList:
         pass
@@ -21,6 +26,34 @@ class TaskListUseCases(ABC):
     async def delete(self, task_list_id: int) -> bool:
         pass
 
+    @abstractmethod
+    async def delete_cascade(self, task_list_id: int) -> Optional[int]:
+        pass
+
+    @abstractmethod
+    async def delete_tasks(self, task_list_id: int, limit: Optional[int] = None) -> int:
+        pass
+
+    @abstractmethod
+    async def count_tasks(self, task_list_id: int) -> int:
+        pass
+
+    @abstractmethod
+    async def clone(
+        self,
+        task_list_id: int,
+        task_list: TaskList,
+        reset_status: bool = False,
+        due_date_shift: Optional[timedelta] = None,
+        assigned_user_id: Optional[int] = None,
+        unassign: bool = False,
+    ) -> Optional[TaskListClone]:
+        pass
+
     @abstractmethod
     async def list_all(self) -> List[TaskList]:
         pass
+
+    @abstractmethod
+    async def list_for_user(self, user_id: int) -> List[TaskList]:
+        pass
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 
-from src.domain.entities.task import Task, TaskPriority, TaskStatus
+from src.domain.entities.task import Task, TaskChanges, TaskPriority, TaskStatus
 
 
 class TaskUseCases(ABC):
@@ -13,10 +13,18 @@ class TaskUseCases(ABC):
     async def get(self, task_id: int) -> Optional[Task]:
         pass
 
+    @abstractmethod
+    async def get_by_ids(self, task_ids: List[int]) -> List[Optional[Task]]:
+        pass
+
     @abstractmethod
     async def update(self, task_id: int, task: Task) -> Task:
         pass
 
+    @abstractmethod
+    async def bulk_update(self, changes: TaskChanges, task_ids: Optional[List[int]] = None, filters=None) -> List[Task]:
+        pass
+
     @abstractmethod
     async def delete(self, task_id: int) -> bool:
         pass
@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+
+from src.domain.entities.notification import EmailMessage
+
+
+class EmailSender(ABC):
+    @abstractmethod
+    async def send(self, message: EmailMessage) -> None:
+        pass
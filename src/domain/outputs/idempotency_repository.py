@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+
+from src.domain.entities.idempotency_record import IdempotencyRecord
+
+
+class IdempotencyRepository(ABC):
+    @abstractmethod
+    async def get(self, user_id: int, key: str, now: datetime) -> Optional[IdempotencyRecord]:
+        """Return the unexpired record stored for the key, if any."""
+        pass
+
+    @abstractmethod
+    async def save(self, record: IdempotencyRecord) -> bool:
+        """Store a record in the current transaction. Returns False if a live record already holds the key."""
+        pass
+
+    @abstractmethod
+    async def commit(self) -> None:
+        """Commit the current transaction, i.e. the write together with its stored response."""
+        pass
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        """Discard the current transaction, i.e. a write whose key another request stored first."""
+        pass
+
+    @abstractmethod
+    async def purge_expired(self, now: datetime, limit: int) -> int:
+        pass
@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+
+from src.domain.entities.notification import TaskNotification
+
+
+class NotificationPublisher(ABC):
+    @abstractmethod
+    def publish(self, notification: TaskNotification) -> None:
+        """Hand a notification over for background delivery. Must never block the caller."""
+        pass
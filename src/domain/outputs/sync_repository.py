@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+
+from src.domain.entities.task import Task
+from src.domain.entities.task_list import TaskList
+from src.domain.entities.tombstone import Tombstone
+
+
+class SyncRepository(ABC):
+    """Keyset reads over (updated_at, id) used by delta sync clients."""
+
+    @abstractmethod
+    async def get_tasks_changed_since(self, after_timestamp: Optional[datetime], after_id: int, limit: int) -> List[Task]:
+        pass
+
+    @abstractmethod
+    async def get_task_lists_changed_since(self, after_timestamp: Optional[datetime], after_id: int, limit: int) -> List[TaskList]:
+        pass
+
+    @abstractmethod
+    async def get_tombstones_since(self, after_timestamp: Optional[datetime], after_id: int, limit: int) -> List[Tombstone]:
+        pass
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
+from datetime import timedelta
 from typing import List, Optional
 
-from src.domain.entities.task_list import TaskList
+from src.domain.entities.task_list import TaskList, TaskListClone
 
 
 class TaskListRepository(ABC):
@@ -13,6 +14,11 @@ class TaskListRepository(ABC):
     async def get_by_id(self, task_list_id: int) -> Optional[TaskList]:
         pass
 
+    @abstractmethod
+    async def get_by_ids(self, task_list_ids: List[int]) -> List[Optional[TaskList]]:
+        """Active lists in ``task_list_ids`` order, with None for ids that do not exist (one lookup for the batch)."""
+        pass
+
     @abstractmethod
     async def update(self, task_list: TaskList) -> TaskList:
         pass
@@ -21,6 +27,34 @@ class TaskListRepository(ABC):
     async def delete(self, task_list_id: int) -> bool:
         pass
 
+    @abstractmethod
+    async def clone(
+        self,
+        task_list_id: int,
+        task_list: TaskList,
+        reset_status: bool = False,
+        due_date_shift: Optional[timedelta] = None,
+        assigned_user_id: Optional[int] = None,
+        unassign: bool = False,
+    ) -> Optional[TaskListClone]:
+        """Copy the list and its active tasks; None when the source list does not exist.
+
+        The copy takes title, description and owner from ``task_list`` where set, else from the source.
+        Copied tasks are pending when ``reset_status``, have their due dates moved by ``due_date_shift``,
+        and are assigned to ``assigned_user_id`` (or to nobody with ``unassign``) instead of their original assignee.
+        """
+        pass
+
     @abstractmethod
     async def list_all(self) -> List[TaskList]:
         pass
+
+    @abstractmethod
+    async def list_for_user(self, user_id: int) -> List[TaskList]:
+        """Active lists the user owns or has tasks assigned in, by id."""
+        pass
+
+    @abstractmethod
+    async def list_page(self, after_id: int = 0, limit: int = 100) -> List[TaskList]:
+        """Every list (any owner, active or not) with an id above ``after_id``, by id."""
+        pass
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 
-from src.domain.entities.task import Task, TaskPriority, TaskStatus
+from src.domain.entities.task import Task, TaskChanges, TaskPriority, TaskSearchHit, TaskStatus
 
 
 class TaskRepository(ABC):
@@ -13,23 +14,108 @@ class TaskRepository(ABC):
     async def get_by_id(self, task_id: int) -> Optional[Task]:
         pass
 
+    @abstractmethod
+    async def get_by_ids(self, task_ids: List[int]) -> List[Optional[Task]]:
+        """Active tasks in ``task_ids`` order, with None for ids that do not exist (one lookup for the batch)."""
+        pass
+
     @abstractmethod
     async def update(self, task: Task) -> Task:
         pass
 
+    @abstractmethod
+    async def bulk_update(
+        self,
+        changes: TaskChanges,
+        task_ids: Optional[List[int]] = None,
+        task_list_id: Optional[int] = None,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        due_before: Optional[datetime] = None,
+        due_after: Optional[datetime] = None,
+        overdue: bool = False,
+    ) -> List[Tuple[Task, Task]]:
+        """Apply ``changes`` to the active tasks in ``task_ids`` (when given) that match every filter.
+
+        Tasks that already hold the new values are left alone. Returns (before, after) pairs, by id,
+        for the tasks that changed. Raises InvalidTaskListException / InvalidUserException when the
+        target list or assignee does not exist, in which case nothing is updated.
+        """
+        pass
+
     @abstractmethod
     async def delete(self, task_id: int) -> bool:
         pass
 
+    @abstractmethod
+    async def delete_by_task_list_id(self, task_list_id: int, limit: Optional[int] = None) -> int:
+        """Delete the list's tasks, lowest ids first and at most ``limit`` of them. Returns how many were deleted."""
+        pass
+
     @abstractmethod
     async def get_by_task_list_id(self, task_list_id: int) -> List[Task]:
         pass
 
+    @abstractmethod
+    async def count_by_task_list_id(self, task_list_id: int) -> int:
+        pass
+
     @abstractmethod
     async def get_tasks_by_filters(
         self,
         task_list_id: Optional[int] = None,
         status: Optional[TaskStatus] = None,
         priority: Optional[TaskPriority] = None,
+        due_before: Optional[datetime] = None,
+        due_after: Optional[datetime] = None,
+        overdue: bool = False,
+    ) -> List[Task]:
+        """Tasks matching every given filter; due_after is inclusive, due_before exclusive.
+
+        ``overdue`` keeps open tasks (active and not completed) whose due date has passed.
+        """
+        pass
+
+    @abstractmethod
+    async def get_overdue(self, assigned_user_id: Optional[int] = None, limit: int = 100) -> List[Task]:
+        """Open tasks past their due date, most overdue first (then by id)."""
+        pass
+
+    @abstractmethod
+    async def get_assigned(
+        self,
+        assigned_user_id: int,
+        statuses: Optional[List[TaskStatus]] = None,
+        after_priority: Optional[TaskPriority] = None,
+        after_due_date: Optional[datetime] = None,
+        after_id: int = 0,
+        limit: int = 20,
     ) -> List[Task]:
+        """Tasks assigned to the user, highest priority first, then by due date (undated last) and id.
+
+        When ``after_priority`` is set, the page starts after the task at (after_priority, after_due_date, after_id).
+        """
+        pass
+
+    @abstractmethod
+    async def claim(self, task_list_id: int, user_id: int, limit: int = 1) -> List[Task]:
+        """Atomically move up to ``limit`` pending tasks of the list to in progress, assigned to ``user_id``.
+
+        Highest priority is claimed first, then the oldest. Concurrent claimers never get the
+        same task and never wait on each other's claims.
+        """
+        pass
+
+    @abstractmethod
+    async def search(
+        self,
+        query: str,
+        task_list_id: Optional[int] = None,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        after_rank: Optional[float] = None,
+        after_id: int = 0,
+        limit: int = 20,
+    ) -> List[TaskSearchHit]:
+        """Tasks matching ``query`` by rank (highest first) then id, after the (after_rank, after_id) keyset position."""
         pass
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
 
 from src.domain.entities.user import User
 
@@ -13,6 +13,11 @@ class UserRepository(ABC):
     async def get(self, user_id: int) -> Optional[User]:
         pass
 
+    @abstractmethod
+    async def get_by_ids(self, user_ids: List[int]) -> List[Optional[User]]:
+        """Users in ``user_ids`` order, with None for ids that do not exist (one lookup for the batch)."""
+        pass
+
     @abstractmethod
     async def get_by_email(self, email: str) -> Optional[User]:
         pass
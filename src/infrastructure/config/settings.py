@@ -1,3 +1,5 @@
+from typing import Dict, Optional
+
 from pydantic import ConfigDict
 from pydantic_settings import BaseSettings
 
@@ -9,6 +11,9 @@ class Settings(BaseSettings):
     database_url: str
     test_database_url: str
 
+    # Repository backend for tasks, task lists and users: sqlalchemy | memory (no database, for benchmarks and tests)
+    repository_backend: str = "sqlalchemy"
+
     # JWT
     secret_key: str
     algorithm: str
@@ -17,6 +22,106 @@ class Settings(BaseSettings):
     # Email
     email_from: str
     email_enabled: bool
+    email_backend: str = "log"  # log | file | smtp | memory
+    email_file_path: str = "notifications.jsonl"
+    smtp_host: str = "localhost"
+    smtp_port: int = 1025
+
+    # Notification pipeline
+    notification_digest_interval_seconds: float = 60.0
+    notification_max_pending: int = 10000
+    notification_workers: int = 4
+    notification_max_attempts: int = 5
+    notification_retry_base_seconds: float = 0.5
+
+    # Request coalescing (single-flight) for identical concurrent reads
+    single_flight_enabled: bool = True
+    single_flight_timeout_seconds: float = 10.0
+
+    # Admission control (per worker concurrency budgets, adapted from observed latency)
+    admission_control_enabled: bool = True
+    admission_read_limit: int = 64
+    admission_write_limit: int = 32
+    admission_auth_limit: int = 8
+    admission_graphql_limit: int = 32
+    admission_max_queue: int = 128
+    admission_queue_timeout_seconds: float = 2.0
+    admission_latency_target_seconds: float = 0.5
+
+    # Transactional outbox relay; it also hands committed task notifications to the dispatcher of its worker
+    outbox_relay_enabled: bool = True
+    outbox_batch_size: int = 100
+    outbox_poll_interval_seconds: float = 1.0
+    outbox_relay_workers: int = 1
+    # Relayed rows are deleted once processed for longer than the retention window, in batches
+    outbox_purge_enabled: bool = True
+    outbox_retention_hours: float = 24.0
+    outbox_purge_batch_size: int = 1000
+    outbox_purge_batch_sleep_seconds: float = 0.1
+    outbox_purge_interval_seconds: float = 3600.0
+
+    # Delta sync: once caught up, the watermark steps back this far so rows committed late are still picked up
+    sync_rescan_seconds: float = 5.0
+
+    # Idempotency-Key handling for create endpoints
+    idempotency_ttl_seconds: float = 86400.0
+    idempotency_wait_timeout_seconds: float = 30.0
+    idempotency_purge_interval_seconds: float = 3600.0
+    idempotency_purge_batch_size: int = 1000
+
+    # Purge of soft-deleted tasks and task lists: rows inactive for longer than the retention window
+    # are hard-deleted in keyset-ordered batches, pausing between batches to spread WAL and lock load
+    purge_enabled: bool = True
+    purge_retention_days: float = 30.0
+    purge_batch_size: int = 500
+    purge_batch_sleep_seconds: float = 0.1
+    purge_interval_seconds: float = 3600.0
+
+    # Cascade delete of task lists: lists with more active tasks than one chunk are deleted in the
+    # background, one chunk per transaction
+    cascade_delete_chunk_size: int = 1000
+    cascade_delete_chunk_sleep_seconds: float = 0.05
+
+    # SQL observability: statement echo, sampled logging, slow query log and EXPLAIN capture
+    sql_echo: bool = False
+    sql_log_sample_rate: float = 0.0
+    sql_slow_query_threshold_ms: float = 200.0
+    sql_explain_slow_queries: bool = False
+    sql_explain_cooldown_seconds: float = 300.0
+    sql_max_fingerprints: int = 2000
+    sql_top_queries_limit: int = 100
+
+    # Request tracing (W3C traceparent in and out; spans exported as OTLP/JSON lines)
+    tracing_enabled: bool = False
+    tracing_sample_rate: float = 0.01
+    tracing_exporter: str = "file"  # file | memory
+    tracing_file_path: str = "traces.jsonl"
+    tracing_service_name: str = "task-manager-api"
+
+    # /api/admin routes (on top of a login) and /api/metrics require X-Admin-Token: <admin_token>; unset keeps them closed
+    admin_token: Optional[str] = None
+
+    # On-demand request profiling: requests sending X-Profile: <profiler_token>, plus a sampled fraction
+    profiler_enabled: bool = False
+    profiler_token: Optional[str] = None
+    profiler_sample_rate: float = 0.0
+    profiler_interval_ms: float = 5.0
+    profiler_format: str = "collapsed"  # collapsed | speedscope
+    profiler_directory: str = "profiles"
+    profiler_max_files: int = 50
+
+    # Event loop lag monitor; in debug mode the stack of any callback blocking past the threshold is logged
+    loop_monitor_enabled: bool = True
+    loop_monitor_interval_seconds: float = 0.1
+    loop_monitor_block_threshold_seconds: float = 0.1
+    loop_monitor_debug: bool = False
+
+    # Structured logging: JSON lines on stdout written by a listener thread; per-logger levels and keep rates as JSON maps
+    log_level: str = "INFO"
+    log_format: str = "json"  # json | text
+    log_levels: Dict[str, str] = {}
+    log_sampling: Dict[str, float] = {}
+    log_queue_size: int = 10000
 
 
 # Global settings instance
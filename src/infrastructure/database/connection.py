@@ -1,18 +1,46 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 
 from src.infrastructure.config.settings import settings
+from src.infrastructure.observability.query_log import query_log
 
 Base = declarative_base()
 
+_engine: Optional[AsyncEngine] = None
+_session_factory: Optional[sessionmaker] = None
+
+
+def create_engine() -> AsyncEngine:
+    engine = create_async_engine(settings.database_url, echo=settings.sql_echo)
+    query_log.attach(engine)
+    return engine
+
 
-def create_engine():
-    return create_async_engine(settings.database_url, echo=True)
+def get_engine() -> AsyncEngine:
+    """Process-wide engine, so every session shares one connection pool."""
+    global _engine
+    if _engine is None:
+        _engine = create_engine()
+    return _engine
 
 
 def get_session_factory():
-    engine = create_engine()
-    return sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    global _session_factory
+    if _session_factory is None:
+        _session_factory = sessionmaker(get_engine(), class_=AsyncSession, expire_on_commit=False)
+    return _session_factory
+
+
+async def dispose_engine() -> None:
+    global _engine, _session_factory
+    if query_log.explainer is not None:
+        await query_log.explainer.close()
+    if _engine is not None:
+        await _engine.dispose()
+    _engine = None
+    _session_factory = None
 
 
 async def get_db_session() -> AsyncSession:
@@ -1,12 +1,49 @@
+from src.domain.entities.idempotency_record import IdempotencyRecord
+from src.domain.entities.outbox_event import OutboxEvent
 from src.domain.entities.task import Task
 from src.domain.entities.task_list import TaskList
+from src.domain.entities.tombstone import Tombstone
 from src.domain.entities.user import User
+from src.infrastructure.database.models.idempotency_key_model import IdempotencyKeyModel
+from src.infrastructure.database.models.outbox_event_model import OutboxEventModel
 from src.infrastructure.database.models.task_list_model import TaskListModel
 from src.infrastructure.database.models.task_model import TaskModel
+from src.infrastructure.database.models.tombstone_model import TombstoneModel
 from src.infrastructure.database.models.user_model import UserModel
 
+# Column selections in dataclass field order, so a Core row converts with ``Entity(*row)``.
+# Reading plain rows skips ORM instance construction and the identity map on bulk reads.
+TASK_LIST_COLUMNS = (
+    TaskListModel.title,
+    TaskListModel.id,
+    TaskListModel.description,
+    TaskListModel.user_id,
+    TaskListModel.is_active,
+    TaskListModel.created_at,
+    TaskListModel.updated_at,
+)
+
+TASK_COLUMNS = (
+    TaskModel.title,
+    TaskModel.task_list_id,
+    TaskModel.id,
+    TaskModel.description,
+    TaskModel.status,
+    TaskModel.priority,
+    TaskModel.assigned_user_id,
+    TaskModel.due_date,
+    TaskModel.is_active,
+    TaskModel.created_at,
+    TaskModel.updated_at,
+)
+
 
 class TaskListMapper:
+    @staticmethod
+    def from_row(row) -> TaskList:
+        """Build the entity from a row selected with ``TASK_LIST_COLUMNS``."""
+        return TaskList(*row)
+
     @staticmethod
     def to_domain(model: TaskListModel) -> TaskList:
         return TaskList(
@@ -63,6 +100,11 @@ def user_to_model(entity: User) -> UserModel:
 
 
 class TaskMapper:
+    @staticmethod
+    def from_row(row) -> Task:
+        """Build the entity from a row selected with ``TASK_COLUMNS``."""
+        return Task(*row)
+
     @staticmethod
     def to_domain(model: TaskModel) -> Task:
         return Task(
@@ -94,3 +136,52 @@ class TaskMapper:
             created_at=entity.created_at,
             updated_at=entity.updated_at,
         )
+
+
+class TombstoneMapper:
+    @staticmethod
+    def to_domain(model: TombstoneModel) -> Tombstone:
+        return Tombstone(
+            id=model.id,
+            entity_type=model.entity_type,
+            entity_id=model.entity_id,
+            deleted_at=model.deleted_at,
+        )
+
+    @staticmethod
+    def to_model(entity: Tombstone) -> TombstoneModel:
+        return TombstoneModel(
+            id=entity.id,
+            entity_type=entity.entity_type,
+            entity_id=entity.entity_id,
+            deleted_at=entity.deleted_at,
+        )
+
+
+class OutboxEventMapper:
+    @staticmethod
+    def to_domain(model: OutboxEventModel) -> OutboxEvent:
+        return OutboxEvent(
+            id=model.id,
+            aggregate_type=model.aggregate_type,
+            aggregate_id=model.aggregate_id,
+            event_type=model.event_type,
+            payload=model.payload,
+            created_at=model.created_at,
+            processed_at=model.processed_at,
+        )
+
+
+class IdempotencyRecordMapper:
+    @staticmethod
+    def to_domain(model: IdempotencyKeyModel) -> IdempotencyRecord:
+        return IdempotencyRecord(
+            user_id=model.user_id,
+            key=model.key,
+            scope=model.scope,
+            request_hash=model.request_hash,
+            status_code=model.status_code,
+            response_body=model.response_body,
+            expires_at=model.expires_at,
+            created_at=model.created_at,
+        )
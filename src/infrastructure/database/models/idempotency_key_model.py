@@ -0,0 +1,19 @@
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, SmallInteger, String
+
+from src.infrastructure.database.connection import Base
+from src.infrastructure.utils.datetime_utils import utc_now
+
+
+class IdempotencyKeyModel(Base):
+    __tablename__ = "idempotency_keys"
+    __table_args__ = (Index("ix_idempotency_keys_expires_at", "expires_at"),)
+
+    # Keys are namespaced per user so clients cannot collide with (or read) each other's responses
+    user_id = Column(Integer, primary_key=True)
+    key = Column(String(255), primary_key=True)
+    scope = Column(String(100), nullable=False)
+    request_hash = Column(String(64), nullable=False)
+    status_code = Column(SmallInteger, nullable=False)
+    response_body = Column(JSON, nullable=False)
+    created_at = Column(DateTime, default=utc_now, nullable=False)
+    expires_at = Column(DateTime, nullable=False)
@@ -0,0 +1,20 @@
+from sqlalchemy import JSON, BigInteger, Column, DateTime, Index, Integer, String, text
+
+from src.infrastructure.database.connection import Base
+from src.infrastructure.utils.datetime_utils import utc_now
+
+
+class OutboxEventModel(Base):
+    __tablename__ = "outbox"
+    __table_args__ = (
+        # Keeps the relay's claim query cheap no matter how many processed rows accumulate
+        Index("ix_outbox_unprocessed", "id", postgresql_where=text("processed_at IS NULL")),
+    )
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    aggregate_type = Column(String(50), nullable=False)
+    aggregate_id = Column(Integer, nullable=False)
+    event_type = Column(String(100), nullable=False)
+    payload = Column(JSON, nullable=False)
+    created_at = Column(DateTime, default=utc_now, nullable=False)
+    processed_at = Column(DateTime, nullable=True)
@@ -1,11 +1,18 @@
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String, text
 
 from src.infrastructure.database.connection import Base
+from src.infrastructure.database.models.task_model import ACTIVE_SQL, INACTIVE_SQL
 from src.infrastructure.utils.datetime_utils import utc_now
 
 
 class TaskListModel(Base):
     __tablename__ = "task_lists"
+    __table_args__ = (
+        Index("ix_task_lists_updated_at_id", "updated_at", "id", postgresql_where=text(ACTIVE_SQL)),
+        Index("ix_task_lists_inactive_updated_at_id", "updated_at", "id", postgresql_where=text(INACTIVE_SQL)),
+        # Serves "my lists": equality on owner and active flag, rows already in id order
+        Index("ix_task_lists_user_active_id", "user_id", "is_active", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(255), nullable=False)
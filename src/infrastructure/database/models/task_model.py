@@ -1,12 +1,44 @@
-from sqlalchemy import Boolean, Column, DateTime, Enum, ForeignKey, Integer, String
+from sqlalchemy import Boolean, Column, Computed, DateTime, Enum, ForeignKey, Index, Integer, String, and_, literal_column, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred
 
 from src.domain.entities.task import TaskPriority, TaskStatus
 from src.infrastructure.database.connection import Base
 from src.infrastructure.utils.datetime_utils import utc_now
+from src.infrastructure.utils.text_search import SEARCH_CONFIG
+
+# Title terms weigh A and description terms B, so ts_rank scores title matches higher
+SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')"
+)
+# Predicate of the partial due-date indexes: only open tasks are ever overdue, and they are a
+# small, shrinking fraction of the table
+OPEN_TASK_SQL = "status <> 'COMPLETED' AND is_active"
+# Predicate of the claim queue index: only pending tasks can be claimed
+PENDING_TASK_SQL = "status = 'PENDING' AND is_active"
+# Deletes are soft: reads only ever see active rows, so their indexes leave the rest out, and the
+# purge job finds inactive rows through an index of their own
+ACTIVE_SQL = "is_active"
+INACTIVE_SQL = "NOT is_active"
 
 
 class TaskModel(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_updated_at_id", "updated_at", "id", postgresql_where=text(ACTIVE_SQL)),
+        Index("ix_tasks_inactive_updated_at_id", "updated_at", "id", postgresql_where=text(INACTIVE_SQL)),
+        Index("ix_tasks_active_task_list_id", "task_list_id", "id", postgresql_where=text(ACTIVE_SQL)),
+        Index("ix_tasks_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_tasks_title_trgm", "title", postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}),
+        Index("ix_tasks_open_due_date", "due_date", postgresql_where=text(OPEN_TASK_SQL)),
+        Index("ix_tasks_open_assignee_due_date", "assigned_user_id", "due_date", postgresql_where=text(OPEN_TASK_SQL)),
+        # Lists a user has assigned tasks in, read from the index alone
+        Index("ix_tasks_assigned_user_task_list", "assigned_user_id", "task_list_id", postgresql_where=text(ACTIVE_SQL)),
+        Index("ix_tasks_pending_claim_queue", "task_list_id", text("priority DESC"), "created_at", "id", postgresql_where=text(PENDING_TASK_SQL)),
+        # Covers the assigned-to-me queue: filter, order and keyset columns all live in the index
+        Index("ix_tasks_assignee_queue", "assigned_user_id", "status", text("priority DESC"), "due_date", "id", postgresql_where=text(ACTIVE_SQL)),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(255), nullable=False)
@@ -19,3 +51,12 @@ class TaskModel(Base):
     is_active = Column(Boolean, default=True, nullable=False)
     created_at = Column(DateTime, default=utc_now)
     updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
+    # Maintained by PostgreSQL; deferred so loading a task never ships the vector
+    search_vector = deferred(Column(TSVECTOR, Computed(SEARCH_VECTOR_SQL, persisted=True)))
+
+
+# OPEN_TASK_SQL as a column expression for queries. The status is a literal rather than a bound
+# parameter: PostgreSQL only uses a partial index when it can prove the query implies the index
+# predicate, which it cannot do for a parameter under a generic prepared-statement plan
+OPEN_TASK = and_(TaskModel.status != literal_column("'COMPLETED'"), TaskModel.is_active)
+PENDING_TASK = and_(TaskModel.status == literal_column("'PENDING'"), TaskModel.is_active)
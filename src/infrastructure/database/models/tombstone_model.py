@@ -0,0 +1,15 @@
+from sqlalchemy import Column, DateTime, Enum, Index, Integer
+
+from src.domain.entities.tombstone import SyncEntityType
+from src.infrastructure.database.connection import Base
+from src.infrastructure.utils.datetime_utils import utc_now
+
+
+class TombstoneModel(Base):
+    __tablename__ = "sync_tombstones"
+    __table_args__ = (Index("ix_sync_tombstones_deleted_at_id", "deleted_at", "id"),)
+
+    id = Column(Integer, primary_key=True)
+    entity_type = Column(Enum(SyncEntityType), nullable=False)
+    entity_id = Column(Integer, nullable=False)
+    deleted_at = Column(DateTime, default=utc_now, nullable=False)
@@ -0,0 +1,339 @@
+"""Bulk seed data generator.
+
+Generates deterministic, production-shaped data and loads it with asyncpg binary COPY
+(``copy_records_to_table``) over a pool of connections, one chunk per COPY:
+
+    python -m src.infrastructure.database.seed --users 10000 --lists 200000 --tasks 20000000
+
+Shape of the data:
+
+* list sizes follow a Pareto distribution, so a few lists hold most tasks and many are small or empty
+* list owners and task assignees are skewed towards a minority of heavy users
+* status and priority follow fixed weights, and 60% of tasks have a due date in a window around ``--anchor``
+
+The same ``--seed`` and ``--anchor`` always produce the same rows, independent of ``--workers``.
+Secondary indexes and foreign keys on the seeded tables are dropped for the load and rebuilt
+afterwards, which is much cheaper than maintaining them row by row. Unique indexes and
+primary keys stay in place.
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from bisect import bisect_right
+from datetime import date, datetime, timedelta, timezone
+from itertools import accumulate
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import asyncpg
+from passlib.context import CryptContext
+
+from src.infrastructure.config.settings import settings
+
+SEEDED_TABLES = ("users", "task_lists", "tasks")
+
+USER_COLUMNS = ("id", "email", "username", "hashed_password", "is_active", "created_at", "updated_at")
+TASK_LIST_COLUMNS = ("id", "title", "description", "user_id", "is_active", "created_at", "updated_at")
+TASK_COLUMNS = (
+    "id",
+    "title",
+    "description",
+    "task_list_id",
+    "status",
+    "priority",
+    "assigned_user_id",
+    "due_date",
+    "is_active",
+    "created_at",
+    "updated_at",
+)
+
+# Enum labels as stored by SQLAlchemy (member names), with their relative frequency
+STATUS_WEIGHTS = {"PENDING": 30, "IN_PROGRESS": 15, "COMPLETED": 55}
+PRIORITY_WEIGHTS = {"LOW": 30, "MEDIUM": 50, "HIGH": 20}
+
+ASSIGNED_RATIO = 0.7
+DUE_DATE_RATIO = 0.6
+DUE_DATE_WINDOW_DAYS = (-60, 120)
+HISTORY_DAYS = 365
+LIST_SIZE_ALPHA = 1.16  # Pareto shape giving roughly an 80/20 split
+USER_ACTIVITY_ALPHA = 1.5
+
+TASK_VERBS = ("Review", "Update", "Fix", "Write", "Plan", "Deploy", "Test", "Refactor", "Document", "Design")
+TASK_OBJECTS = ("report", "API", "dashboard", "invoice", "migration", "release notes", "onboarding", "backlog", "budget", "roadmap")
+LIST_NAMES = ("Sprint", "Backlog", "Personal", "Team", "Project", "Errands", "Marketing", "Support", "Research", "Ops")
+
+
+def chunk_rng(seed: int, table: str, chunk_index: int) -> random.Random:
+    # Seeding per chunk keeps output identical however chunks are scheduled across workers
+    return random.Random(f"{seed}:{table}:{chunk_index}")
+
+
+def skewed_cum_weights(count: int, alpha: float, rng: random.Random) -> List[float]:
+    return list(accumulate(rng.paretovariate(alpha) for _ in range(count)))
+
+
+def list_sizes(lists: int, tasks: int, seed: int) -> List[int]:
+    """Split ``tasks`` over ``lists`` with Pareto-distributed sizes that sum exactly to ``tasks``."""
+    if lists <= 0:
+        return []
+    rng = random.Random(f"{seed}:list_sizes")
+    weights = [rng.paretovariate(LIST_SIZE_ALPHA) for _ in range(lists)]
+    total = sum(weights)
+    sizes = [int(weight * tasks / total) for weight in weights]
+    for index in range(tasks - sum(sizes)):
+        sizes[index % lists] += 1
+    return sizes
+
+
+class SeedPlan:
+    """Id ranges and distributions shared by every chunk generator."""
+
+    def __init__(self, users: int, lists: int, tasks: int, seed: int, anchor: datetime, id_offsets: Dict[str, int], password_hash: str):
+        self.users = users
+        self.lists = lists
+        self.tasks = tasks
+        self.seed = seed
+        self.anchor = anchor
+        self.user_offset = id_offsets.get("users", 0)
+        self.list_offset = id_offsets.get("task_lists", 0)
+        self.task_offset = id_offsets.get("tasks", 0)
+        self.password_hash = password_hash
+
+        rng = random.Random(f"{seed}:plan")
+        self.user_cum_weights = skewed_cum_weights(users, USER_ACTIVITY_ALPHA, rng)
+        self.sizes = list_sizes(lists, tasks, seed)
+        # First task index of each list; a task chunk finds its starting list with one bisect
+        self.list_starts = [0] + list(accumulate(self.sizes))[:-1] if self.sizes else []
+
+    def user_ids(self, rng: random.Random, k: int) -> List[int]:
+        indexes = rng.choices(range(self.users), cum_weights=self.user_cum_weights, k=k)
+        return [self.user_offset + index + 1 for index in indexes]
+
+    def _timestamps(self, rng: random.Random) -> Tuple[datetime, datetime]:
+        created_at = self.anchor - timedelta(seconds=rng.uniform(0, HISTORY_DAYS * 86400))
+        updated_at = min(self.anchor, created_at + timedelta(seconds=rng.expovariate(1 / (7 * 86400))))
+        return created_at, updated_at
+
+    def user_records(self, start: int, stop: int) -> List[tuple]:
+        rng = chunk_rng(self.seed, "users", start)
+        records = []
+        for index in range(start, stop):
+            user_id = self.user_offset + index + 1
+            created_at, updated_at = self._timestamps(rng)
+            records.append(
+                (
+                    user_id,
+                    f"seed{user_id}@example.com",
+                    f"seed_{user_id}",
+                    self.password_hash,
+                    True,
+                    created_at.replace(tzinfo=timezone.utc),
+                    updated_at.replace(tzinfo=timezone.utc),
+                )
+            )
+        return records
+
+    def task_list_records(self, start: int, stop: int) -> List[tuple]:
+        rng = chunk_rng(self.seed, "task_lists", start)
+        owners = self.user_ids(rng, stop - start) if self.users else [None] * (stop - start)
+        records = []
+        for offset, index in enumerate(range(start, stop)):
+            created_at, updated_at = self._timestamps(rng)
+            records.append(
+                (
+                    self.list_offset + index + 1,
+                    f"{rng.choice(LIST_NAMES)} {index + 1}",
+                    None if rng.random() < 0.5 else f"Seeded list with {self.sizes[index]} tasks",
+                    owners[offset],
+                    True,
+                    created_at,
+                    updated_at,
+                )
+            )
+        return records
+
+    def task_records(self, start: int, stop: int) -> List[tuple]:
+        rng = chunk_rng(self.seed, "tasks", start)
+        count = stop - start
+        statuses = rng.choices(list(STATUS_WEIGHTS), weights=list(STATUS_WEIGHTS.values()), k=count)
+        priorities = rng.choices(list(PRIORITY_WEIGHTS), weights=list(PRIORITY_WEIGHTS.values()), k=count)
+        assignees = self.user_ids(rng, count) if self.users else [None] * count
+
+        list_index = bisect_right(self.list_starts, start) - 1
+        list_end = self.list_starts[list_index] + self.sizes[list_index]
+        anchor_day = datetime.combine(self.anchor.date(), datetime.min.time())
+        records = []
+        for offset, index in enumerate(range(start, stop)):
+            while index >= list_end:
+                list_index += 1
+                list_end += self.sizes[list_index]
+            created_at, updated_at = self._timestamps(rng)
+            due_date = None
+            if rng.random() < DUE_DATE_RATIO:
+                due_date = anchor_day + timedelta(days=rng.randint(*DUE_DATE_WINDOW_DAYS), hours=rng.choice((9, 12, 17, 23)))
+            records.append(
+                (
+                    self.task_offset + index + 1,
+                    f"{rng.choice(TASK_VERBS)} {rng.choice(TASK_OBJECTS)} #{index + 1}",
+                    None if rng.random() < 0.4 else "Generated by the seed script",
+                    self.list_offset + list_index + 1,
+                    statuses[offset],
+                    priorities[offset],
+                    assignees[offset] if rng.random() < ASSIGNED_RATIO else None,
+                    due_date,
+                    True,
+                    created_at,
+                    updated_at,
+                )
+            )
+        return records
+
+
+def asyncpg_dsn(database_url: str) -> str:
+    return database_url.replace("postgresql+asyncpg://", "postgresql://", 1)
+
+
+async def drop_secondary_indexes(connection: asyncpg.Connection, tables: Sequence[str]) -> List[str]:
+    """Drop non-unique indexes that do not back a constraint. Returns their definitions."""
+    rows = await connection.fetch(
+        """
+        SELECT i.relname AS name, pg_get_indexdef(ix.indexrelid) AS definition
+        FROM pg_index ix
+        JOIN pg_class i ON i.oid = ix.indexrelid
+        JOIN pg_class t ON t.oid = ix.indrelid
+        JOIN pg_namespace n ON n.oid = t.relnamespace
+        WHERE n.nspname = current_schema() AND t.relname = ANY($1::text[])
+          AND NOT ix.indisunique AND NOT ix.indisprimary
+          AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = ix.indexrelid)
+        """,
+        list(tables),
+    )
+    for row in rows:
+        await connection.execute(f'DROP INDEX IF EXISTS "{row["name"]}"')
+    return [row["definition"] for row in rows]
+
+
+async def drop_foreign_keys(connection: asyncpg.Connection, tables: Sequence[str]) -> List[Tuple[str, str, str]]:
+    """Drop foreign keys on the seeded tables. Returns (table, name, definition) to restore them."""
+    rows = await connection.fetch(
+        """
+        SELECT t.relname AS table_name, c.conname AS name, pg_get_constraintdef(c.oid) AS definition
+        FROM pg_constraint c
+        JOIN pg_class t ON t.oid = c.conrelid
+        JOIN pg_namespace n ON n.oid = t.relnamespace
+        WHERE n.nspname = current_schema() AND c.contype = 'f' AND t.relname = ANY($1::text[])
+        """,
+        list(tables),
+    )
+    for row in rows:
+        await connection.execute(f'ALTER TABLE "{row["table_name"]}" DROP CONSTRAINT "{row["name"]}"')
+    return [(row["table_name"], row["name"], row["definition"]) for row in rows]
+
+
+async def restore_schema(pool: asyncpg.Pool, index_definitions: List[str], foreign_keys: List[Tuple[str, str, str]]) -> None:
+    async def build_index(definition: str) -> None:
+        async with pool.acquire() as connection:
+            await connection.execute("SET maintenance_work_mem = '512MB'")
+            await connection.execute(definition)
+
+    # Index builds on different tables/columns are independent, so run them side by side
+    await asyncio.gather(*(build_index(definition) for definition in index_definitions))
+    async with pool.acquire() as connection:
+        for table, name, definition in foreign_keys:
+            # NOT VALID + VALIDATE checks existing rows in one pass without blocking writers for the whole scan
+            await connection.execute(f'ALTER TABLE "{table}" ADD CONSTRAINT "{name}" {definition} NOT VALID')
+            await connection.execute(f'ALTER TABLE "{table}" VALIDATE CONSTRAINT "{name}"')
+
+
+async def copy_table(pool: asyncpg.Pool, table: str, columns: Sequence[str], total: int, chunk_size: int, generate, workers: int) -> float:
+    semaphore = asyncio.Semaphore(workers)
+
+    async def load_chunk(start: int) -> None:
+        async with semaphore:
+            records = generate(start, min(start + chunk_size, total))
+            async with pool.acquire() as connection:
+                await connection.copy_records_to_table(table, records=records, columns=columns)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(load_chunk(start) for start in range(0, total, chunk_size)))
+    return time.perf_counter() - started
+
+
+async def seed(
+    database_url: str,
+    users: int,
+    lists: int,
+    tasks: int,
+    seed_value: int = 42,
+    anchor: Optional[datetime] = None,
+    chunk_size: int = 50000,
+    workers: int = 4,
+    keep_indexes: bool = False,
+) -> dict:
+    if tasks and not lists:
+        raise ValueError("Tasks need at least one task list")
+    anchor = anchor or datetime.combine(date.today(), datetime.min.time())
+    pool = await asyncpg.create_pool(asyncpg_dsn(database_url), min_size=workers, max_size=workers + 1)
+    try:
+        async with pool.acquire() as connection:
+            id_offsets = {table: await connection.fetchval(f"SELECT COALESCE(MAX(id), 0) FROM {table}") for table in SEEDED_TABLES}
+            index_definitions: List[str] = []
+            foreign_keys: List[Tuple[str, str, str]] = []
+            if not keep_indexes:
+                index_definitions = await drop_secondary_indexes(connection, SEEDED_TABLES)
+                foreign_keys = await drop_foreign_keys(connection, SEEDED_TABLES)
+
+        plan = SeedPlan(users, lists, tasks, seed_value, anchor, id_offsets, CryptContext(schemes=["bcrypt"]).hash("password123"))
+        timings = {}
+        try:
+            timings["users"] = await copy_table(pool, "users", USER_COLUMNS, users, chunk_size, plan.user_records, workers)
+            timings["task_lists"] = await copy_table(pool, "task_lists", TASK_LIST_COLUMNS, lists, chunk_size, plan.task_list_records, workers)
+            timings["tasks"] = await copy_table(pool, "tasks", TASK_COLUMNS, tasks, chunk_size, plan.task_records, workers)
+        finally:
+            started = time.perf_counter()
+            await restore_schema(pool, index_definitions, foreign_keys)
+            timings["rebuild_indexes"] = time.perf_counter() - started
+
+        async with pool.acquire() as connection:
+            for table in SEEDED_TABLES:
+                await connection.execute(f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), (SELECT COALESCE(MAX(id), 1) FROM {table}))")
+                await connection.execute(f"ANALYZE {table}")
+    finally:
+        await pool.close()
+
+    load_seconds = timings["users"] + timings["task_lists"] + timings["tasks"]
+    rows = users + lists + tasks
+    return {
+        "rows": {"users": users, "task_lists": lists, "tasks": tasks},
+        "seconds": {name: round(value, 2) for name, value in timings.items()},
+        "rows_per_minute": round(rows / load_seconds * 60) if load_seconds else None,
+        "rows_per_minute_including_indexes": round(rows / (load_seconds + timings["rebuild_indexes"]) * 60) if rows else None,
+        "indexes_rebuilt": len(index_definitions),
+        "foreign_keys_revalidated": len(foreign_keys),
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Bulk-load deterministic seed data with COPY")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--lists", type=int, default=10000)
+    parser.add_argument("--tasks", type=int, default=1000000)
+    parser.add_argument("--seed", type=int, default=42, help="Same seed and anchor produce the same rows")
+    parser.add_argument("--anchor", type=date.fromisoformat, help="Date that timestamps and due dates are generated around (default: today)")
+    parser.add_argument("--chunk-size", type=int, default=50000, help="Rows per COPY")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent COPY connections")
+    parser.add_argument("--keep-indexes", action="store_true", help="Load with secondary indexes and foreign keys in place")
+    parser.add_argument("--database-url", default=settings.database_url)
+    args = parser.parse_args(argv)
+
+    anchor = datetime.combine(args.anchor, datetime.min.time()) if args.anchor else None
+    report = asyncio.run(
+        seed(args.database_url, args.users, args.lists, args.tasks, args.seed, anchor, args.chunk_size, args.workers, args.keep_indexes)
+    )
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session
+
+# True while a session in the current task holds writes it has not committed yet. AsyncSession runs
+# these sync events in a greenlet sharing the task's context, so the flag is visible to the task.
+_uncommitted_writes: ContextVar[bool] = ContextVar("uncommitted_writes", default=False)
+
+
+def has_uncommitted_writes() -> bool:
+    """Whether reads in this task must see writes no other session can see yet."""
+    return _uncommitted_writes.get()
+
+
+@event.listens_for(Session, "after_flush")
+def _after_flush(session: Session, flush_context) -> None:
+    _uncommitted_writes.set(True)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _after_statement(state: ORMExecuteState) -> None:
+    # INSERT/UPDATE/DELETE statements executed directly, which never go through a flush
+    if not state.is_select:
+        _uncommitted_writes.set(True)
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _after_transaction(session: Session) -> None:
+    _uncommitted_writes.set(False)
@@ -0,0 +1,76 @@
+import asyncio
+import json
+import logging
+import smtplib
+from email.message import EmailMessage as MIMEEmailMessage
+from pathlib import Path
+from typing import List
+
+from src.domain.entities.notification import EmailMessage
+from src.domain.outputs.email_sender import EmailSender
+from src.infrastructure.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class LoggingEmailSender(EmailSender):
+    """Simulated delivery: the email is only written to the application log."""
+
+    async def send(self, message: EmailMessage) -> None:
+        logger.info("Simulated email to %s: %s", message.to, message.subject)
+
+
+class FileEmailSender(EmailSender):
+    """Appends each email as a JSON line, useful as a sink in tests and local runs."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+
+    async def send(self, message: EmailMessage) -> None:
+        line = json.dumps({"to": message.to, "from": message.sender, "subject": message.subject, "body": message.body})
+        await asyncio.to_thread(self._append, line)
+
+    def _append(self, line: str) -> None:
+        with self.path.open("a", encoding="utf-8") as handle:
+            handle.write(line + "\n")
+
+
+class InMemoryEmailSender(EmailSender):
+    def __init__(self):
+        self.sent: List[EmailMessage] = []
+
+    async def send(self, message: EmailMessage) -> None:
+        self.sent.append(message)
+
+
+class SMTPEmailSender(EmailSender):
+    """Plain SMTP delivery, e.g. against a local stand-in such as MailHog on port 1025."""
+
+    def __init__(self, host: str, port: int, timeout: float = 10.0):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+
+    async def send(self, message: EmailMessage) -> None:
+        # smtplib is blocking; keep it off the event loop
+        await asyncio.to_thread(self._send, message)
+
+    def _send(self, message: EmailMessage) -> None:
+        mime = MIMEEmailMessage()
+        mime["From"] = message.sender or settings.email_from
+        mime["To"] = message.to
+        mime["Subject"] = message.subject
+        mime.set_content(message.body)
+        with smtplib.SMTP(self.host, self.port, timeout=self.timeout) as client:
+            client.send_message(mime)
+
+
+def create_email_sender() -> EmailSender:
+    backend = settings.email_backend.lower()
+    if backend == "file":
+        return FileEmailSender(settings.email_file_path)
+    if backend == "smtp":
+        return SMTPEmailSender(settings.smtp_host, settings.smtp_port)
+    if backend == "memory":
+        return InMemoryEmailSender()
+    return LoggingEmailSender()
@@ -0,0 +1,67 @@
+import asyncio
+import logging
+from typing import Optional
+
+from src.infrastructure.config.settings import settings
+from src.infrastructure.database.connection import get_session_factory
+from src.infrastructure.observability.metrics import metrics
+from src.infrastructure.repositories.sqlalchemy_idempotency_repository import SQLAlchemyIdempotencyRepository
+from src.infrastructure.utils.datetime_utils import utc_now
+
+logger = logging.getLogger(__name__)
+
+
+class IdempotencyKeyPurger:
+    """Deletes expired idempotency records in small batches so the table stays compact."""
+
+    def __init__(self, session_factory, interval: float = 3600.0, batch_size: int = 1000):
+        self.session_factory = session_factory
+        self.interval = interval
+        self.batch_size = batch_size
+        self._task: Optional[asyncio.Task] = None
+        self._purged = metrics.counter("idempotency_keys_purged_total")
+
+    async def purge_once(self) -> int:
+        total = 0
+        while True:
+            # One short transaction per batch keeps row locks brief
+            async with self.session_factory() as session:
+                purged = await SQLAlchemyIdempotencyRepository(session).purge_expired(utc_now(), self.batch_size)
+                await session.commit()
+            total += purged
+            self._purged.inc(purged)
+            if purged < self.batch_size:
+                return total
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.purge_once()
+            except Exception:
+                logger.exception("Idempotency key purge failed")
+            await asyncio.sleep(self.interval)
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+
+_purger: Optional[IdempotencyKeyPurger] = None
+
+
+def get_idempotency_purger() -> IdempotencyKeyPurger:
+    global _purger
+    if _purger is None:
+        _purger = IdempotencyKeyPurger(
+            get_session_factory(),
+            interval=settings.idempotency_purge_interval_seconds,
+            batch_size=settings.idempotency_purge_batch_size,
+        )
+    return _purger
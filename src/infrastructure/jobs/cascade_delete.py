@@ -0,0 +1,106 @@
+import asyncio
+import logging
+from dataclasses import replace
+from datetime import timedelta
+from typing import Callable, Dict, Optional
+
+from src.application.dtos.task_list_deletion_dto import TaskListDeletionDTO
+from src.application.use_cases.task_list.task_list_service import TaskListService
+from src.domain.exceptions.task_list_exceptions import TaskListHasTasksException
+from src.infrastructure.config.settings import settings
+from src.infrastructure.database.connection import get_session_factory
+from src.infrastructure.observability.metrics import metrics
+from src.infrastructure.utils.datetime_utils import utc_now
+
+logger = logging.getLogger(__name__)
+
+ServiceBuilder = Callable[[object], TaskListService]
+
+
+class CascadeDeleteRunner:
+    """Deletes very large task lists in the background, one chunk of tasks per transaction.
+
+    Each chunk is a single set-based statement over at most ``chunk_size`` tasks and commits on
+    its own, so row locks are held briefly and other writers to the list are never blocked for
+    long. The list itself goes in the same transaction as the last chunk. Progress is kept per
+    list in this process and survives the job for ``keep_finished`` so clients can poll it.
+    """
+
+    def __init__(self, session_factory, chunk_size: int = 1000, chunk_sleep: float = 0.05, keep_finished: timedelta = timedelta(hours=1)):
+        self.session_factory = session_factory
+        self.chunk_size = chunk_size
+        self.chunk_sleep = chunk_sleep
+        self.keep_finished = keep_finished
+        self._jobs: Dict[int, TaskListDeletionDTO] = {}
+        self._tasks: Dict[int, asyncio.Task] = {}
+        self._deleted = metrics.counter("cascade_deleted_tasks_total")
+
+    def start(self, task_list_id: int, tasks_total: int, build_service: ServiceBuilder) -> TaskListDeletionDTO:
+        """Start deleting the list, or return the deletion already running for it."""
+        self._prune()
+        job = self._jobs.get(task_list_id)
+        if job is None or job.status != "running":
+            job = TaskListDeletionDTO(task_list_id=task_list_id, status="running", tasks_total=tasks_total, started_at=utc_now())
+            self._jobs[task_list_id] = job
+            self._tasks[task_list_id] = asyncio.create_task(self._run(job, build_service))
+        return replace(job)
+
+    def get(self, task_list_id: int) -> Optional[TaskListDeletionDTO]:
+        job = self._jobs.get(task_list_id)
+        return replace(job) if job else None
+
+    async def _run(self, job: TaskListDeletionDTO, build_service: ServiceBuilder) -> None:
+        try:
+            while not await self._delete_chunk(job, build_service):
+                await asyncio.sleep(self.chunk_sleep)
+            job.status = "completed"
+        except Exception as e:
+            logger.exception("Cascade delete failed", extra={"task_list_id": job.task_list_id})
+            job.status, job.error = "failed", str(e)
+        finally:
+            job.finished_at = utc_now()
+            self._tasks.pop(job.task_list_id, None)
+
+    async def _delete_chunk(self, job: TaskListDeletionDTO, build_service: ServiceBuilder) -> bool:
+        """Delete one chunk; returns True once the list itself is gone."""
+        async with self.session_factory() as session:
+            service = build_service(session)
+            deleted = await service.delete_tasks(job.task_list_id, self.chunk_size)
+            finished = False
+            if deleted < self.chunk_size:
+                try:
+                    await service.delete(job.task_list_id)
+                    finished = True
+                except TaskListHasTasksException:
+                    # Tasks were added while the job ran; take another pass
+                    pass
+            await session.commit()
+        job.tasks_deleted += deleted
+        self._deleted.inc(deleted)
+        return finished
+
+    def _prune(self) -> None:
+        cutoff = utc_now() - self.keep_finished
+        for task_list_id, job in list(self._jobs.items()):
+            if job.finished_at is not None and job.finished_at < cutoff:
+                del self._jobs[task_list_id]
+
+    async def stop(self) -> None:
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+_runner: Optional[CascadeDeleteRunner] = None
+
+
+def get_cascade_delete_runner() -> CascadeDeleteRunner:
+    global _runner
+    if _runner is None:
+        _runner = CascadeDeleteRunner(
+            get_session_factory(),
+            chunk_size=settings.cascade_delete_chunk_size,
+            chunk_sleep=settings.cascade_delete_chunk_sleep_seconds,
+        )
+    return _runner
@@ -0,0 +1,225 @@
+import asyncio
+import logging
+import random
+import time
+from collections import defaultdict
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import select
+
+from src.domain.entities.notification import EmailMessage, NotificationType, TaskNotification
+from src.domain.outputs.email_sender import EmailSender
+from src.domain.outputs.notification_publisher import NotificationPublisher
+from src.infrastructure.config.settings import settings
+from src.infrastructure.database.connection import get_session_factory
+from src.infrastructure.database.models.user_model import UserModel
+from src.infrastructure.external.email_senders import create_email_sender
+from src.infrastructure.observability.metrics import metrics
+from src.infrastructure.utils.datetime_utils import utc_now
+
+logger = logging.getLogger(__name__)
+
+RecipientResolver = Callable[[Sequence[int]], Awaitable[Dict[int, str]]]
+
+
+class NotificationDispatcher(NotificationPublisher):
+    """Collects task notifications per recipient and delivers one digest email per recipient per interval.
+
+    ``publish`` only touches in-memory buckets, so request handlers never wait on delivery.
+    Pending notifications are capped; once the cap is reached new ones are dropped and counted,
+    which is the backpressure signal when delivery cannot keep up. A flush loop hands digests to
+    a fixed pool of sender workers through a bounded queue and retries failed sends with jittered
+    exponential backoff.
+    """
+
+    def __init__(
+        self,
+        sender: EmailSender,
+        resolve_recipients: RecipientResolver,
+        digest_interval: float = 60.0,
+        max_pending: int = 10000,
+        workers: int = 4,
+        max_attempts: int = 5,
+        retry_base_delay: float = 0.5,
+        retry_max_delay: float = 30.0,
+    ):
+        self.sender = sender
+        self.resolve_recipients = resolve_recipients
+        self.digest_interval = digest_interval
+        self.max_pending = max_pending
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+
+        self._buckets: Dict[int, Dict[Tuple[int, NotificationType], TaskNotification]] = defaultdict(dict)
+        self._pending = 0
+        self._outbox: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+        self._enqueued = metrics.counter("notifications_enqueued_total")
+        self._coalesced = metrics.counter("notifications_coalesced_total")
+        self._dropped = metrics.counter("notifications_dropped_total")
+        self._sent = metrics.counter("notification_emails_sent_total")
+        self._failed = metrics.counter("notification_emails_failed_total")
+        self._retries = metrics.counter("notification_email_retries_total")
+        self._pending_gauge = metrics.gauge("notifications_pending")
+        self._digest_size = metrics.histogram("notification_digest_size", buckets=(1, 2, 5, 10, 25, 50, 100))
+        self._send_seconds = metrics.histogram("notification_email_send_seconds")
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def publish(self, notification: TaskNotification) -> None:
+        key = (notification.task_id, notification.type)
+        if notification.created_at is None:
+            notification.created_at = utc_now()
+
+        bucket = self._buckets.get(notification.recipient_user_id)
+        if bucket is not None and key in bucket:
+            # Only the latest state of a task matters to the recipient
+            bucket[key] = notification
+            self._coalesced.inc()
+            return
+
+        if self._pending >= self.max_pending:
+            self._dropped.inc()
+            return
+
+        self._buckets[notification.recipient_user_id][key] = notification
+        self._pending += 1
+        self._enqueued.inc()
+        self._pending_gauge.set(self._pending)
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+        self._outbox = asyncio.Queue(maxsize=self.workers * 4)
+        self._tasks = [asyncio.create_task(self._send_worker()) for _ in range(self.workers)]
+        self._tasks.append(asyncio.create_task(self._flush_loop()))
+
+    async def stop(self) -> None:
+        """Deliver what is pending, then stop the workers."""
+        if not self._tasks:
+            return
+        flush_loop = self._tasks.pop()
+        flush_loop.cancel()
+        await asyncio.gather(flush_loop, return_exceptions=True)
+
+        await self.flush()
+        await self._outbox.join()
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def flush(self) -> int:
+        """Turn the current buckets into digests and queue them for the sender workers."""
+        if not self._buckets or self._outbox is None:
+            return 0
+
+        buckets, self._buckets = self._buckets, defaultdict(dict)
+        self._pending = 0
+        self._pending_gauge.set(0)
+
+        try:
+            emails = await self.resolve_recipients(list(buckets))
+        except Exception:
+            logger.exception("Could not resolve notification recipients; dropping %d digests", len(buckets))
+            self._dropped.inc(sum(len(bucket) for bucket in buckets.values()))
+            return 0
+
+        queued = 0
+        for user_id, bucket in buckets.items():
+            email = emails.get(user_id)
+            if not email:
+                self._dropped.inc(len(bucket))
+                continue
+            notifications = sorted(bucket.values(), key=lambda notification: notification.created_at)
+            self._digest_size.observe(len(notifications))
+            # Blocks while every worker is busy, so slow delivery pushes back on the flush loop
+            await self._outbox.put(self._build_digest(email, notifications))
+            queued += 1
+        return queued
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.digest_interval)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Notification flush failed")
+
+    async def _send_worker(self) -> None:
+        while True:
+            message = await self._outbox.get()
+            try:
+                await self._send_with_retry(message)
+            finally:
+                self._outbox.task_done()
+
+    async def _send_with_retry(self, message: EmailMessage) -> bool:
+        for attempt in range(1, self.max_attempts + 1):
+            started = time.perf_counter()
+            try:
+                await self.sender.send(message)
+            except Exception as e:
+                if attempt == self.max_attempts:
+                    self._failed.inc()
+                    logger.error("Giving up on email to %s after %d attempts: %s", message.to, attempt, e)
+                    return False
+                self._retries.inc()
+                # Full jitter keeps retries from many workers from synchronising against a recovering server
+                await asyncio.sleep(random.uniform(0, min(self.retry_max_delay, self.retry_base_delay * 2 ** (attempt - 1))))
+            else:
+                self._send_seconds.observe(time.perf_counter() - started)
+                self._sent.inc()
+                return True
+        return False
+
+    @staticmethod
+    def _build_digest(email: str, notifications: List[TaskNotification]) -> EmailMessage:
+        lines = []
+        for notification in notifications:
+            if notification.type == NotificationType.TASK_ASSIGNED:
+                lines.append(f"- You were assigned task #{notification.task_id} '{notification.task_title}'")
+            else:
+                status = notification.status.value if notification.status else "unknown"
+                lines.append(f"- Task #{notification.task_id} '{notification.task_title}' is now {status}")
+
+        subject = "Task update" if len(notifications) == 1 else f"{len(notifications)} task updates"
+        return EmailMessage(to=email, subject=subject, body="\n".join(lines), sender=settings.email_from)
+
+
+def make_user_email_resolver(session_factory) -> RecipientResolver:
+    """Resolve user ids to email addresses with one query per flush."""
+
+    async def resolve(user_ids: Sequence[int]) -> Dict[int, str]:
+        async with session_factory() as session:
+            result = await session.execute(select(UserModel.id, UserModel.email).where(UserModel.id.in_(user_ids), UserModel.is_active.is_(True)))
+            return {user_id: email for user_id, email in result.all()}
+
+    return resolve
+
+
+_dispatcher: Optional[NotificationDispatcher] = None
+
+
+def get_notification_dispatcher() -> Optional[NotificationDispatcher]:
+    """Process-wide dispatcher, or None when email notifications are disabled."""
+    global _dispatcher
+    if not settings.email_enabled:
+        return None
+    if _dispatcher is None:
+        _dispatcher = NotificationDispatcher(
+            sender=create_email_sender(),
+            resolve_recipients=make_user_email_resolver(get_session_factory()),
+            digest_interval=settings.notification_digest_interval_seconds,
+            max_pending=settings.notification_max_pending,
+            workers=settings.notification_workers,
+            max_attempts=settings.notification_max_attempts,
+            retry_base_delay=settings.notification_retry_base_seconds,
+        )
+    return _dispatcher
@@ -0,0 +1,63 @@
+from typing import Dict
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.notification import NotificationType, TaskNotification
+from src.domain.entities.outbox_event import OutboxEvent
+from src.domain.entities.task import TaskStatus
+from src.domain.outputs.notification_publisher import NotificationPublisher
+from src.infrastructure.database.models.outbox_event_model import OutboxEventModel
+from src.infrastructure.outbox.event_bus import EventBus
+from src.infrastructure.outbox.recorder import TASK, event_payload, outbox_row
+
+# Outbox event type (after the "task." prefix) for each kind of notification
+NOTIFICATION_EVENTS: Dict[NotificationType, str] = {
+    NotificationType.TASK_ASSIGNED: "assigned",
+    NotificationType.TASK_STATUS_CHANGED: "status_changed",
+}
+
+
+class OutboxNotificationPublisher(NotificationPublisher):
+    """Records task notifications as outbox events in the writer's transaction.
+
+    Nothing is delivered before the task write commits: the relay picks the rows up once they
+    are visible and hands them to ``NotificationEventHandler``. A rollback discards them.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    def publish(self, notification: TaskNotification) -> None:
+        # Added to the unit of work rather than executed, so publishing stays synchronous; the row is flushed with the task's writes
+        row = outbox_row(TASK, notification.task_id, NOTIFICATION_EVENTS[notification.type], event_payload(notification))
+        self.session.add(OutboxEventModel(**row))
+
+
+def notification_from_event(event: OutboxEvent) -> TaskNotification:
+    payload = event.payload
+    return TaskNotification(
+        type=NotificationType(payload["type"]),
+        recipient_user_id=payload["recipient_user_id"],
+        task_id=payload["task_id"],
+        task_title=payload["task_title"],
+        status=TaskStatus(payload["status"]) if payload.get("status") else None,
+        created_at=event.created_at,
+    )
+
+
+class NotificationEventHandler:
+    """Event bus subscriber passing relayed notification events on to a publisher (the dispatcher)."""
+
+    def __init__(self, publisher: NotificationPublisher):
+        self.publisher = publisher
+
+    async def __call__(self, event: OutboxEvent) -> None:
+        self.publisher.publish(notification_from_event(event))
+
+    def subscribe(self, bus: EventBus) -> None:
+        for event_type in NOTIFICATION_EVENTS.values():
+            bus.subscribe(f"{TASK}.{event_type}", self)
+
+    def unsubscribe(self, bus: EventBus) -> None:
+        for event_type in NOTIFICATION_EVENTS.values():
+            bus.unsubscribe(f"{TASK}.{event_type}", self)
@@ -0,0 +1,142 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Deque, List, Optional
+
+from src.infrastructure.config.settings import settings
+from src.infrastructure.observability.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class BlockReport:
+    """A stall of the event loop: how long it lasted and where the loop thread was while stalled."""
+
+    def __init__(self, duration: float, stack: str):
+        self.duration = duration
+        self.stack = stack
+
+
+class LoopLagMonitor:
+    """Measures event loop scheduling lag with a heartbeat task.
+
+    The heartbeat sleeps ``interval`` and records how late it woke up; a callback that holds
+    the loop for ``d`` seconds shows up as roughly ``d`` of lag. With ``capture_stacks``
+    a watchdog thread also grabs the loop thread's stack once the heartbeat is overdue by
+    ``block_threshold``, i.e. while the offending code is still running, and the stack is
+    logged when the loop recovers.
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.1,
+        block_threshold: float = 0.1,
+        capture_stacks: bool = False,
+        max_reports: int = 20,
+        stack_limit: int = 40,
+        record_metrics: bool = True,
+    ):
+        self.interval = interval
+        self.block_threshold = block_threshold
+        self.capture_stacks = capture_stacks
+        self.max_lag = 0.0
+        self.reports: Deque[BlockReport] = deque(maxlen=max_reports)
+        self.stack_limit = stack_limit
+        self.record_metrics = record_metrics
+
+        self._beat = 0.0
+        self._sleep_started = 0.0
+        self._pending: Optional[BlockReport] = None
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._lag = metrics.histogram("event_loop_lag_seconds")
+        self._blocked = metrics.counter("event_loop_blocked_total")
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._beat = time.monotonic()
+        self._sleep_started = asyncio.get_running_loop().time()
+        self._stop.clear()
+        self._task = asyncio.create_task(self._run())
+        if self.capture_stacks:
+            self._watchdog = threading.Thread(target=self._watch, name="event-loop-watchdog", daemon=True)
+            self._watchdog.start()
+        # Let the heartbeat take its first beat before the caller continues
+        await asyncio.sleep(0)
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stop.set()
+        # Account for a stall that is still in progress (the heartbeat has not woken up yet)
+        self.observe(max(0.0, asyncio.get_running_loop().time() - self._sleep_started - self.interval))
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        if self._watchdog is not None:
+            self._watchdog.join()
+            self._watchdog = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            self._beat = time.monotonic()
+            self._sleep_started = loop.time()
+            await asyncio.sleep(self.interval)
+            self.observe(max(0.0, loop.time() - self._sleep_started - self.interval))
+
+    def observe(self, lag: float) -> None:
+        self.max_lag = max(self.max_lag, lag)
+        if self.record_metrics:
+            self._lag.observe(lag)
+        if lag < self.block_threshold:
+            self._pending = None
+            return
+
+        if self.record_metrics:
+            self._blocked.inc()
+        report, self._pending = self._pending, None
+        if report is not None:
+            report.duration = lag
+            self.reports.append(report)
+            logger.warning("Event loop blocked for %.3fs; loop thread was at:\n%s", lag, report.stack)
+        elif not self.capture_stacks:
+            logger.warning("Event loop blocked for %.3fs", lag)
+
+    def _watch(self) -> None:
+        check_every = max(self.block_threshold / 4, 0.001)
+        while not self._stop.wait(check_every):
+            stalled = time.monotonic() - self._beat - self.interval
+            if stalled < self.block_threshold or self._pending is not None:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is not None:
+                self._pending = BlockReport(stalled, "".join(traceback.format_stack(frame, self.stack_limit)))
+
+    def blocks(self) -> List[BlockReport]:
+        return list(self.reports)
+
+
+_monitor: Optional[LoopLagMonitor] = None
+
+
+def get_loop_monitor() -> Optional[LoopLagMonitor]:
+    """Process-wide monitor, or None when disabled."""
+    global _monitor
+    if not settings.loop_monitor_enabled:
+        return None
+    if _monitor is None:
+        _monitor = LoopLagMonitor(
+            interval=settings.loop_monitor_interval_seconds,
+            block_threshold=settings.loop_monitor_block_threshold_seconds,
+            capture_stacks=settings.loop_monitor_debug,
+        )
+    return _monitor
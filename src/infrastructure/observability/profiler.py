@@ -0,0 +1,283 @@
+import asyncio
+import json
+import os
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from types import FrameType
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from src.infrastructure.config.settings import settings
+from src.infrastructure.observability.metrics import metrics
+
+WAITING_FRAME = "(waiting)"
+CHILD_TASK_FRAME = "(task)"
+PROFILE_FORMATS = ("collapsed", "speedscope")
+_UNSAFE_NAME_CHARS = re.compile(r"[^A-Za-z0-9_.-]+")
+
+Frame = Tuple[str, str, int]  # (function, file, line)
+Stack = Tuple[Frame, ...]  # root first
+
+
+def _frame_key(frame: FrameType) -> Frame:
+    code = frame.f_code
+    return code.co_qualname, code.co_filename, code.co_firstlineno
+
+
+class StackSampler:
+    """Samples the stack of one request on a timer thread.
+
+    The request is identified by ``marker``, the frame of the coroutine that wraps it
+    (the profiler middleware). Each tick reads the event loop thread's current stack:
+
+    * if the marker is on it, the request is running and the frames above the marker are recorded
+    * otherwise the request is suspended; the task's await chain is recorded under a
+      ``(waiting)`` frame, so time spent on I/O or behind other requests is visible too
+
+    Tasks spawned by the request (e.g. ``asyncio.gather`` of GraphQL field resolvers) are
+    registered through the loop's task factory and recorded under a ``(task)`` frame when
+    they run. Handlers run in a threadpool (plain ``def`` endpoints) show up as waiting on
+    the threadpool call.
+    """
+
+    def __init__(self, marker: FrameType, task: Optional[asyncio.Task], interval: float = 0.005, max_samples: int = 100000):
+        self.marker = marker
+        self.task = task
+        self.interval = interval
+        self.max_samples = max_samples
+        self.stacks: List[Stack] = []
+        self.child_roots: Set[FrameType] = set()
+        self.started: Optional[float] = None
+        self.duration = 0.0
+        self._thread_id = threading.get_ident()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self.started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> List[Stack]:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.duration = time.perf_counter() - self.started if self.started else 0.0
+        return self.stacks
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval) and len(self.stacks) < self.max_samples:
+            frame = sys._current_frames().get(self._thread_id)
+            stack = self._running_stack(frame) or self._waiting_stack()
+            if stack:
+                self.stacks.append(stack)
+
+    def track(self, task: asyncio.Task) -> None:
+        frame = getattr(task.get_coro(), "cr_frame", None)
+        if frame is not None:
+            self.child_roots.add(frame)
+
+    def _running_stack(self, frame: Optional[FrameType]) -> Optional[Stack]:
+        child_roots = frozenset(self.child_roots)
+        frames = []
+        while frame is not None:
+            if frame is self.marker:
+                return tuple(reversed(frames))
+            frames.append(_frame_key(frame))
+            if frame in child_roots:
+                return ((CHILD_TASK_FRAME, "", 0),) + tuple(reversed(frames))
+            frame = frame.f_back
+        return None
+
+    def _waiting_stack(self) -> Optional[Stack]:
+        if self.task is None or self.task.done():
+            return None
+        frames = _await_chain(self.task.get_coro())
+        for index, frame in enumerate(frames):
+            if frame is self.marker:
+                frames = frames[index + 1 :]
+                break
+        return ((WAITING_FRAME, "", 0),) + tuple(_frame_key(frame) for frame in frames)
+
+
+_active_sampler: ContextVar[Optional[StackSampler]] = ContextVar("active_sampler", default=None)
+
+
+def install_task_tracking(loop: asyncio.AbstractEventLoop) -> None:
+    """Wrap the loop's task factory so tasks created inside a profiled request are attributed to it."""
+    previous = loop.get_task_factory()
+    if getattr(previous, "tracks_profiled_tasks", False):
+        return
+
+    def factory(loop, coro, **kwargs):
+        task = previous(loop, coro, **kwargs) if previous else asyncio.Task(coro, loop=loop, **kwargs)
+        # Runs in the creating task's context, so this is the sampler of the request that spawned it
+        sampler = _active_sampler.get()
+        if sampler is not None:
+            sampler.track(task)
+        return task
+
+    factory.tracks_profiled_tasks = True
+    loop.set_task_factory(factory)
+
+
+@contextmanager
+def sampling(sampler: StackSampler) -> Iterator[StackSampler]:
+    install_task_tracking(asyncio.get_running_loop())
+    token = _active_sampler.set(sampler)
+    sampler.start()
+    try:
+        yield sampler
+    finally:
+        sampler.stop()
+        _active_sampler.reset(token)
+
+
+def _await_chain(coro) -> List[FrameType]:
+    """Frames of a suspended coroutine and everything it awaits, outermost first (``Task.get_stack`` stops at the root)."""
+    frames = []
+    while coro is not None:
+        frame = getattr(coro, "cr_frame", None) or getattr(coro, "gi_frame", None)
+        if frame is None:
+            break
+        frames.append(frame)
+        coro = getattr(coro, "cr_await", None) or getattr(coro, "gi_yieldfrom", None)
+    return frames
+
+
+def _frame_label(frame: Frame) -> str:
+    function, filename, line = frame
+    if not filename:
+        return function
+    return f"{function} ({os.path.basename(filename)}:{line})"
+
+
+def to_collapsed(stacks: Iterable[Stack]) -> str:
+    """Brendan Gregg's collapsed format (``a;b;c count``), the input of flamegraph.pl and most flamegraph viewers."""
+    counts: Dict[str, int] = {}
+    for stack in stacks:
+        key = ";".join(_frame_label(frame).replace(";", ":") for frame in stack)
+        counts[key] = counts.get(key, 0) + 1
+    return "".join(f"{key} {count}\n" for key, count in sorted(counts.items()))
+
+
+def to_speedscope(stacks: List[Stack], interval: float, name: str) -> dict:
+    """Sampled profile in the speedscope file format, keeping sample order (time order view)."""
+    frame_index: Dict[Frame, int] = {}
+    frames = []
+    samples = []
+    for stack in stacks:
+        indexes = []
+        for frame in stack:
+            index = frame_index.get(frame)
+            if index is None:
+                index = frame_index[frame] = len(frames)
+                function, filename, line = frame
+                frames.append({"name": function, "file": filename, "line": line} if filename else {"name": function})
+            indexes.append(index)
+        samples.append(indexes)
+
+    interval_ms = interval * 1000
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "name": name,
+        "exporter": "task-manager-api",
+        "shared": {"frames": frames},
+        "profiles": [
+            {
+                "type": "sampled",
+                "name": name,
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": round(len(samples) * interval_ms, 3),
+                "samples": samples,
+                "weights": [interval_ms] * len(samples),
+            }
+        ],
+    }
+
+
+class ProfileStore:
+    """Bounded on-disk ring of profiles: once ``max_files`` are stored, the oldest is removed per new one."""
+
+    def __init__(self, directory: str, max_files: int = 50):
+        self.directory = Path(directory)
+        self.max_files = max_files
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def new_name(label: str, profile_format: str) -> str:
+        extension = "speedscope.json" if profile_format == "speedscope" else "collapsed.txt"
+        return f"{time.time_ns()}-{_UNSAFE_NAME_CHARS.sub('_', label).strip('_')[:80]}.{extension}"
+
+    def save(self, name: str, content: str) -> None:
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            (self.directory / name).write_text(content, encoding="utf-8")
+            for old in self.list()[self.max_files :]:
+                (self.directory / old).unlink(missing_ok=True)
+
+    def list(self) -> List[str]:
+        """Stored profile names, newest first."""
+        if not self.directory.is_dir():
+            return []
+        return sorted((path.name for path in self.directory.iterdir() if path.is_file()), reverse=True)
+
+    def path(self, name: str) -> Optional[Path]:
+        # Only names this store produced; never follow a client-supplied path outside the directory
+        if name != os.path.basename(name) or name not in self.list():
+            return None
+        return self.directory / name
+
+
+def render_profile(stacks: List[Stack], interval: float, profile_format: str, name: str) -> str:
+    if profile_format == "speedscope":
+        return json.dumps(to_speedscope(stacks, interval, name))
+    return to_collapsed(stacks)
+
+
+class RequestProfiler:
+    """Profiles single requests on demand, at most ``max_concurrent`` at a time per worker."""
+
+    def __init__(self, store: ProfileStore, interval: float = 0.005, default_format: str = "collapsed", max_concurrent: int = 1):
+        self.store = store
+        self.interval = interval
+        self.default_format = default_format
+        self.max_concurrent = max_concurrent
+        self.active = 0
+        self._profiles = metrics.counter("profiler_profiles_total")
+        self._skipped = metrics.counter("profiler_skipped_total")
+
+    def try_acquire(self) -> bool:
+        if self.active >= self.max_concurrent:
+            self._skipped.inc()
+            return False
+        self.active += 1
+        return True
+
+    def release(self) -> None:
+        self.active -= 1
+
+    async def save(self, name: str, stacks: List[Stack], profile_format: str) -> None:
+        self._profiles.inc()
+        content = render_profile(stacks, self.interval, profile_format, name)
+        # Rendering is cheap; the file write and ring trimming stay off the event loop
+        await asyncio.to_thread(self.store.save, name, content)
+
+
+_profiler: Optional[RequestProfiler] = None
+
+
+def get_request_profiler() -> RequestProfiler:
+    global _profiler
+    if _profiler is None:
+        _profiler = RequestProfiler(
+            ProfileStore(settings.profiler_directory, settings.profiler_max_files),
+            interval=settings.profiler_interval_ms / 1000,
+            default_format=settings.profiler_format,
+        )
+    return _profiler
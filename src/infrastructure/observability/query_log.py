@@ -0,0 +1,246 @@
+import asyncio
+import json
+import logging
+import random
+import re
+import time
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.infrastructure.config.settings import settings
+from src.infrastructure.observability.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w$])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|%s|(?<!:):\w+|\?")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_ARRAY = re.compile(r"\bANY\s*\(\s*ARRAY\[[^\]]*\]\s*\)", re.IGNORECASE)
+_VALUES_ROWS = re.compile(r"(\(\?(?:, \?)*\))(?:\s*,\s*\(\?(?:, \?)*\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
+def fingerprint(statement: str) -> str:
+    """Normalize a statement so that executions differing only in literals or parameters group together."""
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _PLACEHOLDER.sub("?", normalized)
+    normalized = _NUMBER.sub("?", normalized)
+    normalized = _WHITESPACE.sub(" ", normalized).strip()
+    normalized = _IN_LIST.sub("IN (...)", normalized)
+    normalized = _ARRAY.sub("ANY (ARRAY[...])", normalized)
+    return _VALUES_ROWS.sub(r"\1, ...", normalized)
+
+
+def redact_plan(plan: Any) -> Any:
+    """Replace the literals PostgreSQL prints into plan conditions ("Filter", "Index Cond", ...) with ``?``.
+
+    EXPLAIN inlines the bound parameter values there; node types, costs and timings are kept.
+    """
+    if isinstance(plan, dict):
+        return {key: redact_plan(value) for key, value in plan.items()}
+    if isinstance(plan, list):
+        return [redact_plan(value) for value in plan]
+    if isinstance(plan, str):
+        return _NUMBER.sub("?", _STRING_LITERAL.sub("?", plan))
+    return plan
+
+
+def redact_parameters(parameters: Any) -> Any:
+    """Keep the shape and types of bound parameters but never their values."""
+    if isinstance(parameters, dict):
+        return {key: f"<{type(value).__name__}>" for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        if parameters and isinstance(parameters[0], (dict, list, tuple)):
+            return f"<{len(parameters)} rows>"
+        return [f"<{type(value).__name__}>" for value in parameters]
+    return None if parameters is None else f"<{type(parameters).__name__}>"
+
+
+class QueryStats:
+    def __init__(self, fingerprint: str):
+        self.fingerprint = fingerprint
+        self.calls = 0
+        self.slow_calls = 0
+        self.rows = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.plan: Optional[Any] = None
+        self.explained_at: Optional[float] = None
+
+    def to_dict(self) -> dict:
+        return {
+            "fingerprint": self.fingerprint,
+            "calls": self.calls,
+            "slow_calls": self.slow_calls,
+            "rows": self.rows,
+            "total_ms": round(self.total_seconds * 1000, 3),
+            "mean_ms": round(self.total_seconds * 1000 / self.calls, 3) if self.calls else 0.0,
+            "max_ms": round(self.max_seconds * 1000, 3),
+            "plan": self.plan,
+        }
+
+
+class SlowQueryExplainer:
+    """Runs ``EXPLAIN (ANALYZE, BUFFERS)`` for slow statements on a dedicated side connection.
+
+    Explains are scheduled as background tasks so the request that ran the slow statement
+    never waits for them. Only plain SELECTs are explained, since ANALYZE executes the
+    statement; each fingerprint is explained at most once per cooldown, and at most
+    ``max_concurrent`` explains run at a time (others are skipped, not queued).
+    """
+
+    def __init__(self, database_url: str, cooldown: float = 300.0, max_concurrent: int = 1, statement_timeout_ms: int = 10000):
+        self.database_url = database_url
+        self.cooldown = cooldown
+        self.max_concurrent = max_concurrent
+        self.statement_timeout_ms = statement_timeout_ms
+        self._engine: Optional[AsyncEngine] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._explained = metrics.counter("db_explains_total")
+        self._failed = metrics.counter("db_explain_errors_total")
+
+    @staticmethod
+    def explainable(statement: str) -> bool:
+        head = statement.lstrip().upper()
+        return head.startswith("SELECT") and " FOR UPDATE" not in head and " FOR SHARE" not in head
+
+    def maybe_explain(self, stats: QueryStats, statement: str, parameters: Any) -> bool:
+        now = time.monotonic()
+        if not self.explainable(statement) or len(self._tasks) >= self.max_concurrent:
+            return False
+        if stats.explained_at is not None and now - stats.explained_at < self.cooldown:
+            return False
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        stats.explained_at = now
+        task = loop.create_task(self._explain(stats, statement, parameters))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+
+    async def _explain(self, stats: QueryStats, statement: str, parameters: Any) -> None:
+        if self._engine is None:
+            # Separate single-connection engine: never competes with request traffic for the main pool
+            # and has no query log attached, so explains are not themselves recorded
+            self._engine = create_async_engine(self.database_url, pool_size=1, max_overflow=0)
+        try:
+            async with self._engine.connect() as connection:
+                await connection.exec_driver_sql(f"SET statement_timeout = {int(self.statement_timeout_ms)}")
+                result = await connection.exec_driver_sql(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}", parameters or ())
+                plan = result.scalar()
+                await connection.rollback()
+        except Exception as e:
+            self._failed.inc()
+            logger.warning("EXPLAIN failed for %s: %s", stats.fingerprint, e)
+            return
+        stats.plan = redact_plan(json.loads(plan) if isinstance(plan, str) else plan)
+        self._explained.inc()
+        logger.warning("Plan for slow query %s: %s", stats.fingerprint, json.dumps(stats.plan))
+
+    async def close(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._engine is not None:
+            await self._engine.dispose()
+            self._engine = None
+
+
+class QueryLog:
+    """Per-worker SQL observability, attached to an engine through cursor execute events.
+
+    Every statement is timed and accumulated under its normalized fingerprint. Statements
+    slower than the threshold are always logged, with bound parameters redacted; other
+    statements are logged for a random ``sample_rate`` fraction only. At most
+    ``max_fingerprints`` fingerprints are tracked; when full, the one with the least total
+    time is evicted so the heavy hitters survive.
+    """
+
+    def __init__(
+        self,
+        slow_threshold: float = 0.2,
+        sample_rate: float = 0.0,
+        max_fingerprints: int = 2000,
+        explainer: Optional[SlowQueryExplainer] = None,
+        rng: Optional[random.Random] = None,
+    ):
+        self.slow_threshold = slow_threshold
+        self.sample_rate = sample_rate
+        self.max_fingerprints = max_fingerprints
+        self.explainer = explainer
+        self._rng = rng or random.Random()
+        self._stats: Dict[str, QueryStats] = {}
+        self._duration = metrics.histogram("db_query_seconds")
+        self._slow = metrics.counter("db_slow_queries_total")
+        self._evicted = metrics.counter("db_query_fingerprints_evicted_total")
+
+    def attach(self, engine) -> None:
+        sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+
+        @event.listens_for(sync_engine, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            context._query_log_started = time.perf_counter()
+
+        @event.listens_for(sync_engine, "after_cursor_execute")
+        def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            started = getattr(context, "_query_log_started", None)
+            if started is not None:
+                self.record(statement, parameters, time.perf_counter() - started, getattr(cursor, "rowcount", -1), executemany)
+
+    def record(self, statement: str, parameters: Any, elapsed: float, rowcount: int = -1, executemany: bool = False) -> QueryStats:
+        key = fingerprint(statement)
+        stats = self._stats.get(key)
+        if stats is None:
+            if len(self._stats) >= self.max_fingerprints:
+                del self._stats[min(self._stats.values(), key=lambda candidate: candidate.total_seconds).fingerprint]
+                self._evicted.inc()
+            stats = self._stats[key] = QueryStats(key)
+
+        stats.calls += 1
+        stats.total_seconds += elapsed
+        stats.max_seconds = max(stats.max_seconds, elapsed)
+        if rowcount and rowcount > 0:
+            stats.rows += rowcount
+        self._duration.observe(elapsed)
+
+        if elapsed >= self.slow_threshold:
+            stats.slow_calls += 1
+            self._slow.inc()
+            logger.warning("Slow query (%.1f ms): %s parameters=%s", elapsed * 1000, statement, redact_parameters(parameters))
+            if self.explainer is not None and not executemany:
+                self.explainer.maybe_explain(stats, statement, parameters)
+        elif self.sample_rate and self._rng.random() < self.sample_rate:
+            logger.info("Query (%.1f ms): %s parameters=%s", elapsed * 1000, statement, redact_parameters(parameters))
+        return stats
+
+    def top(self, limit: int = 20) -> List[QueryStats]:
+        return sorted(self._stats.values(), key=lambda stats: stats.total_seconds, reverse=True)[:limit]
+
+    def snapshot(self, limit: int = 20) -> dict:
+        return {
+            "slow_threshold_ms": self.slow_threshold * 1000,
+            "sample_rate": self.sample_rate,
+            "fingerprints": len(self._stats),
+            "top": [stats.to_dict() for stats in self.top(limit)],
+        }
+
+    def reset(self) -> None:
+        self._stats.clear()
+
+
+# Global query log for this worker process, attached to the application engine
+query_log = QueryLog(
+    slow_threshold=settings.sql_slow_query_threshold_ms / 1000,
+    sample_rate=settings.sql_log_sample_rate,
+    max_fingerprints=settings.sql_max_fingerprints,
+    explainer=(
+        SlowQueryExplainer(settings.database_url, cooldown=settings.sql_explain_cooldown_seconds) if settings.sql_explain_slow_queries else None
+    ),
+)
@@ -0,0 +1,205 @@
+import json
+import logging
+import queue
+import random
+import sys
+import uuid
+from contextvars import ContextVar, Token
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional, TextIO
+
+from src.infrastructure.config.settings import settings
+from src.infrastructure.observability.metrics import metrics
+from src.infrastructure.observability.tracing import current_span
+
+# Attributes every LogRecord has; anything else on a record came from ``extra=`` and is emitted as a field
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "request_id", "trace_id", "span_id"}
+
+_request_id: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+
+def new_request_id() -> str:
+    return uuid.uuid4().hex
+
+
+def current_request_id() -> Optional[str]:
+    return _request_id.get()
+
+
+def bind_request_id(request_id: Optional[str]) -> Token:
+    return _request_id.set(request_id)
+
+
+def reset_request_id(token: Token) -> None:
+    _request_id.reset(token)
+
+
+class RequestContextFilter(logging.Filter):
+    """Stamps records with the request id and trace/span ids of the emitting context.
+
+    Runs on the producing thread (handler filters run before the record is queued), which
+    is the only place the request's contextvars are visible.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = _request_id.get()
+        span = current_span()
+        record.trace_id = getattr(span, "trace_id", None)
+        record.span_id = getattr(span, "span_id", None)
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps a fraction of the records below WARNING from selected loggers.
+
+    ``rates`` maps logger names to keep rates; the longest matching prefix (``a.b`` covers
+    ``a.b.c``) applies. WARNING and above are always kept.
+    """
+
+    def __init__(self, rates: Dict[str, float], rng: Optional[random.Random] = None):
+        super().__init__()
+        self.rates = dict(rates)
+        self._rng = rng or random.Random()
+        self._resolved: Dict[str, float] = {}
+        self._sampled_out = metrics.counter("log_records_sampled_out_total")
+
+    def rate_for(self, name: str) -> float:
+        rate = self._resolved.get(name)
+        if rate is None:
+            rate, prefix = 1.0, name
+            while prefix:
+                if prefix in self.rates:
+                    rate = self.rates[prefix]
+                    break
+                prefix = prefix.rpartition(".")[0]
+            self._resolved[name] = rate
+        return rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not self.rates:
+            return True
+        rate = self.rate_for(record.name)
+        if rate >= 1.0 or self._rng.random() < rate:
+            return True
+        self._sampled_out.inc()
+        return False
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: timestamp, level, logger, message, request/trace ids and any ``extra`` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key in ("request_id", "trace_id", "span_id"):
+            value = getattr(record, key, None)
+            if value:
+                entry[key] = value
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        if record.stack_info:
+            entry["stack_info"] = record.stack_info
+        return json.dumps(entry, default=str, separators=(",", ":"))
+
+
+class TextFormatter(logging.Formatter):
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)s %(name)s [%(request_id)s] %(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        if not hasattr(record, "request_id"):
+            record.request_id = None
+        return super().format(record)
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """Hands records to a bounded queue drained by a listener thread; never blocks the caller.
+
+    When the queue is full the record is dropped and counted, so a stalled output stream
+    cannot stall the event loop. The message is rendered and the traceback formatted here,
+    while the arguments are still alive, but they stay separate fields for the JSON formatter.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self._dropped = metrics.counter("log_records_dropped_total")
+        self._exception_formatter = logging.Formatter()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self._exception_formatter.formatException(record.exc_info)
+        prepared = logging.makeLogRecord(vars(record))
+        prepared.msg = message
+        prepared.args = None
+        prepared.exc_info = None
+        return prepared
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self._dropped.inc()
+
+
+_handler: Optional[NonBlockingQueueHandler] = None
+_listener: Optional[QueueListener] = None
+
+
+def create_formatter(log_format: str) -> logging.Formatter:
+    return TextFormatter() if log_format.lower() == "text" else JsonFormatter()
+
+
+def configure_logging(
+    level: Optional[str] = None,
+    log_format: Optional[str] = None,
+    levels: Optional[Dict[str, str]] = None,
+    sampling: Optional[Dict[str, float]] = None,
+    queue_size: Optional[int] = None,
+    stream: Optional[TextIO] = None,
+) -> NonBlockingQueueHandler:
+    """Route the root logger through a queue to a listener thread writing to ``stream`` (stdout).
+
+    Safe to call again: the previous handler is flushed and replaced.
+    """
+    global _handler, _listener
+    shutdown_logging()
+
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(create_formatter(log_format or settings.log_format))
+
+    handler = NonBlockingQueueHandler(queue.Queue(queue_size if queue_size is not None else settings.log_queue_size))
+    handler.addFilter(SamplingFilter(sampling if sampling is not None else settings.log_sampling))
+    handler.addFilter(RequestContextFilter())
+
+    root = logging.getLogger()
+    root.setLevel((level or settings.log_level).upper())
+    root.addHandler(handler)
+    for name, logger_level in (levels if levels is not None else settings.log_levels).items():
+        logging.getLogger(name).setLevel(logger_level.upper())
+
+    _listener = QueueListener(handler.queue, output, respect_handler_level=True)
+    _listener.start()
+    _handler = handler
+    return handler
+
+
+def shutdown_logging() -> None:
+    """Drain queued records to the output and detach the handler."""
+    global _handler, _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    if _handler is not None:
+        logging.getLogger().removeHandler(_handler)
+        _handler = None
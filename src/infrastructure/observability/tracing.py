@@ -0,0 +1,410 @@
+import functools
+import inspect
+import json
+import logging
+import queue
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from src.infrastructure.config.settings import settings
+from src.infrastructure.observability.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+TRACEPARENT_HEADER = "traceparent"
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+# OTLP span kinds and status codes
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+RemoteParent = Tuple[str, str, bool]
+
+
+def parse_traceparent(value: Optional[str]) -> Optional[RemoteParent]:
+    """Parse a W3C ``traceparent`` header into (trace_id, parent_span_id, sampled)."""
+    if not value:
+        return None
+    match = _TRACEPARENT.match(value.strip().lower())
+    if match is None:
+        return None
+    trace_id, span_id, flags = match.groups()
+    if trace_id == "0" * 32 or span_id == "0" * 16:
+        return None
+    return trace_id, span_id, bool(int(flags, 16) & 1)
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items()]
+
+
+class _Trace:
+    """Spans of one trace finished in this process, exported together when the local root ends."""
+
+    __slots__ = ("spans", "exported")
+
+    def __init__(self):
+        self.spans: List["Span"] = []
+        self.exported = False
+
+
+class Span:
+    recording = True
+
+    __slots__ = (
+        "tracer",
+        "trace",
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "kind",
+        "attributes",
+        "start_ns",
+        "end_ns",
+        "status",
+        "message",
+        "local_root",
+    )
+
+    def __init__(
+        self, tracer: "Tracer", trace: _Trace, name: str, trace_id: str, span_id: str, parent_id: Optional[str], kind: int, local_root: bool
+    ):
+        self.tracer = tracer
+        self.trace = trace
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.kind = kind
+        self.local_root = local_root
+        self.attributes: Dict[str, Any] = {}
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.status = STATUS_OK
+        self.message: Optional[str] = None
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        return None if self.end_ns is None else (self.end_ns - self.start_ns) / 1e6
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def record_exception(self, error: BaseException) -> None:
+        self.status = STATUS_ERROR
+        self.message = str(error)
+        self.attributes["exception.type"] = type(error).__name__
+
+    def end(self) -> None:
+        self.end_ns = time.time_ns()
+        self.tracer._on_end(self)
+
+    def to_otlp(self) -> Dict[str, Any]:
+        status: Dict[str, Any] = {"code": self.status}
+        if self.message:
+            status["message"] = self.message
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": _otlp_attributes(self.attributes),
+            "status": status,
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+class NonRecordingSpan:
+    """Marks an unsampled trace, so nested spans skip all work; keeps ids only to propagate the decision."""
+
+    recording = False
+
+    def __init__(self, trace_id: Optional[str] = None, span_id: Optional[str] = None):
+        self.trace_id = trace_id
+        self.span_id = span_id
+
+    @property
+    def traceparent(self) -> Optional[str]:
+        return f"00-{self.trace_id}-{self.span_id}-00" if self.trace_id else None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def record_exception(self, error: BaseException) -> None:
+        pass
+
+
+_UNSAMPLED = NonRecordingSpan()
+_current_span: ContextVar[Optional[Union[Span, NonRecordingSpan]]] = ContextVar("current_span", default=None)
+
+
+def current_span() -> Optional[Union[Span, NonRecordingSpan]]:
+    return _current_span.get()
+
+
+class InMemorySpanExporter:
+    """Keeps finished spans in a list, for tests."""
+
+    def __init__(self):
+        self.spans: List[Span] = []
+
+    def export(self, spans: List[Span]) -> None:
+        self.spans.extend(spans)
+
+    def names(self) -> List[str]:
+        return [span.name for span in self.spans]
+
+    def clear(self) -> None:
+        self.spans.clear()
+
+    def flush(self) -> None:
+        pass
+
+
+class OTLPJsonFileExporter:
+    """Appends spans as OTLP/JSON ``ExportTraceServiceRequest`` lines, readable by the OpenTelemetry collector's file receiver.
+
+    Spans are buffered until ``batch_size`` are pending, or until ``flush``, then handed to a writer
+    thread: ``export`` runs on the event loop when a span ends, so it never touches the file itself.
+    Batches arriving while ``max_queued_batches`` are already waiting are dropped and counted.
+    """
+
+    def __init__(self, path: str, service_name: str, batch_size: int = 256, max_queued_batches: int = 16):
+        self.path = Path(path)
+        self.service_name = service_name
+        self.batch_size = batch_size
+        self._pending: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue(max_queued_batches)
+        self._writer: Optional[threading.Thread] = None
+        self._dropped = metrics.counter("tracing_spans_dropped_total")
+        self._export_errors = metrics.counter("tracing_export_errors_total")
+
+    def export(self, spans: List[Span]) -> None:
+        with self._lock:
+            self._pending.extend(span.to_otlp() for span in spans)
+            if len(self._pending) < self.batch_size:
+                return
+            pending, self._pending = self._pending, []
+        self._enqueue(pending)
+
+    def flush(self) -> None:
+        """Write every pending span and wait until the writer thread is done with them."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if pending:
+            self._start_writer()
+            self._queue.put(pending)
+        self._queue.join()
+
+    def _enqueue(self, spans: List[Dict[str, Any]]) -> None:
+        self._start_writer()
+        try:
+            self._queue.put_nowait(spans)
+        except queue.Full:
+            self._dropped.inc(len(spans))
+
+    def _start_writer(self) -> None:
+        with self._lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._run, name="span-file-writer", daemon=True)
+                self._writer.start()
+
+    def _run(self) -> None:
+        while True:
+            spans = self._queue.get()
+            try:
+                self._write(spans)
+            except Exception:
+                self._export_errors.inc()
+                logger.exception("Span export failed")
+            finally:
+                self._queue.task_done()
+
+    def _write(self, spans: List[Dict[str, Any]]) -> None:
+        request = {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": _otlp_attributes({"service.name": self.service_name})},
+                    "scopeSpans": [{"scope": {"name": __name__}, "spans": spans}],
+                }
+            ]
+        }
+        with self.path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(request, separators=(",", ":")) + "\n")
+
+
+class Tracer:
+    """Head-sampled tracer whose current span is carried in a contextvar.
+
+    The sampling decision is taken once per trace, at the local root (or taken from the
+    incoming ``traceparent``), and inherited by every nested span. Unsampled traces only
+    set a marker in the contextvar, so nested instrumentation returns immediately.
+    """
+
+    def __init__(
+        self, enabled: bool = False, sample_rate: float = 1.0, exporter=None, max_spans_per_trace: int = 1000, rng: Optional[random.Random] = None
+    ):
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self.exporter = exporter
+        self.max_spans_per_trace = max_spans_per_trace
+        self._rng = rng or random.Random()
+        self._dropped = metrics.counter("tracing_spans_dropped_total")
+        self._export_errors = metrics.counter("tracing_export_errors_total")
+
+    def _new_id(self, bits: int) -> str:
+        return f"{self._rng.getrandbits(bits) or 1:0{bits // 4}x}"
+
+    @contextmanager
+    def start_span(
+        self, name: str, kind: int = SPAN_KIND_INTERNAL, attributes: Optional[Dict[str, Any]] = None, remote_parent: Optional[RemoteParent] = None
+    ) -> Iterator[Union[Span, NonRecordingSpan]]:
+        parent = _current_span.get()
+        if not self.enabled or (parent is not None and not parent.recording and remote_parent is None):
+            yield parent or _UNSAMPLED
+            return
+
+        if remote_parent is not None:
+            trace_id, parent_id, sampled = remote_parent
+            trace, local_root = _Trace(), True
+        elif parent is not None:
+            trace_id, parent_id, sampled = parent.trace_id, parent.span_id, True
+            trace, local_root = parent.trace, False
+        else:
+            trace_id, parent_id, sampled = None, None, self._rng.random() < self.sample_rate
+            trace, local_root = _Trace(), True
+
+        if not sampled:
+            marker = NonRecordingSpan(trace_id, parent_id) if trace_id else _UNSAMPLED
+            token = _current_span.set(marker)
+            try:
+                yield marker
+            finally:
+                _current_span.reset(token)
+            return
+
+        span = Span(self, trace, name, trace_id or self._new_id(128), self._new_id(64), parent_id, kind, local_root)
+        if attributes:
+            span.attributes.update(attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_exception(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+
+    def _on_end(self, span: Span) -> None:
+        trace = span.trace
+        if trace.exported:
+            # Finished after its local root, e.g. in a task spawned by the request
+            self._export([span])
+            return
+        if len(trace.spans) >= self.max_spans_per_trace:
+            self._dropped.inc()
+        else:
+            trace.spans.append(span)
+        if span.local_root:
+            trace.exported = True
+            self._export(trace.spans)
+
+    def _export(self, spans: List[Span]) -> None:
+        if self.exporter is None:
+            return
+        try:
+            self.exporter.export(spans)
+        except Exception:
+            self._export_errors.inc()
+            logger.exception("Span export failed")
+
+    def shutdown(self) -> None:
+        if self.exporter is not None:
+            self.exporter.flush()
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """Decorator that runs a sync or async function inside a span (named after its qualname by default)."""
+
+    def decorator(fn: Callable) -> Callable:
+        span_name = name or fn.__qualname__
+
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                if not tracer.enabled:
+                    return await fn(*args, **kwargs)
+                parent = _current_span.get()
+                if parent is not None and not parent.recording:
+                    return await fn(*args, **kwargs)
+                with tracer.start_span(span_name):
+                    return await fn(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return fn(*args, **kwargs)
+            parent = _current_span.get()
+            if parent is not None and not parent.recording:
+                return fn(*args, **kwargs)
+            with tracer.start_span(span_name):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def trace_methods(cls: type) -> type:
+    """Class decorator that traces every public method defined on the class as ``ClassName.method``."""
+    for attribute, value in list(vars(cls).items()):
+        if not attribute.startswith("_") and inspect.isfunction(value):
+            setattr(cls, attribute, traced(f"{cls.__name__}.{attribute}")(value))
+    return cls
+
+
+def create_span_exporter():
+    backend = settings.tracing_exporter.lower()
+    if backend == "memory":
+        return InMemorySpanExporter()
+    return OTLPJsonFileExporter(settings.tracing_file_path, settings.tracing_service_name)
+
+
+# Global tracer for this worker process; off unless TRACING_ENABLED is set
+tracer = Tracer(
+    enabled=settings.tracing_enabled,
+    sample_rate=settings.tracing_sample_rate,
+    exporter=create_span_exporter() if settings.tracing_enabled else None,
+)
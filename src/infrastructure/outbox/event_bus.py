@@ -0,0 +1,43 @@
+import logging
+from collections import defaultdict
+from typing import Awaitable, Callable, Dict, List
+
+from src.domain.entities.outbox_event import OutboxEvent
+from src.infrastructure.observability.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+EventHandler = Callable[[OutboxEvent], Awaitable[None]]
+
+
+class EventBus:
+    """In-process publish/subscribe for events relayed from the outbox.
+
+    Handlers subscribe to an exact event type (``task.updated``), an aggregate prefix
+    (``task.*``) or everything (``*``). A failing handler is logged and counted but does not
+    stop delivery to the other handlers.
+    """
+
+    def __init__(self):
+        self._handlers: Dict[str, List[EventHandler]] = defaultdict(list)
+
+    def subscribe(self, pattern: str, handler: EventHandler) -> None:
+        self._handlers[pattern].append(handler)
+
+    def unsubscribe(self, pattern: str, handler: EventHandler) -> None:
+        if handler in self._handlers.get(pattern, []):
+            self._handlers[pattern].remove(handler)
+
+    async def publish(self, event: OutboxEvent) -> None:
+        aggregate = event.event_type.split(".", 1)[0]
+        for pattern in (event.event_type, f"{aggregate}.*", "*"):
+            for handler in self._handlers.get(pattern, ()):
+                try:
+                    await handler(event)
+                except Exception:
+                    metrics.counter("outbox_handler_errors_total", event_type=event.event_type).inc()
+                    logger.exception("Outbox handler failed for event %s (%s)", event.id, event.event_type)
+
+
+# Process-wide bus the outbox relay publishes to
+event_bus = EventBus()
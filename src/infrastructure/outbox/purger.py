@@ -0,0 +1,106 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import Delete, delete, select
+
+from src.infrastructure.config.settings import settings
+from src.infrastructure.database.connection import get_session_factory
+from src.infrastructure.database.models.outbox_event_model import OutboxEventModel
+from src.infrastructure.observability.metrics import metrics
+from src.infrastructure.utils.datetime_utils import utc_now
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxPurger:
+    """Deletes relayed outbox rows once they are older than the retention window.
+
+    Rows go in id order in small batches, each its own short transaction, with a pause between
+    batches. Unprocessed rows are never touched, whatever their age.
+    """
+
+    def __init__(self, session_factory, retention: timedelta, batch_size: int = 1000, batch_sleep: float = 0.1, interval: float = 3600.0):
+        self.session_factory = session_factory
+        self.retention = retention
+        self.batch_size = batch_size
+        self.batch_sleep = batch_sleep
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+        self._purged = metrics.counter("outbox_events_purged_total")
+
+    @staticmethod
+    def purge_statement(cutoff: datetime, after_id: int, limit: int) -> Delete:
+        # Walks the primary key from the last batch on; rows the relay is still holding are skipped, not waited for
+        batch = (
+            select(OutboxEventModel.id)
+            .where(OutboxEventModel.id > after_id, OutboxEventModel.processed_at < cutoff)
+            .order_by(OutboxEventModel.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return (
+            delete(OutboxEventModel)
+            .where(OutboxEventModel.id.in_(batch.scalar_subquery()))
+            .returning(OutboxEventModel.id)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def purge_once(self) -> int:
+        """Purge every processed row currently past the retention window. Returns the rows removed."""
+        cutoff = utc_now() - self.retention
+        total = 0
+        after_id = 0
+        while True:
+            async with self.session_factory() as session:
+                result = await session.execute(self.purge_statement(cutoff, after_id, self.batch_size))
+                ids = result.scalars().all()
+                await session.commit()
+            total += len(ids)
+            self._purged.inc(len(ids))
+            if len(ids) < self.batch_size:
+                break
+            after_id = max(ids)
+            await asyncio.sleep(self.batch_sleep)
+        if total:
+            logger.info("Purged processed outbox rows", extra={"outbox": total})
+        return total
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.purge_once()
+            except Exception:
+                logger.exception("Outbox purge failed")
+            await asyncio.sleep(self.interval)
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+
+_purger: Optional[OutboxPurger] = None
+
+
+def get_outbox_purger() -> Optional[OutboxPurger]:
+    """Process-wide purger, or None when outbox purging is disabled for this worker."""
+    global _purger
+    if not settings.outbox_purge_enabled:
+        return None
+    if _purger is None:
+        _purger = OutboxPurger(
+            get_session_factory(),
+            retention=timedelta(hours=settings.outbox_retention_hours),
+            batch_size=settings.outbox_purge_batch_size,
+            batch_sleep=settings.outbox_purge_batch_sleep_seconds,
+            interval=settings.outbox_purge_interval_seconds,
+        )
+    return _purger
@@ -0,0 +1,79 @@
+from dataclasses import asdict, fields
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Iterable
+
+from sqlalchemy import ColumnElement
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy import String, cast, func, insert, literal, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.selectable import CTE
+
+from src.infrastructure.database.models.outbox_event_model import OutboxEventModel
+from src.infrastructure.utils.datetime_utils import utc_now
+
+TASK = "task"
+TASK_LIST = "task_list"
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def event_payload(entity: Any) -> Dict[str, Any]:
+    """JSON-safe snapshot of a domain dataclass."""
+    return {key: _json_value(value) for key, value in asdict(entity).items() if key != "hashed_password"}
+
+
+def payload_expression(rows: CTE, entity_class: type) -> ColumnElement:
+    """``event_payload`` computed by PostgreSQL from the columns of ``rows``, for events written by SQL.
+
+    Enum columns hold the member names; every enum here has the lower-cased name as its value.
+    json_build_object renders timestamps the way ``datetime.isoformat`` does. Keys are inlined: its
+    arguments are untyped, so PostgreSQL could not infer a type for bound parameters there.
+    """
+    arguments = []
+    for field in fields(entity_class):
+        column = rows.c[field.name]
+        if isinstance(column.type, SQLEnum):
+            column = func.lower(cast(column, String))
+        arguments.extend((literal_column(f"'{field.name}'"), column))
+    return func.json_build_object(*arguments)
+
+
+def outbox_rows_from(rows: CTE, aggregate_type: str, event_type: str, entity_class: type):
+    """``INSERT INTO outbox ... SELECT`` with one event per row of ``rows`` (a CTE with the entity's columns)."""
+    events = select(
+        literal(aggregate_type),
+        rows.c.id,
+        literal(f"{aggregate_type}.{event_type}"),
+        payload_expression(rows, entity_class),
+        literal(utc_now()),
+    )
+    return insert(OutboxEventModel).from_select(["aggregate_type", "aggregate_id", "event_type", "payload", "created_at"], events)
+
+
+def outbox_row(aggregate_type: str, aggregate_id: int, event_type: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "aggregate_type": aggregate_type,
+        "aggregate_id": aggregate_id,
+        "event_type": f"{aggregate_type}.{event_type}",
+        "payload": payload,
+        "created_at": utc_now(),
+    }
+
+
+async def record_event(session: AsyncSession, aggregate_type: str, aggregate_id: int, event_type: str, payload: Dict[str, Any]) -> None:
+    """Write an outbox row in the caller's transaction; it becomes visible to the relay only on commit."""
+    await session.execute(insert(OutboxEventModel).values(**outbox_row(aggregate_type, aggregate_id, event_type, payload)))
+
+
+async def record_events(session: AsyncSession, rows: Iterable[Dict[str, Any]]) -> None:
+    """Multi-row variant of ``record_event`` for set-based writes."""
+    rows = list(rows)
+    if rows:
+        await session.execute(insert(OutboxEventModel), rows)
@@ -0,0 +1,117 @@
+import asyncio
+import logging
+import time
+from typing import List, Optional
+
+from sqlalchemy import select, update
+
+from src.infrastructure.config.settings import settings
+from src.infrastructure.database.connection import get_session_factory
+from src.infrastructure.database.mappers import OutboxEventMapper
+from src.infrastructure.database.models.outbox_event_model import OutboxEventModel
+from src.infrastructure.observability.metrics import metrics
+from src.infrastructure.outbox.event_bus import EventBus, event_bus
+from src.infrastructure.utils.datetime_utils import utc_now
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxRelay:
+    """Moves committed outbox rows to in-process subscribers.
+
+    Each batch is claimed with ``SELECT ... FOR UPDATE SKIP LOCKED`` inside its own transaction,
+    published, and marked processed before commit, so relays running in several tasks or worker
+    processes never hand the same row out twice. If a relay dies between publishing and commit
+    the batch is released and delivered again, i.e. delivery is at-least-once across crashes.
+    """
+
+    def __init__(self, session_factory, bus: EventBus, batch_size: int = 100, poll_interval: float = 1.0, concurrency: int = 1):
+        self.session_factory = session_factory
+        self.bus = bus
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.concurrency = concurrency
+        self._tasks: List[asyncio.Task] = []
+        self._stopping: Optional[asyncio.Event] = None
+
+        self._relayed = metrics.counter("outbox_events_relayed_total")
+        self._batches = metrics.counter("outbox_batches_total")
+        self._batch_seconds = metrics.histogram("outbox_batch_seconds")
+
+    async def relay_batch(self) -> int:
+        """Claim, publish and mark one batch. Returns the number of events relayed."""
+        started = time.perf_counter()
+        async with self.session_factory() as session:
+            async with session.begin():
+                result = await session.execute(
+                    select(OutboxEventModel)
+                    .where(OutboxEventModel.processed_at.is_(None))
+                    .order_by(OutboxEventModel.id)
+                    .limit(self.batch_size)
+                    .with_for_update(skip_locked=True)
+                )
+                events = [OutboxEventMapper.to_domain(model) for model in result.scalars().all()]
+                if not events:
+                    return 0
+
+                for event in events:
+                    await self.bus.publish(event)
+
+                await session.execute(
+                    update(OutboxEventModel)
+                    .where(OutboxEventModel.id.in_([event.id for event in events]))
+                    .values(processed_at=utc_now())
+                    .execution_options(synchronize_session=False)
+                )
+
+        self._relayed.inc(len(events))
+        self._batches.inc()
+        self._batch_seconds.observe(time.perf_counter() - started)
+        return len(events)
+
+    async def run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                relayed = await self.relay_batch()
+            except Exception:
+                logger.exception("Outbox relay batch failed")
+                relayed = 0
+
+            if relayed < self.batch_size:
+                # Caught up: wait for new rows (or shutdown) before polling again
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+        self._stopping = asyncio.Event()
+        self._tasks = [asyncio.create_task(self.run()) for _ in range(self.concurrency)]
+
+    async def stop(self) -> None:
+        if not self._tasks:
+            return
+        self._stopping.set()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+
+_relay: Optional[OutboxRelay] = None
+
+
+def get_outbox_relay() -> Optional[OutboxRelay]:
+    """Process-wide relay, or None when the relay is disabled for this worker."""
+    global _relay
+    if not settings.outbox_relay_enabled:
+        return None
+    if _relay is None:
+        _relay = OutboxRelay(
+            session_factory=get_session_factory(),
+            bus=event_bus,
+            batch_size=settings.outbox_batch_size,
+            poll_interval=settings.outbox_poll_interval_seconds,
+            concurrency=settings.outbox_relay_workers,
+        )
+    return _relay
@@ -0,0 +1,40 @@
+from dataclasses import replace
+from datetime import datetime
+from typing import Optional
+
+from src.domain.entities.idempotency_record import IdempotencyRecord
+from src.domain.outputs.idempotency_repository import IdempotencyRepository
+from src.infrastructure.repositories.in_memory_store import InMemoryStore, in_memory_store
+from src.infrastructure.utils.datetime_utils import utc_now
+
+
+class InMemoryIdempotencyRepository(IdempotencyRepository):
+    def __init__(self, store: InMemoryStore = in_memory_store):
+        self.store = store
+
+    async def get(self, user_id: int, key: str, now: datetime) -> Optional[IdempotencyRecord]:
+        record = self.store.idempotency_records.get((user_id, key))
+        return replace(record) if record is not None and record.expires_at > now else None
+
+    async def save(self, record: IdempotencyRecord) -> bool:
+        created_at = record.created_at or utc_now()
+        current = self.store.idempotency_records.get((record.user_id, record.key))
+        # An expired record is taken over in place; a live one keeps the key
+        if current is not None and current.expires_at > created_at:
+            return False
+        self.store.idempotency_records[(record.user_id, record.key)] = replace(record, created_at=created_at)
+        return True
+
+    async def commit(self) -> None:
+        # Writes to the store are visible as soon as they are made
+        pass
+
+    async def rollback(self) -> None:
+        # The store has no transactions; in one process the single-flight group keeps a duplicate from racing the save
+        pass
+
+    async def purge_expired(self, now: datetime, limit: int) -> int:
+        expired = [key for key, record in self.store.idempotency_records.items() if record.expires_at <= now][:limit]
+        for key in expired:
+            del self.store.idempotency_records[key]
+        return len(expired)
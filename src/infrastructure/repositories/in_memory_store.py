@@ -0,0 +1,82 @@
+from collections import defaultdict
+from datetime import datetime
+from typing import DefaultDict, Dict, Iterable, List, Set, Tuple
+
+from src.domain.entities.idempotency_record import IdempotencyRecord
+from src.domain.entities.task import Task, TaskPriority, TaskStatus
+from src.domain.entities.task_list import TaskList
+from src.domain.entities.tombstone import SyncEntityType, Tombstone
+from src.domain.entities.user import User
+
+
+class InMemoryStore:
+    """Tables and secondary indexes backing the in-memory repositories.
+
+    Repositories share one store per process the way SQLAlchemy repositories share a database.
+    Every mutation completes without awaiting, so it is atomic with respect to other coroutines.
+    Entities are copied on the way in and out; callers never hold a reference into the store.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.users: Dict[int, User] = {}
+        self.user_ids_by_email: Dict[str, int] = {}
+        self.user_ids_by_username: Dict[str, int] = {}
+
+        self.task_lists: Dict[int, TaskList] = {}
+
+        self.tasks: Dict[int, Task] = {}
+        self.task_ids_by_task_list: DefaultDict[int, Set[int]] = defaultdict(set)
+        self.task_ids_by_status_priority: DefaultDict[Tuple[TaskStatus, TaskPriority], Set[int]] = defaultdict(set)
+        self.task_ids_by_assignee: DefaultDict[int, Set[int]] = defaultdict(set)
+
+        self.tombstones: List[Tombstone] = []
+        self.idempotency_records: Dict[Tuple[int, str], IdempotencyRecord] = {}
+
+        self._sequences: DefaultDict[str, int] = defaultdict(int)
+
+    def next_id(self, table: str) -> int:
+        self._sequences[table] += 1
+        return self._sequences[table]
+
+    def add_tombstone(self, entity_type: SyncEntityType, entity_id: int, deleted_at: datetime) -> None:
+        # Lets delta sync clients drop the row on their side, like the sync_tombstones table
+        self.tombstones.append(Tombstone(entity_type=entity_type, entity_id=entity_id, id=self.next_id("sync_tombstones"), deleted_at=deleted_at))
+
+    def index_task(self, task: Task) -> None:
+        # Like the partial indexes on the PostgreSQL side, secondary indexes only hold active tasks
+        if not task.is_active:
+            return
+        self.task_ids_by_task_list[task.task_list_id].add(task.id)
+        self.task_ids_by_status_priority[(task.status, task.priority)].add(task.id)
+        if task.assigned_user_id is not None:
+            self.task_ids_by_assignee[task.assigned_user_id].add(task.id)
+
+    def unindex_task(self, task: Task) -> None:
+        self._discard(self.task_ids_by_task_list, task.task_list_id, task.id)
+        self._discard(self.task_ids_by_status_priority, (task.status, task.priority), task.id)
+        if task.assigned_user_id is not None:
+            self._discard(self.task_ids_by_assignee, task.assigned_user_id, task.id)
+
+    def task_ids_with_status_priority(self, status: TaskStatus = None, priority: TaskPriority = None) -> Set[int]:
+        statuses: Iterable[TaskStatus] = (status,) if status is not None else TaskStatus
+        priorities: Iterable[TaskPriority] = (priority,) if priority is not None else TaskPriority
+        ids: Set[int] = set()
+        for key_status in statuses:
+            for key_priority in priorities:
+                ids |= self.task_ids_by_status_priority.get((key_status, key_priority), set())
+        return ids
+
+    @staticmethod
+    def _discard(index: Dict, key, entity_id: int) -> None:
+        ids = index.get(key)
+        if ids is not None:
+            ids.discard(entity_id)
+            if not ids:
+                del index[key]
+
+
+# Process-wide store used when settings.repository_backend is "memory"
+in_memory_store = InMemoryStore()
@@ -0,0 +1,39 @@
+import heapq
+from dataclasses import replace
+from datetime import datetime
+from typing import Callable, Iterable, List, Optional, TypeVar
+
+from src.domain.entities.task import Task
+from src.domain.entities.task_list import TaskList
+from src.domain.entities.tombstone import Tombstone
+from src.domain.outputs.sync_repository import SyncRepository
+from src.infrastructure.repositories.in_memory_store import InMemoryStore, in_memory_store
+
+T = TypeVar("T")
+
+
+class InMemorySyncRepository(SyncRepository):
+    def __init__(self, store: InMemoryStore = in_memory_store):
+        self.store = store
+
+    @staticmethod
+    def _keyset_page(
+        rows: Iterable[T], timestamp_of: Callable[[T], Optional[datetime]], after_timestamp: Optional[datetime], after_id: int, limit: int
+    ) -> List[T]:
+        # Same (timestamp, id) order and bound as the keyset query on the PostgreSQL side
+        keyed = ((timestamp_of(row), row.id, row) for row in rows if timestamp_of(row) is not None)
+        if after_timestamp is not None:
+            keyed = (entry for entry in keyed if (entry[0], entry[1]) > (after_timestamp, after_id))
+        return [replace(row) for _, _, row in heapq.nsmallest(limit, keyed, key=lambda entry: entry[:2])]
+
+    async def get_tasks_changed_since(self, after_timestamp: Optional[datetime], after_id: int, limit: int) -> List[Task]:
+        # Soft-deleted rows reach clients as tombstones instead
+        tasks = (task for task in self.store.tasks.values() if task.is_active)
+        return self._keyset_page(tasks, lambda task: task.updated_at, after_timestamp, after_id, limit)
+
+    async def get_task_lists_changed_since(self, after_timestamp: Optional[datetime], after_id: int, limit: int) -> List[TaskList]:
+        task_lists = (task_list for task_list in self.store.task_lists.values() if task_list.is_active)
+        return self._keyset_page(task_lists, lambda task_list: task_list.updated_at, after_timestamp, after_id, limit)
+
+    async def get_tombstones_since(self, after_timestamp: Optional[datetime], after_id: int, limit: int) -> List[Tombstone]:
+        return self._keyset_page(self.store.tombstones, lambda tombstone: tombstone.deleted_at, after_timestamp, after_id, limit)
@@ -0,0 +1,134 @@
+from dataclasses import replace
+from datetime import timedelta
+from typing import List, Optional
+
+from src.domain.entities.task import TaskStatus
+from src.domain.entities.task_list import TaskList, TaskListClone
+from src.domain.entities.tombstone import SyncEntityType
+from src.domain.exceptions.task_list_exceptions import InvalidUserException, TaskListHasTasksException
+from src.domain.outputs.task_list_repository import TaskListRepository
+from src.infrastructure.repositories.in_memory_store import InMemoryStore, in_memory_store
+from src.infrastructure.utils.datetime_utils import utc_now
+
+
+class InMemoryTaskListRepository(TaskListRepository):
+    def __init__(self, store: InMemoryStore = in_memory_store):
+        self.store = store
+
+    def _check_user(self, task_list: TaskList) -> None:
+        if task_list.user_id is not None and task_list.user_id not in self.store.users:
+            raise InvalidUserException(task_list.user_id)
+
+    async def create(self, task_list: TaskList) -> TaskList:
+        self._check_user(task_list)
+        now = utc_now()
+        created = replace(
+            task_list,
+            id=self.store.next_id("task_lists"),
+            is_active=True if task_list.is_active is None else task_list.is_active,
+            created_at=task_list.created_at or now,
+            updated_at=task_list.updated_at or now,
+        )
+        self.store.task_lists[created.id] = created
+        return replace(created)
+
+    async def get_by_id(self, task_list_id: int) -> Optional[TaskList]:
+        task_list = self.store.task_lists.get(task_list_id)
+        return replace(task_list) if task_list and task_list.is_active else None
+
+    async def get_by_ids(self, task_list_ids: List[int]) -> List[Optional[TaskList]]:
+        return [await self.get_by_id(task_list_id) for task_list_id in task_list_ids]
+
+    async def update(self, task_list: TaskList) -> TaskList:
+        current = self.store.task_lists.get(task_list.id)
+        if not current or not current.is_active:
+            raise ValueError(f"TaskList with id {task_list.id} not found")
+        self._check_user(task_list)
+
+        updated = replace(
+            current,
+            title=task_list.title,
+            description=task_list.description,
+            user_id=task_list.user_id,
+            is_active=task_list.is_active,
+            updated_at=utc_now(),
+        )
+        self.store.task_lists[updated.id] = updated
+        return replace(updated)
+
+    async def delete(self, task_list_id: int) -> bool:
+        task_list = self.store.task_lists.get(task_list_id)
+        if task_list is None or not task_list.is_active:
+            return False
+        # The task index only holds active tasks, which keep their list alive
+        if self.store.task_ids_by_task_list.get(task_list_id):
+            raise TaskListHasTasksException(task_list_id)
+        now = utc_now()
+        self.store.task_lists[task_list_id] = replace(task_list, is_active=False, updated_at=now)
+        self.store.add_tombstone(SyncEntityType.TASK_LIST, task_list_id, now)
+        return True
+
+    async def clone(
+        self,
+        task_list_id: int,
+        task_list: TaskList,
+        reset_status: bool = False,
+        due_date_shift: Optional[timedelta] = None,
+        assigned_user_id: Optional[int] = None,
+        unassign: bool = False,
+    ) -> Optional[TaskListClone]:
+        source = self.store.task_lists.get(task_list_id)
+        if source is None or not source.is_active:
+            return None
+        user_id = source.user_id if task_list.user_id is None else task_list.user_id
+        if user_id is not None and user_id not in self.store.users:
+            raise InvalidUserException(user_id)
+        if assigned_user_id is not None and assigned_user_id not in self.store.users:
+            raise InvalidUserException(assigned_user_id)
+
+        now = utc_now()
+        copy = TaskList(
+            id=self.store.next_id("task_lists"),
+            title=source.title if task_list.title is None else task_list.title,
+            description=source.description if task_list.description is None else task_list.description,
+            user_id=user_id,
+            created_at=now,
+            updated_at=now,
+        )
+        self.store.task_lists[copy.id] = copy
+        task_ids = sorted(self.store.task_ids_by_task_list.get(task_list_id, ()))
+        for task_id in task_ids:
+            task = self.store.tasks[task_id]
+            if unassign:
+                assignee = None
+            else:
+                assignee = task.assigned_user_id if assigned_user_id is None else assigned_user_id
+            copied = replace(
+                task,
+                id=self.store.next_id("tasks"),
+                task_list_id=copy.id,
+                status=TaskStatus.PENDING if reset_status else task.status,
+                assigned_user_id=assignee,
+                due_date=task.due_date + due_date_shift if due_date_shift is not None and task.due_date is not None else task.due_date,
+                created_at=now,
+                updated_at=now,
+            )
+            self.store.tasks[copied.id] = copied
+            self.store.index_task(copied)
+        return TaskListClone(task_list=replace(copy), tasks_copied=len(task_ids))
+
+    async def list_all(self) -> List[TaskList]:
+        return [replace(task_list) for task_list in self.store.task_lists.values() if task_list.is_active]
+
+    async def list_for_user(self, user_id: int) -> List[TaskList]:
+        assigned = {self.store.tasks[task_id].task_list_id for task_id in self.store.task_ids_by_assignee.get(user_id, ())}
+        return [
+            replace(task_list)
+            for task_list_id, task_list in sorted(self.store.task_lists.items())
+            if task_list.is_active and (task_list.user_id == user_id or task_list_id in assigned)
+        ]
+
+    async def list_page(self, after_id: int = 0, limit: int = 100) -> List[TaskList]:
+        task_lists = self.store.task_lists
+        task_list_ids = sorted(task_list_id for task_list_id, task_list in task_lists.items() if task_list_id > after_id and task_list.is_active)
+        return [replace(task_lists[task_list_id]) for task_list_id in task_list_ids[:limit]]
@@ -0,0 +1,273 @@
+from dataclasses import replace
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from src.domain.entities.task import PRIORITY_RANK, UNSET, Task, TaskChanges, TaskPriority, TaskSearchHit, TaskStatus
+from src.domain.entities.tombstone import SyncEntityType
+from src.domain.exceptions.task_exceptions import InvalidTaskListException, InvalidUserException
+from src.domain.outputs.task_repository import TaskRepository
+from src.infrastructure.repositories.in_memory_store import InMemoryStore, in_memory_store
+from src.infrastructure.utils.datetime_utils import utc_now
+from src.infrastructure.utils.text_search import TRIGRAM_SIMILARITY_THRESHOLD, search_terms, trigram_similarity, words
+
+# ts_rank's default weights for title (A) and description (B) terms
+TITLE_WEIGHT = 1.0
+DESCRIPTION_WEIGHT = 0.4
+
+
+class InMemoryTaskRepository(TaskRepository):
+    def __init__(self, store: InMemoryStore = in_memory_store):
+        self.store = store
+
+    def _check_references(self, task: Task) -> None:
+        # Mirrors the foreign keys on tasks.task_list_id and tasks.assigned_user_id
+        if task.task_list_id not in self.store.task_lists:
+            raise InvalidTaskListException(task.task_list_id)
+        if task.assigned_user_id is not None and task.assigned_user_id not in self.store.users:
+            raise InvalidUserException(task.assigned_user_id)
+
+    def _fetch(self, task_ids) -> List[Task]:
+        return [replace(self.store.tasks[task_id]) for task_id in sorted(task_ids) if self.store.tasks[task_id].is_active]
+
+    async def create(self, task: Task) -> Task:
+        self._check_references(task)
+        now = utc_now()
+        created = replace(
+            task,
+            id=self.store.next_id("tasks"),
+            status=task.status or TaskStatus.PENDING,
+            priority=task.priority or TaskPriority.MEDIUM,
+            is_active=True if task.is_active is None else task.is_active,
+            created_at=task.created_at or now,
+            updated_at=task.updated_at or now,
+        )
+        self.store.tasks[created.id] = created
+        self.store.index_task(created)
+        return replace(created)
+
+    async def get_by_id(self, task_id: int) -> Optional[Task]:
+        task = self.store.tasks.get(task_id)
+        return replace(task) if task and task.is_active else None
+
+    async def get_by_ids(self, task_ids: List[int]) -> List[Optional[Task]]:
+        return [await self.get_by_id(task_id) for task_id in task_ids]
+
+    async def update(self, task: Task) -> Task:
+        current = self.store.tasks.get(task.id)
+        if not current or not current.is_active:
+            raise ValueError(f"Task with id {task.id} not found")
+        self._check_references(task)
+
+        updated = replace(
+            current,
+            title=task.title,
+            description=task.description,
+            task_list_id=task.task_list_id,
+            status=task.status,
+            priority=task.priority,
+            assigned_user_id=task.assigned_user_id,
+            due_date=task.due_date,
+            is_active=task.is_active,
+            updated_at=utc_now(),
+        )
+        self.store.unindex_task(current)
+        self.store.tasks[updated.id] = updated
+        self.store.index_task(updated)
+        return replace(updated)
+
+    async def bulk_update(
+        self,
+        changes: TaskChanges,
+        task_ids: Optional[List[int]] = None,
+        task_list_id: Optional[int] = None,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        due_before: Optional[datetime] = None,
+        due_after: Optional[datetime] = None,
+        overdue: bool = False,
+    ) -> List[Tuple[Task, Task]]:
+        # The references are the same for every row, so they are checked once up front
+        if changes.task_list_id is not UNSET and changes.task_list_id not in self.store.task_lists:
+            raise InvalidTaskListException(changes.task_list_id)
+        if changes.assigned_user_id not in (None, UNSET) and changes.assigned_user_id not in self.store.users:
+            raise InvalidUserException(changes.assigned_user_id)
+
+        tasks = await self.get_tasks_by_filters(task_list_id, status, priority, due_before, due_after, overdue)
+        if task_ids is not None:
+            wanted = set(task_ids)
+            tasks = [task for task in tasks if task.id in wanted]
+        values = changes.values()
+        now = utc_now()
+        changed = []
+        for task in tasks:
+            if all(getattr(task, name) == value for name, value in values.items()):
+                continue
+            updated = replace(task, **values, updated_at=now)
+            self.store.unindex_task(self.store.tasks[task.id])
+            self.store.tasks[updated.id] = updated
+            self.store.index_task(updated)
+            changed.append((task, replace(updated)))
+        return changed
+
+    async def delete(self, task_id: int) -> bool:
+        task = self.store.tasks.get(task_id)
+        if task is None or not task.is_active:
+            return False
+        now = utc_now()
+        self.store.unindex_task(task)
+        self.store.tasks[task_id] = replace(task, is_active=False, updated_at=now)
+        self.store.add_tombstone(SyncEntityType.TASK, task_id, now)
+        return True
+
+    async def delete_by_task_list_id(self, task_list_id: int, limit: Optional[int] = None) -> int:
+        task_ids = sorted(self.store.task_ids_by_task_list.get(task_list_id, ()))[:limit]
+        now = utc_now()
+        for task_id in task_ids:
+            task = self.store.tasks[task_id]
+            self.store.unindex_task(task)
+            self.store.tasks[task_id] = replace(task, is_active=False, updated_at=now)
+            self.store.add_tombstone(SyncEntityType.TASK, task_id, now)
+        return len(task_ids)
+
+    async def list_all(self) -> List[Task]:
+        return [replace(task) for task in self.store.tasks.values() if task.is_active]
+
+    async def get_by_task_list_id(self, task_list_id: int) -> List[Task]:
+        return self._fetch(self.store.task_ids_by_task_list.get(task_list_id, ()))
+
+    async def count_by_task_list_id(self, task_list_id: int) -> int:
+        return len(self.store.task_ids_by_task_list.get(task_list_id, ()))
+
+    async def get_tasks_by_filters(
+        self,
+        task_list_id: Optional[int] = None,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        due_before: Optional[datetime] = None,
+        due_after: Optional[datetime] = None,
+        overdue: bool = False,
+    ) -> List[Task]:
+        candidates = None
+        if task_list_id is not None:
+            candidates = self.store.task_ids_by_task_list.get(task_list_id, set())
+        if status is not None or priority is not None:
+            matching = self.store.task_ids_with_status_priority(status, priority)
+            candidates = matching if candidates is None else candidates & matching
+        tasks = self._fetch(self.store.tasks if candidates is None else candidates)
+
+        now = utc_now()
+        return [
+            task
+            for task in tasks
+            if (due_before is None or (task.due_date is not None and task.due_date < due_before))
+            and (due_after is None or (task.due_date is not None and task.due_date >= due_after))
+            and (not overdue or self._is_overdue(task, now))
+        ]
+
+    async def get_overdue(self, assigned_user_id: Optional[int] = None, limit: int = 100) -> List[Task]:
+        task_ids = self.store.tasks if assigned_user_id is None else self.store.task_ids_by_assignee.get(assigned_user_id, ())
+        now = utc_now()
+        overdue = [task for task in self._fetch(task_ids) if self._is_overdue(task, now)]
+        overdue.sort(key=lambda task: (task.due_date, task.id))
+        return overdue[:limit]
+
+    async def get_assigned(
+        self,
+        assigned_user_id: int,
+        statuses: Optional[List[TaskStatus]] = None,
+        after_priority: Optional[TaskPriority] = None,
+        after_due_date: Optional[datetime] = None,
+        after_id: int = 0,
+        limit: int = 20,
+    ) -> List[Task]:
+        tasks = self._fetch(self.store.task_ids_by_assignee.get(assigned_user_id, ()))
+        if statuses:
+            tasks = [task for task in tasks if task.status in statuses]
+        tasks.sort(key=self._queue_key)
+        if after_priority is not None:
+            position = self._queue_key(Task(title="", task_list_id=0, id=after_id, priority=after_priority, due_date=after_due_date))
+            tasks = [task for task in tasks if self._queue_key(task) > position]
+        return tasks[:limit]
+
+    async def claim(self, task_list_id: int, user_id: int, limit: int = 1) -> List[Task]:
+        # No await between picking and updating, so claims are atomic on the event loop
+        pending = [
+            task
+            for task in self._fetch(self.store.task_ids_by_task_list.get(task_list_id, ()))
+            if task.status == TaskStatus.PENDING and task.is_active
+        ]
+        pending.sort(key=lambda task: (-PRIORITY_RANK[task.priority], task.created_at, task.id))
+        if pending and user_id not in self.store.users:
+            raise InvalidUserException(user_id)
+
+        claimed = []
+        now = utc_now()
+        for task in pending[:limit]:
+            updated = replace(self.store.tasks[task.id], status=TaskStatus.IN_PROGRESS, assigned_user_id=user_id, updated_at=now)
+            self.store.unindex_task(self.store.tasks[task.id])
+            self.store.tasks[updated.id] = updated
+            self.store.index_task(updated)
+            claimed.append(replace(updated))
+        return claimed
+
+    @staticmethod
+    def _queue_key(task: Task):
+        # priority DESC, due_date ASC NULLS LAST, id
+        return (-PRIORITY_RANK[task.priority], task.due_date is None, task.due_date or datetime.min, task.id)
+
+    @staticmethod
+    def _is_overdue(task: Task, now: datetime) -> bool:
+        # Mirrors OPEN_TASK plus due_date < now on the PostgreSQL side
+        return task.status != TaskStatus.COMPLETED and task.is_active and task.due_date is not None and task.due_date < now
+
+    async def get_by_assigned_user_id(self, user_id: int) -> List[Task]:
+        return self._fetch(self.store.task_ids_by_assignee.get(user_id, ()))
+
+    async def search(
+        self,
+        query: str,
+        task_list_id: Optional[int] = None,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        after_rank: Optional[float] = None,
+        after_id: int = 0,
+        limit: int = 20,
+    ) -> List[TaskSearchHit]:
+        # Same matching rules as the PostgreSQL search (every term as a word prefix, or a fuzzy title
+        # match), without stemming; the rank approximates ts_rank + similarity
+        terms = search_terms(query)
+        hits = []
+        for task in self.store.tasks.values():
+            if not task.is_active:
+                continue
+            if task_list_id is not None and task.task_list_id != task_list_id:
+                continue
+            if (status is not None and task.status != status) or (priority is not None and task.priority != priority):
+                continue
+            similarity = trigram_similarity(task.title, query)
+            term_rank = self._term_rank(terms, task)
+            if term_rank is None and similarity < TRIGRAM_SIMILARITY_THRESHOLD:
+                continue
+            rank = (term_rank or 0.0) + similarity
+            if after_rank is not None and (rank > after_rank or (rank == after_rank and task.id <= after_id)):
+                continue
+            hits.append(TaskSearchHit(task=replace(task), rank=rank))
+        hits.sort(key=lambda hit: (-hit.rank, hit.task.id))
+        return hits[:limit]
+
+    @staticmethod
+    def _term_rank(terms: List[str], task: Task) -> Optional[float]:
+        if not terms:
+            return None
+        title_words = words(task.title)
+        description_words = words(task.description or "")
+        weights = []
+        for term in terms:
+            if any(word.startswith(term) for word in title_words):
+                weights.append(TITLE_WEIGHT)
+            elif any(word.startswith(term) for word in description_words):
+                weights.append(DESCRIPTION_WEIGHT)
+            else:
+                return None
+        # A single title hit scores about 0.06 in ts_rank; keep term and similarity scores in the same proportion
+        return sum(weights) / len(weights) * 0.06
@@ -0,0 +1,38 @@
+from dataclasses import replace
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from src.domain.entities.user import User
+from src.domain.exceptions.user_exceptions import DuplicateEmailException, DuplicateUsernameException
+from src.domain.repositories.user_repository import UserRepository
+from src.infrastructure.repositories.in_memory_store import InMemoryStore, in_memory_store
+
+
+class InMemoryUserRepository(UserRepository):
+    def __init__(self, store: InMemoryStore = in_memory_store):
+        self.store = store
+
+    async def create(self, user: User) -> User:
+        # Same unique constraints as the users table (case-sensitive, email checked first)
+        if user.email in self.store.user_ids_by_email:
+            raise DuplicateEmailException(user.email)
+        if user.username in self.store.user_ids_by_username:
+            raise DuplicateUsernameException(user.username)
+
+        now = datetime.now(timezone.utc)
+        created = replace(user, id=self.store.next_id("users"), created_at=now, updated_at=now)
+        self.store.users[created.id] = created
+        self.store.user_ids_by_email[created.email] = created.id
+        self.store.user_ids_by_username[created.username] = created.id
+        return replace(created)
+
+    async def get(self, user_id: int) -> Optional[User]:
+        user = self.store.users.get(user_id)
+        return replace(user) if user else None
+
+    async def get_by_ids(self, user_ids: List[int]) -> List[Optional[User]]:
+        return [await self.get(user_id) for user_id in user_ids]
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        user_id = self.store.user_ids_by_email.get(email)
+        return await self.get(user_id) if user_id is not None else None
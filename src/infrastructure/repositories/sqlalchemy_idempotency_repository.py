@@ -0,0 +1,67 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import delete, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.idempotency_record import IdempotencyRecord
+from src.domain.outputs.idempotency_repository import IdempotencyRepository
+from src.infrastructure.database.mappers import IdempotencyRecordMapper
+from src.infrastructure.database.models.idempotency_key_model import IdempotencyKeyModel
+from src.infrastructure.observability.tracing import trace_methods
+from src.infrastructure.utils.datetime_utils import utc_now
+
+
+@trace_methods
+class SQLAlchemyIdempotencyRepository(IdempotencyRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get(self, user_id: int, key: str, now: datetime) -> Optional[IdempotencyRecord]:
+        result = await self.session.execute(
+            select(IdempotencyKeyModel).where(
+                IdempotencyKeyModel.user_id == user_id,
+                IdempotencyKeyModel.key == key,
+                IdempotencyKeyModel.expires_at > now,
+            )
+        )
+        model = result.scalar_one_or_none()
+        return IdempotencyRecordMapper.to_domain(model) if model else None
+
+    async def save(self, record: IdempotencyRecord) -> bool:
+        values = {
+            "user_id": record.user_id,
+            "key": record.key,
+            "scope": record.scope,
+            "request_hash": record.request_hash,
+            "status_code": record.status_code,
+            "response_body": record.response_body,
+            "created_at": record.created_at or utc_now(),
+            "expires_at": record.expires_at,
+        }
+        statement = insert(IdempotencyKeyModel).values(**values)
+        # An expired row is taken over in place; a live one (possibly written by another worker,
+        # in which case the insert waits for that transaction) leaves nothing to return
+        statement = statement.on_conflict_do_update(
+            index_elements=[IdempotencyKeyModel.user_id, IdempotencyKeyModel.key],
+            set_={column: statement.excluded[column] for column in values if column not in ("user_id", "key")},
+            where=IdempotencyKeyModel.expires_at <= values["created_at"],
+        ).returning(IdempotencyKeyModel.key)
+        result = await self.session.execute(statement)
+        return result.first() is not None
+
+    async def commit(self) -> None:
+        await self.session.commit()
+
+    async def rollback(self) -> None:
+        await self.session.rollback()
+
+    async def purge_expired(self, now: datetime, limit: int) -> int:
+        expired = select(IdempotencyKeyModel.user_id, IdempotencyKeyModel.key).where(IdempotencyKeyModel.expires_at <= now).limit(limit)
+        result = await self.session.execute(
+            delete(IdempotencyKeyModel)
+            .where(tuple_(IdempotencyKeyModel.user_id, IdempotencyKeyModel.key).in_(expired))
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
@@ -0,0 +1,50 @@
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.task import Task
+from src.domain.entities.task_list import TaskList
+from src.domain.entities.tombstone import Tombstone
+from src.domain.outputs.sync_repository import SyncRepository
+from src.infrastructure.database.mappers import TASK_COLUMNS, TASK_LIST_COLUMNS, TaskListMapper, TaskMapper, TombstoneMapper
+from src.infrastructure.database.models.task_list_model import TaskListModel
+from src.infrastructure.database.models.task_model import TaskModel
+from src.infrastructure.database.models.tombstone_model import TombstoneModel
+from src.infrastructure.observability.tracing import trace_methods
+
+
+@trace_methods
+class SQLAlchemySyncRepository(SyncRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @staticmethod
+    def _keyset_query(model, timestamp_column, after_timestamp: Optional[datetime], after_id: int, limit: int, columns=None, conditions=()):
+        # Row comparison on (timestamp, id) is answered by the composite index in a single range scan
+        query = select(*columns) if columns else select(model)
+        query = query.where(*conditions)
+        if after_timestamp is not None:
+            query = query.where(tuple_(timestamp_column, model.id) > tuple_(after_timestamp, after_id))
+        else:
+            query = query.where(timestamp_column.is_not(None))
+        return query.order_by(timestamp_column, model.id).limit(limit)
+
+    async def get_tasks_changed_since(self, after_timestamp: Optional[datetime], after_id: int, limit: int) -> List[Task]:
+        # Soft-deleted rows reach clients as tombstones instead
+        query = self._keyset_query(TaskModel, TaskModel.updated_at, after_timestamp, after_id, limit, TASK_COLUMNS, (TaskModel.is_active,))
+        result = await self.session.execute(query)
+        return [TaskMapper.from_row(row) for row in result.all()]
+
+    async def get_task_lists_changed_since(self, after_timestamp: Optional[datetime], after_id: int, limit: int) -> List[TaskList]:
+        query = self._keyset_query(
+            TaskListModel, TaskListModel.updated_at, after_timestamp, after_id, limit, TASK_LIST_COLUMNS, (TaskListModel.is_active,)
+        )
+        result = await self.session.execute(query)
+        return [TaskListMapper.from_row(row) for row in result.all()]
+
+    async def get_tombstones_since(self, after_timestamp: Optional[datetime], after_id: int, limit: int) -> List[Tombstone]:
+        query = self._keyset_query(TombstoneModel, TombstoneModel.deleted_at, after_timestamp, after_id, limit)
+        result = await self.session.execute(query)
+        return [TombstoneMapper.to_domain(model) for model in result.scalars().all()]
@@ -1,16 +1,46 @@
+from datetime import datetime, timedelta
 from typing import List, Optional
 
-from sqlalchemy import select
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import (
+    ARRAY,
+    Delete,
+    Integer,
+    Interval,
+    Select,
+    Update,
+    any_,
+    bindparam,
+    cast,
+    delete,
+    exists,
+    func,
+    insert,
+    literal,
+    literal_column,
+    null,
+    select,
+    true,
+    tuple_,
+    union,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.domain.entities.task_list import TaskList
+from src.domain.entities.task import Task, TaskStatus
+from src.domain.entities.task_list import TaskList, TaskListClone
+from src.domain.entities.tombstone import SyncEntityType
 from src.domain.exceptions.task_list_exceptions import TaskListHasTasksException
 from src.domain.outputs.task_list_repository import TaskListRepository
-from src.infrastructure.database.mappers import TaskListMapper
+from src.infrastructure.database.mappers import TASK_COLUMNS, TASK_LIST_COLUMNS, TaskListMapper
 from src.infrastructure.database.models.task_list_model import TaskListModel
+from src.infrastructure.database.models.task_model import TaskModel
+from src.infrastructure.database.models.tombstone_model import TombstoneModel
+from src.infrastructure.observability.tracing import trace_methods
+from src.infrastructure.outbox.recorder import TASK, TASK_LIST, event_payload, outbox_rows_from, record_event
+from src.infrastructure.utils.datetime_utils import utc_now
 
 
+@trace_methods
 class SQLAlchemyTaskListRepository(TaskListRepository):
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -20,15 +50,30 @@ class SQLAlchemyTaskListRepository(TaskListRepository):
         self.session.add(model)
         await self.session.flush()
         await self.session.refresh(model)
-        return TaskListMapper.to_domain(model)
+        created_task_list = TaskListMapper.to_domain(model)
+        await record_event(self.session, TASK_LIST, created_task_list.id, "created", event_payload(created_task_list))
+        return created_task_list
 
     async def get_by_id(self, task_list_id: int) -> Optional[TaskList]:
-        result = await self.session.execute(select(TaskListModel).where(TaskListModel.id == task_list_id))
+        result = await self.session.execute(select(TaskListModel).where(TaskListModel.id == task_list_id, TaskListModel.is_active))
         model = result.scalar_one_or_none()
         return TaskListMapper.to_domain(model) if model else None
 
+    @staticmethod
+    def by_ids_statement(task_list_ids: List[int]) -> Select:
+        # One primary-key lookup per distinct id, bound as a single array parameter
+        ids = bindparam("task_list_ids", list(dict.fromkeys(task_list_ids)), type_=ARRAY(Integer))
+        return select(*TASK_LIST_COLUMNS).where(TaskListModel.id == any_(ids), TaskListModel.is_active)
+
+    async def get_by_ids(self, task_list_ids: List[int]) -> List[Optional[TaskList]]:
+        if not task_list_ids:
+            return []
+        result = await self.session.execute(self.by_ids_statement(task_list_ids))
+        task_lists = {task_list.id: task_list for task_list in map(TaskListMapper.from_row, result.all())}
+        return [task_lists.get(task_list_id) for task_list_id in task_list_ids]
+
     async def update(self, task_list: TaskList) -> TaskList:
-        result = await self.session.execute(select(TaskListModel).where(TaskListModel.id == task_list.id))
+        result = await self.session.execute(select(TaskListModel).where(TaskListModel.id == task_list.id, TaskListModel.is_active))
         model = result.scalar_one_or_none()
 
         if not model:
@@ -39,28 +84,150 @@ class SQLAlchemyTaskListRepository(TaskListRepository):
         model.user_id = task_list.user_id
         model.is_active = task_list.is_active
 
-        await self.session.commit()
+        await self.session.flush()
         await self.session.refresh(model)
-        return TaskListMapper.to_domain(model)
+        updated_task_list = TaskListMapper.to_domain(model)
+        await record_event(self.session, TASK_LIST, updated_task_list.id, "updated", event_payload(updated_task_list))
+        await self.session.commit()
+        return updated_task_list
+
+    @staticmethod
+    def soft_delete_statement(task_list_id: int) -> Update:
+        # A list still holding active tasks is left alone; the caller tells that apart from a missing list
+        active_tasks = exists().where(TaskModel.task_list_id == TaskListModel.id, TaskModel.is_active)
+        return (
+            update(TaskListModel)
+            .where(TaskListModel.id == task_list_id, TaskListModel.is_active, ~active_tasks)
+            .values(is_active=False, updated_at=utc_now())
+            .returning(*TASK_LIST_COLUMNS)
+            .execution_options(synchronize_session=False)
+        )
 
     async def delete(self, task_list_id: int) -> bool:
-        try:
-            result = await self.session.execute(select(TaskListModel).where(TaskListModel.id == task_list_id))
-            model = result.scalar_one_or_none()
-            if model:
-                await self.session.delete(model)
-                await self.session.flush()  # Use flush instead of commit
-                return True
-            return False
-        except IntegrityError as e:
-            await self.session.rollback()
-            # Check if it's a foreign key constraint error
-            if "foreign key constraint" in str(e).lower() or "violates foreign key" in str(e).lower():
+        row = (await self.session.execute(self.soft_delete_statement(task_list_id))).first()
+        if row is None:
+            if await self.get_by_id(task_list_id):
                 raise TaskListHasTasksException(task_list_id)
-            # Re-raise other integrity errors
-            raise e
+            return False
+        await record_event(self.session, TASK_LIST, task_list_id, "deleted", event_payload(TaskListMapper.from_row(row)))
+        # Tombstone lets delta sync clients drop the row on their side
+        self.session.add(TombstoneModel(entity_type=SyncEntityType.TASK_LIST, entity_id=task_list_id))
+        await self.session.flush()
+        return True
+
+    @staticmethod
+    def purge_statement(cutoff: datetime, after_updated_at: Optional[datetime] = None, after_id: int = 0, limit: int = 500) -> Delete:
+        # Same walk as the task purge over ix_task_lists_inactive_updated_at_id. Lists that tasks (even
+        # inactive ones awaiting their own purge) still reference are skipped and picked up by a later run
+        referenced = exists().where(TaskModel.task_list_id == TaskListModel.id)
+        conditions = [~TaskListModel.is_active, TaskListModel.updated_at < cutoff, ~referenced]
+        if after_updated_at is not None:
+            conditions.append(tuple_(TaskListModel.updated_at, TaskListModel.id) > tuple_(after_updated_at, after_id))
+        batch = select(TaskListModel.id).where(*conditions).order_by(TaskListModel.updated_at, TaskListModel.id).limit(limit)
+        return (
+            delete(TaskListModel).where(TaskListModel.id.in_(batch), ~TaskListModel.is_active).returning(TaskListModel.updated_at, TaskListModel.id)
+        )
+
+    @staticmethod
+    def clone_statement(
+        task_list_id: int,
+        task_list: TaskList,
+        reset_status: bool = False,
+        due_date_shift: Optional[timedelta] = None,
+        assigned_user_id: Optional[int] = None,
+        unassign: bool = False,
+    ) -> Select:
+        # Copy list, tasks and their outbox events in one statement: each INSERT ... SELECT is a
+        # data-modifying CTE, so the database does all the copying no matter how many tasks there are
+        now = utc_now()
+        source_list = select(
+            TaskListModel.title if task_list.title is None else literal(task_list.title),
+            TaskListModel.description if task_list.description is None else literal(task_list.description),
+            TaskListModel.user_id if task_list.user_id is None else literal(task_list.user_id),
+            true(),
+            literal(now),
+            literal(now),
+        ).where(TaskListModel.id == task_list_id, TaskListModel.is_active)
+        new_list = (
+            insert(TaskListModel)
+            .from_select(["title", "description", "user_id", "is_active", "created_at", "updated_at"], source_list)
+            .returning(*TASK_LIST_COLUMNS)
+            .cte("new_list")
+        )
+
+        if unassign:
+            assignee = null()
+        elif assigned_user_id is not None:
+            assignee = literal(assigned_user_id)
+        else:
+            assignee = TaskModel.assigned_user_id
+        source_tasks = (
+            select(
+                TaskModel.title,
+                TaskModel.description,
+                new_list.c.id,
+                cast(literal_column(f"'{TaskStatus.PENDING.name}'"), TaskModel.status.type) if reset_status else TaskModel.status,
+                TaskModel.priority,
+                assignee,
+                TaskModel.due_date if due_date_shift is None else TaskModel.due_date + literal(due_date_shift, Interval),
+                true(),
+                literal(now),
+                literal(now),
+            )
+            .where(TaskModel.task_list_id == task_list_id, TaskModel.is_active)
+            .order_by(TaskModel.id)
+        )
+        task_columns = [
+            "title",
+            "description",
+            "task_list_id",
+            "status",
+            "priority",
+            "assigned_user_id",
+            "due_date",
+            "is_active",
+            "created_at",
+            "updated_at",
+        ]
+        copied = insert(TaskModel).from_select(task_columns, source_tasks).returning(*TASK_COLUMNS).cte("copied")
+
+        list_event = outbox_rows_from(new_list, TASK_LIST, "created", TaskList).cte("list_event")
+        task_events = outbox_rows_from(copied, TASK, "created", Task).cte("task_events")
+        tasks_copied = select(func.count()).select_from(copied).scalar_subquery()
+        # Unreferenced data-modifying CTEs still run in PostgreSQL; add_cte makes SQLAlchemy render them
+        return select(*new_list.c, tasks_copied.label("tasks_copied")).add_cte(list_event, task_events)
+
+    async def clone(
+        self,
+        task_list_id: int,
+        task_list: TaskList,
+        reset_status: bool = False,
+        due_date_shift: Optional[timedelta] = None,
+        assigned_user_id: Optional[int] = None,
+        unassign: bool = False,
+    ) -> Optional[TaskListClone]:
+        statement = self.clone_statement(task_list_id, task_list, reset_status, due_date_shift, assigned_user_id, unassign)
+        row = (await self.session.execute(statement)).first()
+        if row is None:
+            return None
+        return TaskListClone(task_list=TaskListMapper.from_row(row[:-1]), tasks_copied=row.tasks_copied)
 
     async def list_all(self) -> List[TaskList]:
-        result = await self.session.execute(select(TaskListModel))
+        result = await self.session.execute(select(TaskListModel).where(TaskListModel.is_active))
         models = result.scalars().all()
         return [TaskListMapper.to_domain(model) for model in models]
+
+    async def list_for_user(self, user_id: int) -> List[TaskList]:
+        # A UNION rather than an OR so each branch keeps its own index: ix_task_lists_user_active_id for
+        # owned lists, ix_tasks_assigned_user_task_list then primary key lookups for the assigned ones
+        owned = select(*TASK_LIST_COLUMNS).where(TaskListModel.user_id == user_id, TaskListModel.is_active)
+        assigned_list_ids = select(TaskModel.task_list_id).where(TaskModel.assigned_user_id == user_id, TaskModel.is_active)
+        assigned = select(*TASK_LIST_COLUMNS).where(TaskListModel.id.in_(assigned_list_ids), TaskListModel.is_active)
+        lists = union(owned, assigned).subquery()
+        result = await self.session.execute(select(*lists.c).order_by(lists.c.id))
+        return [TaskListMapper.from_row(row) for row in result.all()]
+
+    async def list_page(self, after_id: int = 0, limit: int = 100) -> List[TaskList]:
+        statement = select(*TASK_LIST_COLUMNS).where(TaskListModel.id > after_id, TaskListModel.is_active).order_by(TaskListModel.id).limit(limit)
+        result = await self.session.execute(statement)
+        return [TaskListMapper.from_row(row) for row in result.all()]
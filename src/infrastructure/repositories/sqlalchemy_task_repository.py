@@ -1,16 +1,44 @@
-from typing import List, Optional
+from dataclasses import replace
+from datetime import datetime
+from typing import List, Optional, Tuple
 
-from sqlalchemy import and_, select
+from sqlalchemy import (
+    ARRAY,
+    REAL,
+    ColumnElement,
+    Delete,
+    Integer,
+    Select,
+    Update,
+    and_,
+    any_,
+    bindparam,
+    delete,
+    func,
+    insert,
+    literal_column,
+    or_,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.domain.entities.task import Task, TaskPriority, TaskStatus
+from src.domain.entities.task import PRIORITY_RANK, Task, TaskChanges, TaskPriority, TaskSearchHit, TaskStatus
+from src.domain.entities.tombstone import SyncEntityType
 from src.domain.exceptions.task_exceptions import InvalidTaskListException, InvalidUserException
 from src.domain.outputs.task_repository import TaskRepository
-from src.infrastructure.database.mappers import TaskMapper
-from src.infrastructure.database.models.task_model import TaskModel
+from src.infrastructure.database.mappers import TASK_COLUMNS, TaskMapper
+from src.infrastructure.database.models.task_model import OPEN_TASK, PENDING_TASK, TaskModel
+from src.infrastructure.database.models.tombstone_model import TombstoneModel
+from src.infrastructure.observability.tracing import trace_methods
+from src.infrastructure.outbox.recorder import TASK, event_payload, outbox_row, record_event, record_events
+from src.infrastructure.utils.datetime_utils import utc_now
+from src.infrastructure.utils.text_search import SEARCH_CONFIG, prefix_tsquery, search_terms
 
 
+@trace_methods
 class SQLAlchemyTaskRepository(TaskRepository):
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -21,7 +49,9 @@ class SQLAlchemyTaskRepository(TaskRepository):
             self.session.add(model)
             await self.session.flush()  # Solo flush para obtener ID
             await self.session.refresh(model)
-            return TaskMapper.to_domain(model)
+            created_task = TaskMapper.to_domain(model)
+            await record_event(self.session, TASK, created_task.id, "created", event_payload(created_task))
+            return created_task
         except IntegrityError as e:
             # No hacer rollback aquí - solo lanzar la excepción apropiada
             error_message = str(e).lower()
@@ -42,12 +72,25 @@ class SQLAlchemyTaskRepository(TaskRepository):
             raise e
 
     async def get_by_id(self, task_id: int) -> Optional[Task]:
-        result = await self.session.execute(select(TaskModel).where(TaskModel.id == task_id))
+        result = await self.session.execute(select(TaskModel).where(TaskModel.id == task_id, TaskModel.is_active))
         model = result.scalar_one_or_none()
         return TaskMapper.to_domain(model) if model else None
 
+    @staticmethod
+    def by_ids_statement(task_ids: List[int]) -> Select:
+        # One primary-key lookup per distinct id, bound as a single array parameter
+        ids = bindparam("task_ids", list(dict.fromkeys(task_ids)), type_=ARRAY(Integer))
+        return select(*TASK_COLUMNS).where(TaskModel.id == any_(ids), TaskModel.is_active)
+
+    async def get_by_ids(self, task_ids: List[int]) -> List[Optional[Task]]:
+        if not task_ids:
+            return []
+        result = await self.session.execute(self.by_ids_statement(task_ids))
+        tasks = {task.id: task for task in map(TaskMapper.from_row, result.all())}
+        return [tasks.get(task_id) for task_id in task_ids]
+
     async def update(self, task: Task) -> Task:
-        result = await self.session.execute(select(TaskModel).where(TaskModel.id == task.id))
+        result = await self.session.execute(select(TaskModel).where(TaskModel.id == task.id, TaskModel.is_active))
         model = result.scalar_one_or_none()
 
         if not model:
@@ -65,7 +108,9 @@ class SQLAlchemyTaskRepository(TaskRepository):
 
             await self.session.flush()
             await self.session.refresh(model)
-            return TaskMapper.to_domain(model)
+            updated_task = TaskMapper.to_domain(model)
+            await record_event(self.session, TASK, updated_task.id, "updated", event_payload(updated_task))
+            return updated_task
         except IntegrityError as e:
             # No hacer rollback aquí - solo lanzar la excepción apropiada
             error_message = str(e).lower()
@@ -85,44 +130,318 @@ class SQLAlchemyTaskRepository(TaskRepository):
             # Re-raise other integrity errors
             raise e
 
+    @staticmethod
+    def bulk_update_statement(
+        changes: TaskChanges,
+        task_ids: Optional[List[int]] = None,
+        task_list_id: Optional[int] = None,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        due_before: Optional[datetime] = None,
+        due_after: Optional[datetime] = None,
+        overdue: bool = False,
+    ) -> Update:
+        values = changes.values()
+        conditions = SQLAlchemyTaskRepository.filter_conditions(task_list_id, status, priority, due_before, due_after, overdue)
+        if task_ids is not None:
+            # One array parameter however many ids, so every batch size shares a single prepared statement
+            conditions.append(TaskModel.id == any_(bindparam("task_ids", task_ids, type_=ARRAY(Integer))))
+        # Rows that already hold the new values are not rewritten and raise no events
+        conditions.append(or_(*(getattr(TaskModel, name).is_distinct_from(value) for name, value in values.items())))
+        # The subquery locks the rows in id order, so concurrent bulk updates cannot deadlock, and hands
+        # the pre-update values to RETURNING for the per-row notifications
+        previous = (
+            select(TaskModel.id, TaskModel.task_list_id, TaskModel.status, TaskModel.assigned_user_id)
+            .where(*conditions)
+            .order_by(TaskModel.id)
+            .with_for_update()
+            .subquery("previous")
+        )
+        return (
+            update(TaskModel)
+            .where(TaskModel.id == previous.c.id)
+            .values(**values, updated_at=utc_now())
+            .returning(
+                *TASK_COLUMNS,
+                previous.c.task_list_id.label("previous_task_list_id"),
+                previous.c.status.label("previous_status"),
+                previous.c.assigned_user_id.label("previous_assigned_user_id"),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    async def bulk_update(
+        self,
+        changes: TaskChanges,
+        task_ids: Optional[List[int]] = None,
+        task_list_id: Optional[int] = None,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        due_before: Optional[datetime] = None,
+        due_after: Optional[datetime] = None,
+        overdue: bool = False,
+    ) -> List[Tuple[Task, Task]]:
+        statement = self.bulk_update_statement(changes, task_ids, task_list_id, status, priority, due_before, due_after, overdue)
+        try:
+            # The foreign keys check the new list and assignee inside the one statement; no per-row lookups
+            rows = (await self.session.execute(statement)).all()
+        except IntegrityError as e:
+            error_message = str(e).lower()
+            if "assigned_user_id" in error_message:
+                raise InvalidUserException(changes.assigned_user_id)
+            if "task_list_id" in error_message:
+                raise InvalidTaskListException(changes.task_list_id)
+            raise
+        changed = []
+        for row in rows:
+            after = TaskMapper.from_row(row[: len(TASK_COLUMNS)])
+            previous_task_list_id, previous_status, previous_assigned_user_id = row[len(TASK_COLUMNS) :]
+            before = replace(after, task_list_id=previous_task_list_id, status=previous_status, assigned_user_id=previous_assigned_user_id)
+            changed.append((before, after))
+        changed.sort(key=lambda pair: pair[1].id)
+        await record_events(self.session, (outbox_row(TASK, after.id, "updated", event_payload(after)) for _, after in changed))
+        return changed
+
+    @staticmethod
+    def soft_delete_statement(task_id: int) -> Update:
+        # One UPDATE, no ORM load; the purge job removes the row once it is past the retention window
+        return (
+            update(TaskModel)
+            .where(TaskModel.id == task_id, TaskModel.is_active)
+            .values(is_active=False, updated_at=utc_now())
+            .returning(*TASK_COLUMNS)
+            .execution_options(synchronize_session=False)
+        )
+
     async def delete(self, task_id: int) -> bool:
-        result = await self.session.execute(select(TaskModel).where(TaskModel.id == task_id))
-        model = result.scalar_one_or_none()
-        if model:
-            await self.session.delete(model)
-            await self.session.flush()
-            return True
-        return False
+        row = (await self.session.execute(self.soft_delete_statement(task_id))).first()
+        if row is None:
+            return False
+        await record_event(self.session, TASK, task_id, "deleted", event_payload(TaskMapper.from_row(row)))
+        # Tombstone lets delta sync clients drop the row on their side
+        self.session.add(TombstoneModel(entity_type=SyncEntityType.TASK, entity_id=task_id))
+        await self.session.flush()
+        return True
+
+    @staticmethod
+    def delete_by_task_list_statement(task_list_id: int, limit: Optional[int] = None) -> Update:
+        conditions = [TaskModel.task_list_id == task_list_id, TaskModel.is_active]
+        if limit is not None:
+            # One chunk, lowest ids first from ix_tasks_active_task_list_id, so each chunk locks a bounded set of rows
+            chunk = select(TaskModel.id).where(*conditions).order_by(TaskModel.id).limit(limit)
+            conditions = [TaskModel.id.in_(chunk), TaskModel.is_active]
+        return (
+            update(TaskModel)
+            .where(*conditions)
+            .values(is_active=False, updated_at=utc_now())
+            .returning(*TASK_COLUMNS)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def delete_by_task_list_id(self, task_list_id: int, limit: Optional[int] = None) -> int:
+        result = await self.session.execute(self.delete_by_task_list_statement(task_list_id, limit))
+        deleted = [TaskMapper.from_row(row) for row in result.all()]
+        if deleted:
+            await record_events(self.session, (outbox_row(TASK, task.id, "deleted", event_payload(task)) for task in deleted))
+            tombstones = [{"entity_type": SyncEntityType.TASK, "entity_id": task.id, "deleted_at": task.updated_at} for task in deleted]
+            await self.session.execute(insert(TombstoneModel), tombstones)
+        return len(deleted)
+
+    @staticmethod
+    def purge_statement(cutoff: datetime, after_updated_at: Optional[datetime] = None, after_id: int = 0, limit: int = 500) -> Delete:
+        # Oldest inactive rows first from ix_tasks_inactive_updated_at_id. Resuming after the previous
+        # batch skips the index entries of rows already purged, which stay behind until VACUUM; NOT
+        # is_active is repeated on the DELETE so a row restored in the meantime is rechecked and kept
+        conditions = [~TaskModel.is_active, TaskModel.updated_at < cutoff]
+        if after_updated_at is not None:
+            conditions.append(tuple_(TaskModel.updated_at, TaskModel.id) > tuple_(after_updated_at, after_id))
+        batch = select(TaskModel.id).where(*conditions).order_by(TaskModel.updated_at, TaskModel.id).limit(limit)
+        return delete(TaskModel).where(TaskModel.id.in_(batch), ~TaskModel.is_active).returning(TaskModel.updated_at, TaskModel.id)
 
     async def list_all(self) -> List[Task]:
-        result = await self.session.execute(select(TaskModel))
+        result = await self.session.execute(select(TaskModel).where(TaskModel.is_active))
         models = result.scalars().all()
         return [TaskMapper.to_domain(model) for model in models]
 
     async def get_by_task_list_id(self, task_list_id: int) -> List[Task]:
-        result = await self.session.execute(select(TaskModel).where(TaskModel.task_list_id == task_list_id))
+        result = await self.session.execute(select(TaskModel).where(TaskModel.task_list_id == task_list_id, TaskModel.is_active))
         models = result.scalars().all()
         return [TaskMapper.to_domain(model) for model in models]
 
+    async def count_by_task_list_id(self, task_list_id: int) -> int:
+        statement = select(func.count()).select_from(TaskModel).where(TaskModel.task_list_id == task_list_id, TaskModel.is_active)
+        return (await self.session.execute(statement)).scalar_one()
+
+    @staticmethod
+    def filter_conditions(
+        task_list_id: Optional[int] = None,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        due_before: Optional[datetime] = None,
+        due_after: Optional[datetime] = None,
+        overdue: bool = False,
+    ) -> List[ColumnElement[bool]]:
+        conditions = [TaskModel.is_active]
+        if task_list_id is not None:
+            conditions.append(TaskModel.task_list_id == task_list_id)
+        if status is not None:
+            conditions.append(TaskModel.status == status)
+        if priority is not None:
+            conditions.append(TaskModel.priority == priority)
+        if due_before is not None:
+            conditions.append(TaskModel.due_date < due_before)
+        if due_after is not None:
+            conditions.append(TaskModel.due_date >= due_after)
+        if overdue:
+            conditions.extend((OPEN_TASK, TaskModel.due_date < utc_now()))
+        return conditions
+
     async def get_tasks_by_filters(
         self,
         task_list_id: Optional[int] = None,
         status: Optional[TaskStatus] = None,
         priority: Optional[TaskPriority] = None,
+        due_before: Optional[datetime] = None,
+        due_after: Optional[datetime] = None,
+        overdue: bool = False,
+    ) -> List[Task]:
+        query = select(TaskModel).where(and_(*self.filter_conditions(task_list_id, status, priority, due_before, due_after, overdue)))
+
+        result = await self.session.execute(query)
+        models = result.scalars().all()
+        return [TaskMapper.to_domain(model) for model in models]
+
+    @staticmethod
+    def overdue_statement(now: datetime, assigned_user_id: Optional[int] = None, limit: int = 100) -> Select:
+        # A range scan of ix_tasks_open_assignee_due_date (per user) or ix_tasks_open_due_date, already
+        # in due-date order, so the LIMIT stops it early; closed tasks are not in either index
+        conditions = [OPEN_TASK, TaskModel.due_date < now]
+        if assigned_user_id is not None:
+            conditions.append(TaskModel.assigned_user_id == assigned_user_id)
+        return select(*TASK_COLUMNS).where(*conditions).order_by(TaskModel.due_date, TaskModel.id).limit(limit)
+
+    async def get_overdue(self, assigned_user_id: Optional[int] = None, limit: int = 100) -> List[Task]:
+        result = await self.session.execute(self.overdue_statement(utc_now(), assigned_user_id, limit))
+        return [TaskMapper.from_row(row) for row in result.all()]
+
+    @staticmethod
+    def assigned_statement(
+        assigned_user_id: int,
+        statuses: Optional[List[TaskStatus]] = None,
+        after_priority: Optional[TaskPriority] = None,
+        after_due_date: Optional[datetime] = None,
+        after_id: int = 0,
+        limit: int = 20,
+    ) -> Select:
+        order = (TaskModel.priority.desc(), TaskModel.due_date.asc().nulls_last(), TaskModel.id)
+        conditions = [TaskModel.assigned_user_id == assigned_user_id, TaskModel.is_active]
+        if statuses:
+            conditions.append(TaskModel.status.in_(statuses))
+        if after_priority is not None:
+            # Mixed sort directions rule out a row comparison, so the keyset is spelled out; the
+            # redundant priority bound lets the scan start at the cursor's priority
+            if after_due_date is None:
+                later_in_priority = and_(TaskModel.due_date.is_(None), TaskModel.id > after_id)
+            else:
+                later_in_priority = or_(
+                    TaskModel.due_date > after_due_date,
+                    TaskModel.due_date.is_(None),
+                    and_(TaskModel.due_date == after_due_date, TaskModel.id > after_id),
+                )
+            conditions.append(TaskModel.priority <= after_priority)
+            conditions.append(or_(TaskModel.priority < after_priority, and_(TaskModel.priority == after_priority, later_in_priority)))
+
+        # Pick the page's ids with an index-only scan of ix_tasks_assignee_queue, then read just those rows
+        page = select(TaskModel.id).where(*conditions).order_by(*order).limit(limit).subquery()
+        return select(*TASK_COLUMNS).join(page, TaskModel.id == page.c.id).order_by(*order)
+
+    async def get_assigned(
+        self,
+        assigned_user_id: int,
+        statuses: Optional[List[TaskStatus]] = None,
+        after_priority: Optional[TaskPriority] = None,
+        after_due_date: Optional[datetime] = None,
+        after_id: int = 0,
+        limit: int = 20,
     ) -> List[Task]:
-        query = select(TaskModel)
-        conditions = []
+        statement = self.assigned_statement(assigned_user_id, statuses, after_priority, after_due_date, after_id, limit)
+        result = await self.session.execute(statement)
+        return [TaskMapper.from_row(row) for row in result.all()]
 
+    @staticmethod
+    def claim_statement(task_list_id: int, user_id: int, limit: int = 1, skip_locked: bool = True) -> Update:
+        # Lock the next pending rows in ix_tasks_pending_claim_queue order, skipping rows another claimer
+        # holds, and flip them in the same statement; the CTE is evaluated once, so the LIMIT is honoured
+        claimable = (
+            select(TaskModel.id)
+            .where(TaskModel.task_list_id == task_list_id, PENDING_TASK)
+            .order_by(TaskModel.priority.desc(), TaskModel.created_at, TaskModel.id)
+            .limit(limit)
+            .with_for_update(skip_locked=skip_locked)
+            .cte("claimable")
+        )
+        return (
+            update(TaskModel)
+            .where(TaskModel.id == claimable.c.id)
+            .values(status=TaskStatus.IN_PROGRESS, assigned_user_id=user_id, updated_at=utc_now())
+            .returning(*TASK_COLUMNS)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def claim(self, task_list_id: int, user_id: int, limit: int = 1) -> List[Task]:
+        try:
+            result = await self.session.execute(self.claim_statement(task_list_id, user_id, limit))
+        except IntegrityError:
+            raise InvalidUserException(user_id)
+        claimed = [TaskMapper.from_row(row) for row in result.all()]
+        await record_events(self.session, (outbox_row(TASK, task.id, "updated", event_payload(task)) for task in claimed))
+        # RETURNING follows no particular order
+        return sorted(claimed, key=lambda task: (-PRIORITY_RANK[task.priority], task.created_at, task.id))
+
+    @staticmethod
+    def search_statement(
+        query: str,
+        task_list_id: Optional[int] = None,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        after_rank: Optional[float] = None,
+        after_id: int = 0,
+        limit: int = 20,
+    ) -> Select:
+        # Full-text prefix match through the GIN index on search_vector, or a fuzzy title match through
+        # the trigram index (typos); PostgreSQL combines both indexes with a BitmapOr
+        fuzzy = TaskModel.title.bool_op("%")(query)
+        rank = func.similarity(TaskModel.title, query, type_=REAL)
+        terms = search_terms(query)
+        if terms:
+            tsquery = func.to_tsquery(literal_column(f"'{SEARCH_CONFIG}'::regconfig"), prefix_tsquery(terms))
+            match = or_(TaskModel.search_vector.bool_op("@@")(tsquery), fuzzy)
+            rank = func.ts_rank(TaskModel.search_vector, tsquery, type_=REAL) + rank
+        else:
+            match = fuzzy
+
+        conditions = [match, TaskModel.is_active]
         if task_list_id is not None:
             conditions.append(TaskModel.task_list_id == task_list_id)
         if status is not None:
             conditions.append(TaskModel.status == status)
         if priority is not None:
             conditions.append(TaskModel.priority == priority)
+        if after_rank is not None:
+            conditions.append(or_(rank < after_rank, and_(rank == after_rank, TaskModel.id > after_id)))
 
-        if conditions:
-            query = query.where(and_(*conditions))
+        return select(*TASK_COLUMNS, rank.label("rank")).where(*conditions).order_by(rank.desc(), TaskModel.id).limit(limit)
 
-        result = await self.session.execute(query)
-        models = result.scalars().all()
-        return [TaskMapper.to_domain(model) for model in models]
+    async def search(
+        self,
+        query: str,
+        task_list_id: Optional[int] = None,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        after_rank: Optional[float] = None,
+        after_id: int = 0,
+        limit: int = 20,
+    ) -> List[TaskSearchHit]:
+        statement = self.search_statement(query, task_list_id, status, priority, after_rank, after_id, limit)
+        result = await self.session.execute(statement)
+        return [TaskSearchHit(task=TaskMapper.from_row(row[:-1]), rank=row.rank) for row in result.all()]
@@ -1,6 +1,6 @@
-from typing import Optional
+from typing import List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import ARRAY, Integer, Select, any_, bindparam, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -9,8 +9,10 @@ from src.domain.exceptions.user_exceptions import DuplicateEmailException, Dupli
 from src.domain.repositories.user_repository import UserRepository
 from src.infrastructure.database.mappers import user_to_domain, user_to_model
 from src.infrastructure.database.models.user_model import UserModel
+from src.infrastructure.observability.tracing import trace_methods
 
 
+@trace_methods
 class SQLAlchemyUserRepository(UserRepository):
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -37,6 +39,19 @@ class SQLAlchemyUserRepository(UserRepository):
         user_model = result.scalar_one_or_none()
         return user_to_domain(user_model) if user_model else None
 
+    @staticmethod
+    def by_ids_statement(user_ids: List[int]) -> Select:
+        # One primary-key lookup per distinct id, bound as a single array parameter
+        ids = bindparam("user_ids", list(dict.fromkeys(user_ids)), type_=ARRAY(Integer))
+        return select(UserModel).where(UserModel.id == any_(ids))
+
+    async def get_by_ids(self, user_ids: List[int]) -> List[Optional[User]]:
+        if not user_ids:
+            return []
+        result = await self.session.execute(self.by_ids_statement(user_ids))
+        users = {model.id: user_to_domain(model) for model in result.scalars().all()}
+        return [users.get(user_id) for user_id in user_ids]
+
     async def get_by_email(self, email: str) -> Optional[User]:
         result = await self.session.execute(select(UserModel).where(UserModel.email == email))
         user_model = result.scalar_one_or_none()
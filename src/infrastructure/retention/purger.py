@@ -0,0 +1,101 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+from sqlalchemy import Delete
+
+from src.infrastructure.config.settings import settings
+from src.infrastructure.database.connection import get_session_factory
+from src.infrastructure.observability.metrics import metrics
+from src.infrastructure.repositories.sqlalchemy_task_list_repository import SQLAlchemyTaskListRepository
+from src.infrastructure.repositories.sqlalchemy_task_repository import SQLAlchemyTaskRepository
+from src.infrastructure.utils.datetime_utils import utc_now
+
+logger = logging.getLogger(__name__)
+
+# Builds the DELETE for one batch: (cutoff, after_updated_at, after_id, limit)
+PurgeStatement = Callable[[datetime, Optional[datetime], int, int], Delete]
+
+
+class SoftDeletePurger:
+    """Hard-deletes soft-deleted tasks and task lists once they are older than the retention window.
+
+    Rows go oldest first in small batches, each its own short transaction, with a pause between
+    batches so the purge never holds many row locks or writes a burst of WAL. Tasks are purged
+    before lists, since a list is only removed once no task references it.
+    """
+
+    def __init__(self, session_factory, retention: timedelta, batch_size: int = 500, batch_sleep: float = 0.1, interval: float = 3600.0):
+        self.session_factory = session_factory
+        self.retention = retention
+        self.batch_size = batch_size
+        self.batch_sleep = batch_sleep
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+        self._tasks_purged = metrics.counter("soft_deleted_rows_purged_total", table="tasks")
+        self._task_lists_purged = metrics.counter("soft_deleted_rows_purged_total", table="task_lists")
+
+    async def _purge(self, statement: PurgeStatement, cutoff: datetime, purged_counter) -> int:
+        total = 0
+        after_updated_at: Optional[datetime] = None
+        after_id = 0
+        while True:
+            async with self.session_factory() as session:
+                result = await session.execute(statement(cutoff, after_updated_at, after_id, self.batch_size))
+                keys = result.all()
+                await session.commit()
+            total += len(keys)
+            purged_counter.inc(len(keys))
+            if len(keys) < self.batch_size:
+                return total
+            # RETURNING is unordered; the next batch starts after the newest key of this one
+            after_updated_at, after_id = max(tuple(key) for key in keys)
+            await asyncio.sleep(self.batch_sleep)
+
+    async def purge_once(self) -> dict:
+        """Purge everything currently past the retention window. Returns rows removed per table."""
+        cutoff = utc_now() - self.retention
+        tasks = await self._purge(SQLAlchemyTaskRepository.purge_statement, cutoff, self._tasks_purged)
+        task_lists = await self._purge(SQLAlchemyTaskListRepository.purge_statement, cutoff, self._task_lists_purged)
+        if tasks or task_lists:
+            logger.info("Purged soft-deleted rows", extra={"tasks": tasks, "task_lists": task_lists})
+        return {"tasks": tasks, "task_lists": task_lists}
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.purge_once()
+            except Exception:
+                logger.exception("Soft-deleted row purge failed")
+            await asyncio.sleep(self.interval)
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+
+_purger: Optional[SoftDeletePurger] = None
+
+
+def get_soft_delete_purger() -> Optional[SoftDeletePurger]:
+    """Process-wide purger, or None when purging is disabled for this worker."""
+    global _purger
+    if not settings.purge_enabled:
+        return None
+    if _purger is None:
+        _purger = SoftDeletePurger(
+            get_session_factory(),
+            retention=timedelta(days=settings.purge_retention_days),
+            batch_size=settings.purge_batch_size,
+            batch_sleep=settings.purge_batch_sleep_seconds,
+            interval=settings.purge_interval_seconds,
+        )
+    return _purger
@@ -1,5 +1,11 @@
 from datetime import datetime, timezone
+from typing import Optional
 
 
 def utc_now() -> datetime:
     return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def strip_timezone(value: Optional[datetime]) -> Optional[datetime]:
+    """Drop tzinfo the way incoming due dates are normalized before they are stored."""
+    return value.replace(tzinfo=None) if value is not None and value.tzinfo is not None else value
@@ -0,0 +1,41 @@
+import re
+from typing import FrozenSet, List
+
+# Text search configuration of tasks.search_vector; queries must be parsed with the same one
+SEARCH_CONFIG = "english"
+MAX_SEARCH_TERMS = 8
+# pg_trgm's default pg_trgm.similarity_threshold, applied by the ``%`` operator
+TRIGRAM_SIMILARITY_THRESHOLD = 0.3
+
+_WORD = re.compile(r"[^\W_]+")
+
+
+def words(text: str) -> List[str]:
+    """Lowercased words of ``text``; punctuation (and so any tsquery syntax) is dropped."""
+    return _WORD.findall(text.lower())
+
+
+def search_terms(query: str) -> List[str]:
+    return words(query)[:MAX_SEARCH_TERMS]
+
+
+def prefix_tsquery(terms: List[str]) -> str:
+    """``to_tsquery`` input requiring every term, each as a prefix: ``fix:* & repo:*``."""
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+def trigrams(text: str) -> FrozenSet[str]:
+    """Trigrams the way pg_trgm extracts them: per word, padded with two spaces in front and one behind."""
+    grams = set()
+    for word in words(text):
+        padded = f"  {word} "
+        grams.update(padded[index : index + 3] for index in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+def trigram_similarity(left: str, right: str) -> float:
+    """pg_trgm ``similarity()``: shared trigrams over distinct trigrams of both strings."""
+    left_grams, right_grams = trigrams(left), trigrams(right)
+    if not left_grams or not right_grams:
+        return 0.0
+    return len(left_grams & right_grams) / len(left_grams | right_grams)
@@ -1,12 +1,15 @@
-
+from functools import cached_property
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
+from strawberry.dataloader import DataLoader
 from strawberry.fastapi import BaseContext
 
+from src.domain.entities.task import Task
 from src.domain.entities.user import User
 from src.infrastructure.database.connection import get_db_session
 from src.presentation.rest.middleware.auth_middleware import get_current_user
+from src.presentation.shared.dependencies.service_factory import ServiceFactory
 
 
 class GraphQLContext(BaseContext):
@@ -16,6 +19,16 @@ class GraphQLContext(BaseContext):
         self.db_session = db_session
         self.current_user = current_user
 
+    # Per-request loaders: every id requested while resolving one operation is fetched in one batch query
+
+    @cached_property
+    def task_loader(self) -> DataLoader[int, Task]:
+        return DataLoader(load_fn=ServiceFactory.create_task_service(self.db_session).get_by_ids)
+
+    @cached_property
+    def user_loader(self) -> DataLoader[int, User]:
+        return DataLoader(load_fn=ServiceFactory.create_user_service(self.db_session).get_by_ids)
+
 
 async def get_graphql_context(
     db_session: AsyncSession = Depends(get_db_session),
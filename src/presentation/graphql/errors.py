@@ -0,0 +1,45 @@
+from typing import Dict, Iterator, Optional, Type
+
+from graphql.error import GraphQLError
+from strawberry.extensions import SchemaExtension
+
+from src.domain.exceptions.concurrency_exceptions import CoalescedReadTimeoutException
+
+# Error code reported in ``extensions.code`` for domain exceptions the client should react to
+ERROR_CODES: Dict[Type[Exception], str] = {
+    CoalescedReadTimeoutException: "GATEWAY_TIMEOUT",
+}
+
+
+def _domain_error(error: Optional[BaseException]) -> Optional[Exception]:
+    # Resolvers re-raise failures as plain exceptions, so look down the chain for the original
+    while error is not None:
+        if isinstance(error, tuple(ERROR_CODES)):
+            return error
+        error = error.__cause__ or error.__context__
+    return None
+
+
+class ErrorCodeExtension(SchemaExtension):
+    """Gives errors caused by a known domain exception its message and an ``extensions.code``."""
+
+    def on_operation(self) -> Iterator[None]:
+        yield
+        result = self.execution_context.result
+        if result and result.errors:
+            result.errors = [self._format(error) for error in result.errors]
+
+    @staticmethod
+    def _format(error: GraphQLError) -> GraphQLError:
+        cause = _domain_error(error.original_error)
+        if cause is None:
+            return error
+        return GraphQLError(
+            message=str(cause),
+            nodes=error.nodes,
+            source=error.source,
+            positions=error.positions,
+            path=error.path,
+            original_error=cause,
+            extensions={**(error.extensions or {}), "code": ERROR_CODES[type(cause)]},
+        )
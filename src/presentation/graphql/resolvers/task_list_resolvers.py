@@ -1,3 +1,5 @@
+import logging
+from datetime import datetime, timedelta
 from typing import List, Optional
 
 import strawberry
@@ -6,21 +8,31 @@ from strawberry.types import Info
 from src.domain.entities.task import TaskPriority, TaskStatus
 from src.domain.entities.task_list import TaskList
 from src.domain.exceptions.task_list_exceptions import InvalidUserException, TaskListHasTasksException
+from src.infrastructure.jobs.cascade_delete import get_cascade_delete_runner
+from src.infrastructure.observability.tracing import traced, tracer
+from src.infrastructure.utils.datetime_utils import strip_timezone
 from src.presentation.graphql.context import GraphQLContext
 from src.presentation.graphql.types.task_list_types import (
+    TaskListCloneInput,
+    TaskListCloneType,
     TaskListCreateInput,
+    TaskListDeletionType,
     TaskListType,
     TaskListUpdateInput,
     TaskListWithTasksType,
     task_list_to_graphql,
     task_to_graphql,
 )
+from src.presentation.rest.dtos.task_list_schemas import TaskListCloneResponseSchema, TaskListResponseSchema
 from src.presentation.shared.dependencies.service_factory import ServiceFactory
 
+logger = logging.getLogger(__name__)
+
 
 @strawberry.type
 class TaskListQuery:
     @strawberry.field
+    @traced()
     async def task_list(self, id: int, info: Info[GraphQLContext, None]) -> Optional[TaskListType]:
         try:
             if id <= 0:
@@ -35,30 +47,42 @@ class TaskListQuery:
 
             return task_list_to_graphql(result)
         except ValueError as e:
-            print(f"GraphQL task_list validation error: {e}")
+            logger.info("taskList rejected: %s", e, extra={"task_list_id": id})
             return None
         except Exception as e:
-            print(f"GraphQL task_list error: {e}")
+            logger.exception("taskList failed", extra={"task_list_id": id})
             raise Exception(f"Failed to retrieve task list: {str(e)}")
 
     @strawberry.field
+    @traced()
     async def task_lists(self, info: Info[GraphQLContext, None]) -> List[TaskListType]:
         try:
             session = info.context.db_session
             service = ServiceFactory.create_task_list_service(session)
-            results = await service.list_all()
+            results = await service.list_for_user(info.context.current_user.id)
             return [task_list_to_graphql(result) for result in results]
         except Exception as e:
-            print(f"GraphQL task_lists error: {e}")
+            logger.exception("taskLists failed")
             raise Exception(f"Failed to retrieve task lists: {str(e)}")
 
     @strawberry.field
+    @traced()
+    async def task_list_deletion(self, task_list_id: int, info: Info[GraphQLContext, None]) -> Optional[TaskListDeletionType]:
+        """Progress of a background cascade delete started by this worker."""
+        job = get_cascade_delete_runner().get(task_list_id)
+        return TaskListDeletionType(**vars(job)) if job else None
+
+    @strawberry.field
+    @traced()
     async def task_list_with_tasks(
         self,
         id: int,
         info: Info[GraphQLContext, None],
         status: Optional[str] = None,
         priority: Optional[str] = None,
+        due_before: Optional[datetime] = None,
+        due_after: Optional[datetime] = None,
+        overdue: bool = False,
     ) -> Optional[TaskListWithTasksType]:
         try:
             if id <= 0:
@@ -71,55 +95,107 @@ class TaskListQuery:
             status_enum = TaskStatus(status) if status else None
             priority_enum = TaskPriority(priority) if priority else None
 
-            result = await service.get_tasks_with_completion(id, status_enum, priority_enum)
+            result = await service.get_tasks_with_completion(
+                id, status_enum, priority_enum, strip_timezone(due_before), strip_timezone(due_after), overdue
+            )
 
             if not result:
                 return None
 
-            return TaskListWithTasksType(
-                id=result.task_list.id,
-                title=result.task_list.title,
-                description=result.task_list.description,
-                user_id=result.task_list.user_id,
-                is_active=result.task_list.is_active,
-                created_at=result.task_list.created_at,
-                updated_at=result.task_list.updated_at,
-                tasks=[task_to_graphql(task) for task in result.tasks],
-                completion_percentage=result.completion_percentage,
-                total_tasks=result.total_tasks,
-                completed_tasks=result.completed_tasks,
-            )
+            with tracer.start_span("graphql.serialize") as span:
+                span.set_attribute("graphql.items", len(result.tasks))
+                return TaskListWithTasksType(
+                    id=result.task_list.id,
+                    title=result.task_list.title,
+                    description=result.task_list.description,
+                    user_id=result.task_list.user_id,
+                    is_active=result.task_list.is_active,
+                    created_at=result.task_list.created_at,
+                    updated_at=result.task_list.updated_at,
+                    tasks=[task_to_graphql(task) for task in result.tasks],
+                    completion_percentage=result.completion_percentage,
+                    total_tasks=result.total_tasks,
+                    completed_tasks=result.completed_tasks,
+                )
         except ValueError as e:
-            print(f"GraphQL task_list_with_tasks validation error: {e}")
+            logger.info("taskListWithTasks rejected: %s", e, extra={"task_list_id": id})
             return None
         except Exception as e:
-            print(f"GraphQL task_list_with_tasks error: {e}")
+            logger.exception("taskListWithTasks failed", extra={"task_list_id": id})
             raise Exception(f"Failed to retrieve task list with tasks: {str(e)}")
 
 
 @strawberry.type
 class TaskListMutation:
     @strawberry.mutation
-    async def create_task_list(self, input: TaskListCreateInput, info: Info[GraphQLContext, None]) -> TaskListType:
+    @traced()
+    async def create_task_list(
+        self, input: TaskListCreateInput, info: Info[GraphQLContext, None], idempotency_key: Optional[str] = None
+    ) -> TaskListType:
         try:
-            print(f"GraphQL create_task_list called with: title={input.title}, user_id={input.user_id}")
             session = info.context.db_session
             service = ServiceFactory.create_task_list_service(session)
+            idempotency = ServiceFactory.create_idempotency_service(session)
 
-            task_list = TaskList(title=input.title, description=input.description, user_id=input.user_id)
-            print(f"Created task_list entity: {task_list}")
+            user_id = input.user_id if input.user_id is not None else info.context.current_user.id
+            task_list = TaskList(title=input.title, description=input.description, user_id=user_id)
 
-            result = await service.create(task_list)
-            print(f"Service create returned: {result}")
-            return task_list_to_graphql(result)
+            async def create():
+                result = await service.create(task_list)
+                logger.info("Task list created", extra={"task_list_id": result.id, "user_id": result.user_id})
+                return TaskListResponseSchema.model_validate(result).model_dump(mode="json")
+
+            outcome = await idempotency.execute(
+                info.context.current_user.id, idempotency_key, "graphql:createTaskList", strawberry.asdict(input), create
+            )
+            return task_list_to_graphql(TaskListResponseSchema.model_validate(outcome.body))
         except InvalidUserException as e:
-            print(f"InvalidUserException caught: {e}")
+            logger.info("createTaskList rejected: %s", e, extra={"user_id": input.user_id})
             raise Exception(f"Invalid user: {str(e)}")
-        except Exception as e:
-            print(f"Unexpected exception in create_task_list: {type(e).__name__}: {e}")
+        except Exception:
+            logger.exception("createTaskList failed", extra={"user_id": input.user_id})
+            raise
+
+    @strawberry.mutation
+    @traced()
+    async def clone_task_list(
+        self, id: int, info: Info[GraphQLContext, None], input: Optional[TaskListCloneInput] = None, idempotency_key: Optional[str] = None
+    ) -> Optional[TaskListCloneType]:
+        """Copy a list with all its tasks server-side; null when the source list does not exist."""
+        input = input or TaskListCloneInput()
+        try:
+            session = info.context.db_session
+            service = ServiceFactory.create_task_list_service(session)
+            idempotency = ServiceFactory.create_idempotency_service(session)
+
+            user_id = input.user_id if input.user_id is not None else info.context.current_user.id
+            task_list = TaskList(title=input.title, description=input.description, user_id=user_id)
+            shift = timedelta(seconds=input.due_date_offset_seconds) if input.due_date_offset_seconds is not None else None
+
+            async def clone():
+                result = await service.clone(id, task_list, input.reset_status, shift, input.assigned_user_id, input.unassign)
+                if result is None:
+                    raise ValueError("Task list not found")
+                logger.info("Task list cloned", extra={"task_list_id": id, "clone_id": result.task_list.id, "tasks": result.tasks_copied})
+                task_list_data = TaskListResponseSchema.model_validate(result.task_list).model_dump()
+                return TaskListCloneResponseSchema(**task_list_data, tasks_copied=result.tasks_copied).model_dump(mode="json")
+
+            outcome = await idempotency.execute(
+                info.context.current_user.id, idempotency_key, f"graphql:cloneTaskList:{id}", strawberry.asdict(input), clone
+            )
+            body = TaskListCloneResponseSchema.model_validate(outcome.body)
+            return TaskListCloneType(task_list=task_list_to_graphql(body), tasks_copied=body.tasks_copied)
+        except ValueError:
+            return None
+        except InvalidUserException as e:
+            logger.info("cloneTaskList rejected: %s", e, extra={"task_list_id": id})
+            raise Exception(f"Invalid user: {str(e)}")
+        except Exception:
+            logger.exception("cloneTaskList failed", extra={"task_list_id": id})
             raise
 
     @strawberry.mutation
+    @traced()
     async def update_task_list(self, id: int, input: TaskListUpdateInput, info: Info[GraphQLContext, None]) -> Optional[TaskListType]:
         session = info.context.db_session
         service = ServiceFactory.create_task_list_service(session)
@@ -138,21 +214,41 @@ class TaskListMutation:
 
         try:
             result = await service.update(id, task_list)
+            logger.info("Task list updated", extra={"task_list_id": id})
             return task_list_to_graphql(result)
         except ValueError:
             return None
         except InvalidUserException as e:
+            logger.info("updateTaskList rejected: %s", e, extra={"task_list_id": id, "user_id": task_list.user_id})
             raise Exception(f"Invalid user: {str(e)}")
 
     @strawberry.mutation
-    async def delete_task_list(self, id: int, info: Info[GraphQLContext, None]) -> bool:
+    @traced()
+    async def delete_task_list(self, id: int, info: Info[GraphQLContext, None], cascade: bool = False) -> bool:
+        """With ``cascade`` the list's tasks are deleted too; large lists continue in the background (see taskListDeletion)."""
+        session = info.context.db_session
         try:
-            session = info.context.db_session
             service = ServiceFactory.create_task_list_service(session)
-            return await service.delete(id)
-        except TaskListHasTasksException as e:
-            print(f"GraphQL deleteTaskList error: {e}")
-            raise Exception("Cannot delete task list that contains tasks. Please delete all tasks first.")
+            if not cascade:
+                deleted = await service.delete(id)
+            elif not await service.get(id):
+                deleted = False
+            else:
+                runner = get_cascade_delete_runner()
+                tasks_total = await service.count_tasks(id)
+                if tasks_total > runner.chunk_size:
+                    runner.start(id, tasks_total, ServiceFactory.create_task_list_service)
+                    logger.info("Task list cascade delete started", extra={"task_list_id": id, "tasks": tasks_total})
+                    return True
+                deleted = await service.delete_cascade(id) is not None
+            if deleted:
+                logger.info("Task list deleted", extra={"task_list_id": id, "cascade": cascade})
+            return deleted
+        except TaskListHasTasksException:
+            # GraphQL errors do not fail the request, so undo any tasks a cascade already deleted
+            await session.rollback()
+            logger.info("deleteTaskList rejected: task list has tasks", extra={"task_list_id": id})
+            raise Exception("Cannot delete task list that contains tasks. Delete its tasks first or pass cascade: true.")
         except Exception as e:
-            print(f"GraphQL deleteTaskList error: {e}")
+            logger.exception("deleteTaskList failed", extra={"task_list_id": id})
             raise Exception(f"Failed to delete task list: {str(e)}")
@@ -1,24 +1,46 @@
+import logging
+from datetime import datetime
 from typing import List, Optional
 
 import strawberry
 from strawberry.types import Info
 
-from src.domain.entities.task import Task, TaskPriority, TaskStatus
-from src.domain.exceptions.task_exceptions import InvalidTaskListException
+from src.application.dtos.task_dto import TaskFiltersDTO
+from src.domain.entities.task import UNSET, Task, TaskChanges, TaskPriority, TaskStatus
+from src.domain.exceptions.task_exceptions import (
+    InvalidSearchCursorException,
+    InvalidTaskCursorException,
+    InvalidTaskListException,
+    InvalidUserException,
+)
+from src.infrastructure.observability.tracing import traced
+from src.infrastructure.utils.datetime_utils import strip_timezone
 from src.presentation.graphql.context import GraphQLContext
 from src.presentation.graphql.types.task_list_types import (
+    TaskBulkPatchInput,
     TaskCreateInput,
+    TaskFilterInput,
+    TaskPageType,
+    TaskPriorityEnum,
+    TaskSearchHitType,
+    TaskSearchPageType,
+    TaskStatusEnum,
     TaskStatusUpdateInput,
     TaskType,
     TaskUpdateInput,
     task_to_graphql,
 )
+from src.presentation.rest.dtos.task_schemas import TaskResponseSchema
+from src.presentation.rest.middleware.id_list import MAX_IDS
 from src.presentation.shared.dependencies.service_factory import ServiceFactory
 
+logger = logging.getLogger(__name__)
+
 
 @strawberry.type
 class TaskQuery:
     @strawberry.field
+    @traced()
     async def task(self, id: int, info: Info[GraphQLContext, None]) -> Optional[TaskType]:
         try:
             if id <= 0:
@@ -33,31 +55,115 @@ class TaskQuery:
 
             return task_to_graphql(result)
         except ValueError as e:
-            print(f"GraphQL task validation error: {e}")
+            logger.info("task rejected: %s", e, extra={"task_id": id})
             return None
         except Exception as e:
-            print(f"GraphQL task error: {e}")
+            logger.exception("task failed", extra={"task_id": id})
             raise Exception(f"Failed to retrieve task: {str(e)}")
 
     @strawberry.field
-    async def tasks(self, info: Info[GraphQLContext, None]) -> List[TaskType]:
+    @traced()
+    async def tasks_by_ids(self, ids: List[int], info: Info[GraphQLContext, None]) -> List[Optional[TaskType]]:
+        """The tasks in ``ids``, in that order; null for ids that do not exist."""
+        if not 1 <= len(ids) <= MAX_IDS:
+            raise Exception(f"ids must hold between 1 and {MAX_IDS} ids")
+        results = await info.context.task_loader.load_many(ids)
+        return [task_to_graphql(result) if result else None for result in results]
+
+    @strawberry.field
+    @traced()
+    async def tasks(
+        self,
+        info: Info[GraphQLContext, None],
+        task_list_id: Optional[int] = None,
+        status: Optional[TaskStatusEnum] = None,
+        priority: Optional[TaskPriorityEnum] = None,
+        due_before: Optional[datetime] = None,
+        due_after: Optional[datetime] = None,
+        overdue: bool = False,
+    ) -> List[TaskType]:
         try:
             session = info.context.db_session
             service = ServiceFactory.create_task_service(session)
-            results = await service.list_all()
+            filters = TaskFiltersDTO(
+                task_list_id=task_list_id,
+                status=TaskStatus(status.value) if status else None,
+                priority=TaskPriority(priority.value) if priority else None,
+                due_before=strip_timezone(due_before),
+                due_after=strip_timezone(due_after),
+                overdue=overdue,
+            )
+            results = await service.list_all() if filters == TaskFiltersDTO() else await service.get_by_filters(filters)
             return [task_to_graphql(result) for result in results]
         except Exception as e:
-            print(f"GraphQL tasks error: {e}")
+            logger.exception("tasks failed")
             raise Exception(f"Failed to retrieve tasks: {str(e)}")
 
+    @strawberry.field
+    @traced()
+    async def my_tasks(
+        self,
+        info: Info[GraphQLContext, None],
+        status: Optional[List[TaskStatusEnum]] = None,
+        after: Optional[str] = None,
+        first: int = 20,
+    ) -> TaskPageType:
+        if not 1 <= first <= 100:
+            raise Exception("first must be between 1 and 100")
+
+        service = ServiceFactory.create_task_service(info.context.db_session)
+        statuses = [TaskStatus(value.value) for value in status] if status else None
+        try:
+            result = await service.get_assigned(info.context.current_user.id, statuses, after, first)
+        except InvalidTaskCursorException as e:
+            logger.info("myTasks rejected: invalid cursor")
+            raise Exception(str(e))
+        return TaskPageType(tasks=[task_to_graphql(task) for task in result.tasks], next_cursor=result.next_cursor, has_more=result.has_more)
+
+    @strawberry.field
+    @traced()
+    async def search_tasks(
+        self,
+        query: str,
+        info: Info[GraphQLContext, None],
+        task_list_id: Optional[int] = None,
+        status: Optional[TaskStatusEnum] = None,
+        priority: Optional[TaskPriorityEnum] = None,
+        after: Optional[str] = None,
+        first: int = 20,
+    ) -> TaskSearchPageType:
+        if not query.strip() or len(query) > 200:
+            raise Exception("Search query must be between 1 and 200 characters")
+        if not 1 <= first <= 100:
+            raise Exception("first must be between 1 and 100")
+
+        service = ServiceFactory.create_task_service(info.context.db_session)
+        filters = TaskFiltersDTO(
+            task_list_id=task_list_id,
+            status=TaskStatus(status.value) if status else None,
+            priority=TaskPriority(priority.value) if priority else None,
+        )
+        try:
+            result = await service.search(query, filters, after, first)
+        except InvalidSearchCursorException as e:
+            logger.info("searchTasks rejected: invalid cursor")
+            raise Exception(str(e))
+        return TaskSearchPageType(
+            hits=[TaskSearchHitType(task=task_to_graphql(hit.task), rank=hit.rank) for hit in result.hits],
+            next_cursor=result.next_cursor,
+            has_more=result.has_more,
+        )
+
 
 @strawberry.type
 class TaskMutation:
     @strawberry.mutation
-    async def create_task(self, input: TaskCreateInput, info: Info[GraphQLContext, None]) -> TaskType:
+    @traced()
+    async def create_task(self, input: TaskCreateInput, info: Info[GraphQLContext, None], idempotency_key: Optional[str] = None) -> TaskType:
         try:
             session = info.context.db_session
             service = ServiceFactory.create_task_service(session)
+            idempotency = ServiceFactory.create_idempotency_service(session)
 
             # Normalize due_date to remove timezone info if present
             due_date = input.due_date
@@ -74,16 +180,22 @@ class TaskMutation:
                 due_date=due_date,
             )
 
-            result = await service.create(task)
-            return task_to_graphql(result)
+            async def create():
+                result = await service.create(task)
+                logger.info("Task created", extra={"task_id": result.id, "task_list_id": result.task_list_id})
+                return TaskResponseSchema.model_validate(result).model_dump(mode="json")
+
+            outcome = await idempotency.execute(info.context.current_user.id, idempotency_key, "graphql:createTask", strawberry.asdict(input), create)
+            return task_to_graphql(TaskResponseSchema.model_validate(outcome.body))
         except InvalidTaskListException as e:
-            print(f"GraphQL createTask error: {e}")
+            logger.info("createTask rejected: unknown task list", extra={"task_list_id": e.task_list_id})
             raise Exception(f"Task list {e.task_list_id} does not exist")
         except Exception as e:
-            print(f"GraphQL createTask error: {e}")
+            logger.exception("createTask failed", extra={"task_list_id": input.task_list_id})
             raise Exception(f"Failed to create task: {str(e)}")
 
     @strawberry.mutation
+    @traced()
     async def update_task(self, id: int, input: TaskUpdateInput, info: Info[GraphQLContext, None]) -> Optional[TaskType]:
         session = info.context.db_session
         service = ServiceFactory.create_task_service(session)
@@ -105,23 +217,70 @@ class TaskMutation:
 
         try:
             result = await service.update(id, task)
+            logger.info("Task updated", extra={"task_id": id})
             return task_to_graphql(result)
         except ValueError:
             return None
 
     @strawberry.mutation
+    @traced()
+    async def bulk_update_tasks(
+        self, patch: TaskBulkPatchInput, info: Info[GraphQLContext, None], ids: Optional[List[int]] = None, filter: Optional[TaskFilterInput] = None
+    ) -> List[TaskType]:
+        """Apply ``patch`` to the tasks in ``ids`` and/or matching ``filter``; returns the tasks that changed."""
+        if ids is None and (filter is None or filter == TaskFilterInput()):
+            raise Exception("ids or a non-empty filter is required")
+        if ids is not None and not 1 <= len(ids) <= 1000:
+            raise Exception("ids must hold between 1 and 1000 task ids")
+        session = info.context.db_session
+        service = ServiceFactory.create_task_service(session)
+
+        filters = None
+        if filter is not None:
+            filters = TaskFiltersDTO(
+                task_list_id=filter.task_list_id,
+                status=TaskStatus(filter.status.value) if filter.status else None,
+                priority=TaskPriority(filter.priority.value) if filter.priority else None,
+                due_before=strip_timezone(filter.due_before),
+                due_after=strip_timezone(filter.due_after),
+                overdue=filter.overdue,
+            )
+        changes = TaskChanges(
+            task_list_id=patch.task_list_id or UNSET,
+            status=TaskStatus(patch.status.value) if patch.status else UNSET,
+            priority=TaskPriority(patch.priority.value) if patch.priority else UNSET,
+            assigned_user_id=UNSET if patch.assigned_user_id is strawberry.UNSET else patch.assigned_user_id,
+            due_date=UNSET if patch.due_date is strawberry.UNSET else strip_timezone(patch.due_date),
+        )
+        try:
+            results = await service.bulk_update(changes, ids, filters)
+        except (InvalidTaskListException, InvalidUserException) as e:
+            # The failed statement aborted the transaction; GraphQL errors would otherwise still commit
+            await session.rollback()
+            logger.info("bulkUpdateTasks rejected", extra={"reason": str(e)})
+            raise Exception(str(e))
+        logger.info("Tasks bulk updated", extra={"updated": len(results)})
+        return [task_to_graphql(result) for result in results]
+
+    @strawberry.mutation
+    @traced()
     async def delete_task(self, id: int, info: Info[GraphQLContext, None]) -> bool:
         session = info.context.db_session
         service = ServiceFactory.create_task_service(session)
-        return await service.delete(id)
+        deleted = await service.delete(id)
+        if deleted:
+            logger.info("Task deleted", extra={"task_id": id})
+        return deleted
 
     @strawberry.mutation
+    @traced()
     async def change_task_status(self, id: int, input: TaskStatusUpdateInput, info: Info[GraphQLContext, None]) -> Optional[TaskType]:
         session = info.context.db_session
         service = ServiceFactory.create_task_service(session)
 
         try:
             result = await service.change_status(id, TaskStatus(input.status.value))
+            logger.info("Task status changed", extra={"task_id": id, "status": result.status.value})
             return task_to_graphql(result)
         except ValueError:
             return None
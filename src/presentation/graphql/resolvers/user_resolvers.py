@@ -0,0 +1,24 @@
+import logging
+from typing import List, Optional
+
+import strawberry
+from strawberry.types import Info
+
+from src.infrastructure.observability.tracing import traced
+from src.presentation.graphql.context import GraphQLContext
+from src.presentation.graphql.types.user_types import UserType, user_to_graphql
+from src.presentation.rest.middleware.id_list import MAX_IDS
+
+logger = logging.getLogger(__name__)
+
+
+@strawberry.type
+class UserQuery:
+    @strawberry.field
+    @traced()
+    async def users_by_ids(self, ids: List[int], info: Info[GraphQLContext, None]) -> List[Optional[UserType]]:
+        """The users in ``ids``, in that order; null for ids that do not exist."""
+        if not 1 <= len(ids) <= MAX_IDS:
+            raise Exception(f"ids must hold between 1 and {MAX_IDS} ids")
+        results = await info.context.user_loader.load_many(ids)
+        return [user_to_graphql(result) if result else None for result in results]
@@ -1,14 +1,18 @@
 import strawberry
 
+from src.infrastructure.config.settings import settings
+from src.presentation.graphql.errors import ErrorCodeExtension
 from src.presentation.graphql.resolvers.task_list_resolvers import (
     TaskListMutation,
     TaskListQuery,
 )
 from src.presentation.graphql.resolvers.task_resolvers import TaskMutation, TaskQuery
+from src.presentation.graphql.resolvers.user_resolvers import UserQuery
+from src.presentation.graphql.tracing import TracingExtension
 
 
 @strawberry.type
-class Query(TaskListQuery, TaskQuery):
+class Query(TaskListQuery, TaskQuery, UserQuery):
     pass
 
 
@@ -17,4 +21,6 @@ class Mutation(TaskListMutation, TaskMutation):
     pass
 
 
-schema = strawberry.Schema(query=Query, mutation=Mutation)
+schema = strawberry.Schema(
+    query=Query, mutation=Mutation, extensions=[ErrorCodeExtension, TracingExtension] if settings.tracing_enabled else [ErrorCodeExtension]
+)
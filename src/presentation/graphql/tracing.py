@@ -0,0 +1,14 @@
+from strawberry.extensions import SchemaExtension
+
+from src.infrastructure.observability.tracing import tracer
+
+
+class TracingExtension(SchemaExtension):
+    """Wraps each GraphQL operation in a span; resolver spans nest under it."""
+
+    def on_operation(self):
+        with tracer.start_span("graphql.operation") as span:
+            yield
+            span.set_attribute("graphql.operation.name", self.execution_context.operation_name or "")
+            if self.execution_context.errors:
+                span.set_attribute("graphql.errors", len(self.execution_context.errors))
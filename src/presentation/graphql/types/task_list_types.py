@@ -47,6 +47,26 @@ class TaskType:
     updated_at: Optional[datetime] = None
 
 
+@strawberry.type
+class TaskSearchHitType:
+    task: TaskType
+    rank: float
+
+
+@strawberry.type
+class TaskSearchPageType:
+    hits: List[TaskSearchHitType]
+    next_cursor: Optional[str] = None
+    has_more: bool
+
+
+@strawberry.type
+class TaskPageType:
+    tasks: List[TaskType]
+    next_cursor: Optional[str] = None
+    has_more: bool
+
+
 @strawberry.type
 class TaskListWithTasksType:
     id: int
@@ -62,6 +82,23 @@ class TaskListWithTasksType:
     completed_tasks: int
 
 
+@strawberry.type
+class TaskListCloneType:
+    task_list: TaskListType
+    tasks_copied: int
+
+
+@strawberry.type
+class TaskListDeletionType:
+    task_list_id: int
+    status: str
+    tasks_total: int
+    tasks_deleted: int
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+
+
 @strawberry.input
 class TaskListCreateInput:
     title: str
@@ -75,6 +112,21 @@ class TaskListCreateInput:
             raise ValueError("Title cannot exceed 200 characters")
 
 
+@strawberry.input
+class TaskListCloneInput:
+    title: Optional[str] = None
+    description: Optional[str] = None
+    user_id: Optional[int] = None
+    reset_status: bool = False
+    due_date_offset_seconds: Optional[int] = None
+    assigned_user_id: Optional[int] = None
+    unassign: bool = False
+
+    def __post_init__(self):
+        if self.unassign and self.assigned_user_id is not None:
+            raise ValueError("assignedUserId and unassign are mutually exclusive")
+
+
 @strawberry.input
 class TaskListUpdateInput:
     title: Optional[str] = None
@@ -104,6 +156,31 @@ class TaskUpdateInput:
     due_date: Optional[datetime] = None
 
 
+@strawberry.input
+class TaskFilterInput:
+    task_list_id: Optional[int] = None
+    status: Optional[TaskStatusEnum] = None
+    priority: Optional[TaskPriorityEnum] = None
+    due_before: Optional[datetime] = None
+    due_after: Optional[datetime] = None
+    overdue: bool = False
+
+
+@strawberry.input
+class TaskBulkPatchInput:
+    task_list_id: Optional[int] = None
+    status: Optional[TaskStatusEnum] = None
+    priority: Optional[TaskPriorityEnum] = None
+    # null clears the assignee or due date; leaving the field out keeps it
+    assigned_user_id: Optional[int] = strawberry.UNSET
+    due_date: Optional[datetime] = strawberry.UNSET
+
+    def __post_init__(self):
+        clears = self.assigned_user_id is not strawberry.UNSET or self.due_date is not strawberry.UNSET
+        if not (self.task_list_id or self.status or self.priority or clears):
+            raise ValueError("patch must set at least one field")
+
+
 @strawberry.input
 class TaskStatusUpdateInput:
     status: TaskStatusEnum
@@ -122,27 +199,28 @@ def task_list_to_graphql(domain_obj) -> TaskListType:
     )
 
 
-def task_to_graphql(domain_obj) -> TaskType:
-    # Map domain enum values to GraphQL enum values
-    status_mapping = {
-        TaskStatus.PENDING: TaskStatusEnum.PENDING,
-        TaskStatus.IN_PROGRESS: TaskStatusEnum.IN_PROGRESS,
-        TaskStatus.COMPLETED: TaskStatusEnum.COMPLETED,
-    }
-
-    priority_mapping = {
-        TaskPriority.LOW: TaskPriorityEnum.LOW,
-        TaskPriority.MEDIUM: TaskPriorityEnum.MEDIUM,
-        TaskPriority.HIGH: TaskPriorityEnum.HIGH,
-    }
+# Domain -> GraphQL enum maps, built once instead of on every conversion
+TASK_STATUS_TO_GRAPHQL = {
+    TaskStatus.PENDING: TaskStatusEnum.PENDING,
+    TaskStatus.IN_PROGRESS: TaskStatusEnum.IN_PROGRESS,
+    TaskStatus.COMPLETED: TaskStatusEnum.COMPLETED,
+}
+
+TASK_PRIORITY_TO_GRAPHQL = {
+    TaskPriority.LOW: TaskPriorityEnum.LOW,
+    TaskPriority.MEDIUM: TaskPriorityEnum.MEDIUM,
+    TaskPriority.HIGH: TaskPriorityEnum.HIGH,
+}
 
+
+def task_to_graphql(domain_obj) -> TaskType:
     return TaskType(
         id=domain_obj.id,
         title=domain_obj.title,
         description=domain_obj.description,
         task_list_id=domain_obj.task_list_id,
-        status=status_mapping[domain_obj.status],
-        priority=priority_mapping[domain_obj.priority],
+        status=TASK_STATUS_TO_GRAPHQL[domain_obj.status],
+        priority=TASK_PRIORITY_TO_GRAPHQL[domain_obj.priority],
         assigned_user_id=domain_obj.assigned_user_id,
         due_date=domain_obj.due_date,
         is_active=domain_obj.is_active,
@@ -0,0 +1,25 @@
+from datetime import datetime
+from typing import Optional
+
+import strawberry
+
+
+@strawberry.type
+class UserType:
+    id: int
+    email: str
+    username: str
+    is_active: bool
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+def user_to_graphql(domain_obj) -> UserType:
+    return UserType(
+        id=domain_obj.id,
+        email=domain_obj.email,
+        username=domain_obj.username,
+        is_active=domain_obj.is_active,
+        created_at=domain_obj.created_at,
+        updated_at=domain_obj.updated_at,
+    )
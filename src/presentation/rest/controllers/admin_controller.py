@@ -0,0 +1,80 @@
+import logging
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import FileResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.use_cases.task_list.task_list_service import TaskListService
+from src.domain.entities.user import User
+from src.domain.exceptions.task_list_exceptions import InvalidTaskListCursorException
+from src.infrastructure.config.settings import settings
+from src.infrastructure.database.connection import get_db_session
+from src.infrastructure.observability.profiler import get_request_profiler
+from src.infrastructure.observability.query_log import query_log
+from src.presentation.rest.dtos.task_list_schemas import TaskListPageResponseSchema, TaskListResponseSchema
+from src.presentation.rest.middleware.admin_guard import require_admin
+from src.presentation.rest.middleware.auth_middleware import get_current_user
+from src.presentation.shared.dependencies.service_factory import ServiceFactory
+
+router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin)])
+
+logger = logging.getLogger(__name__)
+
+
+@router.get("/queries")
+async def get_top_queries(
+    current_user: Annotated[User, Depends(get_current_user)],
+    limit: int = Query(20, ge=1, le=settings.sql_top_queries_limit, description="Number of fingerprints to return"),
+):
+    """Normalized SQL fingerprints for this worker, ordered by total execution time."""
+    return query_log.snapshot(limit)
+
+
+@router.delete("/queries", status_code=status.HTTP_204_NO_CONTENT)
+async def reset_query_stats(current_user: Annotated[User, Depends(get_current_user)]):
+    """Clear the accumulated query statistics for this worker."""
+    query_log.reset()
+    logger.info("Query statistics reset", extra={"user_id": current_user.id})
+
+
+@router.get("/profiles")
+async def list_profiles(current_user: Annotated[User, Depends(get_current_user)]):
+    """Request profiles stored by this worker, newest first."""
+    return {"profiles": get_request_profiler().store.list()}
+
+
+@router.get("/profiles/{name}")
+async def get_profile(name: str, current_user: Annotated[User, Depends(get_current_user)]):
+    """Download a stored profile (collapsed stacks for flamegraph tools, or speedscope JSON)."""
+    path = get_request_profiler().store.path(name)
+    if path is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+    media_type = "application/json" if name.endswith(".json") else "text/plain"
+    return FileResponse(path, media_type=media_type, filename=name)
+
+
+async def get_task_list_service(
+    session: AsyncSession = Depends(get_db_session),
+) -> TaskListService:
+    return ServiceFactory.create_task_list_service(session)
+
+
+@router.get("/task-lists", response_model=TaskListPageResponseSchema)
+async def list_all_task_lists(
+    current_user: Annotated[User, Depends(get_current_user)],
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    limit: int = Query(100, ge=1, le=500, description="Maximum task lists per page"),
+    service: TaskListService = Depends(get_task_list_service),
+):
+    """Every task list regardless of owner, in id order, one page at a time."""
+    try:
+        result = await service.list_page(cursor, limit)
+    except InvalidTaskListCursorException as e:
+        logger.info("Task list listing rejected: invalid cursor")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return TaskListPageResponseSchema(
+        task_lists=[TaskListResponseSchema.model_validate(task_list) for task_list in result.task_lists],
+        next_cursor=result.next_cursor,
+        has_more=result.has_more,
+    )
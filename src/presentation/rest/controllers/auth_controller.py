@@ -1,3 +1,4 @@
+import logging
 from datetime import timedelta
 from typing import Annotated
 
@@ -15,6 +16,8 @@ from src.presentation.shared.dependencies.service_factory import ServiceFactory
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
+logger = logging.getLogger(__name__)
+
 
 async def get_auth_service(session: AsyncSession = Depends(get_db_session)) -> AuthService:
     return ServiceFactory.create_auth_service(session=session)
@@ -25,6 +28,7 @@ async def login(login_data: LoginRequest, auth_service: AuthService = Depends(ge
     """Authenticate user and return JWT token."""
     user = await auth_service.authenticate_user(login_data.email, login_data.password)
     if not user:
+        logger.info("Login failed")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -42,10 +46,13 @@ async def register(register_data: RegisterRequest, auth_service: AuthService = D
     """Register a new user."""
     try:
         user = await auth_service.register_user(email=register_data.email, username=register_data.username, password=register_data.password)
+        logger.info("User registered", extra={"user_id": user.id})
         return UserResponse(id=user.id, email=user.email, username=user.username, is_active=user.is_active)
     except DuplicateEmailException as e:
+        logger.info("Registration rejected: duplicate email")
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except DuplicateUsernameException as e:
+        logger.info("Registration rejected: duplicate username")
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
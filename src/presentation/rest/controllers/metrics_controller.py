@@ -0,0 +1,12 @@
+from fastapi import APIRouter, Depends
+
+from src.infrastructure.observability.metrics import metrics
+from src.presentation.rest.middleware.admin_guard import require_admin
+
+router = APIRouter(prefix="/metrics", tags=["metrics"], dependencies=[Depends(require_admin)])
+
+
+@router.get("")
+async def get_metrics():
+    """In-process counters, gauges and histograms for this worker."""
+    return metrics.snapshot()
@@ -0,0 +1,48 @@
+import logging
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.use_cases.sync.sync_service import SyncService
+from src.domain.entities.user import User
+from src.domain.exceptions.sync_exceptions import InvalidWatermarkException
+from src.infrastructure.database.connection import get_db_session
+from src.presentation.rest.dtos.sync_schemas import SyncResponseSchema, TombstoneResponseSchema
+from src.presentation.rest.dtos.task_list_schemas import TaskListResponseSchema
+from src.presentation.rest.dtos.task_schemas import TaskResponseSchema
+from src.presentation.rest.middleware.auth_middleware import get_current_user
+from src.presentation.shared.dependencies.service_factory import ServiceFactory
+
+router = APIRouter(prefix="/sync", tags=["sync"])
+
+logger = logging.getLogger(__name__)
+
+
+async def get_sync_service(
+    session: AsyncSession = Depends(get_db_session),
+) -> SyncService:
+    return ServiceFactory.create_sync_service(session)
+
+
+@router.get("", response_model=SyncResponseSchema)
+async def sync_changes(
+    current_user: Annotated[User, Depends(get_current_user)],
+    service: SyncService = Depends(get_sync_service),
+    since: Optional[str] = Query(None, description="Watermark returned by the previous sync call; omit for a full snapshot"),
+    limit: int = Query(500, ge=1, le=1000, description="Maximum rows returned per entity type"),
+):
+    """Get tasks and task lists created, updated or deleted since the given watermark."""
+    try:
+        result = await service.get_changes(since, limit)
+    except InvalidWatermarkException as e:
+        logger.info("Sync rejected: invalid watermark", extra={"user_id": current_user.id})
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return SyncResponseSchema(
+        tasks=[TaskResponseSchema.model_validate(task) for task in result.tasks],
+        task_lists=[TaskListResponseSchema.model_validate(task_list) for task_list in result.task_lists],
+        deleted=[TombstoneResponseSchema.model_validate(tombstone) for tombstone in result.tombstones],
+        watermark=result.watermark,
+        has_more=result.has_more,
+    )
@@ -1,17 +1,28 @@
-from typing import Annotated, List
+import logging
+from datetime import datetime
+from typing import Annotated, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.application.dtos.task_dto import TaskFiltersDTO
+from src.application.use_cases.idempotency.idempotency_service import IdempotencyService
 from src.application.use_cases.task.task_service import TaskService
-from src.domain.entities.task import Task
+from src.domain.entities.task import Task, TaskChanges, TaskPriority, TaskStatus
 from src.domain.entities.user import User
-from src.domain.exceptions.task_exceptions import InvalidTaskListException, InvalidUserException
+from src.domain.exceptions.task_exceptions import InvalidSearchCursorException, InvalidTaskListException, InvalidUserException
 from src.infrastructure.database.connection import get_db_session
+from src.infrastructure.utils.datetime_utils import strip_timezone
 from src.presentation.rest.middleware.auth_middleware import get_current_user
+from src.presentation.rest.middleware.id_list import get_ids
+from src.presentation.rest.middleware.idempotency import get_idempotency_key, get_idempotency_service, run_idempotent
 from src.presentation.rest.dtos.task_schemas import (
+    TaskBulkUpdateResponseSchema,
+    TaskBulkUpdateSchema,
     TaskCreateSchema,
     TaskResponseSchema,
+    TaskSearchHitSchema,
+    TaskSearchResponseSchema,
     TaskUpdateSchema,
 )
 from src.presentation.rest.dtos.task_status_schemas import TaskStatusUpdateSchema
@@ -19,6 +30,8 @@ from src.presentation.shared.dependencies.service_factory import ServiceFactory
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
+logger = logging.getLogger(__name__)
+
 
 async def get_task_service(
     session: AsyncSession = Depends(get_db_session),
@@ -30,7 +43,10 @@ async def get_task_service(
 async def create_task(
     task_data: TaskCreateSchema,
     current_user: Annotated[User, Depends(get_current_user)],
+    response: Response,
     service: TaskService = Depends(get_task_service),
+    idempotency: IdempotencyService = Depends(get_idempotency_service),
+    idempotency_key: Optional[str] = Depends(get_idempotency_key),
 ):
     # Normalize due_date to remove timezone info if present
     due_date = task_data.due_date
@@ -46,15 +62,49 @@ async def create_task(
         assigned_user_id=task_data.assigned_user_id,
         due_date=due_date,
     )
-    try:
+
+    async def create():
         result = await service.create(task)
-        return TaskResponseSchema.model_validate(result)
+        logger.info("Task created", extra={"task_id": result.id, "task_list_id": result.task_list_id, "user_id": current_user.id})
+        return TaskResponseSchema.model_validate(result).model_dump(mode="json")
+
+    try:
+        return await run_idempotent(
+            idempotency, response, current_user, idempotency_key, "POST /api/tasks", task_data.model_dump(mode="json"), create
+        )
     except InvalidTaskListException as e:
+        logger.info("Task create rejected: unknown task list", extra={"task_list_id": e.task_list_id})
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except InvalidUserException as e:
+        logger.info("Task create rejected: unknown assignee", extra={"assigned_user_id": task_data.assigned_user_id})
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
+# Declared before /{task_id} so "search" is not parsed as a task id
+@router.get("/search", response_model=TaskSearchResponseSchema)
+async def search_tasks(
+    q: str = Query(..., min_length=1, max_length=200, description="Words to find in titles and descriptions; the last may be partial"),
+    task_list_id: Optional[int] = Query(None, description="Only tasks of this list"),
+    status: Optional[TaskStatus] = Query(None, description="Filter by task status"),
+    priority: Optional[TaskPriority] = Query(None, description="Filter by task priority"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum hits per page"),
+    service: TaskService = Depends(get_task_service),
+):
+    """Full-text search over task titles and descriptions, best match first, with fuzzy title matching."""
+    filters = TaskFiltersDTO(task_list_id=task_list_id, status=status, priority=priority)
+    try:
+        result = await service.search(q, filters, cursor, limit)
+    except InvalidSearchCursorException as e:
+        logger.info("Task search rejected: invalid cursor")
+        raise HTTPException(status_code=400, detail=str(e))
+    return TaskSearchResponseSchema(
+        hits=[TaskSearchHitSchema.model_validate(hit) for hit in result.hits],
+        next_cursor=result.next_cursor,
+        has_more=result.has_more,
+    )
+
+
 @router.get("/{task_id}", response_model=TaskResponseSchema)
 async def get_task(
     task_id: int,
@@ -66,11 +116,31 @@ async def get_task(
     return TaskResponseSchema.model_validate(result)
 
 
-@router.get("/", response_model=List[TaskResponseSchema])
+@router.get("/", response_model=List[Optional[TaskResponseSchema]])
 async def list_tasks(
+    ids: Optional[List[int]] = Depends(get_ids),
+    task_list_id: Optional[int] = Query(None, description="Only tasks of this list"),
+    status: Optional[TaskStatus] = Query(None, description="Filter by task status"),
+    priority: Optional[TaskPriority] = Query(None, description="Filter by task priority"),
+    due_before: Optional[datetime] = Query(None, description="Only tasks due before this time (exclusive)"),
+    due_after: Optional[datetime] = Query(None, description="Only tasks due at or after this time"),
+    overdue: bool = Query(False, description="Only open tasks past their due date"),
     service: TaskService = Depends(get_task_service),
 ):
-    results = await service.list_all()
+    """Tasks matching the filters, or with ``ids`` the given tasks in that order (null for missing ones)."""
+    filters = TaskFiltersDTO(
+        task_list_id=task_list_id,
+        status=status,
+        priority=priority,
+        due_before=strip_timezone(due_before),
+        due_after=strip_timezone(due_after),
+        overdue=overdue,
+    )
+    if ids is not None:
+        if filters != TaskFiltersDTO():
+            raise HTTPException(status_code=422, detail="ids cannot be combined with filters")
+        return [TaskResponseSchema.model_validate(result) if result else None for result in await service.get_by_ids(ids)]
+    results = await service.list_all() if filters == TaskFiltersDTO() else await service.get_by_filters(filters)
     return [TaskResponseSchema.model_validate(result) for result in results]
 
 
@@ -97,12 +167,15 @@ async def update_task(
     )
     try:
         result = await service.update(task_id, task)
+        logger.info("Task updated", extra={"task_id": task_id, "user_id": current_user.id})
         return TaskResponseSchema.model_validate(result)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except InvalidTaskListException as e:
+        logger.info("Task update rejected: unknown task list", extra={"task_id": task_id, "task_list_id": e.task_list_id})
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except InvalidUserException as e:
+        logger.info("Task update rejected: unknown assignee", extra={"task_id": task_id, "assigned_user_id": task_data.assigned_user_id})
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
@@ -115,6 +188,41 @@ async def delete_task(
     success = await service.delete(task_id)
     if not success:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+    logger.info("Task deleted", extra={"task_id": task_id, "user_id": current_user.id})
+
+
+@router.patch("/bulk", response_model=TaskBulkUpdateResponseSchema)
+async def bulk_update_tasks(
+    bulk_data: TaskBulkUpdateSchema,
+    current_user: Annotated[User, Depends(get_current_user)],
+    service: TaskService = Depends(get_task_service),
+):
+    """Move, reprioritize, reassign or change the status of many tasks in one statement.
+
+    Selects the tasks in ``task_ids`` and/or matching ``filter``; tasks that already hold the patched
+    values are left alone and not counted. ``null`` for ``assigned_user_id`` or ``due_date`` clears it.
+    """
+    filters = None
+    if bulk_data.filter is not None:
+        filters = TaskFiltersDTO(
+            **bulk_data.filter.model_dump(exclude={"due_before", "due_after"}),
+            due_before=strip_timezone(bulk_data.filter.due_before),
+            due_after=strip_timezone(bulk_data.filter.due_after),
+        )
+    values = bulk_data.patch.changes()
+    if "due_date" in values:
+        values["due_date"] = strip_timezone(values["due_date"])
+    changes = TaskChanges(**values)
+    try:
+        results = await service.bulk_update(changes, bulk_data.task_ids, filters)
+    except InvalidTaskListException as e:
+        logger.info("Bulk task update rejected: unknown task list", extra={"task_list_id": e.task_list_id})
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except InvalidUserException as e:
+        logger.info("Bulk task update rejected: unknown assignee", extra={"assigned_user_id": e.user_id})
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    logger.info("Tasks bulk updated", extra={"updated": len(results), "user_id": current_user.id})
+    return TaskBulkUpdateResponseSchema(updated=len(results), task_ids=[result.id for result in results])
 
 
 @router.patch("/{task_id}/status", response_model=TaskResponseSchema)
@@ -126,6 +234,7 @@ async def change_task_status(
 ):
     try:
         result = await service.change_status(task_id, status_data.status)
+        logger.info("Task status changed", extra={"task_id": task_id, "status": result.status.value, "user_id": current_user.id})
         return TaskResponseSchema.model_validate(result)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
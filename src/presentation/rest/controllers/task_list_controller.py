@@ -1,18 +1,29 @@
+import logging
+from datetime import datetime
 from typing import Annotated, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.application.use_cases.idempotency.idempotency_service import IdempotencyService
 from src.application.use_cases.task.task_service import TaskService
 from src.application.use_cases.task_list.task_list_service import TaskListService
 from src.domain.entities.task import TaskPriority, TaskStatus
 from src.domain.entities.task_list import TaskList
 from src.domain.entities.user import User
-from src.domain.exceptions.task_list_exceptions import InvalidUserException
+from src.domain.exceptions.task_list_exceptions import InvalidUserException, TaskListHasTasksException
 from src.infrastructure.database.connection import get_db_session
+from src.infrastructure.jobs.cascade_delete import CascadeDeleteRunner, get_cascade_delete_runner
+from src.infrastructure.utils.datetime_utils import strip_timezone
 from src.presentation.rest.middleware.auth_middleware import get_current_user
+from src.presentation.rest.middleware.id_list import get_ids
+from src.presentation.rest.middleware.idempotency import get_idempotency_key, get_idempotency_service, run_idempotent
 from src.presentation.rest.dtos.task_list_schemas import (
+    TaskListCloneResponseSchema,
+    TaskListCloneSchema,
     TaskListCreateSchema,
+    TaskListDeletionResponseSchema,
     TaskListResponseSchema,
     TaskListUpdateSchema,
     TaskListWithTasksResponseSchema,
@@ -22,6 +33,8 @@ from src.presentation.shared.dependencies.service_factory import ServiceFactory
 
 router = APIRouter(prefix="/task-lists", tags=["task-lists"])
 
+logger = logging.getLogger(__name__)
+
 
 async def get_task_list_service(
     session: AsyncSession = Depends(get_db_session),
@@ -39,17 +52,29 @@ async def get_task_service(
 async def create_task_list(
     task_list_data: TaskListCreateSchema,
     current_user: Annotated[User, Depends(get_current_user)],
+    response: Response,
     service: TaskListService = Depends(get_task_list_service),
+    idempotency: IdempotencyService = Depends(get_idempotency_service),
+    idempotency_key: Optional[str] = Depends(get_idempotency_key),
 ):
     task_list = TaskList(
         title=task_list_data.title,
         description=task_list_data.description,
-        user_id=task_list_data.user_id,
+        # Lists are owned by their creator unless another owner is given
+        user_id=task_list_data.user_id if task_list_data.user_id is not None else current_user.id,
     )
-    try:
+
+    async def create():
         result = await service.create(task_list)
-        return TaskListResponseSchema.model_validate(result)
+        logger.info("Task list created", extra={"task_list_id": result.id, "user_id": current_user.id})
+        return TaskListResponseSchema.model_validate(result).model_dump(mode="json")
+
+    try:
+        return await run_idempotent(
+            idempotency, response, current_user, idempotency_key, "POST /api/task-lists", task_list_data.model_dump(mode="json"), create
+        )
     except InvalidUserException as e:
+        logger.info("Task list create rejected: unknown owner", extra={"owner_id": task_list_data.user_id})
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
@@ -65,12 +90,20 @@ async def get_task_list(
     return TaskListResponseSchema.model_validate(result)
 
 
-@router.get("/", response_model=List[TaskListResponseSchema])
+@router.get("/", response_model=List[Optional[TaskListResponseSchema]])
 async def list_task_lists(
     current_user: Annotated[User, Depends(get_current_user)],
+    ids: Optional[List[int]] = Depends(get_ids),
     service: TaskListService = Depends(get_task_list_service),
 ):
-    results = await service.list_all()
+    """The caller's active lists plus lists with tasks assigned to them; see /api/admin/task-lists for every list.
+
+    With ``ids``, the given lists the caller owns in that order instead (null for missing ones and for anyone else's).
+    """
+    if ids is not None:
+        results = await service.get_by_ids(ids, user_id=current_user.id)
+        return [TaskListResponseSchema.model_validate(result) if result else None for result in results]
+    results = await service.list_for_user(current_user.id)
     return [TaskListResponseSchema.model_validate(result) for result in results]
 
 
@@ -84,26 +117,166 @@ async def update_task_list(
     task_list = TaskList(
         title=task_list_data.title,
         description=task_list_data.description,
+        # None keeps the current owner; editing a list never transfers it to the caller
         user_id=task_list_data.user_id,
     )
     try:
         result = await service.update(task_list_id, task_list)
+        logger.info("Task list updated", extra={"task_list_id": task_list_id, "user_id": current_user.id})
         return TaskListResponseSchema.model_validate(result)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except InvalidUserException as e:
+        logger.info("Task list update rejected: unknown owner", extra={"task_list_id": task_list_id, "owner_id": task_list_data.user_id})
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
-@router.delete("/{task_list_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete(
+    "/{task_list_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={status.HTTP_202_ACCEPTED: {"model": TaskListDeletionResponseSchema, "description": "Cascade delete running in the background"}},
+)
 async def delete_task_list(
     task_list_id: int,
     current_user: Annotated[User, Depends(get_current_user)],
+    cascade: bool = Query(False, description="Also delete the list's tasks"),
     service: TaskListService = Depends(get_task_list_service),
+    runner: CascadeDeleteRunner = Depends(get_cascade_delete_runner),
 ):
-    success = await service.delete(task_list_id)
-    if not success:
+    """Delete a task list. Without ``cascade`` the list must have no tasks left.
+
+    With ``cascade=true`` the tasks and the list go in one transaction; lists with more tasks than one
+    chunk are deleted in the background instead (202), with progress at ``/{task_list_id}/deletion``.
+    """
+    if not cascade:
+        try:
+            success = await service.delete(task_list_id)
+        except TaskListHasTasksException as e:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"{e}; pass cascade=true to delete them with it")
+        if not success:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task list not found")
+        logger.info("Task list deleted", extra={"task_list_id": task_list_id, "user_id": current_user.id})
+        return
+
+    if not await service.get(task_list_id):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task list not found")
+    tasks_total = await service.count_tasks(task_list_id)
+    if tasks_total > runner.chunk_size:
+        job = runner.start(task_list_id, tasks_total, ServiceFactory.create_task_list_service)
+        logger.info("Task list cascade delete started", extra={"task_list_id": task_list_id, "tasks": tasks_total, "user_id": current_user.id})
+        return JSONResponse(
+            TaskListDeletionResponseSchema.model_validate(job).model_dump(mode="json"),
+            status_code=status.HTTP_202_ACCEPTED,
+            headers={"Location": f"/api/task-lists/{task_list_id}/deletion"},
+        )
+
+    try:
+        deleted = await service.delete_cascade(task_list_id)
+    except TaskListHasTasksException as e:
+        # Tasks added between the two statements; the transaction rolls back and the client may retry
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    if deleted is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task list not found")
+    logger.info("Task list deleted with its tasks", extra={"task_list_id": task_list_id, "tasks": deleted, "user_id": current_user.id})
+
+
+@router.get("/{task_list_id}/deletion", response_model=TaskListDeletionResponseSchema)
+async def get_task_list_deletion(
+    task_list_id: int,
+    current_user: Annotated[User, Depends(get_current_user)],
+    runner: CascadeDeleteRunner = Depends(get_cascade_delete_runner),
+):
+    """Progress of a background cascade delete started by this worker."""
+    job = runner.get(task_list_id)
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No cascade delete for this task list")
+    return TaskListDeletionResponseSchema.model_validate(job)
+
+
+@router.post("/{task_list_id}/claim", response_model=List[TaskResponseSchema])
+async def claim_tasks(
+    task_list_id: int,
+    current_user: Annotated[User, Depends(get_current_user)],
+    response: Response,
+    n: int = Query(1, ge=1, le=100, description="Number of tasks to claim"),
+    service: TaskService = Depends(get_task_service),
+    task_list_service: TaskListService = Depends(get_task_list_service),
+    idempotency: IdempotencyService = Depends(get_idempotency_service),
+    idempotency_key: Optional[str] = Depends(get_idempotency_key),
+):
+    """Claim the list's next pending tasks (highest priority, then oldest): in progress and assigned to the caller.
+
+    Concurrent claimers get disjoint tasks without waiting on each other; an empty list means the queue is drained.
+    Send an Idempotency-Key so a retried claim returns the same tasks instead of claiming more.
+    """
+
+    async def claim():
+        result = await service.claim(task_list_id, current_user.id, n)
+        # Only tell "no such list" from "drained" when nothing was claimed, keeping the hot path to one statement
+        if not result and not await task_list_service.get(task_list_id):
+            raise ValueError("Task list not found")
+        logger.info("Tasks claimed", extra={"task_list_id": task_list_id, "user_id": current_user.id, "claimed": len(result)})
+        return [TaskResponseSchema.model_validate(task).model_dump(mode="json") for task in result]
+
+    try:
+        return await run_idempotent(
+            idempotency, response, current_user, idempotency_key, f"POST /api/task-lists/{task_list_id}/claim", {"n": n}, claim, status.HTTP_200_OK
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+
+@router.post("/{task_list_id}/clone", response_model=TaskListCloneResponseSchema, status_code=status.HTTP_201_CREATED)
+async def clone_task_list(
+    task_list_id: int,
+    clone_data: TaskListCloneSchema,
+    current_user: Annotated[User, Depends(get_current_user)],
+    response: Response,
+    service: TaskListService = Depends(get_task_list_service),
+    idempotency: IdempotencyService = Depends(get_idempotency_service),
+    idempotency_key: Optional[str] = Depends(get_idempotency_key),
+):
+    """Copy a list with all its tasks in one statement, optionally as pending, with shifted due dates or reassigned."""
+    task_list = TaskList(
+        title=clone_data.title,
+        description=clone_data.description,
+        # The copy belongs to the caller unless another owner is given
+        user_id=clone_data.user_id if clone_data.user_id is not None else current_user.id,
+    )
+
+    async def clone():
+        result = await service.clone(
+            task_list_id,
+            task_list,
+            clone_data.reset_status,
+            clone_data.due_date_offset,
+            clone_data.assigned_user_id,
+            clone_data.unassign,
+        )
+        if result is None:
+            raise ValueError("Task list not found")
+        logger.info(
+            "Task list cloned",
+            extra={"task_list_id": task_list_id, "clone_id": result.task_list.id, "tasks": result.tasks_copied, "user_id": current_user.id},
+        )
+        task_list_data = TaskListResponseSchema.model_validate(result.task_list).model_dump()
+        return TaskListCloneResponseSchema(**task_list_data, tasks_copied=result.tasks_copied).model_dump(mode="json")
+
+    try:
+        return await run_idempotent(
+            idempotency,
+            response,
+            current_user,
+            idempotency_key,
+            f"POST /api/task-lists/{task_list_id}/clone",
+            clone_data.model_dump(mode="json"),
+            clone,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except InvalidUserException as e:
+        logger.info("Task list clone rejected: unknown user", extra={"task_list_id": task_list_id})
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.get("/{task_list_id}/tasks", response_model=TaskListWithTasksResponseSchema)
@@ -113,10 +286,15 @@ async def get_task_list_with_tasks(
     service: TaskListService = Depends(get_task_list_service),
     status: Optional[TaskStatus] = Query(None, description="Filter by task status"),
     priority: Optional[TaskPriority] = Query(None, description="Filter by task priority"),
+    due_before: Optional[datetime] = Query(None, description="Only tasks due before this time (exclusive)"),
+    due_after: Optional[datetime] = Query(None, description="Only tasks due at or after this time"),
+    overdue: bool = Query(False, description="Only open tasks past their due date"),
 ):
-    """Get a task list with its tasks, filtered by status and/or priority, including completion percentage."""
+    """Get a task list with its tasks, filtered by status, priority and/or due date, including completion percentage."""
     try:
-        result = await service.get_tasks_with_completion(task_list_id, status, priority)
+        result = await service.get_tasks_with_completion(
+            task_list_id, status, priority, strip_timezone(due_before), strip_timezone(due_after), overdue
+        )
 
         # Create response combining task_list data with additional fields
         task_list_data = TaskListResponseSchema.model_validate(result.task_list).model_dump()
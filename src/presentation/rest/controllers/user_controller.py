@@ -1,18 +1,26 @@
-from typing import Annotated
+import logging
+from typing import Annotated, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.application.use_cases.task.task_service import TaskService
 from src.application.use_cases.user.user_service import UserService
+from src.domain.entities.task import TaskStatus
 from src.domain.entities.user import User
+from src.domain.exceptions.task_exceptions import InvalidTaskCursorException
 from src.domain.exceptions.user_exceptions import DuplicateEmailException, DuplicateUsernameException
 from src.infrastructure.database.connection import get_db_session
 from src.presentation.rest.middleware.auth_middleware import get_current_user
+from src.presentation.rest.middleware.id_list import get_ids
+from src.presentation.rest.dtos.task_schemas import TaskPageResponseSchema, TaskResponseSchema
 from src.presentation.rest.dtos.user_schemas import UserCreateSchema, UserResponseSchema
 from src.presentation.shared.dependencies.service_factory import ServiceFactory
 
 router = APIRouter(prefix="/users", tags=["users"])
 
+logger = logging.getLogger(__name__)
+
 
 async def get_user_service(
     session: AsyncSession = Depends(get_db_session),
@@ -20,6 +28,12 @@ async def get_user_service(
     return ServiceFactory.create_user_service(session)
 
 
+async def get_task_service(
+    session: AsyncSession = Depends(get_db_session),
+) -> TaskService:
+    return ServiceFactory.create_task_service(session)
+
+
 @router.post("/", response_model=UserResponseSchema, status_code=status.HTTP_201_CREATED)
 async def create_user(
     user_data: UserCreateSchema,
@@ -31,13 +45,40 @@ async def create_user(
             username=user_data.username,
         )
         result = await service.create(user)
+        logger.info("User created", extra={"user_id": result.id})
         return UserResponseSchema.model_validate(result)
     except DuplicateEmailException as e:
+        logger.info("User create rejected: duplicate email")
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"Email already exists: {e.email}")
     except DuplicateUsernameException as e:
+        logger.info("User create rejected: duplicate username")
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"Username already exists: {e.username}")
 
 
+@router.get("/", response_model=List[Optional[UserResponseSchema]])
+async def get_users(
+    current_user: Annotated[User, Depends(get_current_user)],
+    ids: Optional[List[int]] = Depends(get_ids),
+    service: UserService = Depends(get_user_service),
+):
+    """The users in ``ids``, in that order (null for missing ones)."""
+    if ids is None:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="ids is required")
+    return [UserResponseSchema.model_validate(result) if result else None for result in await service.get_by_ids(ids)]
+
+
+# Declared before /{user_id} so "me" is not parsed as a user id
+@router.get("/me/overdue", response_model=List[TaskResponseSchema])
+async def get_my_overdue_tasks(
+    current_user: Annotated[User, Depends(get_current_user)],
+    limit: int = Query(100, ge=1, le=500, description="Maximum tasks returned"),
+    service: TaskService = Depends(get_task_service),
+):
+    """Open tasks assigned to the caller that are past their due date, most overdue first."""
+    results = await service.get_overdue(current_user.id, limit)
+    return [TaskResponseSchema.model_validate(result) for result in results]
+
+
 @router.get("/{user_id}", response_model=UserResponseSchema)
 async def get_user(
     user_id: int,
@@ -48,3 +89,28 @@ async def get_user(
     if not result:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     return UserResponseSchema.model_validate(result)
+
+
+@router.get("/{user_id}/tasks", response_model=TaskPageResponseSchema)
+async def get_user_tasks(
+    user_id: int,
+    current_user: Annotated[User, Depends(get_current_user)],
+    status: Optional[List[TaskStatus]] = Query(None, description="Only tasks in these statuses (repeat the parameter for several)"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum tasks per page"),
+    user_service: UserService = Depends(get_user_service),
+    task_service: TaskService = Depends(get_task_service),
+):
+    """Tasks assigned to the user: highest priority first, then soonest due date (undated last), then id."""
+    if not await user_service.get(user_id):
+        raise HTTPException(status_code=404, detail="User not found")
+    try:
+        result = await task_service.get_assigned(user_id, status, cursor, limit)
+    except InvalidTaskCursorException as e:
+        logger.info("User tasks rejected: invalid cursor", extra={"user_id": user_id})
+        raise HTTPException(status_code=400, detail=str(e))
+    return TaskPageResponseSchema(
+        tasks=[TaskResponseSchema.model_validate(task) for task in result.tasks],
+        next_cursor=result.next_cursor,
+        has_more=result.has_more,
+    )
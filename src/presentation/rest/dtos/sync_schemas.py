@@ -0,0 +1,24 @@
+from datetime import datetime
+from typing import List
+
+from pydantic import BaseModel, ConfigDict
+
+from src.domain.entities.tombstone import SyncEntityType
+from src.presentation.rest.dtos.task_list_schemas import TaskListResponseSchema
+from src.presentation.rest.dtos.task_schemas import TaskResponseSchema
+
+
+class TombstoneResponseSchema(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    entity_type: SyncEntityType
+    entity_id: int
+    deleted_at: datetime
+
+
+class SyncResponseSchema(BaseModel):
+    tasks: List[TaskResponseSchema]
+    task_lists: List[TaskListResponseSchema]
+    deleted: List[TombstoneResponseSchema]
+    watermark: str
+    has_more: bool
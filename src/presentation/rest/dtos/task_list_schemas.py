@@ -1,7 +1,7 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from src.presentation.rest.dtos.task_schemas import TaskResponseSchema
 
@@ -18,6 +18,22 @@ class TaskListUpdateSchema(BaseModel):
     user_id: Optional[int] = None
 
 
+class TaskListCloneSchema(BaseModel):
+    title: Optional[str] = Field(None, min_length=4, description="Title of the copy; defaults to the source list's")
+    description: Optional[str] = None
+    user_id: Optional[int] = Field(None, description="Owner of the copy; defaults to the caller")
+    reset_status: bool = Field(False, description="Copy every task as pending")
+    due_date_offset: Optional[timedelta] = Field(None, description="Shift due dates by this much (seconds or ISO 8601 duration)")
+    assigned_user_id: Optional[int] = Field(None, description="Assign every copied task to this user")
+    unassign: bool = Field(False, description="Copy every task unassigned")
+
+    @model_validator(mode="after")
+    def check_assignment(self) -> "TaskListCloneSchema":
+        if self.unassign and self.assigned_user_id is not None:
+            raise ValueError("assigned_user_id and unassign are mutually exclusive")
+        return self
+
+
 class TaskListResponseSchema(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -35,3 +51,25 @@ class TaskListWithTasksResponseSchema(TaskListResponseSchema):
     completion_percentage: float
     total_tasks: int
     completed_tasks: int
+
+
+class TaskListCloneResponseSchema(TaskListResponseSchema):
+    tasks_copied: int
+
+
+class TaskListPageResponseSchema(BaseModel):
+    task_lists: List[TaskListResponseSchema]
+    next_cursor: Optional[str] = None
+    has_more: bool
+
+
+class TaskListDeletionResponseSchema(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    task_list_id: int
+    status: str
+    tasks_total: int
+    tasks_deleted: int
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
@@ -1,7 +1,7 @@
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from src.domain.entities.task import TaskPriority, TaskStatus
 
@@ -46,3 +46,58 @@ class TaskFiltersSchema(BaseModel):
     task_list_id: Optional[int] = None
     status: Optional[TaskStatus] = None
     priority: Optional[TaskPriority] = None
+    due_before: Optional[datetime] = None
+    due_after: Optional[datetime] = None
+    overdue: bool = False
+
+
+class TaskBulkPatchSchema(BaseModel):
+    task_list_id: Optional[int] = None
+    status: Optional[TaskStatus] = None
+    priority: Optional[TaskPriority] = None
+    # An explicit null clears these two; leaving them out keeps the current value
+    assigned_user_id: Optional[int] = None
+    due_date: Optional[datetime] = None
+
+    def changes(self) -> Dict[str, Any]:
+        """The fields the request sent, minus nulls for the fields that cannot be cleared."""
+        sent = {name: getattr(self, name) for name in self.model_fields_set}
+        return {name: value for name, value in sent.items() if value is not None or name in ("assigned_user_id", "due_date")}
+
+
+class TaskBulkUpdateSchema(BaseModel):
+    task_ids: Optional[List[int]] = Field(None, min_length=1, max_length=1000)
+    filter: Optional[TaskFiltersSchema] = None
+    patch: TaskBulkPatchSchema
+
+    @model_validator(mode="after")
+    def check_selection_and_patch(self) -> "TaskBulkUpdateSchema":
+        if self.task_ids is None and (self.filter is None or self.filter == TaskFiltersSchema()):
+            raise ValueError("task_ids or a non-empty filter is required")
+        if not self.patch.changes():
+            raise ValueError("patch must set at least one field")
+        return self
+
+
+class TaskBulkUpdateResponseSchema(BaseModel):
+    updated: int
+    task_ids: List[int]
+
+
+class TaskSearchHitSchema(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    task: TaskResponseSchema
+    rank: float
+
+
+class TaskSearchResponseSchema(BaseModel):
+    hits: List[TaskSearchHitSchema]
+    next_cursor: Optional[str] = None
+    has_more: bool
+
+
+class TaskPageResponseSchema(BaseModel):
+    tasks: List[TaskResponseSchema]
+    next_cursor: Optional[str] = None
+    has_more: bool
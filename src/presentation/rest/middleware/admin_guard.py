@@ -0,0 +1,19 @@
+import hmac
+from typing import Optional
+
+from fastapi import Header, HTTPException, status
+
+from src.infrastructure.config.settings import settings
+
+ADMIN_TOKEN_HEADER = "X-Admin-Token"
+
+
+async def require_admin(admin_token: Optional[str] = Header(None, alias=ADMIN_TOKEN_HEADER)) -> None:
+    """
+    Guard for the /admin routes: the request must send X-Admin-Token matching ADMIN_TOKEN.
+    A logged-in user is not enough; with no token configured the admin routes stay closed.
+    Raises 403 otherwise.
+    """
+    expected = settings.admin_token
+    if not (expected and admin_token and hmac.compare_digest(admin_token.encode(), expected.encode())):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
@@ -0,0 +1,215 @@
+import asyncio
+import json
+import math
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.config.settings import settings
+from src.infrastructure.observability.metrics import metrics
+
+# Paths that must keep answering while the API is shedding load
+EXEMPT_PATHS = frozenset({"/", "/health", "/api/metrics", "/docs", "/redoc", "/openapi.json"})
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class AdaptiveLimiter:
+    """Concurrency limit with a bounded FIFO wait queue, adapted with AIMD from observed latency.
+
+    The configured limit is the ceiling. Requests slower than the latency target (or failing
+    with a 5xx) shrink the limit multiplicatively, at most once per cooldown window; fast
+    requests while the limiter is busy grow it back by roughly one slot per ``limit`` requests.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_limit: int,
+        max_queue: int,
+        queue_timeout: float,
+        latency_target: float,
+        min_limit: int = 1,
+        backoff_ratio: float = 0.9,
+        cooldown: float = 1.0,
+    ):
+        self.name = name
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.limit = float(max_limit)
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.latency_target = latency_target
+        self.backoff_ratio = backoff_ratio
+        self.cooldown = cooldown
+        self.in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._last_decrease = 0.0
+        self._avg_latency = latency_target
+
+        self._queue_time = metrics.histogram("admission_queue_seconds", budget=name)
+        self._limit_gauge = metrics.gauge("admission_limit", budget=name)
+        self._in_flight_gauge = metrics.gauge("admission_in_flight", budget=name)
+        self._queue_gauge = metrics.gauge("admission_queue_depth", budget=name)
+        self._limit_gauge.set(self.limit)
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self) -> Optional[str]:
+        """Wait for a slot. Returns None once admitted, or the reason the request was shed."""
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self._admit(0.0)
+            return None
+
+        if len(self._waiters) >= self.max_queue:
+            return "queue_full"
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        self._queue_gauge.set(len(self._waiters))
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(future, self.queue_timeout)
+        except asyncio.TimeoutError:
+            self._discard(future)
+            return "queue_timeout"
+        except asyncio.CancelledError:
+            self._discard(future)
+            if future.done() and not future.cancelled():
+                # The slot was handed over just before the client went away; give it back
+                self._hand_over()
+            raise
+
+        # in_flight was already incremented on our behalf by _hand_over
+        self._queue_time.observe(time.perf_counter() - started)
+        return None
+
+    def release(self, latency: float, success: bool) -> None:
+        self._adapt(latency, success)
+        self._hand_over()
+
+    def retry_after(self) -> int:
+        """Seconds until the current queue is expected to drain."""
+        drain = (len(self._waiters) + 1) * self._avg_latency / max(self.limit, 1.0)
+        return max(1, math.ceil(max(drain, self.queue_timeout)))
+
+    def _admit(self, queued: float) -> None:
+        self.in_flight += 1
+        self._in_flight_gauge.set(self.in_flight)
+        self._queue_time.observe(queued)
+
+    def _discard(self, future: asyncio.Future) -> None:
+        try:
+            self._waiters.remove(future)
+        except ValueError:
+            pass
+        self._queue_gauge.set(len(self._waiters))
+
+    def _hand_over(self) -> None:
+        # Free our slot, then admit the oldest live waiters while the (possibly changed) limit allows
+        self.in_flight -= 1
+        while self._waiters and self.in_flight < int(self.limit):
+            future = self._waiters.popleft()
+            if not future.done():
+                self.in_flight += 1
+                future.set_result(None)
+        self._in_flight_gauge.set(self.in_flight)
+        self._queue_gauge.set(len(self._waiters))
+
+    def _adapt(self, latency: float, success: bool) -> None:
+        self._avg_latency = 0.9 * self._avg_latency + 0.1 * latency
+        now = time.monotonic()
+        if not success or latency > self.latency_target:
+            if now - self._last_decrease >= self.cooldown:
+                self.limit = max(float(self.min_limit), self.limit * self.backoff_ratio)
+                self._last_decrease = now
+        elif self.in_flight >= self.limit / 2:
+            self.limit = min(float(self.max_limit), self.limit + 1.0 / self.limit)
+        self._limit_gauge.set(round(self.limit, 2))
+
+
+def classify_request(scope: Scope) -> Optional[str]:
+    """Map a request to its admission budget, or None when it bypasses admission control."""
+    path = scope.get("path", "")
+    if path in EXEMPT_PATHS:
+        return None
+    if path.startswith("/api/auth"):
+        return "auth"
+    if path.startswith("/graphql"):
+        return "graphql"
+    if scope.get("method", "GET") in READ_METHODS:
+        return "read"
+    return "write"
+
+
+def build_default_limiters() -> Dict[str, AdaptiveLimiter]:
+    budgets = {
+        "read": settings.admission_read_limit,
+        "write": settings.admission_write_limit,
+        "auth": settings.admission_auth_limit,
+        "graphql": settings.admission_graphql_limit,
+    }
+    return {
+        name: AdaptiveLimiter(
+            name,
+            max_limit=limit,
+            max_queue=settings.admission_max_queue,
+            queue_timeout=settings.admission_queue_timeout_seconds,
+            latency_target=settings.admission_latency_target_seconds,
+        )
+        for name, limit in budgets.items()
+    }
+
+
+class AdmissionControlMiddleware:
+    """ASGI middleware that rejects requests with 503 instead of letting them pile up in the worker."""
+
+    def __init__(self, app: ASGIApp, limiters: Optional[Dict[str, AdaptiveLimiter]] = None):
+        self.app = app
+        self.limiters = limiters if limiters is not None else build_default_limiters()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        budget = classify_request(scope) if scope["type"] == "http" else None
+        limiter = self.limiters.get(budget) if budget else None
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        shed_reason = await limiter.acquire()
+        if shed_reason is not None:
+            metrics.counter("admission_shed_total", budget=budget, reason=shed_reason).inc()
+            await self._reject(send, limiter.retry_after())
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            limiter.release(time.perf_counter() - started, status_code < 500)
+
+    @staticmethod
+    async def _reject(send: Send, retry_after: int) -> None:
+        body = json.dumps({"detail": "Server is overloaded, please retry later"}).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 503,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"retry-after", str(retry_after).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
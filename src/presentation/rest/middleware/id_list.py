@@ -0,0 +1,20 @@
+from typing import List, Optional
+
+from fastapi import HTTPException, Query, status
+
+MAX_IDS = 100
+
+
+async def get_ids(
+    ids: Optional[str] = Query(None, description=f"Comma-separated ids to fetch in one request (at most {MAX_IDS}); missing ids come back as null")
+) -> Optional[List[int]]:
+    """Parse ``?ids=1,2,3`` in the order given; None when the parameter is absent."""
+    if ids is None:
+        return None
+    try:
+        parsed = [int(part) for part in ids.split(",") if part.strip()]
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="ids must be comma-separated integers")
+    if not 1 <= len(parsed) <= MAX_IDS:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=f"ids must hold between 1 and {MAX_IDS} ids")
+    return parsed
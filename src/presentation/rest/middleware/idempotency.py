@@ -0,0 +1,48 @@
+from typing import Any, Optional
+
+from fastapi import Depends, Header, HTTPException, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.use_cases.idempotency.idempotency_service import Handler, IdempotencyService
+from src.domain.entities.user import User
+from src.domain.exceptions.idempotency_exceptions import IdempotencyKeyInProgressException, IdempotencyKeyReusedException
+from src.infrastructure.database.connection import get_db_session
+from src.presentation.shared.dependencies.service_factory import ServiceFactory
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+
+async def get_idempotency_service(session: AsyncSession = Depends(get_db_session)) -> IdempotencyService:
+    """Dependency to get IdempotencyService on the request's session (same transaction as the write)."""
+    return ServiceFactory.create_idempotency_service(session)
+
+
+async def get_idempotency_key(
+    idempotency_key: Optional[str] = Header(None, alias=IDEMPOTENCY_KEY_HEADER, min_length=1, max_length=255)
+) -> Optional[str]:
+    return idempotency_key
+
+
+async def run_idempotent(
+    service: IdempotencyService,
+    response: Response,
+    current_user: User,
+    key: Optional[str],
+    scope: str,
+    payload: Any,
+    handler: Handler,
+    status_code: int = status.HTTP_201_CREATED,
+) -> Any:
+    """Execute ``handler`` once per Idempotency-Key and return its (possibly replayed) body."""
+    try:
+        result = await service.execute(current_user.id, key, scope, payload, handler, status_code)
+    except IdempotencyKeyReusedException as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    except IdempotencyKeyInProgressException as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    response.status_code = result.status_code
+    if result.replayed:
+        response.headers[REPLAYED_HEADER] = "true"
+    return result.body
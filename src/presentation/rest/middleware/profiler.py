@@ -0,0 +1,71 @@
+import asyncio
+import hmac
+import random
+import sys
+from typing import Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.config.settings import settings
+from src.infrastructure.observability.profiler import PROFILE_FORMATS, RequestProfiler, StackSampler, get_request_profiler, sampling
+
+PROFILE_HEADER = b"x-profile"
+PROFILE_FORMAT_HEADER = b"x-profile-format"
+
+
+class ProfilerMiddleware:
+    """ASGI middleware that runs selected requests under a sampling stack profiler.
+
+    A request is profiled when it sends ``X-Profile: <token>`` matching the configured
+    token, or when it falls in the sampled fraction. ``X-Profile-Format`` picks
+    ``collapsed`` or ``speedscope``. The response carries ``X-Profile-Id``, the name of
+    the stored profile (see ``GET /api/admin/profiles``). Covers REST and GraphQL alike,
+    since both run as coroutines in the request's task.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        profiler: Optional[RequestProfiler] = None,
+        token: Optional[str] = None,
+        sample_rate: Optional[float] = None,
+        rng: Optional[random.Random] = None,
+    ):
+        self.app = app
+        self.profiler = profiler or get_request_profiler()
+        self.token = token if token is not None else settings.profiler_token
+        self.sample_rate = sample_rate if sample_rate is not None else settings.profiler_sample_rate
+        self._rng = rng or random.Random()
+
+    def _requested_format(self, scope: Scope) -> Optional[str]:
+        headers = dict(scope.get("headers", ()))
+        supplied = headers.get(PROFILE_HEADER)
+        requested = bool(self.token and supplied and hmac.compare_digest(supplied, self.token.encode()))
+        if not requested and not (self.sample_rate and self._rng.random() < self.sample_rate):
+            return None
+        profile_format = headers.get(PROFILE_FORMAT_HEADER, b"").decode("latin-1").lower() if requested else ""
+        return profile_format if profile_format in PROFILE_FORMATS else self.profiler.default_format
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        profile_format = self._requested_format(scope) if scope["type"] == "http" else None
+        if profile_format is None or not self.profiler.try_acquire():
+            await self.app(scope, receive, send)
+            return
+
+        name = self.profiler.store.new_name(f"{scope.get('method', '')} {scope.get('path', '')}", profile_format)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + [(b"x-profile-id", name.encode())]
+            await send(message)
+
+        # This coroutine's frame marks where the request's own stack begins
+        sampler = StackSampler(sys._getframe(), asyncio.current_task(), self.profiler.interval)
+        try:
+            with sampling(sampler):
+                await self.app(scope, receive, send_wrapper)
+        finally:
+            try:
+                await self.profiler.save(name, sampler.stacks, profile_format)
+            finally:
+                self.profiler.release()
@@ -0,0 +1,61 @@
+import logging
+import re
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.observability.structured_logging import bind_request_id, new_request_id, reset_request_id
+
+REQUEST_ID_HEADER = b"x-request-id"
+_VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9._-]{1,128}$")
+
+access_logger = logging.getLogger("src.presentation.rest.access")
+
+
+class RequestContextMiddleware:
+    """ASGI middleware that gives each HTTP request an id and writes one access log record for it.
+
+    A well-formed incoming ``X-Request-ID`` is reused, otherwise one is generated; it is
+    bound for every log record emitted while handling the request and echoed on the
+    response. The access log is the highest-volume logger, so it is the usual target
+    of ``LOG_SAMPLING``.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        supplied = dict(scope.get("headers", ())).get(REQUEST_ID_HEADER, b"").decode("latin-1")
+        request_id = supplied if _VALID_REQUEST_ID.match(supplied) else new_request_id()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = list(message.get("headers", [])) + [(REQUEST_ID_HEADER, request_id.encode())]
+            await send(message)
+
+        token = bind_request_id(request_id)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if access_logger.isEnabledFor(logging.INFO):
+                access_logger.info(
+                    "%s %s %d",
+                    scope.get("method", ""),
+                    scope.get("path", ""),
+                    status_code,
+                    extra={
+                        "http_method": scope.get("method", ""),
+                        "http_path": scope.get("path", ""),
+                        "http_status": status_code,
+                        "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+                    },
+                )
+            reset_request_id(token)
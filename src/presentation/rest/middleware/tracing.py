@@ -0,0 +1,41 @@
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.observability.tracing import SPAN_KIND_SERVER, STATUS_ERROR, TRACEPARENT_HEADER, Tracer, parse_traceparent, tracer
+
+
+class TracingMiddleware:
+    """ASGI middleware that opens the server span of each HTTP request.
+
+    An incoming W3C ``traceparent`` header continues the caller's trace and sampling
+    decision. Sampled responses carry a ``traceparent`` header naming the server span.
+    """
+
+    def __init__(self, app: ASGIApp, tracer: Tracer = tracer):
+        self.app = app
+        self.tracer = tracer
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.tracer.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        remote_parent = None
+        for name, value in scope.get("headers", ()):
+            if name == TRACEPARENT_HEADER.encode():
+                remote_parent = parse_traceparent(value.decode("latin-1"))
+                break
+
+        method = scope.get("method", "GET")
+        attributes = {"http.method": method, "http.target": scope.get("path", "")}
+        with self.tracer.start_span(f"{method} {scope.get('path', '')}", SPAN_KIND_SERVER, attributes, remote_parent) as span:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.status_code", message["status"])
+                    if message["status"] >= 500 and span.recording:
+                        span.status = STATUS_ERROR
+                    if span.traceparent:
+                        message["headers"] = list(message.get("headers", [])) + [(TRACEPARENT_HEADER.encode(), span.traceparent.encode())]
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
@@ -1,9 +1,38 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.use_cases.auth.auth_service import AuthService
+from src.application.use_cases.idempotency.idempotency_service import IdempotencyService
+from src.application.use_cases.sync.sync_service import SyncService
 from src.application.use_cases.task.task_service import TaskService
 from src.application.use_cases.task_list.task_list_service import TaskListService
 from src.application.use_cases.user.user_service import UserService
+from src.domain.outputs.task_list_repository import TaskListRepository
+from src.domain.outputs.task_repository import TaskRepository
+from src.domain.repositories.user_repository import UserRepository
+from src.infrastructure.config.settings import settings
+from src.infrastructure.notifications.dispatcher import get_notification_dispatcher
+from src.infrastructure.notifications.outbox import OutboxNotificationPublisher
+from src.infrastructure.repositories.in_memory_idempotency_repository import (
+    InMemoryIdempotencyRepository,
+)
+from src.infrastructure.repositories.in_memory_sync_repository import (
+    InMemorySyncRepository,
+)
+from src.infrastructure.repositories.in_memory_task_list_repository import (
+    InMemoryTaskListRepository,
+)
+from src.infrastructure.repositories.in_memory_task_repository import (
+    InMemoryTaskRepository,
+)
+from src.infrastructure.repositories.in_memory_user_repository import (
+    InMemoryUserRepository,
+)
+from src.infrastructure.repositories.sqlalchemy_idempotency_repository import (
+    SQLAlchemyIdempotencyRepository,
+)
+from src.infrastructure.repositories.sqlalchemy_sync_repository import (
+    SQLAlchemySyncRepository,
+)
 from src.infrastructure.repositories.sqlalchemy_task_list_repository import (
     SQLAlchemyTaskListRepository,
 )
@@ -15,25 +44,55 @@ from src.infrastructure.repositories.sqlalchemy_user_repository import (
 )
 
 
+def _use_memory_backend() -> bool:
+    return settings.repository_backend.lower() == "memory"
+
+
 class ServiceFactory:
+    @staticmethod
+    def create_task_list_repository(session: AsyncSession) -> TaskListRepository:
+        return InMemoryTaskListRepository() if _use_memory_backend() else SQLAlchemyTaskListRepository(session)
+
+    @staticmethod
+    def create_task_repository(session: AsyncSession) -> TaskRepository:
+        return InMemoryTaskRepository() if _use_memory_backend() else SQLAlchemyTaskRepository(session)
+
+    @staticmethod
+    def create_user_repository(session: AsyncSession) -> UserRepository:
+        return InMemoryUserRepository() if _use_memory_backend() else SQLAlchemyUserRepository(session)
+
     @staticmethod
     def create_task_list_service(session: AsyncSession) -> TaskListService:
-        task_list_repository = SQLAlchemyTaskListRepository(session)
-        task_repository = SQLAlchemyTaskRepository(session)
-        user_repository = SQLAlchemyUserRepository(session)
+        task_list_repository = ServiceFactory.create_task_list_repository(session)
+        task_repository = ServiceFactory.create_task_repository(session)
+        user_repository = ServiceFactory.create_user_repository(session)
         return TaskListService(task_list_repository, task_repository, user_repository)
 
     @staticmethod
     def create_task_service(session: AsyncSession) -> TaskService:
-        repository = SQLAlchemyTaskRepository(session)
-        return TaskService(repository)
+        repository = ServiceFactory.create_task_repository(session)
+        if _use_memory_backend():
+            # In-memory writes are visible at once; there is no transaction to wait for
+            return TaskService(repository, notifier=get_notification_dispatcher())
+        # Notifications ride the outbox, so the dispatcher (fed by the relay) only sees committed changes
+        return TaskService(repository, notifier=OutboxNotificationPublisher(session) if settings.email_enabled else None)
 
     @staticmethod
     def create_user_service(session: AsyncSession) -> UserService:
-        repository = SQLAlchemyUserRepository(session)
+        repository = ServiceFactory.create_user_repository(session)
         return UserService(repository)
 
     @staticmethod
     def create_auth_service(session: AsyncSession) -> AuthService:
-        repository = SQLAlchemyUserRepository(session)
+        repository = ServiceFactory.create_user_repository(session)
         return AuthService(repository)
+
+    @staticmethod
+    def create_sync_service(session: AsyncSession) -> SyncService:
+        repository = InMemorySyncRepository() if _use_memory_backend() else SQLAlchemySyncRepository(session)
+        return SyncService(repository)
+
+    @staticmethod
+    def create_idempotency_service(session: AsyncSession) -> IdempotencyService:
+        repository = InMemoryIdempotencyRepository() if _use_memory_backend() else SQLAlchemyIdempotencyRepository(session)
+        return IdempotencyService(repository)
@@ -10,11 +10,27 @@ from alembic.config import Config
 from main import app
 from src.infrastructure.config.settings import settings
 from src.infrastructure.database.connection import Base, get_db_session
+from src.infrastructure.repositories.in_memory_store import in_memory_store
+
+
+def pytest_collection_modifyitems(config, items):
+    """Con el backend en memoria se omiten los tests que dependen de tablas propias de PostgreSQL."""
+    if settings.repository_backend != "memory":
+        return
+    skip_database = pytest.mark.skip(reason="requires PostgreSQL (REPOSITORY_BACKEND=memory)")
+    for item in items:
+        if "database" in item.keywords:
+            item.add_marker(skip_database)
 
 
 @pytest.fixture(scope="session", autouse=True)
 def setup_test_database():
     """Aplica las migraciones de Alembic una vez por sesión de prueba."""
+    if settings.repository_backend == "memory":
+        # REPOSITORY_BACKEND=memory: los tests de API corren sin PostgreSQL
+        yield
+        return
+
     test_db_url = settings.test_database_url
     if not test_db_url:
         raise ValueError("La variable de entorno TEST_DATABASE_URL no está configurada")
@@ -78,10 +94,17 @@ async def db_session(test_engine):
 
 
 @pytest.fixture
-async def test_client(db_session: AsyncSession):
+async def test_client(request):
     """
     Crea un cliente de prueba de httpx asíncrono que utiliza la sesión de BD de prueba.
     """
+    if settings.repository_backend == "memory":
+        in_memory_store.reset()
+        async with httpx.AsyncClient(app=app, base_url="http://test") as client:
+            yield client
+        return
+
+    db_session = request.getfixturevalue("db_session")
 
     def override_get_db_session():
         """Sobrescribe la dependencia para inyectar la sesión de prueba."""
@@ -96,8 +119,14 @@ async def test_client(db_session: AsyncSession):
 
 
 @pytest.fixture
-async def e2e_client(test_engine):
-
+async def e2e_client(request):
+    if settings.repository_backend == "memory":
+        in_memory_store.reset()
+        async with httpx.AsyncClient(app=app, base_url="http://test") as client:
+            yield client
+        return
+
+    test_engine = request.getfixturevalue("test_engine")
     SessionLocal = sessionmaker(bind=test_engine, class_=AsyncSession, expire_on_commit=False)
 
     async def get_e2e_session():
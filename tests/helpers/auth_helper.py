@@ -36,4 +36,15 @@ async def create_test_user_and_get_headers(client, user_num=1):
         email=f"user{user_num}@example.com",
         username=f"user{user_num}",
         password=f"pass{user_num}123"
-    )
\ No newline at end of file
+    )
+
+
+def use_admin_token(monkeypatch, headers, token="test-admin-token"):
+    """
+    Configure ADMIN_TOKEN for the test and return headers that also carry it.
+    """
+    from src.infrastructure.config.settings import settings
+    from src.presentation.rest.middleware.admin_guard import ADMIN_TOKEN_HEADER
+
+    monkeypatch.setattr(settings, "admin_token", token)
+    return {**headers, ADMIN_TOKEN_HEADER: token}
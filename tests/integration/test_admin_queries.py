@@ -0,0 +1,57 @@
+import pytest
+
+from src.infrastructure.observability.query_log import query_log
+from tests.helpers.auth_helper import create_test_user_and_get_headers, use_admin_token
+
+
+@pytest.mark.asyncio
+async def test_top_queries_requires_authentication(test_client):
+    response = await test_client.get("/api/admin/queries")
+
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_top_queries_returns_fingerprints_by_total_time(test_client, monkeypatch):
+    auth_headers = use_admin_token(monkeypatch, await create_test_user_and_get_headers(test_client, 1))
+    query_log.reset()
+    query_log.record("SELECT * FROM tasks WHERE id = $1", (1,), 0.002)
+    query_log.record("SELECT * FROM tasks WHERE id = $1", (2,), 0.002)
+    query_log.record("SELECT * FROM users", (), 0.001)
+
+    response = await test_client.get("/api/admin/queries?limit=1", headers=auth_headers)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [entry["fingerprint"] for entry in body["top"]] == ["SELECT * FROM tasks WHERE id = ?"]
+    assert body["top"][0]["calls"] == 2
+
+    reset_response = await test_client.delete("/api/admin/queries", headers=auth_headers)
+    assert reset_response.status_code == 204
+    assert (await test_client.get("/api/admin/queries", headers=auth_headers)).json()["top"] == []
+
+
+@pytest.mark.asyncio
+async def test_admin_routes_reject_a_normal_user(test_client, monkeypatch):
+    user_headers = await create_test_user_and_get_headers(test_client, 8)
+
+    # No ADMIN_TOKEN configured: closed to everyone
+    assert (await test_client.get("/api/admin/queries", headers=user_headers)).status_code == 403
+
+    use_admin_token(monkeypatch, {})
+    routes = (("GET", "/api/admin/queries"), ("DELETE", "/api/admin/queries"), ("GET", "/api/admin/task-lists"), ("GET", "/api/admin/profiles"))
+    for method, path in routes:
+        assert (await test_client.request(method, path, headers=user_headers)).status_code == 403
+        wrong_token = {**user_headers, "X-Admin-Token": "guess"}
+        assert (await test_client.request(method, path, headers=wrong_token)).status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_metrics_require_the_admin_token(test_client, monkeypatch):
+    assert (await test_client.get("/api/metrics")).status_code == 403
+
+    headers = use_admin_token(monkeypatch, {})
+    response = await test_client.get("/api/metrics", headers=headers)
+
+    assert response.status_code == 200
+    assert "counters" in response.json()
@@ -0,0 +1,64 @@
+import pytest
+
+from tests.helpers.auth_helper import create_test_user_and_get_headers
+
+
+@pytest.mark.asyncio
+async def test_fetch_tasks_and_lists_by_ids(test_client):
+    auth_headers = await create_test_user_and_get_headers(test_client, 1)
+    task_list_id = (await test_client.post("/api/task-lists/", json={"title": "Batch"}, headers=auth_headers)).json()["id"]
+    task_ids = []
+    for title in ("First", "Second"):
+        response = await test_client.post("/api/tasks/", json={"title": title, "task_list_id": task_list_id}, headers=auth_headers)
+        task_ids.append(response.json()["id"])
+
+    tasks = (await test_client.get("/api/tasks/", params={"ids": f"{task_ids[1]},999999,{task_ids[0]}"}, headers=auth_headers)).json()
+    assert [task["title"] if task else None for task in tasks] == ["Second", None, "First"]
+
+    task_lists = (await test_client.get("/api/task-lists/", params={"ids": f"999999,{task_list_id}"}, headers=auth_headers)).json()
+    assert task_lists[0] is None
+    assert task_lists[1]["id"] == task_list_id
+
+
+@pytest.mark.asyncio
+async def test_fetch_users_by_ids(test_client):
+    auth_headers = await create_test_user_and_get_headers(test_client, 2)
+    user_id = (await test_client.get("/api/auth/me", headers=auth_headers)).json()["id"]
+
+    users = (await test_client.get("/api/users/", params={"ids": f"{user_id},999999"}, headers=auth_headers)).json()
+
+    assert users[0]["id"] == user_id
+    assert "hashed_password" not in users[0]
+    assert users[1] is None
+    assert (await test_client.get("/api/users/", headers=auth_headers)).status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_ids_parameter_validation(test_client):
+    auth_headers = await create_test_user_and_get_headers(test_client, 3)
+
+    assert (await test_client.get("/api/tasks/", params={"ids": "1,two"}, headers=auth_headers)).status_code == 422
+    assert (await test_client.get("/api/tasks/", params={"ids": ",".join(map(str, range(1, 102)))}, headers=auth_headers)).status_code == 422
+    assert (await test_client.get("/api/tasks/", params={"ids": "1", "status": "pending"}, headers=auth_headers)).status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_graphql_tasks_and_users_by_ids(test_client):
+    auth_headers = await create_test_user_and_get_headers(test_client, 4)
+    user_id = (await test_client.get("/api/auth/me", headers=auth_headers)).json()["id"]
+    task_list_id = (await test_client.post("/api/task-lists/", json={"title": "Batch"}, headers=auth_headers)).json()["id"]
+    task_id = (await test_client.post("/api/tasks/", json={"title": "Only", "task_list_id": task_list_id}, headers=auth_headers)).json()["id"]
+
+    query = f"""
+    query {{
+        first: tasksByIds(ids: [999999, {task_id}]) {{ id title }}
+        again: tasksByIds(ids: [{task_id}]) {{ id }}
+        usersByIds(ids: [{user_id}, 999999]) {{ id username }}
+    }}
+    """
+    data = (await test_client.post("/graphql", json={"query": query}, headers=auth_headers)).json()["data"]
+
+    assert data["first"] == [None, {"id": task_id, "title": "Only"}]
+    assert data["again"] == [{"id": task_id}]
+    assert data["usersByIds"][0]["id"] == user_id
+    assert data["usersByIds"][1] is None
@@ -0,0 +1,53 @@
+import pytest
+
+from tests.helpers.auth_helper import create_test_user_and_get_headers
+
+
+async def create_list_with_tasks(test_client, auth_headers, tasks: int):
+    task_list_id = (await test_client.post("/api/task-lists/", json={"title": "Cascade"}, headers=auth_headers)).json()["id"]
+    task_ids = []
+    for index in range(tasks):
+        response = await test_client.post("/api/tasks/", json={"title": f"Task {index}", "task_list_id": task_list_id}, headers=auth_headers)
+        task_ids.append(response.json()["id"])
+    return task_list_id, task_ids
+
+
+@pytest.mark.asyncio
+async def test_delete_list_with_tasks_needs_cascade(test_client):
+    auth_headers = await create_test_user_and_get_headers(test_client, 1)
+    task_list_id, _ = await create_list_with_tasks(test_client, auth_headers, 1)
+
+    response = await test_client.delete(f"/api/task-lists/{task_list_id}", headers=auth_headers)
+
+    assert response.status_code == 409
+    assert "cascade=true" in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_cascade_delete_removes_list_and_tasks(test_client):
+    auth_headers = await create_test_user_and_get_headers(test_client, 2)
+    task_list_id, task_ids = await create_list_with_tasks(test_client, auth_headers, 3)
+
+    response = await test_client.delete(f"/api/task-lists/{task_list_id}", params={"cascade": "true"}, headers=auth_headers)
+
+    assert response.status_code == 204
+    assert (await test_client.get(f"/api/task-lists/{task_list_id}", headers=auth_headers)).status_code == 404
+    for task_id in task_ids:
+        assert (await test_client.get(f"/api/tasks/{task_id}", headers=auth_headers)).status_code == 404
+    assert (await test_client.delete(f"/api/task-lists/{task_list_id}", params={"cascade": "true"}, headers=auth_headers)).status_code == 404
+    assert (await test_client.get(f"/api/task-lists/{task_list_id}/deletion", headers=auth_headers)).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_graphql_cascade_delete(test_client):
+    auth_headers = await create_test_user_and_get_headers(test_client, 3)
+    task_list_id, (task_id,) = await create_list_with_tasks(test_client, auth_headers, 1)
+
+    refused = await test_client.post("/graphql", json={"query": f"mutation {{ deleteTaskList(id: {task_list_id}) }}"}, headers=auth_headers)
+    assert "cascade: true" in refused.json()["errors"][0]["message"]
+
+    mutation = f"mutation {{ deleteTaskList(id: {task_list_id}, cascade: true) }}"
+    response = await test_client.post("/graphql", json={"query": mutation}, headers=auth_headers)
+
+    assert response.json()["data"]["deleteTaskList"] is True
+    assert (await test_client.get(f"/api/tasks/{task_id}", headers=auth_headers)).status_code == 404
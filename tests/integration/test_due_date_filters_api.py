@@ -0,0 +1,90 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from tests.helpers.auth_helper import create_test_user_and_get_headers
+
+
+def days_from_now(days):
+    return (datetime.now(timezone.utc) + timedelta(days=days)).replace(tzinfo=None).isoformat()
+
+
+async def create_tasks(test_client, auth_headers, *tasks):
+    list_response = await test_client.post("/api/task-lists/", json={"title": "Due List"}, headers=auth_headers)
+    assert list_response.status_code == 201
+    task_list_id = list_response.json()["id"]
+
+    ids = []
+    for task in tasks:
+        response = await test_client.post("/api/tasks/", json={"title": "Due task", "task_list_id": task_list_id, **task}, headers=auth_headers)
+        assert response.status_code == 201
+        ids.append(response.json()["id"])
+    return task_list_id, ids
+
+
+@pytest.mark.asyncio
+async def test_list_tasks_filters_by_due_date(test_client):
+    auth_headers = await create_test_user_and_get_headers(test_client, 1)
+    task_list_id, (overdue, done, upcoming) = await create_tasks(
+        test_client,
+        auth_headers,
+        {"due_date": days_from_now(-2)},
+        {"due_date": days_from_now(-2), "status": "completed"},
+        {"due_date": days_from_now(3)},
+    )
+
+    overdue_response = await test_client.get("/api/tasks/", params={"task_list_id": task_list_id, "overdue": True})
+    window_response = await test_client.get("/api/tasks/", params={"due_after": days_from_now(1), "due_before": days_from_now(5)})
+
+    assert overdue_response.status_code == 200
+    assert [task["id"] for task in overdue_response.json()] == [overdue]
+    assert [task["id"] for task in window_response.json()] == [upcoming]
+
+
+@pytest.mark.asyncio
+async def test_task_list_tasks_filter_by_due_date(test_client):
+    auth_headers = await create_test_user_and_get_headers(test_client, 2)
+    task_list_id, (overdue, _) = await create_tasks(test_client, auth_headers, {"due_date": days_from_now(-1)}, {"due_date": days_from_now(1)})
+
+    response = await test_client.get(f"/api/task-lists/{task_list_id}/tasks", params={"overdue": True}, headers=auth_headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [task["id"] for task in data["tasks"]] == [overdue]
+    assert data["total_tasks"] == 2
+
+
+@pytest.mark.asyncio
+async def test_my_overdue_tasks(test_client):
+    auth_headers = await create_test_user_and_get_headers(test_client, 3)
+    user_id = (await test_client.get("/api/auth/me", headers=auth_headers)).json()["id"]
+    _, (recent, oldest, _, _) = await create_tasks(
+        test_client,
+        auth_headers,
+        {"due_date": days_from_now(-1), "assigned_user_id": user_id},
+        {"due_date": days_from_now(-9), "assigned_user_id": user_id},
+        {"due_date": days_from_now(-5)},
+        {"due_date": days_from_now(2), "assigned_user_id": user_id},
+    )
+
+    response = await test_client.get("/api/users/me/overdue", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert [task["id"] for task in response.json()] == [oldest, recent]
+    assert (await test_client.get("/api/users/me/overdue")).status_code in (401, 403)
+
+
+@pytest.mark.asyncio
+async def test_graphql_tasks_overdue_filter(test_client):
+    auth_headers = await create_test_user_and_get_headers(test_client, 4)
+    task_list_id, (overdue, _) = await create_tasks(test_client, auth_headers, {"due_date": days_from_now(-1)}, {"due_date": days_from_now(1)})
+
+    query = f"""
+    query {{
+        tasks(taskListId: {task_list_id}, overdue: true) {{ id }}
+    }}
+    """
+    response = await test_client.post("/graphql", json={"query": query}, headers=auth_headers)
+
+    assert response.status_code == 200
+    assert [task["id"] for task in response.json()["data"]["tasks"]] == [overdue]
@@ -0,0 +1,97 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from src.application.use_cases.idempotency.idempotency_service import IdempotencyService
+from src.application.utils.single_flight import SingleFlight
+from src.infrastructure.database.models.idempotency_key_model import IdempotencyKeyModel
+from src.infrastructure.repositories.sqlalchemy_idempotency_repository import SQLAlchemyIdempotencyRepository
+from tests.helpers.auth_helper import create_test_user_and_get_headers
+
+
+@pytest.mark.asyncio
+async def test_retry_with_same_key_replays_response(test_client):
+    auth_headers = await create_test_user_and_get_headers(test_client, 1)
+    headers = {**auth_headers, "Idempotency-Key": "create-list-1"}
+
+    first = await test_client.post("/api/task-lists/", json={"title": "Retried List"}, headers=headers)
+    retry = await test_client.post("/api/task-lists/", json={"title": "Retried List"}, headers=headers)
+
+    assert first.status_code == 201
+    assert retry.status_code == 201
+    assert retry.json() == first.json()
+    assert retry.headers.get("Idempotent-Replayed") == "true"
+
+    lists_response = await test_client.get("/api/task-lists/", headers=auth_headers)
+    assert [task_list["title"] for task_list in lists_response.json()].count("Retried List") == 1
+
+
+@pytest.mark.asyncio
+async def test_same_key_with_different_body_is_rejected(test_client):
+    auth_headers = await create_test_user_and_get_headers(test_client, 1)
+    create_list_response = await test_client.post("/api/task-lists/", json={"title": "List"}, headers=auth_headers)
+    task_list_id = create_list_response.json()["id"]
+    headers = {**auth_headers, "Idempotency-Key": "create-task-1"}
+
+    first = await test_client.post("/api/tasks/", json={"title": "Task A", "task_list_id": task_list_id}, headers=headers)
+    second = await test_client.post("/api/tasks/", json={"title": "Task B", "task_list_id": task_list_id}, headers=headers)
+
+    assert first.status_code == 201
+    assert second.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_graphql_create_task_list_with_idempotency_key(test_client):
+    auth_headers = await create_test_user_and_get_headers(test_client, 1)
+    mutation = """
+        mutation {
+            createTaskList(input: {title: "GraphQL List"}, idempotencyKey: "gql-1") { id title }
+        }
+    """
+
+    first = await test_client.post("/graphql", json={"query": mutation}, headers=auth_headers)
+    retry = await test_client.post("/graphql", json={"query": mutation}, headers=auth_headers)
+
+    assert first.json()["data"]["createTaskList"] == retry.json()["data"]["createTaskList"]
+
+
+@pytest.mark.database
+@pytest.mark.asyncio
+async def test_duplicate_on_another_worker_replays_once_the_first_commits(test_engine):
+    """Two workers (separate sessions and single-flight groups) race the same key."""
+    SessionLocal = sessionmaker(bind=test_engine, class_=AsyncSession, expire_on_commit=False)
+    second_saving = asyncio.Event()
+
+    class FirstRepository(SQLAlchemyIdempotencyRepository):
+        async def commit(self):
+            # Commit only once the second worker's insert is blocked on this row
+            await second_saving.wait()
+            await asyncio.sleep(0.2)
+            await super().commit()
+
+    class SecondRepository(SQLAlchemyIdempotencyRepository):
+        async def save(self, record):
+            second_saving.set()
+            return await super().save(record)
+
+    async def run(repository_class, body):
+        async with SessionLocal() as session:
+            service = IdempotencyService(repository_class(session), group=SingleFlight(timeout=5), ttl_seconds=60)
+            return await service.execute(987654, "race-1", "POST /api/task-lists", {"title": "Raced"}, AsyncMock(return_value=body))
+
+    try:
+        first = asyncio.create_task(run(FirstRepository, {"id": 1}))
+        await asyncio.sleep(0.05)
+        second = await run(SecondRepository, {"id": 2})
+        first = await first
+
+        assert (first.body, first.replayed) == ({"id": 1}, False)
+        assert (second.status_code, second.body, second.replayed) == (201, {"id": 1}, True)
+    finally:
+        async with SessionLocal() as session:
+            await session.execute(delete(IdempotencyKeyModel).where(IdempotencyKeyModel.user_id == 987654))
+            await session.commit()
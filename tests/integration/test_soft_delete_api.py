@@ -0,0 +1,31 @@
+import pytest
+
+from tests.helpers.auth_helper import create_test_user_and_get_headers
+
+
+@pytest.mark.asyncio
+async def test_deleted_tasks_disappear_from_reads_and_free_their_list(test_client):
+    auth_headers = await create_test_user_and_get_headers(test_client, 1)
+    task_list_id = (await test_client.post("/api/task-lists/", json={"title": "Soft"}, headers=auth_headers)).json()["id"]
+    task_ids = []
+    for title in ("Archive gazebo plans", "Keep gazebo plans"):
+        response = await test_client.post("/api/tasks/", json={"title": title, "task_list_id": task_list_id}, headers=auth_headers)
+        task_ids.append(response.json()["id"])
+    deleted_id, kept_id = task_ids
+
+    assert (await test_client.delete(f"/api/tasks/{deleted_id}", headers=auth_headers)).status_code == 204
+    assert (await test_client.delete(f"/api/tasks/{deleted_id}", headers=auth_headers)).status_code == 404
+
+    with_tasks = await test_client.get(f"/api/task-lists/{task_list_id}/tasks", headers=auth_headers)
+    assert [task["id"] for task in with_tasks.json()["tasks"]] == [kept_id]
+    filtered = await test_client.get("/api/tasks/", params={"task_list_id": task_list_id}, headers=auth_headers)
+    assert [task["id"] for task in filtered.json()] == [kept_id]
+    search = await test_client.get("/api/tasks/search", params={"q": "gazebo"})
+    assert [hit["task"]["id"] for hit in search.json()["hits"]] == [kept_id]
+
+    # Only active tasks keep a list from being deleted
+    assert (await test_client.delete(f"/api/tasks/{kept_id}", headers=auth_headers)).status_code == 204
+    assert (await test_client.delete(f"/api/task-lists/{task_list_id}", headers=auth_headers)).status_code == 204
+
+    assert (await test_client.get(f"/api/task-lists/{task_list_id}", headers=auth_headers)).status_code == 404
+    assert (await test_client.get("/api/task-lists/", headers=auth_headers)).json() == []
@@ -0,0 +1,73 @@
+import pytest
+
+from src.infrastructure.config.settings import settings
+from tests.helpers.auth_helper import create_test_user_and_get_headers
+
+
+@pytest.fixture(autouse=True)
+def no_rescan_window(monkeypatch):
+    # These tests check keyset paging; the rescan overlap would repeat the rows written just before
+    monkeypatch.setattr(settings, "sync_rescan_seconds", 0.0)
+
+
+@pytest.mark.asyncio
+async def test_sync_returns_changes_and_tombstones(test_client):
+    auth_headers = await create_test_user_and_get_headers(test_client, 1)
+
+    create_list_response = await test_client.post("/api/task-lists/", json={"title": "Sync List"}, headers=auth_headers)
+    assert create_list_response.status_code == 201
+    task_list_id = create_list_response.json()["id"]
+
+    task_response = await test_client.post("/api/tasks/", json={"title": "Sync Task", "task_list_id": task_list_id}, headers=auth_headers)
+    assert task_response.status_code == 201
+    task_id = task_response.json()["id"]
+
+    response = await test_client.get("/api/sync", headers=auth_headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [task["id"] for task in data["tasks"]] == [task_id]
+    assert [task_list["id"] for task_list in data["task_lists"]] == [task_list_id]
+    assert data["deleted"] == []
+    watermark = data["watermark"]
+
+    delete_response = await test_client.delete(f"/api/tasks/{task_id}", headers=auth_headers)
+    assert delete_response.status_code == 204
+
+    response = await test_client.get("/api/sync", params={"since": watermark}, headers=auth_headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["tasks"] == []
+    assert data["task_lists"] == []
+    assert len(data["deleted"]) == 1
+    assert data["deleted"][0]["entity_type"] == "task"
+    assert data["deleted"][0]["entity_id"] == task_id
+
+
+@pytest.mark.asyncio
+async def test_sync_paginates_with_limit(test_client):
+    auth_headers = await create_test_user_and_get_headers(test_client, 2)
+
+    for index in range(3):
+        response = await test_client.post("/api/task-lists/", json={"title": f"Paged List {index}"}, headers=auth_headers)
+        assert response.status_code == 201
+
+    first_page = await test_client.get("/api/sync", params={"limit": 2}, headers=auth_headers)
+    assert first_page.status_code == 200
+    assert len(first_page.json()["task_lists"]) == 2
+    assert first_page.json()["has_more"] is True
+
+    second_page = await test_client.get("/api/sync", params={"limit": 2, "since": first_page.json()["watermark"]}, headers=auth_headers)
+    assert second_page.status_code == 200
+    assert len(second_page.json()["task_lists"]) == 1
+    assert second_page.json()["has_more"] is False
+
+
+@pytest.mark.asyncio
+async def test_sync_invalid_watermark(test_client):
+    auth_headers = await create_test_user_and_get_headers(test_client, 3)
+
+    response = await test_client.get("/api/sync", params={"since": "garbage"}, headers=auth_headers)
+
+    assert response.status_code == 400
@@ -0,0 +1,110 @@
+import pytest
+
+from tests.helpers.auth_helper import create_test_user_and_get_headers
+
+
+async def create_tasks(test_client, auth_headers, count: int):
+    lists = []
+    for title in ("Backlog", "Sprint"):
+        lists.append((await test_client.post("/api/task-lists/", json={"title": title}, headers=auth_headers)).json()["id"])
+    task_ids = []
+    for index in range(count):
+        response = await test_client.post("/api/tasks/", json={"title": f"Task {index}", "task_list_id": lists[0]}, headers=auth_headers)
+        task_ids.append(response.json()["id"])
+    return lists, task_ids
+
+
+@pytest.mark.asyncio
+async def test_bulk_move_and_reassign_by_ids(test_client):
+    auth_headers = await create_test_user_and_get_headers(test_client, 1)
+    user_id = (await test_client.get("/api/auth/me", headers=auth_headers)).json()["id"]
+    (source_id, target_id), task_ids = await create_tasks(test_client, auth_headers, 3)
+
+    response = await test_client.patch(
+        "/api/tasks/bulk",
+        json={"task_ids": task_ids[:2], "patch": {"task_list_id": target_id, "assigned_user_id": user_id}},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"updated": 2, "task_ids": task_ids[:2]}
+    moved = (await test_client.get("/api/tasks/", params={"task_list_id": target_id}, headers=auth_headers)).json()
+    assert sorted(task["id"] for task in moved) == task_ids[:2]
+    assert {task["assigned_user_id"] for task in moved} == {user_id}
+    remaining = (await test_client.get("/api/tasks/", params={"task_list_id": source_id}, headers=auth_headers)).json()
+    assert [task["id"] for task in remaining] == task_ids[2:]
+
+
+@pytest.mark.asyncio
+async def test_bulk_status_change_by_filter(test_client):
+    auth_headers = await create_test_user_and_get_headers(test_client, 2)
+    (source_id, _), task_ids = await create_tasks(test_client, auth_headers, 3)
+    await test_client.patch(f"/api/tasks/{task_ids[0]}/status", json={"status": "completed"}, headers=auth_headers)
+
+    body = {"filter": {"task_list_id": source_id, "status": "pending"}, "patch": {"status": "in_progress", "priority": "high"}}
+    response = await test_client.patch("/api/tasks/bulk", json=body, headers=auth_headers)
+
+    assert response.json() == {"updated": 2, "task_ids": task_ids[1:]}
+    assert (await test_client.patch("/api/tasks/bulk", json=body, headers=auth_headers)).json() == {"updated": 0, "task_ids": []}
+
+
+@pytest.mark.asyncio
+async def test_bulk_unassign_clears_only_the_fields_sent(test_client):
+    auth_headers = await create_test_user_and_get_headers(test_client, 5)
+    user_id = (await test_client.get("/api/auth/me", headers=auth_headers)).json()["id"]
+    (source_id, _), task_ids = await create_tasks(test_client, auth_headers, 2)
+    assign = {"task_ids": task_ids, "patch": {"assigned_user_id": user_id, "due_date": "2026-03-01T09:00:00"}}
+    await test_client.patch("/api/tasks/bulk", json=assign, headers=auth_headers)
+
+    response = await test_client.patch("/api/tasks/bulk", json={"task_ids": task_ids, "patch": {"assigned_user_id": None}}, headers=auth_headers)
+
+    assert response.json() == {"updated": 2, "task_ids": task_ids}
+    tasks = (await test_client.get("/api/tasks/", params={"task_list_id": source_id}, headers=auth_headers)).json()
+    assert {(task["assigned_user_id"], task["due_date"]) for task in tasks} == {(None, "2026-03-01T09:00:00")}
+    cleared = await test_client.patch("/api/tasks/bulk", json={"task_ids": task_ids, "patch": {"due_date": None}}, headers=auth_headers)
+    assert cleared.json()["updated"] == 2
+    # A null for a field that cannot be cleared is no change at all
+    null_status = await test_client.patch("/api/tasks/bulk", json={"task_ids": task_ids, "patch": {"status": None}}, headers=auth_headers)
+    assert null_status.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_rejections(test_client):
+    auth_headers = await create_test_user_and_get_headers(test_client, 3)
+    _, task_ids = await create_tasks(test_client, auth_headers, 1)
+
+    unknown_list = await test_client.patch("/api/tasks/bulk", json={"task_ids": task_ids, "patch": {"task_list_id": 999999}}, headers=auth_headers)
+    assert unknown_list.status_code == 400
+    unknown_user = await test_client.patch(
+        "/api/tasks/bulk", json={"task_ids": task_ids, "patch": {"assigned_user_id": 999999}}, headers=auth_headers
+    )
+    assert unknown_user.status_code == 400
+    no_selection = await test_client.patch("/api/tasks/bulk", json={"filter": {}, "patch": {"status": "completed"}}, headers=auth_headers)
+    assert no_selection.status_code == 422
+    empty_patch = await test_client.patch("/api/tasks/bulk", json={"task_ids": task_ids, "patch": {}}, headers=auth_headers)
+    assert empty_patch.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_graphql_bulk_update_tasks(test_client):
+    auth_headers = await create_test_user_and_get_headers(test_client, 4)
+    (source_id, target_id), task_ids = await create_tasks(test_client, auth_headers, 2)
+
+    mutation = f"""
+    mutation {{
+        bulkUpdateTasks(filter: {{ taskListId: {source_id} }}, patch: {{ taskListId: {target_id}, status: COMPLETED }}) {{
+            id taskListId status
+        }}
+    }}
+    """
+    response = await test_client.post("/graphql", json={"query": mutation}, headers=auth_headers)
+
+    expected = [{"id": task_id, "taskListId": target_id, "status": "COMPLETED"} for task_id in task_ids]
+    assert response.json()["data"]["bulkUpdateTasks"] == expected
+    rejected_mutation = f"mutation {{ bulkUpdateTasks(ids: [{task_ids[0]}], patch: {{ taskListId: 999999 }}) {{ id }} }}"
+    rejected = await test_client.post("/graphql", json={"query": rejected_mutation}, headers=auth_headers)
+    assert "Task list 999999 does not exist" in rejected.json()["errors"][0]["message"]
+    clear_mutation = f"mutation {{ bulkUpdateTasks(ids: [{task_ids[0]}], patch: {{ dueDate: null }}) {{ id dueDate }} }}"
+    await test_client.patch("/api/tasks/bulk", json={"task_ids": task_ids, "patch": {"due_date": "2026-03-01T09:00:00"}}, headers=auth_headers)
+    cleared = await test_client.post("/graphql", json={"query": clear_mutation}, headers=auth_headers)
+    assert cleared.json()["data"]["bulkUpdateTasks"] == [{"id": task_ids[0], "dueDate": None}]
@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+
+from tests.helpers.auth_helper import create_test_user_and_get_headers
+
+
+async def create_queue(test_client, auth_headers, *priorities):
+    list_response = await test_client.post("/api/task-lists/", json={"title": "Ops queue"}, headers=auth_headers)
+    assert list_response.status_code == 201
+    task_list_id = list_response.json()["id"]
+
+    ids = []
+    for priority in priorities:
+        payload = {"title": "Ops work", "task_list_id": task_list_id, "priority": priority}
+        response = await test_client.post("/api/tasks/", json=payload, headers=auth_headers)
+        assert response.status_code == 201
+        ids.append(response.json()["id"])
+    return task_list_id, ids
+
+
+@pytest.mark.asyncio
+async def test_claim_assigns_next_tasks_to_caller(test_client):
+    auth_headers = await create_test_user_and_get_headers(test_client, 1)
+    user_id = (await test_client.get("/api/auth/me", headers=auth_headers)).json()["id"]
+    task_list_id, (low, high, medium) = await create_queue(test_client, auth_headers, "low", "high", "medium")
+
+    response = await test_client.post(f"/api/task-lists/{task_list_id}/claim", params={"n": 2}, headers=auth_headers)
+
+    assert response.status_code == 200
+    claimed = response.json()
+    assert [task["id"] for task in claimed] == [high, medium]
+    assert {(task["status"], task["assigned_user_id"]) for task in claimed} == {("in_progress", user_id)}
+
+    rest = await test_client.post(f"/api/task-lists/{task_list_id}/claim", params={"n": 5}, headers=auth_headers)
+    assert [task["id"] for task in rest.json()] == [low]
+    assert (await test_client.post(f"/api/task-lists/{task_list_id}/claim", headers=auth_headers)).json() == []
+
+
+@pytest.mark.asyncio
+async def test_concurrent_claimers_get_disjoint_tasks(test_client):
+    auth_headers = await create_test_user_and_get_headers(test_client, 2)
+    task_list_id, ids = await create_queue(test_client, auth_headers, *["medium"] * 6)
+
+    responses = await asyncio.gather(*(test_client.post(f"/api/task-lists/{task_list_id}/claim", headers=auth_headers) for _ in range(8)))
+
+    claimed = [task["id"] for response in responses for task in response.json()]
+    assert sorted(claimed) == sorted(ids)
+
+
+@pytest.mark.database
+@pytest.mark.asyncio
+async def test_claim_retry_with_idempotency_key_replays_the_same_tasks(test_client):
+    auth_headers = await create_test_user_and_get_headers(test_client, 3)
+    task_list_id, _ = await create_queue(test_client, auth_headers, "high", "high")
+    headers = {**auth_headers, "Idempotency-Key": "claim-once"}
+
+    first = await test_client.post(f"/api/task-lists/{task_list_id}/claim", headers=headers)
+    retry = await test_client.post(f"/api/task-lists/{task_list_id}/claim", headers=headers)
+
+    assert retry.json() == first.json()
+    assert len(first.json()) == 1
+
+
+@pytest.mark.asyncio
+async def test_claim_unknown_list_or_without_auth(test_client):
+    auth_headers = await create_test_user_and_get_headers(test_client, 4)
+
+    assert (await test_client.post("/api/task-lists/999999/claim", headers=auth_headers)).status_code == 404
+    assert (await test_client.post("/api/task-lists/1/claim", params={"n": 0}, headers=auth_headers)).status_code == 422
+    assert (await test_client.post("/api/task-lists/1/claim")).status_code in (401, 403)
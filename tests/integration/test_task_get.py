@@ -1,4 +1,7 @@
 import pytest
+
+from src.application.utils import single_flight
+from src.domain.exceptions.concurrency_exceptions import CoalescedReadTimeoutException
 from tests.helpers.auth_helper import create_test_user_and_get_headers
 
 
@@ -102,3 +105,25 @@ async def test_get_all_tasks(test_client):
     assert "Task 1" in titles
     assert "Task 2" in titles
     assert "Task 3" in titles
+
+
+@pytest.mark.asyncio
+async def test_coalesced_read_timeout_is_a_gateway_timeout(test_client, monkeypatch):
+    auth_headers = await create_test_user_and_get_headers(test_client, 204)
+    task_list_id = (await test_client.post("/api/task-lists/", json={"title": "Slow List"}, headers=auth_headers)).json()["id"]
+    task_id = (await test_client.post("/api/tasks/", json={"title": "Slow Task", "task_list_id": task_list_id}, headers=auth_headers)).json()["id"]
+
+    async def timed_out(key, fn, label="default"):
+        raise CoalescedReadTimeoutException(label)
+
+    monkeypatch.setattr(single_flight.settings, "single_flight_enabled", True)
+    monkeypatch.setattr(single_flight.read_group, "do", timed_out)
+
+    for path in (f"/api/tasks/{task_id}", f"/api/task-lists/{task_list_id}", "/api/task-lists/"):
+        response = await test_client.get(path, headers=auth_headers)
+        assert response.status_code == 504, path
+        assert response.json() == {"detail": "Timed out waiting for a concurrent identical request"}
+    graphql = await test_client.post("/graphql", json={"query": f"{{ task(id: {task_id}) {{ id }} }}"}, headers=auth_headers)
+    error = graphql.json()["errors"][0]
+    assert error["message"] == "Timed out waiting for a concurrent identical request"
+    assert error["extensions"]["code"] == "GATEWAY_TIMEOUT"
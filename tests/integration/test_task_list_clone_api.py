@@ -0,0 +1,73 @@
+import pytest
+
+from tests.helpers.auth_helper import create_test_user_and_get_headers
+
+
+async def create_template(test_client, auth_headers, user_id):
+    task_list_id = (await test_client.post("/api/task-lists/", json={"title": "Template"}, headers=auth_headers)).json()["id"]
+    tasks = [
+        {"title": "Kickoff", "status": "completed", "assigned_user_id": user_id, "due_date": "2026-03-01T09:00:00"},
+        {"title": "Retro", "priority": "high"},
+    ]
+    for task in tasks:
+        response = await test_client.post("/api/tasks/", json={**task, "task_list_id": task_list_id}, headers=auth_headers)
+        assert response.status_code == 201
+    return task_list_id
+
+
+@pytest.mark.asyncio
+async def test_clone_task_list_with_options(test_client):
+    auth_headers = await create_test_user_and_get_headers(test_client, 1)
+    user_id = (await test_client.get("/api/auth/me", headers=auth_headers)).json()["id"]
+    template_id = await create_template(test_client, auth_headers, user_id)
+
+    response = await test_client.post(
+        f"/api/task-lists/{template_id}/clone",
+        json={"title": "Sprint 12", "reset_status": True, "due_date_offset": 7 * 86400, "unassign": True},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 201
+    clone = response.json()
+    assert (clone["title"], clone["user_id"], clone["tasks_copied"]) == ("Sprint 12", user_id, 2)
+    tasks = (await test_client.get(f"/api/task-lists/{clone['id']}/tasks", headers=auth_headers)).json()["tasks"]
+    assert sorted((task["title"], task["status"], task["assigned_user_id"], task["due_date"]) for task in tasks) == [
+        ("Kickoff", "pending", None, "2026-03-08T09:00:00"),
+        ("Retro", "pending", None, None),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_clone_task_list_errors(test_client):
+    auth_headers = await create_test_user_and_get_headers(test_client, 2)
+    user_id = (await test_client.get("/api/auth/me", headers=auth_headers)).json()["id"]
+    template_id = await create_template(test_client, auth_headers, user_id)
+
+    assert (await test_client.post("/api/task-lists/999999/clone", json={}, headers=auth_headers)).status_code == 404
+    unknown_user = await test_client.post(f"/api/task-lists/{template_id}/clone", json={"assigned_user_id": 999999}, headers=auth_headers)
+    assert unknown_user.status_code == 400
+    both = await test_client.post(f"/api/task-lists/{template_id}/clone", json={"assigned_user_id": user_id, "unassign": True}, headers=auth_headers)
+    assert both.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_graphql_clone_task_list(test_client):
+    auth_headers = await create_test_user_and_get_headers(test_client, 3)
+    user_id = (await test_client.get("/api/auth/me", headers=auth_headers)).json()["id"]
+    template_id = await create_template(test_client, auth_headers, user_id)
+
+    mutation = f"""
+    mutation {{
+        cloneTaskList(id: {template_id}, input: {{ title: "Copy", resetStatus: true }}) {{
+            taskList {{ id title userId }}
+            tasksCopied
+        }}
+    }}
+    """
+    response = await test_client.post("/graphql", json={"query": mutation}, headers=auth_headers)
+
+    clone = response.json()["data"]["cloneTaskList"]
+    assert clone["tasksCopied"] == 2
+    assert (clone["taskList"]["title"], clone["taskList"]["userId"]) == ("Copy", user_id)
+    missing = await test_client.post("/graphql", json={"query": "mutation { cloneTaskList(id: 999999) { tasksCopied } }"}, headers=auth_headers)
+    assert missing.json()["data"]["cloneTaskList"] is None
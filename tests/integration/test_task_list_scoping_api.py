@@ -0,0 +1,82 @@
+import pytest
+
+from tests.helpers.auth_helper import create_test_user_and_get_headers, use_admin_token
+
+
+@pytest.mark.asyncio
+async def test_list_task_lists_is_scoped_to_the_caller(test_client):
+    ann_headers = await create_test_user_and_get_headers(test_client, 1)
+    bob_headers = await create_test_user_and_get_headers(test_client, 2)
+    bob_id = (await test_client.get("/api/auth/me", headers=bob_headers)).json()["id"]
+
+    private = (await test_client.post("/api/task-lists/", json={"title": "Ann private"}, headers=ann_headers)).json()
+    shared = (await test_client.post("/api/task-lists/", json={"title": "Ann shared"}, headers=ann_headers)).json()
+    bobs = (await test_client.post("/api/task-lists/", json={"title": "Bob own"}, headers=bob_headers)).json()
+    task = {"title": "For Bob", "task_list_id": shared["id"], "assigned_user_id": bob_id}
+    assert (await test_client.post("/api/tasks/", json=task, headers=ann_headers)).status_code == 201
+
+    ann_lists = await test_client.get("/api/task-lists/", headers=ann_headers)
+    bob_lists = await test_client.get("/api/task-lists/", headers=bob_headers)
+
+    assert private["user_id"] is not None
+    assert [task_list["id"] for task_list in ann_lists.json()] == [private["id"], shared["id"]]
+    assert [task_list["id"] for task_list in bob_lists.json()] == [shared["id"], bobs["id"]]
+
+
+@pytest.mark.asyncio
+async def test_editing_another_users_list_keeps_its_owner(test_client):
+    ann_headers = await create_test_user_and_get_headers(test_client, 6)
+    bob_headers = await create_test_user_and_get_headers(test_client, 7)
+    ann_id = (await test_client.get("/api/auth/me", headers=ann_headers)).json()["id"]
+    task_list = (await test_client.post("/api/task-lists/", json={"title": "Ann roadmap"}, headers=ann_headers)).json()
+
+    response = await test_client.put(f"/api/task-lists/{task_list['id']}", json={"title": "Renamed by Bob"}, headers=bob_headers)
+
+    assert response.status_code == 200
+    assert response.json()["user_id"] == ann_id
+    ann_lists = (await test_client.get("/api/task-lists/", headers=ann_headers)).json()
+    assert [(task_list["title"], task_list["user_id"]) for task_list in ann_lists] == [("Renamed by Bob", ann_id)]
+    assert (await test_client.get("/api/task-lists/", headers=bob_headers)).json() == []
+
+
+@pytest.mark.asyncio
+async def test_fetching_task_lists_by_ids_hides_other_users_lists(test_client):
+    ann_headers = await create_test_user_and_get_headers(test_client, 9)
+    bob_headers = await create_test_user_and_get_headers(test_client, 10)
+    anns = (await test_client.post("/api/task-lists/", json={"title": "Ann private"}, headers=ann_headers)).json()
+    bobs = (await test_client.post("/api/task-lists/", json={"title": "Bob own"}, headers=bob_headers)).json()
+
+    response = await test_client.get("/api/task-lists/", params={"ids": f"{anns['id']},{bobs['id']}"}, headers=bob_headers)
+
+    assert response.status_code == 200
+    assert [task_list["title"] if task_list else None for task_list in response.json()] == [None, "Bob own"]
+
+
+@pytest.mark.asyncio
+async def test_graphql_task_lists_is_scoped_to_the_caller(test_client):
+    ann_headers = await create_test_user_and_get_headers(test_client, 3)
+    bob_headers = await create_test_user_and_get_headers(test_client, 4)
+    await test_client.post("/api/task-lists/", json={"title": "Ann only"}, headers=ann_headers)
+
+    response = await test_client.post("/graphql", json={"query": "query { taskLists { id title } }"}, headers=bob_headers)
+
+    assert response.status_code == 200
+    assert response.json()["data"]["taskLists"] == []
+
+
+@pytest.mark.asyncio
+async def test_admin_task_list_listing_is_paginated(test_client, monkeypatch):
+    auth_headers = use_admin_token(monkeypatch, await create_test_user_and_get_headers(test_client, 5))
+    for index in range(3):
+        await test_client.post("/api/task-lists/", json={"title": f"Paged list {index}"}, headers=auth_headers)
+
+    first = await test_client.get("/api/admin/task-lists", params={"limit": 2}, headers=auth_headers)
+    assert first.status_code == 200
+    assert len(first.json()["task_lists"]) == 2
+    assert first.json()["has_more"] is True
+
+    rest = await test_client.get("/api/admin/task-lists", params={"limit": 500, "cursor": first.json()["next_cursor"]}, headers=auth_headers)
+    ids = [task_list["id"] for page in (first, rest) for task_list in page.json()["task_lists"]]
+    assert ids == sorted(set(ids))
+    assert (await test_client.get("/api/admin/task-lists", params={"limit": 501}, headers=auth_headers)).status_code == 422
+    assert (await test_client.get("/api/admin/task-lists", params={"cursor": "garbage!"}, headers=auth_headers)).status_code == 400
@@ -0,0 +1,85 @@
+import pytest
+
+from tests.helpers.auth_helper import create_test_user_and_get_headers
+
+
+async def create_tasks(test_client, auth_headers, *tasks):
+    list_response = await test_client.post("/api/task-lists/", json={"title": "Search List"}, headers=auth_headers)
+    assert list_response.status_code == 201
+    task_list_id = list_response.json()["id"]
+
+    ids = []
+    for title, description in tasks:
+        response = await test_client.post(
+            "/api/tasks/", json={"title": title, "description": description, "task_list_id": task_list_id}, headers=auth_headers
+        )
+        assert response.status_code == 201
+        ids.append(response.json()["id"])
+    return task_list_id, ids
+
+
+@pytest.mark.asyncio
+async def test_search_ranks_title_matches_first(test_client):
+    auth_headers = await create_test_user_and_get_headers(test_client, 1)
+    _, (in_description, in_title, _) = await create_tasks(
+        test_client,
+        auth_headers,
+        ("Quarterly numbers", "Attach the xylophone inventory"),
+        ("Tune xylophone", None),
+        ("Unrelated chore", None),
+    )
+
+    response = await test_client.get("/api/tasks/search", params={"q": "xylophone"})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [hit["task"]["id"] for hit in data["hits"]] == [in_title, in_description]
+    assert data["hits"][0]["rank"] > data["hits"][1]["rank"]
+    assert data["has_more"] is False
+
+
+@pytest.mark.asyncio
+async def test_search_paginates_with_cursor(test_client):
+    auth_headers = await create_test_user_and_get_headers(test_client, 2)
+    task_list_id, ids = await create_tasks(test_client, auth_headers, *[(f"Polish marimba {index}", None) for index in range(3)])
+
+    first = await test_client.get("/api/tasks/search", params={"q": "marimba", "task_list_id": task_list_id, "limit": 2})
+    assert first.status_code == 200
+    assert first.json()["has_more"] is True
+
+    second = await test_client.get(
+        "/api/tasks/search", params={"q": "marimba", "task_list_id": task_list_id, "limit": 2, "cursor": first.json()["next_cursor"]}
+    )
+    assert second.status_code == 200
+    assert second.json()["has_more"] is False
+    seen = [hit["task"]["id"] for page in (first, second) for hit in page.json()["hits"]]
+    assert sorted(seen) == sorted(ids)
+
+
+@pytest.mark.asyncio
+async def test_search_rejects_invalid_cursor_and_empty_query(test_client):
+    assert (await test_client.get("/api/tasks/search", params={"q": "x", "cursor": "garbage!"})).status_code == 400
+    assert (await test_client.get("/api/tasks/search", params={"q": ""})).status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_graphql_search_tasks(test_client):
+    auth_headers = await create_test_user_and_get_headers(test_client, 3)
+    task_list_id, (task_id,) = await create_tasks(test_client, auth_headers, ("Restring ukulele", None))
+
+    query = f"""
+    query {{
+        searchTasks(query: "ukulele", taskListId: {task_list_id}, status: PENDING, first: 5) {{
+            hits {{ rank task {{ id title }} }}
+            nextCursor
+            hasMore
+        }}
+    }}
+    """
+    response = await test_client.post("/graphql", json={"query": query}, headers=auth_headers)
+
+    assert response.status_code == 200
+    page = response.json()["data"]["searchTasks"]
+    assert [hit["task"]["id"] for hit in page["hits"]] == [task_id]
+    assert page["hasMore"] is False
+    assert page["nextCursor"] is None
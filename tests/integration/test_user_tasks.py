@@ -0,0 +1,80 @@
+import pytest
+
+from tests.helpers.auth_helper import create_test_user_and_get_headers
+
+
+async def create_assigned_tasks(test_client, auth_headers, user_id, *tasks):
+    list_response = await test_client.post("/api/task-lists/", json={"title": "Queue List"}, headers=auth_headers)
+    assert list_response.status_code == 201
+    task_list_id = list_response.json()["id"]
+
+    ids = []
+    for task in tasks:
+        payload = {"title": "Queued task", "task_list_id": task_list_id, "assigned_user_id": user_id, **task}
+        response = await test_client.post("/api/tasks/", json=payload, headers=auth_headers)
+        assert response.status_code == 201
+        ids.append(response.json()["id"])
+    return ids
+
+
+async def current_user_id(test_client, auth_headers):
+    return (await test_client.get("/api/auth/me", headers=auth_headers)).json()["id"]
+
+
+@pytest.mark.asyncio
+async def test_user_tasks_are_ordered_and_paginated(test_client):
+    auth_headers = await create_test_user_and_get_headers(test_client, 1)
+    user_id = await current_user_id(test_client, auth_headers)
+    low, high_later, high_soon = await create_assigned_tasks(
+        test_client,
+        auth_headers,
+        user_id,
+        {"priority": "low", "due_date": "2026-11-01T09:00:00"},
+        {"priority": "high", "due_date": "2026-11-20T09:00:00"},
+        {"priority": "high", "due_date": "2026-11-05T09:00:00"},
+    )
+
+    first = await test_client.get(f"/api/users/{user_id}/tasks", params={"limit": 2}, headers=auth_headers)
+    assert first.status_code == 200
+    assert [task["id"] for task in first.json()["tasks"]] == [high_soon, high_later]
+    assert first.json()["has_more"] is True
+
+    second = await test_client.get(f"/api/users/{user_id}/tasks", params={"limit": 2, "cursor": first.json()["next_cursor"]}, headers=auth_headers)
+    assert [task["id"] for task in second.json()["tasks"]] == [low]
+    assert second.json()["has_more"] is False
+
+
+@pytest.mark.asyncio
+async def test_user_tasks_status_filter_and_errors(test_client):
+    auth_headers = await create_test_user_and_get_headers(test_client, 2)
+    user_id = await current_user_id(test_client, auth_headers)
+    pending, _ = await create_assigned_tasks(test_client, auth_headers, user_id, {}, {"status": "completed"})
+
+    response = await test_client.get(f"/api/users/{user_id}/tasks", params={"status": ["pending", "in_progress"]}, headers=auth_headers)
+
+    assert [task["id"] for task in response.json()["tasks"]] == [pending]
+    assert (await test_client.get(f"/api/users/{user_id}/tasks", params={"cursor": "garbage!"}, headers=auth_headers)).status_code == 400
+    assert (await test_client.get("/api/users/999999/tasks", headers=auth_headers)).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_graphql_my_tasks(test_client):
+    auth_headers = await create_test_user_and_get_headers(test_client, 3)
+    user_id = await current_user_id(test_client, auth_headers)
+    medium, high = await create_assigned_tasks(test_client, auth_headers, user_id, {"priority": "medium"}, {"priority": "high"})
+
+    query = """
+    query {
+        myTasks(status: [PENDING], first: 5) {
+            tasks { id }
+            nextCursor
+            hasMore
+        }
+    }
+    """
+    response = await test_client.post("/graphql", json={"query": query}, headers=auth_headers)
+
+    assert response.status_code == 200
+    page = response.json()["data"]["myTasks"]
+    assert [task["id"] for task in page["tasks"]] == [high, medium]
+    assert page["hasMore"] is False
@@ -0,0 +1,69 @@
+"""Fails async tests that block the event loop for longer than a budget.
+
+Each coroutine test runs with a LoopLagMonitor whose heartbeat ticks every few
+milliseconds; if the loop stalls past the budget the test fails with the stack the
+loop thread was executing. Set the budget with ``--loop-blocking-budget`` (seconds,
+0 disables) or the ``loop_blocking_budget`` ini option, and per test with
+``@pytest.mark.loop_blocking_budget(seconds)``; ``@pytest.mark.allow_loop_blocking``
+opts a test out.
+"""
+import functools
+import inspect
+
+import pytest
+
+from src.infrastructure.observability.loop_monitor import LoopLagMonitor
+
+DEFAULT_BUDGET = 0.2
+
+
+def pytest_addoption(parser):
+    parser.addoption("--loop-blocking-budget", type=float, default=None, help="Fail async tests that block the event loop longer than this (s)")
+    parser.addini("loop_blocking_budget", "Default event loop blocking budget for async tests (s)", default=str(DEFAULT_BUDGET))
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "loop_blocking_budget(seconds): event loop blocking budget for this test")
+    config.addinivalue_line("markers", "allow_loop_blocking: do not check this test for event loop blocking")
+
+
+def _budget(item) -> float:
+    if item.get_closest_marker("allow_loop_blocking"):
+        return 0.0
+    marker = item.get_closest_marker("loop_blocking_budget")
+    if marker is not None:
+        return float(marker.args[0])
+    option = item.config.getoption("--loop-blocking-budget")
+    return float(option if option is not None else item.config.getini("loop_blocking_budget"))
+
+
+def _guard(test, budget: float):
+    @functools.wraps(test)
+    async def guarded(*args, **kwargs):
+        monitor = LoopLagMonitor(interval=min(0.005, budget / 4), block_threshold=budget, capture_stacks=True, record_metrics=False)
+        await monitor.start()
+        try:
+            result = await test(*args, **kwargs)
+        finally:
+            await monitor.stop()
+        blocks = monitor.blocks()
+        if monitor.max_lag >= budget:
+            details = "\n".join(f"--- blocked {block.duration:.3f}s at:\n{block.stack}" for block in blocks)
+            pytest.fail(f"Event loop blocked for {monitor.max_lag:.3f}s (budget {budget:.3f}s)\n{details}", pytrace=False)
+        return result
+
+    return guarded
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    # Wrap the raw coroutine function before pytest-asyncio turns it into a sync call
+    test = getattr(item, "obj", None)
+    budget = _budget(item) if inspect.iscoroutinefunction(test) else 0.0
+    if budget > 0:
+        item.obj = _guard(test, budget)
+    try:
+        yield
+    finally:
+        if budget > 0:
+            item.obj = test
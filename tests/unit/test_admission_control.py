@@ -0,0 +1,125 @@
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from src.infrastructure.observability.metrics import metrics
+from src.presentation.rest.middleware.admission_control import (
+    AdaptiveLimiter,
+    AdmissionControlMiddleware,
+    classify_request,
+)
+
+
+def make_limiter(name="test", max_limit=1, max_queue=1, queue_timeout=0.05, latency_target=0.5):
+    return AdaptiveLimiter(name, max_limit=max_limit, max_queue=max_queue, queue_timeout=queue_timeout, latency_target=latency_target)
+
+
+class TestAdaptiveLimiter:
+    @pytest.mark.asyncio
+    async def test_admits_up_to_limit_then_queues(self):
+        limiter = make_limiter(max_limit=2, queue_timeout=1)
+
+        assert await limiter.acquire() is None
+        assert await limiter.acquire() is None
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+
+        assert limiter.queue_depth == 1
+        limiter.release(0.01, True)
+
+        assert await waiter is None
+        assert limiter.in_flight == 2
+        assert limiter.queue_depth == 0
+
+    @pytest.mark.asyncio
+    async def test_sheds_when_queue_wait_exceeds_deadline(self):
+        limiter = make_limiter(queue_timeout=0.01)
+        await limiter.acquire()
+
+        assert await limiter.acquire() == "queue_timeout"
+        assert limiter.queue_depth == 0
+
+    @pytest.mark.asyncio
+    async def test_sheds_immediately_when_queue_is_full(self):
+        limiter = make_limiter(max_queue=1, queue_timeout=1)
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+
+        assert await limiter.acquire() == "queue_full"
+
+        limiter.release(0.01, True)
+        assert await waiter is None
+
+    def test_slow_requests_shrink_limit_and_fast_requests_recover_it(self):
+        limiter = make_limiter(max_limit=10, latency_target=0.1)
+        limiter.in_flight = 10
+
+        limiter.release(1.0, True)
+        assert limiter.limit == pytest.approx(9.0)
+
+        # Decreases are rate-limited to one per cooldown window
+        limiter.in_flight = 9
+        limiter.release(1.0, True)
+        assert limiter.limit == pytest.approx(9.0)
+
+        limiter.in_flight = 9
+        limiter.release(0.01, True)
+        assert 9.0 < limiter.limit <= 10.0
+
+    def test_failures_shrink_limit(self):
+        limiter = make_limiter(max_limit=10)
+        limiter.in_flight = 1
+
+        limiter.release(0.01, False)
+
+        assert limiter.limit == pytest.approx(9.0)
+
+
+class TestClassifyRequest:
+    @pytest.mark.parametrize(
+        "method,path,budget",
+        [
+            ("GET", "/api/tasks/", "read"),
+            ("POST", "/api/tasks/", "write"),
+            ("PATCH", "/api/tasks/1/status", "write"),
+            ("POST", "/api/auth/login", "auth"),
+            ("POST", "/graphql", "graphql"),
+            ("GET", "/health", None),
+            ("GET", "/api/metrics", None),
+        ],
+    )
+    def test_budgets(self, method, path, budget):
+        assert classify_request({"type": "http", "method": method, "path": path}) == budget
+
+
+class TestAdmissionControlMiddleware:
+    @pytest.mark.asyncio
+    async def test_rejects_with_503_and_retry_after(self):
+        release = asyncio.Event()
+        app = FastAPI()
+
+        @app.get("/api/slow")
+        async def slow():
+            await release.wait()
+            return {"ok": True}
+
+        limiter = make_limiter(name="middleware_read", queue_timeout=0.01)
+        wrapped = AdmissionControlMiddleware(app, limiters={"read": limiter})
+
+        async with httpx.AsyncClient(app=wrapped, base_url="http://test") as client:
+            first = asyncio.create_task(client.get("/api/slow"))
+            await asyncio.sleep(0.01)
+
+            rejected = await client.get("/api/slow")
+
+            release.set()
+            accepted = await first
+
+        assert accepted.status_code == 200
+        assert rejected.status_code == 503
+        assert int(rejected.headers["retry-after"]) >= 1
+        assert metrics.counter("admission_shed_total", budget="read", reason="queue_timeout").value >= 1
+        assert limiter.in_flight == 0
@@ -0,0 +1,110 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.application.use_cases.task.task_service import TaskService
+from src.domain.entities.task import Task, TaskPriority, TaskStatus
+from src.domain.entities.task_list import TaskList
+from src.domain.entities.user import User
+from src.domain.exceptions.task_exceptions import InvalidTaskCursorException
+from src.infrastructure.repositories.in_memory_store import InMemoryStore
+from src.infrastructure.repositories.in_memory_task_list_repository import InMemoryTaskListRepository
+from src.infrastructure.repositories.in_memory_task_repository import InMemoryTaskRepository
+from src.infrastructure.repositories.in_memory_user_repository import InMemoryUserRepository
+from src.infrastructure.repositories.sqlalchemy_task_repository import SQLAlchemyTaskRepository
+
+
+@pytest.fixture
+def store():
+    return InMemoryStore()
+
+
+@pytest.fixture
+def repository(store):
+    return InMemoryTaskRepository(store)
+
+
+@pytest.fixture
+async def task_list_id(store):
+    return (await InMemoryTaskListRepository(store).create(TaskList(title="List"))).id
+
+
+@pytest.fixture
+async def user_id(store):
+    return (await InMemoryUserRepository(store).create(User(email="a@example.com", username="a"))).id
+
+
+async def assign(repository, task_list_id, user_id, priority, due_day=None, status=TaskStatus.PENDING):
+    due_date = datetime(2026, 11, due_day) if due_day else None
+    task = Task(title="Task", task_list_id=task_list_id, assigned_user_id=user_id, priority=priority, due_date=due_date, status=status)
+    return await repository.create(task)
+
+
+@pytest.mark.asyncio
+async def test_queue_order_is_priority_then_due_date_with_undated_last(repository, task_list_id, user_id):
+    low = await assign(repository, task_list_id, user_id, TaskPriority.LOW, 1)
+    high_undated = await assign(repository, task_list_id, user_id, TaskPriority.HIGH)
+    high_later = await assign(repository, task_list_id, user_id, TaskPriority.HIGH, 20)
+    high_soon = await assign(repository, task_list_id, user_id, TaskPriority.HIGH, 5)
+    medium = await assign(repository, task_list_id, user_id, TaskPriority.MEDIUM, 2)
+    await repository.create(Task(title="Unassigned", task_list_id=task_list_id, priority=TaskPriority.HIGH))
+
+    tasks = await repository.get_assigned(user_id)
+
+    assert [task.id for task in tasks] == [high_soon.id, high_later.id, high_undated.id, medium.id, low.id]
+
+
+@pytest.mark.asyncio
+async def test_status_filter(repository, task_list_id, user_id):
+    pending = await assign(repository, task_list_id, user_id, TaskPriority.LOW)
+    in_progress = await assign(repository, task_list_id, user_id, TaskPriority.HIGH, status=TaskStatus.IN_PROGRESS)
+    await assign(repository, task_list_id, user_id, TaskPriority.HIGH, status=TaskStatus.COMPLETED)
+
+    tasks = await repository.get_assigned(user_id, [TaskStatus.PENDING, TaskStatus.IN_PROGRESS])
+
+    assert [task.id for task in tasks] == [in_progress.id, pending.id]
+
+
+@pytest.mark.asyncio
+async def test_service_pages_through_the_queue_with_a_cursor(repository, task_list_id, user_id):
+    created = [
+        await assign(repository, task_list_id, user_id, priority, due_day)
+        for priority in (TaskPriority.HIGH, TaskPriority.LOW)
+        for due_day in (None, 3, 3, 1)
+    ]
+    service = TaskService(repository)
+    expected = [task.id for task in await repository.get_assigned(user_id)]
+
+    seen = []
+    cursor = None
+    while True:
+        page = await service.get_assigned(user_id, cursor=cursor, limit=3)
+        seen.extend(task.id for task in page.tasks)
+        if not page.has_more:
+            break
+        cursor = page.next_cursor
+
+    assert seen == expected
+    assert sorted(seen) == [task.id for task in created]
+
+
+def test_queue_cursor_round_trips():
+    task = Task(title="Task", task_list_id=1, id=42, priority=TaskPriority.HIGH, due_date=datetime(2026, 11, 3, 9, 30))
+
+    assert TaskService.decode_queue_cursor(TaskService.encode_queue_cursor(task)) == (TaskPriority.HIGH, task.due_date, 42)
+
+
+@pytest.mark.parametrize("token", ["not-base64!", "WyJ1cmdlbnQiLG51bGwsMV0", "WzFd"])
+def test_invalid_queue_cursor_is_rejected(token):
+    with pytest.raises(InvalidTaskCursorException):
+        TaskService.decode_queue_cursor(token)
+
+
+def test_assigned_statement_selects_the_page_ids_in_index_order():
+    statement = SQLAlchemyTaskRepository.assigned_statement(7, [TaskStatus.PENDING], TaskPriority.MEDIUM, None, 10, limit=20)
+
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+
+    assert "JOIN (SELECT tasks.id AS id" in sql
+    assert "ORDER BY tasks.priority DESC, tasks.due_date ASC NULLS LAST, tasks.id" in sql
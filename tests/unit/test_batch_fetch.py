@@ -0,0 +1,67 @@
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.domain.entities.task import Task, TaskPriority, TaskStatus
+from src.domain.entities.task_list import TaskList
+from src.domain.entities.user import User
+from src.infrastructure.repositories.in_memory_store import InMemoryStore
+from src.infrastructure.repositories.in_memory_task_list_repository import InMemoryTaskListRepository
+from src.infrastructure.repositories.in_memory_task_repository import InMemoryTaskRepository
+from src.infrastructure.repositories.in_memory_user_repository import InMemoryUserRepository
+from src.infrastructure.repositories.sqlalchemy_task_list_repository import SQLAlchemyTaskListRepository
+from src.infrastructure.repositories.sqlalchemy_task_repository import SQLAlchemyTaskRepository
+from src.infrastructure.repositories.sqlalchemy_user_repository import SQLAlchemyUserRepository
+
+NOW = datetime(2026, 1, 1)
+
+
+@pytest.fixture
+def store():
+    return InMemoryStore()
+
+
+@pytest.mark.asyncio
+async def test_in_memory_batches_keep_order_and_mark_missing(store):
+    lists = InMemoryTaskListRepository(store)
+    first, second = [await lists.create(TaskList(title=title)) for title in ("First", "Second")]
+    tasks = InMemoryTaskRepository(store)
+    kept, deleted = [await tasks.create(Task(title=title, task_list_id=first.id)) for title in ("Kept", "Deleted")]
+    await tasks.delete(deleted.id)
+    user = await InMemoryUserRepository(store).create(User(email="ann@example.com", username="ann"))
+
+    assert [task.title if task else None for task in await tasks.get_by_ids([deleted.id, kept.id, 99, kept.id])] == [None, "Kept", None, "Kept"]
+    assert [task_list.id if task_list else None for task_list in await lists.get_by_ids([second.id, 99, first.id])] == [second.id, None, first.id]
+    assert await InMemoryUserRepository(store).get_by_ids([99, user.id]) == [None, user]
+
+
+def test_batch_statements_bind_distinct_ids_as_one_array():
+    for statement, name in (
+        (SQLAlchemyTaskRepository.by_ids_statement([3, 1, 3]), "task_ids"),
+        (SQLAlchemyTaskListRepository.by_ids_statement([3, 1, 3]), "task_list_ids"),
+        (SQLAlchemyUserRepository.by_ids_statement([3, 1, 3]), "user_ids"),
+    ):
+        compiled = statement.compile(dialect=postgresql.dialect())
+        assert f"= ANY (%({name})s::INTEGER[])" in str(compiled)
+        assert compiled.params[name] == [3, 1]
+
+
+@pytest.mark.asyncio
+async def test_sqlalchemy_task_batch_maps_rows_back_to_input_order():
+    session = AsyncMock()
+    result = MagicMock()
+    # RETURNING/ANY give no order guarantee; the repository reorders by the ids asked for
+    result.all.return_value = [
+        ("Two", 1, 2, None, TaskStatus.PENDING, TaskPriority.LOW, None, None, True, NOW, NOW),
+        ("One", 1, 1, None, TaskStatus.PENDING, TaskPriority.LOW, None, None, True, NOW, NOW),
+    ]
+    session.execute = AsyncMock(return_value=result)
+
+    tasks = await SQLAlchemyTaskRepository(session).get_by_ids([1, 5, 2])
+
+    assert [task.title if task else None for task in tasks] == ["One", None, "Two"]
+    session.execute.assert_awaited_once()
+    assert await SQLAlchemyTaskRepository(session).get_by_ids([]) == []
+    session.execute.assert_awaited_once()
@@ -0,0 +1,109 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.application.use_cases.task_list.task_list_service import TaskListService
+from src.domain.entities.task import Task
+from src.domain.entities.task_list import TaskList
+from src.infrastructure.jobs.cascade_delete import CascadeDeleteRunner
+from src.infrastructure.repositories.in_memory_store import InMemoryStore
+from src.infrastructure.repositories.in_memory_task_list_repository import InMemoryTaskListRepository
+from src.infrastructure.repositories.in_memory_task_repository import InMemoryTaskRepository
+from src.infrastructure.repositories.in_memory_user_repository import InMemoryUserRepository
+from src.infrastructure.repositories.sqlalchemy_task_repository import SQLAlchemyTaskRepository
+
+
+@pytest.fixture
+def store():
+    return InMemoryStore()
+
+
+def build_service(store):
+    return TaskListService(InMemoryTaskListRepository(store), InMemoryTaskRepository(store), InMemoryUserRepository(store))
+
+
+async def create_list(store, tasks: int) -> TaskList:
+    task_list = await InMemoryTaskListRepository(store).create(TaskList(title="Big list"))
+    for index in range(tasks):
+        await InMemoryTaskRepository(store).create(Task(title=f"Task {index}", task_list_id=task_list.id))
+    return task_list
+
+
+def session_factory():
+    session = MagicMock()
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=False)
+    session.commit = AsyncMock()
+    return session
+
+
+@pytest.mark.asyncio
+async def test_delete_cascade_removes_tasks_and_list(store):
+    task_list = await create_list(store, 3)
+    service = build_service(store)
+
+    assert await service.delete_cascade(task_list.id) == 3
+
+    assert await service.get(task_list.id) is None
+    assert await InMemoryTaskRepository(store).list_all() == []
+    assert await service.delete_cascade(task_list.id) is None
+
+
+@pytest.mark.asyncio
+async def test_delete_tasks_takes_lowest_ids_first(store):
+    task_list = await create_list(store, 3)
+    service = build_service(store)
+
+    assert await service.delete_tasks(task_list.id, limit=2) == 2
+
+    remaining = await InMemoryTaskRepository(store).get_by_task_list_id(task_list.id)
+    assert [task.title for task in remaining] == ["Task 2"]
+    assert await service.count_tasks(task_list.id) == 1
+
+
+def test_chunk_statement_is_bounded_and_ordered_by_id():
+    sql = str(SQLAlchemyTaskRepository.delete_by_task_list_statement(5, limit=1000).compile(dialect=postgresql.dialect()))
+
+    assert sql.startswith("UPDATE tasks SET is_active=%(is_active)s, updated_at=%(updated_at)s WHERE tasks.id IN (SELECT tasks.id")
+    assert "ORDER BY tasks.id \n LIMIT %(param_1)s) AND tasks.is_active RETURNING" in sql
+
+
+def test_whole_list_statement_is_a_single_update():
+    sql = str(SQLAlchemyTaskRepository.delete_by_task_list_statement(5).compile(dialect=postgresql.dialect()))
+
+    assert "WHERE tasks.task_list_id = %(task_list_id_1)s AND tasks.is_active RETURNING" in sql
+
+
+@pytest.mark.asyncio
+async def test_runner_deletes_in_chunks_and_reports_progress(store):
+    task_list = await create_list(store, 5)
+    runner = CascadeDeleteRunner(session_factory, chunk_size=2, chunk_sleep=0)
+
+    job = runner.start(task_list.id, 5, lambda session: build_service(store))
+    assert job.status == "running" and job.tasks_deleted == 0
+    assert runner.start(task_list.id, 5, lambda session: build_service(store)).started_at == job.started_at
+    while runner.get(task_list.id).status == "running":
+        await asyncio.sleep(0)
+
+    progress = runner.get(task_list.id)
+    assert progress.status == "completed"
+    assert progress.tasks_deleted == 5
+    assert progress.finished_at is not None
+    assert await build_service(store).get(task_list.id) is None
+
+
+@pytest.mark.asyncio
+async def test_runner_records_failures(store):
+    task_list = await create_list(store, 1)
+    service = MagicMock()
+    service.delete_tasks = AsyncMock(side_effect=RuntimeError("connection lost"))
+    runner = CascadeDeleteRunner(session_factory, chunk_size=2, chunk_sleep=0)
+
+    runner.start(task_list.id, 1, lambda session: service)
+    while runner.get(task_list.id).status == "running":
+        await asyncio.sleep(0)
+
+    assert runner.get(task_list.id).status == "failed"
+    assert runner.get(task_list.id).error == "connection lost"
@@ -0,0 +1,86 @@
+from datetime import timedelta
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.domain.entities.task import Task, TaskStatus
+from src.domain.entities.task_list import TaskList
+from src.domain.entities.user import User
+from src.infrastructure.repositories.in_memory_store import InMemoryStore
+from src.infrastructure.repositories.in_memory_task_list_repository import InMemoryTaskListRepository
+from src.infrastructure.repositories.in_memory_task_repository import InMemoryTaskRepository
+from src.infrastructure.repositories.in_memory_user_repository import InMemoryUserRepository
+from src.infrastructure.repositories.sqlalchemy_task_repository import SQLAlchemyTaskRepository
+from src.infrastructure.utils.datetime_utils import utc_now
+
+
+@pytest.fixture
+def store():
+    return InMemoryStore()
+
+
+@pytest.fixture
+def repository(store):
+    return InMemoryTaskRepository(store)
+
+
+@pytest.fixture
+async def task_list_id(store):
+    return (await InMemoryTaskListRepository(store).create(TaskList(title="List"))).id
+
+
+@pytest.fixture
+async def user_id(store):
+    return (await InMemoryUserRepository(store).create(User(email="a@example.com", username="a"))).id
+
+
+async def create(repository, task_list_id, due_in_days, status=TaskStatus.PENDING, assigned_user_id=None):
+    due_date = None if due_in_days is None else utc_now() + timedelta(days=due_in_days)
+    return await repository.create(Task(title="Task", task_list_id=task_list_id, status=status, due_date=due_date, assigned_user_id=assigned_user_id))
+
+
+@pytest.mark.asyncio
+async def test_due_range_is_inclusive_after_and_exclusive_before(repository, task_list_id):
+    last_week = await create(repository, task_list_id, -7)
+    tomorrow = await create(repository, task_list_id, 1)
+    await create(repository, task_list_id, 30)
+    await create(repository, task_list_id, None)
+
+    window = await repository.get_tasks_by_filters(due_after=last_week.due_date, due_before=utc_now() + timedelta(days=2))
+
+    assert [task.id for task in window] == [last_week.id, tomorrow.id]
+    assert await repository.get_tasks_by_filters(due_before=last_week.due_date) == []
+
+
+@pytest.mark.asyncio
+async def test_overdue_skips_completed_archived_and_future_tasks(repository, task_list_id):
+    overdue = await create(repository, task_list_id, -1)
+    await create(repository, task_list_id, -1, status=TaskStatus.COMPLETED)
+    await create(repository, task_list_id, 1)
+    archived = await create(repository, task_list_id, -1)
+    archived.is_active = False
+    await repository.update(archived)
+
+    assert [task.id for task in await repository.get_tasks_by_filters(overdue=True)] == [overdue.id]
+    assert await repository.get_tasks_by_filters(task_list_id=task_list_id + 1, overdue=True) == []
+
+
+@pytest.mark.asyncio
+async def test_get_overdue_is_per_assignee_and_most_overdue_first(repository, task_list_id, user_id):
+    recent = await create(repository, task_list_id, -1, assigned_user_id=user_id)
+    oldest = await create(repository, task_list_id, -10, assigned_user_id=user_id)
+    await create(repository, task_list_id, -5)
+
+    assert [task.id for task in await repository.get_overdue(user_id)] == [oldest.id, recent.id]
+    assert [task.id for task in await repository.get_overdue(user_id, limit=1)] == [oldest.id]
+    assert len(await repository.get_overdue()) == 3
+
+
+def test_overdue_statement_repeats_the_partial_index_predicate_literally():
+    statement = SQLAlchemyTaskRepository.overdue_statement(utc_now(), assigned_user_id=7, limit=50)
+
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+
+    # A bound status parameter would keep PostgreSQL from matching ix_tasks_open_*_due_date under a generic plan
+    assert "tasks.status != 'COMPLETED' AND tasks.is_active" in sql
+    assert "ORDER BY tasks.due_date, tasks.id" in sql
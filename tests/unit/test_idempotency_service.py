@@ -0,0 +1,180 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.use_cases.idempotency.idempotency_service import IdempotencyService, request_fingerprint
+from src.application.utils.single_flight import SingleFlight
+from src.domain.entities.idempotency_record import IdempotencyRecord
+from src.domain.exceptions.idempotency_exceptions import IdempotencyKeyInProgressException, IdempotencyKeyReusedException
+
+SCOPE = "POST /api/tasks"
+PAYLOAD = {"title": "Task", "task_list_id": 1}
+
+
+@pytest.fixture
+def mock_repository():
+    repository = AsyncMock()
+    repository.get.return_value = None
+    repository.save.return_value = True
+    return repository
+
+
+@pytest.fixture
+def idempotency_service(mock_repository):
+    return IdempotencyService(mock_repository, group=SingleFlight(timeout=1.0), ttl_seconds=60)
+
+
+def stored_record(payload=PAYLOAD):
+    return IdempotencyRecord(
+        user_id=1, key="abc", scope=SCOPE, request_hash=request_fingerprint(SCOPE, payload), status_code=201, response_body={"id": 7}
+    )
+
+
+class TestIdempotencyService:
+    @pytest.mark.asyncio
+    async def test_without_key_runs_handler_only(self, idempotency_service, mock_repository):
+        handler = AsyncMock(return_value={"id": 1})
+
+        result = await idempotency_service.execute(1, None, SCOPE, PAYLOAD, handler)
+
+        assert result.body == {"id": 1}
+        assert result.replayed is False
+        mock_repository.get.assert_not_called()
+        mock_repository.save.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_first_request_executes_and_stores_response(self, idempotency_service, mock_repository):
+        handler = AsyncMock(return_value={"id": 1})
+
+        result = await idempotency_service.execute(1, "abc", SCOPE, PAYLOAD, handler)
+
+        assert result.status_code == 201
+        assert result.body == {"id": 1}
+        assert result.replayed is False
+        saved = mock_repository.save.call_args.args[0]
+        assert saved.key == "abc"
+        assert saved.response_body == {"id": 1}
+        assert saved.request_hash == request_fingerprint(SCOPE, PAYLOAD)
+        assert (saved.expires_at - saved.created_at).total_seconds() == 60
+        mock_repository.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_retry_replays_without_running_handler(self, idempotency_service, mock_repository):
+        mock_repository.get.return_value = stored_record()
+        handler = AsyncMock()
+
+        result = await idempotency_service.execute(1, "abc", SCOPE, PAYLOAD, handler)
+
+        assert result.body == {"id": 7}
+        assert result.replayed is True
+        handler.assert_not_called()
+        mock_repository.save.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_key_reused_with_different_payload(self, idempotency_service, mock_repository):
+        mock_repository.get.return_value = stored_record()
+
+        with pytest.raises(IdempotencyKeyReusedException):
+            await idempotency_service.execute(1, "abc", SCOPE, {"title": "Other"}, AsyncMock())
+
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicates_execute_once(self, idempotency_service):
+        calls = 0
+
+        async def handler():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return {"id": 1}
+
+        results = await asyncio.gather(*(idempotency_service.execute(1, "abc", SCOPE, PAYLOAD, handler) for _ in range(5)))
+
+        assert calls == 1
+        assert all(result.body == {"id": 1} for result in results)
+        assert sum(result.replayed for result in results) == 4
+
+    @pytest.mark.asyncio
+    async def test_duplicates_wait_for_the_commit(self, idempotency_service, mock_repository):
+        committing = asyncio.Event()
+        release_commit = asyncio.Event()
+
+        async def commit():
+            committing.set()
+            await release_commit.wait()
+
+        mock_repository.commit.side_effect = commit
+        handler = AsyncMock(return_value={"id": 1})
+
+        first = asyncio.create_task(idempotency_service.execute(1, "abc", SCOPE, PAYLOAD, handler))
+        await committing.wait()
+        duplicate = asyncio.create_task(idempotency_service.execute(1, "abc", SCOPE, PAYLOAD, handler))
+        await asyncio.sleep(0.01)
+
+        assert not first.done() and not duplicate.done()
+        release_commit.set()
+        assert (await duplicate).body == {"id": 1}
+        assert (await first).replayed is False
+        handler.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_commit_is_not_replayed(self, idempotency_service, mock_repository):
+        mock_repository.commit.side_effect = RuntimeError("commit failed")
+
+        with pytest.raises(RuntimeError):
+            await idempotency_service.execute(1, "abc", SCOPE, PAYLOAD, AsyncMock(return_value={"id": 1}))
+
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicate_with_different_payload_conflicts(self, idempotency_service):
+        async def handler():
+            await asyncio.sleep(0.05)
+            return {"id": 1}
+
+        first, second = await asyncio.gather(
+            idempotency_service.execute(1, "abc", SCOPE, PAYLOAD, handler),
+            idempotency_service.execute(1, "abc", SCOPE, {"title": "Other"}, handler),
+            return_exceptions=True,
+        )
+
+        assert first.body == {"id": 1}
+        assert isinstance(second, IdempotencyKeyReusedException)
+
+    @pytest.mark.asyncio
+    async def test_key_held_by_another_worker(self, idempotency_service, mock_repository):
+        mock_repository.save.return_value = False
+
+        with pytest.raises(IdempotencyKeyInProgressException):
+            await idempotency_service.execute(1, "abc", SCOPE, PAYLOAD, AsyncMock(return_value={"id": 1}))
+        mock_repository.rollback.assert_awaited_once()
+        mock_repository.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_losing_the_save_replays_the_winners_response(self, idempotency_service, mock_repository):
+        # Nothing stored when this request started; another worker committed while its save waited
+        mock_repository.get.side_effect = [None, stored_record()]
+        mock_repository.save.return_value = False
+
+        result = await idempotency_service.execute(1, "abc", SCOPE, PAYLOAD, AsyncMock(return_value={"id": 1}))
+
+        assert (result.body, result.replayed) == ({"id": 7}, True)
+        mock_repository.rollback.assert_awaited_once()
+        mock_repository.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failed_write_is_not_stored(self, idempotency_service, mock_repository):
+        handler = AsyncMock(side_effect=ValueError("invalid"))
+
+        with pytest.raises(ValueError):
+            await idempotency_service.execute(1, "abc", SCOPE, PAYLOAD, handler)
+
+        mock_repository.save.assert_not_called()
+        mock_repository.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_keys_are_scoped_per_user(self, idempotency_service, mock_repository):
+        handler = AsyncMock(return_value={"id": 1})
+
+        await idempotency_service.execute(1, "abc", SCOPE, PAYLOAD, handler)
+        await idempotency_service.execute(2, "abc", SCOPE, PAYLOAD, handler)
+
+        assert [call.args[0] for call in mock_repository.get.call_args_list] == [1, 2]
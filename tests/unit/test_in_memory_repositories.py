@@ -0,0 +1,220 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.domain.entities.idempotency_record import IdempotencyRecord
+from src.domain.entities.task import Task, TaskPriority, TaskStatus
+from src.domain.entities.task_list import TaskList
+from src.domain.entities.tombstone import SyncEntityType
+from src.domain.entities.user import User
+from src.domain.exceptions.task_exceptions import InvalidTaskListException
+from src.domain.exceptions.task_exceptions import InvalidUserException as InvalidTaskUserException
+from src.domain.exceptions.task_list_exceptions import InvalidUserException, TaskListHasTasksException
+from src.domain.exceptions.user_exceptions import DuplicateEmailException, DuplicateUsernameException
+from src.infrastructure.repositories.in_memory_idempotency_repository import InMemoryIdempotencyRepository
+from src.infrastructure.repositories.in_memory_store import InMemoryStore
+from src.infrastructure.repositories.in_memory_sync_repository import InMemorySyncRepository
+from src.infrastructure.repositories.in_memory_task_list_repository import InMemoryTaskListRepository
+from src.infrastructure.repositories.in_memory_task_repository import InMemoryTaskRepository
+from src.infrastructure.repositories.in_memory_user_repository import InMemoryUserRepository
+
+
+@pytest.fixture
+def store():
+    return InMemoryStore()
+
+
+@pytest.fixture
+def user_repository(store):
+    return InMemoryUserRepository(store)
+
+
+@pytest.fixture
+def task_list_repository(store):
+    return InMemoryTaskListRepository(store)
+
+
+@pytest.fixture
+def task_repository(store):
+    return InMemoryTaskRepository(store)
+
+
+@pytest.fixture
+async def task_list(task_list_repository):
+    return await task_list_repository.create(TaskList(title="List"))
+
+
+class TestInMemoryUserRepository:
+    @pytest.mark.asyncio
+    async def test_create_assigns_id_and_timestamps(self, user_repository):
+        user = await user_repository.create(User(email="a@example.com", username="a"))
+
+        assert user.id == 1
+        assert user.created_at is not None
+        assert await user_repository.get_by_email("a@example.com") == user
+
+    @pytest.mark.asyncio
+    async def test_duplicate_email(self, user_repository):
+        await user_repository.create(User(email="a@example.com", username="a"))
+
+        with pytest.raises(DuplicateEmailException):
+            await user_repository.create(User(email="a@example.com", username="b"))
+
+    @pytest.mark.asyncio
+    async def test_duplicate_username(self, user_repository):
+        await user_repository.create(User(email="a@example.com", username="a"))
+
+        with pytest.raises(DuplicateUsernameException):
+            await user_repository.create(User(email="b@example.com", username="a"))
+
+
+class TestInMemoryTaskListRepository:
+    @pytest.mark.asyncio
+    async def test_create_with_unknown_user(self, task_list_repository):
+        with pytest.raises(InvalidUserException):
+            await task_list_repository.create(TaskList(title="List", user_id=99))
+
+    @pytest.mark.asyncio
+    async def test_returned_entities_are_copies(self, task_list_repository, task_list):
+        task_list.title = "Changed"
+
+        stored = await task_list_repository.get_by_id(task_list.id)
+
+        assert stored.title == "List"
+
+    @pytest.mark.asyncio
+    async def test_update_missing(self, task_list_repository):
+        with pytest.raises(ValueError):
+            await task_list_repository.update(TaskList(id=5, title="Missing"))
+
+    @pytest.mark.asyncio
+    async def test_delete_with_tasks_is_rejected(self, task_list_repository, task_repository, task_list):
+        await task_repository.create(Task(title="Task", task_list_id=task_list.id))
+
+        with pytest.raises(TaskListHasTasksException):
+            await task_list_repository.delete(task_list.id)
+
+    @pytest.mark.asyncio
+    async def test_delete(self, task_list_repository, task_list):
+        assert await task_list_repository.delete(task_list.id) is True
+        assert await task_list_repository.delete(task_list.id) is False
+
+
+class TestInMemoryTaskRepository:
+    @pytest.mark.asyncio
+    async def test_create_with_unknown_task_list(self, task_repository):
+        with pytest.raises(InvalidTaskListException):
+            await task_repository.create(Task(title="Task", task_list_id=42))
+
+    @pytest.mark.asyncio
+    async def test_create_with_unknown_assignee(self, task_repository, task_list):
+        with pytest.raises(InvalidTaskUserException):
+            await task_repository.create(Task(title="Task", task_list_id=task_list.id, assigned_user_id=7))
+
+    @pytest.mark.asyncio
+    async def test_filters_use_indexes(self, task_repository, task_list_repository, task_list):
+        other_list = await task_list_repository.create(TaskList(title="Other"))
+        high = await task_repository.create(Task(title="High", task_list_id=task_list.id, priority=TaskPriority.HIGH))
+        done = await task_repository.create(Task(title="Done", task_list_id=task_list.id, status=TaskStatus.COMPLETED))
+        await task_repository.create(Task(title="Elsewhere", task_list_id=other_list.id, priority=TaskPriority.HIGH))
+
+        assert [task.id for task in await task_repository.get_by_task_list_id(task_list.id)] == [high.id, done.id]
+        assert [task.id for task in await task_repository.get_tasks_by_filters(task_list_id=task_list.id, priority=TaskPriority.HIGH)] == [high.id]
+        assert [task.id for task in await task_repository.get_tasks_by_filters(status=TaskStatus.COMPLETED)] == [done.id]
+        assert len(await task_repository.get_tasks_by_filters()) == 3
+
+    @pytest.mark.asyncio
+    async def test_update_moves_task_between_index_entries(self, task_repository, user_repository, task_list):
+        user = await user_repository.create(User(email="a@example.com", username="a"))
+        task = await task_repository.create(Task(title="Task", task_list_id=task_list.id))
+
+        task.status = TaskStatus.IN_PROGRESS
+        task.assigned_user_id = user.id
+        await task_repository.update(task)
+
+        assert await task_repository.get_tasks_by_filters(status=TaskStatus.PENDING) == []
+        assert [t.id for t in await task_repository.get_tasks_by_filters(status=TaskStatus.IN_PROGRESS)] == [task.id]
+        assert [t.id for t in await task_repository.get_by_assigned_user_id(user.id)] == [task.id]
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_from_indexes(self, task_repository, store, task_list):
+        task = await task_repository.create(Task(title="Task", task_list_id=task_list.id))
+
+        assert await task_repository.delete(task.id) is True
+
+        assert await task_repository.get_by_id(task.id) is None
+        assert task_list.id not in store.task_ids_by_task_list
+        assert store.task_ids_by_status_priority == {}
+
+
+class TestInMemorySyncRepository:
+    @pytest.mark.asyncio
+    async def test_changes_page_in_timestamp_then_id_order(self, store, task_repository, task_list):
+        tasks = [await task_repository.create(Task(title=f"Task {index}", task_list_id=task_list.id)) for index in range(3)]
+        for task in tasks:
+            store.tasks[task.id].updated_at = datetime(2026, 1, 1)
+        store.tasks[tasks[0].id].updated_at = datetime(2026, 1, 2)
+        sync = InMemorySyncRepository(store)
+
+        first = await sync.get_tasks_changed_since(None, 0, 2)
+        rest = await sync.get_tasks_changed_since(first[-1].updated_at, first[-1].id, 2)
+
+        assert [task.id for task in first + rest] == [tasks[1].id, tasks[2].id, tasks[0].id]
+        assert [task_list.id for task_list in await sync.get_task_lists_changed_since(None, 0, 10)] == [task_list.id]
+
+    @pytest.mark.asyncio
+    async def test_deletes_leave_tombstones_instead_of_rows(self, store, task_repository, task_list_repository, task_list):
+        task = await task_repository.create(Task(title="Task", task_list_id=task_list.id))
+        sync = InMemorySyncRepository(store)
+
+        await task_repository.delete(task.id)
+        await task_list_repository.delete(task_list.id)
+
+        assert await sync.get_tasks_changed_since(None, 0, 10) == []
+        assert await sync.get_task_lists_changed_since(None, 0, 10) == []
+        tombstones = await sync.get_tombstones_since(None, 0, 10)
+        assert [(tombstone.entity_type, tombstone.entity_id) for tombstone in tombstones] == [
+            (SyncEntityType.TASK, task.id),
+            (SyncEntityType.TASK_LIST, task_list.id),
+        ]
+        assert await sync.get_tombstones_since(tombstones[-1].deleted_at, tombstones[-1].id, 10) == []
+
+
+class TestInMemoryIdempotencyRepository:
+    @pytest.mark.asyncio
+    async def test_live_key_is_kept_and_expired_one_taken_over(self, store):
+        repository = InMemoryIdempotencyRepository(store)
+        now = datetime(2026, 1, 1)
+
+        def record(body, created_at):
+            return IdempotencyRecord(
+                user_id=1,
+                key="abc",
+                scope="POST /api/tasks",
+                request_hash="h",
+                status_code=201,
+                response_body=body,
+                created_at=created_at,
+                expires_at=created_at + timedelta(hours=1),
+            )
+
+        assert await repository.save(record({"id": 1}, now)) is True
+        assert await repository.save(record({"id": 2}, now + timedelta(minutes=5))) is False
+        assert (await repository.get(1, "abc", now)).response_body == {"id": 1}
+        assert await repository.get(2, "abc", now) is None
+
+        later = now + timedelta(hours=2)
+        assert await repository.get(1, "abc", later) is None
+        assert await repository.save(record({"id": 3}, later)) is True
+        assert (await repository.get(1, "abc", later)).response_body == {"id": 3}
+
+    @pytest.mark.asyncio
+    async def test_purge_expired_in_batches(self, store):
+        repository = InMemoryIdempotencyRepository(store)
+        now = datetime(2026, 1, 1)
+        for key in ("a", "b", "c"):
+            await repository.save(IdempotencyRecord(user_id=1, key=key, scope="s", request_hash="h", status_code=201, created_at=now, expires_at=now))
+
+        assert await repository.purge_expired(now, 2) == 2
+        assert await repository.purge_expired(now, 2) == 1
+        assert store.idempotency_records == {}
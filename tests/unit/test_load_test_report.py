@@ -0,0 +1,68 @@
+import argparse
+
+import pytest
+
+from benchmarks.load_test import LatencyRecorder, build_report, compare, parse_mix, percentile
+
+
+def scenario_report(p95, p99, throughput, error_rate=0.0):
+    return {"latency_ms": {"p95": p95, "p99": p99}, "throughput_rps": throughput, "error_rate": error_rate}
+
+
+class TestPercentile:
+    def test_nearest_rank(self):
+        samples = [float(value) for value in range(1, 101)]
+
+        assert percentile(samples, 0.50) == 50.0
+        assert percentile(samples, 0.95) == 95.0
+        assert percentile(samples, 0.99) == 99.0
+
+    def test_empty(self):
+        assert percentile([], 0.5) is None
+
+
+class TestBuildReport:
+    def test_counts_errors_and_throughput(self):
+        recorder = LatencyRecorder()
+        recorder.record("filter", 0.010, 200)
+        recorder.record("filter", 0.020, 503)
+        recorder.record("login", 0.100, None)
+
+        report = build_report(recorder, elapsed=2.0, config={})
+
+        assert report["overall"]["requests"] == 3
+        assert report["scenarios"]["filter"]["errors"] == 1
+        assert report["scenarios"]["filter"]["throughput_rps"] == 1.0
+        assert report["scenarios"]["filter"]["status_codes"] == {"200": 1, "503": 1}
+        assert report["scenarios"]["login"]["status_codes"] == {"exception": 1}
+
+
+class TestCompare:
+    def test_within_tolerance(self):
+        baseline = {"scenarios": {"filter": scenario_report(10.0, 20.0, 100.0)}}
+        report = {"scenarios": {"filter": scenario_report(11.0, 21.0, 95.0)}}
+
+        assert compare(report, baseline, tolerance=0.15) == []
+
+    def test_flags_latency_throughput_and_errors(self):
+        baseline = {"scenarios": {"filter": scenario_report(10.0, 20.0, 100.0)}}
+        report = {"scenarios": {"filter": scenario_report(15.0, 20.0, 50.0, error_rate=0.05)}}
+
+        regressions = compare(report, baseline, tolerance=0.15)
+
+        assert len(regressions) == 3
+        assert regressions[0].startswith("filter: p95")
+
+    def test_scenarios_missing_from_run_are_ignored(self):
+        baseline = {"scenarios": {"login": scenario_report(10.0, 20.0, 100.0)}}
+
+        assert compare({"scenarios": {}}, baseline) == []
+
+
+class TestParseMix:
+    def test_weights(self):
+        assert parse_mix("login=1,filter=2.5") == {"login": 1.0, "filter": 2.5}
+
+    def test_unknown_scenario(self):
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_mix("nope=1")
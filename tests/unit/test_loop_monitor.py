@@ -0,0 +1,64 @@
+import asyncio
+import time
+
+import pytest
+
+from src.infrastructure.observability.loop_monitor import LoopLagMonitor
+from tests.plugins.loop_blocking import _guard
+
+
+def block_loop(seconds):
+    time.sleep(seconds)
+
+
+class TestLoopLagMonitor:
+    @pytest.mark.allow_loop_blocking
+    async def test_blocking_call_is_measured_with_stack(self):
+        monitor = LoopLagMonitor(interval=0.005, block_threshold=0.05, capture_stacks=True, record_metrics=False)
+        await monitor.start()
+        await asyncio.sleep(0.01)
+        block_loop(0.15)
+        await asyncio.sleep(0.01)
+        await monitor.stop()
+
+        assert monitor.max_lag >= 0.1
+        [report] = monitor.blocks()
+        assert report.duration >= 0.1
+        assert "block_loop" in report.stack
+
+    async def test_awaiting_is_not_lag(self):
+        monitor = LoopLagMonitor(interval=0.005, block_threshold=0.05, capture_stacks=True, record_metrics=False)
+        await monitor.start()
+        await asyncio.sleep(0.1)
+        await monitor.stop()
+
+        assert monitor.max_lag < 0.05
+        assert monitor.blocks() == []
+
+    @pytest.mark.allow_loop_blocking
+    async def test_stall_in_progress_at_stop_is_counted(self):
+        monitor = LoopLagMonitor(interval=0.005, block_threshold=0.05, record_metrics=False)
+        await monitor.start()
+        block_loop(0.1)
+        await monitor.stop()
+
+        assert monitor.max_lag >= 0.05
+
+
+class TestLoopBlockingPlugin:
+    @pytest.mark.allow_loop_blocking
+    async def test_guard_fails_test_over_budget(self):
+        async def blocking_test():
+            block_loop(0.1)
+
+        with pytest.raises(pytest.fail.Exception, match="Event loop blocked") as failure:
+            await _guard(blocking_test, 0.05)()
+
+        assert "block_loop" in str(failure.value)
+
+    async def test_guard_passes_non_blocking_test(self):
+        async def cooperative_test():
+            await asyncio.sleep(0.05)
+            return "ok"
+
+        assert await _guard(cooperative_test, 0.05)() == "ok"
@@ -0,0 +1,57 @@
+from dataclasses import fields
+from datetime import datetime
+
+from src.domain.entities.task import Task, TaskPriority, TaskStatus
+from src.domain.entities.task_list import TaskList
+from src.infrastructure.database.mappers import TASK_COLUMNS, TASK_LIST_COLUMNS, TaskListMapper, TaskMapper
+from src.infrastructure.database.models.task_list_model import TaskListModel
+from src.infrastructure.database.models.task_model import TaskModel
+from src.presentation.graphql.types.task_list_types import TASK_PRIORITY_TO_GRAPHQL, TASK_STATUS_TO_GRAPHQL, task_to_graphql
+
+
+class TestRowMappers:
+    def test_task_columns_follow_dataclass_field_order(self):
+        assert [column.key for column in TASK_COLUMNS] == [field.name for field in fields(Task)]
+
+    def test_task_list_columns_follow_dataclass_field_order(self):
+        assert [column.key for column in TASK_LIST_COLUMNS] == [field.name for field in fields(TaskList)]
+
+    def test_task_from_row_matches_to_domain(self):
+        now = datetime(2026, 1, 1)
+        values = {
+            "id": 3,
+            "title": "Task",
+            "description": "d",
+            "task_list_id": 1,
+            "status": TaskStatus.IN_PROGRESS,
+            "priority": TaskPriority.HIGH,
+            "assigned_user_id": 2,
+            "due_date": now,
+            "is_active": True,
+            "created_at": now,
+            "updated_at": now,
+        }
+        row = tuple(values[column.key] for column in TASK_COLUMNS)
+
+        assert TaskMapper.from_row(row) == TaskMapper.to_domain(TaskModel(**values))
+
+    def test_task_list_from_row_matches_to_domain(self):
+        values = {"id": 1, "title": "List", "description": None, "user_id": 4, "is_active": True, "created_at": None, "updated_at": None}
+        row = tuple(values[column.key] for column in TASK_LIST_COLUMNS)
+
+        assert TaskListMapper.from_row(row) == TaskListMapper.to_domain(TaskListModel(**values))
+
+
+class TestGraphQLEnumMaps:
+    def test_every_domain_value_is_mapped(self):
+        assert set(TASK_STATUS_TO_GRAPHQL) == set(TaskStatus)
+        assert set(TASK_PRIORITY_TO_GRAPHQL) == set(TaskPriority)
+        assert all(graphql.value == domain.value for domain, graphql in TASK_STATUS_TO_GRAPHQL.items())
+
+    def test_task_to_graphql(self):
+        task = Task(id=1, title="Task", task_list_id=2, status=TaskStatus.COMPLETED, priority=TaskPriority.LOW)
+
+        converted = task_to_graphql(task)
+
+        assert converted.status.value == "completed"
+        assert converted.priority.value == "low"
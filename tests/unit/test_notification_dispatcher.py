@@ -0,0 +1,121 @@
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.domain.entities.notification import EmailMessage, NotificationType, TaskNotification
+from src.domain.entities.task import TaskStatus
+from src.infrastructure.external.email_senders import FileEmailSender, InMemoryEmailSender
+from src.infrastructure.notifications.dispatcher import NotificationDispatcher
+
+
+def make_notification(user_id=1, task_id=10, notification_type=NotificationType.TASK_ASSIGNED, status=TaskStatus.PENDING):
+    return TaskNotification(type=notification_type, recipient_user_id=user_id, task_id=task_id, task_title=f"Task {task_id}", status=status)
+
+
+@pytest.fixture
+def sender():
+    return InMemoryEmailSender()
+
+
+@pytest.fixture
+def resolver():
+    return AsyncMock(side_effect=lambda user_ids: {user_id: f"user{user_id}@example.com" for user_id in user_ids})
+
+
+@pytest.fixture
+async def dispatcher(sender, resolver):
+    dispatcher = NotificationDispatcher(sender, resolver, digest_interval=3600, max_pending=3, workers=2, retry_base_delay=0)
+    await dispatcher.start()
+    yield dispatcher
+    await dispatcher.stop()
+
+
+class TestNotificationDispatcher:
+    @pytest.mark.asyncio
+    async def test_one_digest_per_recipient(self, dispatcher, sender, resolver):
+        dispatcher.publish(make_notification(user_id=1, task_id=10))
+        dispatcher.publish(make_notification(user_id=1, task_id=11))
+        dispatcher.publish(make_notification(user_id=2, task_id=12))
+
+        assert await dispatcher.flush() == 2
+        await dispatcher._outbox.join()
+
+        resolver.assert_awaited_once()
+        assert sorted(message.to for message in sender.sent) == ["user1@example.com", "user2@example.com"]
+        digest = next(message for message in sender.sent if message.to == "user1@example.com")
+        assert digest.subject == "2 task updates"
+        assert "Task 10" in digest.body and "Task 11" in digest.body
+
+    @pytest.mark.asyncio
+    async def test_coalesces_repeated_events_for_same_task(self, dispatcher, sender):
+        dispatcher.publish(make_notification(notification_type=NotificationType.TASK_STATUS_CHANGED, status=TaskStatus.IN_PROGRESS))
+        dispatcher.publish(make_notification(notification_type=NotificationType.TASK_STATUS_CHANGED, status=TaskStatus.COMPLETED))
+
+        assert dispatcher.pending == 1
+        await dispatcher.flush()
+        await dispatcher._outbox.join()
+
+        assert len(sender.sent) == 1
+        assert "completed" in sender.sent[0].body
+        assert "in_progress" not in sender.sent[0].body
+
+    @pytest.mark.asyncio
+    async def test_drops_when_pending_limit_reached(self, dispatcher):
+        for task_id in range(5):
+            dispatcher.publish(make_notification(task_id=task_id))
+
+        assert dispatcher.pending == 3
+
+    @pytest.mark.asyncio
+    async def test_skips_unknown_recipients(self, dispatcher, sender, resolver):
+        resolver.side_effect = None
+        resolver.return_value = {}
+        dispatcher.publish(make_notification())
+
+        assert await dispatcher.flush() == 0
+        assert sender.sent == []
+
+    @pytest.mark.asyncio
+    async def test_retries_failed_sends(self, resolver):
+        sender = AsyncMock()
+        sender.send.side_effect = [ConnectionError("smtp down"), ConnectionError("smtp down"), None]
+        dispatcher = NotificationDispatcher(sender, resolver, max_attempts=3, retry_base_delay=0)
+
+        with patch("src.infrastructure.notifications.dispatcher.random.uniform", return_value=0) as uniform:
+            assert await dispatcher._send_with_retry(EmailMessage(to="a@example.com", subject="s", body="b")) is True
+
+        assert sender.send.await_count == 3
+        assert uniform.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self, resolver):
+        sender = AsyncMock()
+        sender.send.side_effect = ConnectionError("smtp down")
+        dispatcher = NotificationDispatcher(sender, resolver, max_attempts=2, retry_base_delay=0)
+
+        assert await dispatcher._send_with_retry(EmailMessage(to="a@example.com", subject="s", body="b")) is False
+        assert sender.send.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stop_delivers_pending_notifications(self, sender, resolver):
+        dispatcher = NotificationDispatcher(sender, resolver, digest_interval=3600)
+        await dispatcher.start()
+        dispatcher.publish(make_notification())
+
+        await dispatcher.stop()
+
+        assert len(sender.sent) == 1
+
+
+class TestFileEmailSender:
+    @pytest.mark.asyncio
+    async def test_appends_json_lines(self, tmp_path):
+        path = tmp_path / "emails.jsonl"
+        sender = FileEmailSender(str(path))
+
+        await sender.send(EmailMessage(to="a@example.com", subject="Hello", body="Body"))
+        await sender.send(EmailMessage(to="b@example.com", subject="Hi", body="Body"))
+
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [line["to"] for line in lines] == ["a@example.com", "b@example.com"]
@@ -0,0 +1,221 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.domain.entities.notification import NotificationType, TaskNotification
+from src.domain.entities.outbox_event import OutboxEvent
+from src.domain.entities.task import Task, TaskPriority, TaskStatus
+from src.domain.entities.user import User
+from src.infrastructure.database.mappers import OutboxEventMapper
+from src.infrastructure.database.models.outbox_event_model import OutboxEventModel
+from src.infrastructure.notifications.outbox import NotificationEventHandler, OutboxNotificationPublisher
+from src.infrastructure.outbox.event_bus import EventBus
+from src.infrastructure.outbox.purger import OutboxPurger
+from src.infrastructure.outbox.recorder import TASK, event_payload, outbox_row, record_event, record_events
+from src.infrastructure.outbox.relay import OutboxRelay
+
+
+def make_session_factory(session):
+    @asynccontextmanager
+    async def begin():
+        yield
+
+    session.begin = MagicMock(side_effect=begin)
+
+    @asynccontextmanager
+    async def factory():
+        yield session
+
+    return factory
+
+
+def claimed(*ids):
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = [
+        OutboxEventModel(id=event_id, aggregate_type=TASK, aggregate_id=event_id, event_type="task.updated", payload={}) for event_id in ids
+    ]
+    return result
+
+
+class TestRecorder:
+    def test_event_payload_is_json_safe(self):
+        task = Task(id=1, title="T", task_list_id=2, status=TaskStatus.COMPLETED, priority=TaskPriority.HIGH, due_date=datetime(2026, 1, 2))
+
+        payload = event_payload(task)
+
+        assert payload["status"] == "completed"
+        assert payload["priority"] == "high"
+        assert payload["due_date"] == "2026-01-02T00:00:00"
+
+    def test_event_payload_excludes_password_hash(self):
+        user = User(id=1, email="a@b.c", username="a", hashed_password="secret")
+
+        assert "hashed_password" not in event_payload(user)
+
+    def test_outbox_row_prefixes_event_type(self):
+        row = outbox_row(TASK, 5, "created", {"id": 5})
+
+        assert row["event_type"] == "task.created"
+        assert row["aggregate_id"] == 5
+        assert row["created_at"] is not None
+
+    @pytest.mark.asyncio
+    async def test_record_event_uses_callers_session(self):
+        session = AsyncMock()
+
+        await record_event(session, TASK, 5, "deleted", {"id": 5})
+
+        session.execute.assert_called_once()
+        session.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_record_events_skips_empty_batch(self):
+        session = AsyncMock()
+
+        await record_events(session, [])
+
+        session.execute.assert_not_called()
+
+
+class TestEventBus:
+    @pytest.mark.asyncio
+    async def test_exact_prefix_and_wildcard_subscribers(self):
+        bus = EventBus()
+        exact, prefix, everything, other = AsyncMock(), AsyncMock(), AsyncMock(), AsyncMock()
+        bus.subscribe("task.updated", exact)
+        bus.subscribe("task.*", prefix)
+        bus.subscribe("*", everything)
+        bus.subscribe("task_list.*", other)
+        event = OutboxEvent(aggregate_type=TASK, aggregate_id=1, event_type="task.updated", id=1)
+
+        await bus.publish(event)
+
+        exact.assert_called_once_with(event)
+        prefix.assert_called_once_with(event)
+        everything.assert_called_once_with(event)
+        other.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failing_handler_does_not_block_others(self):
+        bus = EventBus()
+        failing = AsyncMock(side_effect=RuntimeError("boom"))
+        healthy = AsyncMock()
+        bus.subscribe("*", failing)
+        bus.subscribe("*", healthy)
+
+        await bus.publish(OutboxEvent(aggregate_type=TASK, aggregate_id=1, event_type="task.created", id=1))
+
+        healthy.assert_called_once()
+
+
+class TestOutboxRelay:
+    @pytest.mark.asyncio
+    async def test_relay_batch_publishes_and_marks_processed(self):
+        session = AsyncMock()
+        session.execute.side_effect = [claimed(1, 2), MagicMock()]
+        bus = EventBus()
+        handler = AsyncMock()
+        bus.subscribe("*", handler)
+        relay = OutboxRelay(make_session_factory(session), bus, batch_size=10)
+
+        relayed = await relay.relay_batch()
+
+        assert relayed == 2
+        assert [call.args[0].id for call in handler.call_args_list] == [1, 2]
+        assert session.execute.call_count == 2
+        claim = session.execute.call_args_list[0].args[0]
+        assert claim._for_update_arg.skip_locked
+        assert "UPDATE outbox" in str(session.execute.call_args_list[1].args[0])
+
+    @pytest.mark.asyncio
+    async def test_relay_batch_with_nothing_pending(self):
+        session = AsyncMock()
+        session.execute.side_effect = [claimed()]
+        relay = OutboxRelay(make_session_factory(session), EventBus())
+
+        assert await relay.relay_batch() == 0
+        assert session.execute.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_start_and_stop(self):
+        session = AsyncMock()
+        session.execute.side_effect = lambda *args, **kwargs: claimed()
+        relay = OutboxRelay(make_session_factory(session), EventBus(), poll_interval=0.01, concurrency=2)
+
+        await relay.start()
+        await asyncio.sleep(0.05)
+        await relay.stop()
+
+        assert session.execute.call_count >= 2
+
+
+class TestOutboxPurger:
+    def test_purge_statement_deletes_only_processed_rows_past_the_cutoff(self):
+        compiled = OutboxPurger.purge_statement(datetime(2026, 1, 1), 40, 500).compile(dialect=postgresql.dialect())
+        sql = str(compiled)
+
+        assert sql.startswith("DELETE FROM outbox WHERE outbox.id IN (SELECT outbox.id")
+        assert "outbox.id > %(id_1)s AND outbox.processed_at < %(processed_at_1)s ORDER BY outbox.id" in sql
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert (compiled.params["id_1"], compiled.params["processed_at_1"]) == (40, datetime(2026, 1, 1))
+
+    @pytest.mark.asyncio
+    async def test_purge_runs_batches_until_a_short_one(self):
+        session = AsyncMock()
+        batches = []
+        for ids in ([4, 2], [7, 5], [9]):
+            result = MagicMock()
+            result.scalars.return_value.all.return_value = ids
+            batches.append(result)
+        session.execute.side_effect = batches
+        purger = OutboxPurger(make_session_factory(session), retention=timedelta(hours=24), batch_size=2, batch_sleep=0)
+
+        assert await purger.purge_once() == 5
+
+        assert session.commit.await_count == 3
+        # Each batch resumes after the highest id the previous one removed
+        assert [call.args[0].compile().params["id_1"] for call in session.execute.call_args_list] == [0, 4, 7]
+
+
+class TestNotificationEvents:
+    @pytest.mark.asyncio
+    async def test_notifications_reach_the_dispatcher_only_through_the_relay(self):
+        session = MagicMock()
+        notification = TaskNotification(
+            type=NotificationType.TASK_STATUS_CHANGED, recipient_user_id=3, task_id=7, task_title="T", status=TaskStatus.COMPLETED
+        )
+
+        OutboxNotificationPublisher(session).publish(notification)
+
+        # Only staged in the writer's transaction; nothing is executed or delivered yet
+        model = session.add.call_args.args[0]
+        assert (model.aggregate_type, model.aggregate_id, model.event_type) == (TASK, 7, "task.status_changed")
+        session.execute.assert_not_called()
+
+        model.id = 1
+        dispatcher = MagicMock()
+        bus = EventBus()
+        handler = NotificationEventHandler(dispatcher)
+        handler.subscribe(bus)
+        await bus.publish(OutboxEventMapper.to_domain(model))
+
+        notification.created_at = model.created_at
+        assert dispatcher.publish.call_args.args[0] == notification
+
+        handler.unsubscribe(bus)
+        await bus.publish(OutboxEventMapper.to_domain(model))
+        dispatcher.publish.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_handler_ignores_other_task_events(self):
+        dispatcher = MagicMock()
+        bus = EventBus()
+        NotificationEventHandler(dispatcher).subscribe(bus)
+
+        await bus.publish(OutboxEvent(aggregate_type=TASK, aggregate_id=1, event_type="task.updated", id=1))
+
+        dispatcher.publish.assert_not_called()
@@ -0,0 +1,144 @@
+import asyncio
+import json
+import random
+import time
+
+import httpx
+import pytest
+import strawberry
+from fastapi import FastAPI
+from strawberry.fastapi import GraphQLRouter
+
+from src.infrastructure.observability.profiler import WAITING_FRAME, ProfileStore, RequestProfiler, to_collapsed, to_speedscope
+from src.presentation.rest.middleware.profiler import ProfilerMiddleware
+
+# The handlers under profile burn CPU on purpose
+pytestmark = pytest.mark.allow_loop_blocking
+
+TOKEN = "profile-secret"
+
+
+def busy_wait(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    async def slow(self) -> int:
+        busy_wait(0.03)
+        return 1
+
+
+def make_app():
+    app = FastAPI()
+
+    @app.get("/work")
+    async def work():
+        busy_wait(0.03)
+        await asyncio.sleep(0.03)
+        return {"ok": True}
+
+    app.include_router(GraphQLRouter(strawberry.Schema(query=Query)), prefix="/graphql")
+    return app
+
+
+@pytest.fixture
+def profiler(tmp_path):
+    return RequestProfiler(ProfileStore(str(tmp_path), max_files=2), interval=0.001)
+
+
+def make_client(profiler, sample_rate=0.0):
+    middleware = ProfilerMiddleware(make_app(), profiler, token=TOKEN, sample_rate=sample_rate, rng=random.Random(1))
+    return httpx.AsyncClient(app=middleware, base_url="http://test")
+
+
+class TestFormats:
+    STACKS = [(("handler", "/app/api.py", 10), ("query", "/app/db.py", 3))] * 2 + [((WAITING_FRAME, "", 0), ("sleep", "/lib/tasks.py", 1))]
+
+    def test_collapsed_counts_identical_stacks(self):
+        assert to_collapsed(self.STACKS) == "(waiting);sleep (tasks.py:1) 1\nhandler (api.py:10);query (db.py:3) 2\n"
+
+    def test_speedscope_shares_frames(self):
+        profile = to_speedscope(self.STACKS, 0.005, "GET /x")
+
+        assert [frame["name"] for frame in profile["shared"]["frames"]] == ["handler", "query", WAITING_FRAME, "sleep"]
+        assert profile["profiles"][0]["samples"] == [[0, 1], [0, 1], [2, 3]]
+        assert profile["profiles"][0]["weights"] == [5.0, 5.0, 5.0]
+
+
+class TestProfileStore:
+    def test_keeps_only_newest_files(self, tmp_path):
+        store = ProfileStore(str(tmp_path), max_files=2)
+        names = [store.new_name(f"GET /{index}", "collapsed") for index in range(3)]
+        for name in names:
+            store.save(name, "a 1\n")
+
+        assert store.list() == names[:0:-1]
+
+    def test_path_rejects_unknown_or_traversing_names(self, tmp_path):
+        store = ProfileStore(str(tmp_path), max_files=2)
+        name = store.new_name("GET /x", "speedscope")
+        store.save(name, "{}")
+
+        assert store.path(name) == tmp_path / name
+        assert store.path("../etc/passwd") is None
+        assert store.path("missing.collapsed.txt") is None
+
+
+class TestProfilerMiddleware:
+    @pytest.mark.asyncio
+    async def test_profiles_request_with_valid_token(self, profiler):
+        async with make_client(profiler) as client:
+            response = await client.get("/work", headers={"X-Profile": TOKEN})
+
+        assert response.status_code == 200
+        name = response.headers["x-profile-id"]
+        content = profiler.store.path(name).read_text()
+        assert "busy_wait" in content
+        assert WAITING_FRAME in content
+        assert profiler.active == 0
+
+    @pytest.mark.asyncio
+    async def test_speedscope_format_on_request(self, profiler):
+        async with make_client(profiler) as client:
+            response = await client.get("/work", headers={"X-Profile": TOKEN, "X-Profile-Format": "speedscope"})
+
+        profile = json.loads(profiler.store.path(response.headers["x-profile-id"]).read_text())
+        assert profile["profiles"][0]["type"] == "sampled"
+        assert profile["profiles"][0]["samples"]
+
+    @pytest.mark.asyncio
+    async def test_wrong_or_missing_token_is_not_profiled(self, profiler):
+        async with make_client(profiler) as client:
+            wrong = await client.get("/work", headers={"X-Profile": "guess"})
+            missing = await client.get("/work")
+
+        assert "x-profile-id" not in wrong.headers
+        assert "x-profile-id" not in missing.headers
+        assert profiler.store.list() == []
+
+    @pytest.mark.asyncio
+    async def test_sampled_requests_are_profiled(self, profiler):
+        async with make_client(profiler, sample_rate=1.0) as client:
+            response = await client.get("/work")
+
+        assert "x-profile-id" in response.headers
+
+    @pytest.mark.asyncio
+    async def test_profiles_graphql_resolvers(self, profiler):
+        async with make_client(profiler) as client:
+            response = await client.post("/graphql", json={"query": "{ slow }"}, headers={"X-Profile": TOKEN})
+
+        assert response.json() == {"data": {"slow": 1}}
+        content = profiler.store.path(response.headers["x-profile-id"]).read_text()
+        assert "Query.slow" in content
+
+    @pytest.mark.asyncio
+    async def test_concurrent_profiles_are_limited(self, profiler):
+        async with make_client(profiler) as client:
+            responses = await asyncio.gather(*(client.get("/work", headers={"X-Profile": TOKEN}) for _ in range(2)))
+
+        assert sum("x-profile-id" in response.headers for response in responses) == 1
@@ -0,0 +1,187 @@
+import asyncio
+import json
+import logging
+import random
+from contextlib import asynccontextmanager
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from src.infrastructure.observability.query_log import QueryLog, QueryStats, SlowQueryExplainer, fingerprint, redact_parameters, redact_plan
+
+
+class FakeExplainer:
+    def __init__(self):
+        self.calls = []
+
+    def maybe_explain(self, stats, statement, parameters):
+        self.calls.append((stats.fingerprint, statement, parameters))
+        return True
+
+
+class TestFingerprint:
+    def test_parameters_and_literals_are_normalized(self):
+        first = fingerprint("SELECT * FROM tasks WHERE id = $1 AND title = 'a'")
+        second = fingerprint("SELECT *  FROM tasks\nWHERE id = $7 AND title = 'it''s'")
+
+        assert first == second == "SELECT * FROM tasks WHERE id = ? AND title = ?"
+
+    def test_in_lists_and_multi_row_values_collapse(self):
+        assert fingerprint("SELECT 1 FROM t WHERE id IN ($1, $2, $3)") == fingerprint("SELECT 1 FROM t WHERE id IN ($1)")
+        assert fingerprint("INSERT INTO t (a) VALUES ($1), ($2), ($3)") == "INSERT INTO t (a) VALUES (?), ..."
+
+    def test_identifiers_with_digits_are_kept(self):
+        assert fingerprint("SELECT tasks_1.id FROM tasks AS tasks_1") == "SELECT tasks_1.id FROM tasks AS tasks_1"
+
+
+class TestRedactParameters:
+    def test_values_are_replaced_by_types(self):
+        assert redact_parameters(("secret@example.com", 3)) == ["<str>", "<int>"]
+        assert redact_parameters({"email": "secret@example.com"}) == {"email": "<str>"}
+        assert redact_parameters([("a",), ("b",)]) == "<2 rows>"
+        assert redact_parameters(None) is None
+
+
+class TestQueryLog:
+    def test_top_orders_by_total_time(self):
+        log = QueryLog(slow_threshold=10)
+        for _ in range(10):
+            log.record("SELECT * FROM a WHERE id = $1", (1,), 0.01)
+        log.record("SELECT * FROM b", (), 0.05)
+
+        top = log.top()
+        assert [stats.fingerprint for stats in top] == ["SELECT * FROM a WHERE id = ?", "SELECT * FROM b"]
+        assert top[0].calls == 10
+        assert top[0].total_seconds == pytest.approx(0.1)
+
+    def test_evicts_least_total_time_when_full(self):
+        log = QueryLog(slow_threshold=10, max_fingerprints=2)
+        log.record("SELECT 1 FROM heavy", (), 1.0)
+        log.record("SELECT 1 FROM light", (), 0.001)
+        log.record("SELECT 1 FROM new", (), 0.01)
+
+        assert {stats.fingerprint for stats in log.top()} == {"SELECT ? FROM heavy", "SELECT ? FROM new"}
+
+    def test_slow_query_is_logged_redacted_and_explained(self, caplog):
+        explainer = FakeExplainer()
+        log = QueryLog(slow_threshold=0.1, explainer=explainer)
+
+        with caplog.at_level(logging.WARNING, logger="src.infrastructure.observability.query_log"):
+            stats = log.record("SELECT * FROM users WHERE email = $1", ("secret@example.com",), 0.5)
+
+        assert stats.slow_calls == 1
+        assert "Slow query" in caplog.text
+        assert "secret@example.com" not in caplog.text
+        assert len(explainer.calls) == 1
+
+    def test_executemany_is_not_explained(self):
+        explainer = FakeExplainer()
+        log = QueryLog(slow_threshold=0.1, explainer=explainer)
+
+        log.record("INSERT INTO t (a) VALUES ($1)", [(1,), (2,)], 0.5, executemany=True)
+
+        assert explainer.calls == []
+
+    def test_fast_queries_are_sampled(self, caplog):
+        log = QueryLog(slow_threshold=1, sample_rate=0.5, rng=random.Random(1))
+
+        with caplog.at_level(logging.INFO, logger="src.infrastructure.observability.query_log"):
+            for _ in range(200):
+                log.record("SELECT 1", (), 0.001)
+
+        assert 60 < len(caplog.records) < 140
+
+    def test_unsampled_fast_queries_are_not_logged(self, caplog):
+        log = QueryLog(slow_threshold=1, sample_rate=0.0)
+
+        with caplog.at_level(logging.DEBUG, logger="src.infrastructure.observability.query_log"):
+            log.record("SELECT 1", (), 0.001)
+
+        assert caplog.records == []
+
+    def test_attach_records_statements_from_engine(self):
+        log = QueryLog(slow_threshold=10)
+        engine = create_engine("sqlite://")
+        log.attach(engine)
+
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+
+        assert log.top()[0].fingerprint == "SELECT ?"
+        assert log.top()[0].calls == 2
+
+
+class TestSlowQueryExplainer:
+    def test_only_plain_selects_are_explainable(self):
+        assert SlowQueryExplainer.explainable("SELECT * FROM tasks")
+        assert not SlowQueryExplainer.explainable("UPDATE tasks SET title = $1")
+        assert not SlowQueryExplainer.explainable("SELECT * FROM outbox FOR UPDATE SKIP LOCKED")
+
+    @pytest.mark.asyncio
+    async def test_cooldown_and_concurrency_limit(self):
+        explainer = SlowQueryExplainer("postgresql+asyncpg://unused/db", cooldown=60)
+        started = asyncio.Event()
+
+        async def fake_explain(stats, statement, parameters):
+            started.set()
+            await asyncio.sleep(0.01)
+
+        explainer._explain = fake_explain
+        stats = QueryStats("SELECT ?")
+
+        assert explainer.maybe_explain(stats, "SELECT 1", ())
+        assert not explainer.maybe_explain(QueryStats("SELECT ? FROM t"), "SELECT 1 FROM t", ())
+        await started.wait()
+        await asyncio.sleep(0.02)
+
+        assert not explainer.maybe_explain(stats, "SELECT 1", ())
+        assert explainer.maybe_explain(QueryStats("SELECT ? FROM t"), "SELECT 1 FROM t", ())
+        await explainer.close()
+
+    @pytest.mark.asyncio
+    async def test_plan_literals_are_redacted_before_storing_and_logging(self, caplog):
+        plan = [
+            {
+                "Plan": {
+                    "Node Type": "Index Scan",
+                    "Index Name": "ix_users_email",
+                    "Index Cond": "((email)::text = 'alice@example.com'::text)",
+                    "Filter": "(is_active AND (id <> 4242))",
+                    "Total Cost": 8.3,
+                    "Actual Total Time": 0.02,
+                },
+                "Execution Time": 0.05,
+            }
+        ]
+
+        class FakeConnection:
+            async def exec_driver_sql(self, statement, parameters=()):
+                result = MagicMock()
+                result.scalar.return_value = json.dumps(plan)
+                return result
+
+            async def rollback(self):
+                pass
+
+        @asynccontextmanager
+        async def connect():
+            yield FakeConnection()
+
+        explainer = SlowQueryExplainer("postgresql+asyncpg://unused/db")
+        explainer._engine = MagicMock(connect=connect)
+        stats = QueryStats("SELECT * FROM users WHERE email = ?")
+
+        with caplog.at_level(logging.WARNING):
+            await explainer._explain(stats, "SELECT * FROM users WHERE email = $1", ("alice@example.com",))
+
+        node = stats.plan[0]["Plan"]
+        assert node["Index Cond"] == "((email)::text = ?::text)"
+        assert node["Filter"] == "(is_active AND (id <> ?))"
+        assert (node["Node Type"], node["Index Name"], node["Total Cost"]) == ("Index Scan", "ix_users_email", 8.3)
+        assert stats.plan[0]["Execution Time"] == 0.05
+        for leaked in ("alice@example.com", "4242"):
+            assert leaked not in caplog.text
+            assert leaked not in json.dumps(stats.to_dict())
+        assert redact_plan({"Output": ["'x'::text", "id"]}) == {"Output": ["?::text", "id"]}
@@ -0,0 +1,90 @@
+from collections import Counter
+from datetime import datetime, timedelta
+
+from src.infrastructure.database.seed import (
+    PRIORITY_WEIGHTS,
+    STATUS_WEIGHTS,
+    TASK_COLUMNS,
+    TASK_LIST_COLUMNS,
+    USER_COLUMNS,
+    SeedPlan,
+    asyncpg_dsn,
+    list_sizes,
+)
+
+ANCHOR = datetime(2026, 6, 1)
+
+
+def make_plan(users=50, lists=200, tasks=20000, seed=7, offsets=None):
+    return SeedPlan(users, lists, tasks, seed, ANCHOR, offsets or {}, "hash")
+
+
+class TestListSizes:
+    def test_sizes_sum_to_total(self):
+        sizes = list_sizes(1000, 123457, seed=1)
+
+        assert len(sizes) == 1000
+        assert sum(sizes) == 123457
+
+    def test_sizes_are_skewed(self):
+        sizes = sorted(list_sizes(1000, 100000, seed=1), reverse=True)
+
+        # The largest 20% of lists hold far more than 20% of the tasks
+        assert sum(sizes[:200]) > 0.4 * 100000
+
+    def test_sizes_are_deterministic(self):
+        assert list_sizes(100, 5000, seed=3) == list_sizes(100, 5000, seed=3)
+        assert list_sizes(100, 5000, seed=3) != list_sizes(100, 5000, seed=4)
+
+
+class TestSeedPlan:
+    def test_records_match_column_count(self):
+        plan = make_plan()
+
+        assert len(plan.user_records(0, 1)[0]) == len(USER_COLUMNS)
+        assert len(plan.task_list_records(0, 1)[0]) == len(TASK_LIST_COLUMNS)
+        assert len(plan.task_records(0, 1)[0]) == len(TASK_COLUMNS)
+
+    def test_chunks_are_deterministic(self):
+        assert make_plan().task_records(5000, 6000) == make_plan().task_records(5000, 6000)
+
+    def test_tasks_fill_lists_in_order(self):
+        plan = make_plan()
+        # Chunk boundaries must not change which list a task belongs to
+        records = plan.task_records(0, 7000) + plan.task_records(7000, 20000)
+
+        list_ids = [record[TASK_COLUMNS.index("task_list_id")] for record in records]
+        assert list_ids == sorted(list_ids)
+        assert Counter(list_ids) == {index + 1: size for index, size in enumerate(plan.sizes) if size}
+
+    def test_task_value_domains(self):
+        plan = make_plan()
+        records = plan.task_records(0, 20000)
+        column = {name: index for index, name in enumerate(TASK_COLUMNS)}
+
+        statuses = Counter(record[column["status"]] for record in records)
+        assert set(statuses) == set(STATUS_WEIGHTS)
+        assert statuses["COMPLETED"] > statuses["PENDING"] > statuses["IN_PROGRESS"]
+        assert {record[column["priority"]] for record in records} == set(PRIORITY_WEIGHTS)
+
+        assignees = [record[column["assigned_user_id"]] for record in records]
+        assert 0.6 < sum(a is not None for a in assignees) / len(records) < 0.8
+        assert all(1 <= a <= 50 for a in assignees if a is not None)
+
+        due_dates = [record[column["due_date"]] for record in records if record[column["due_date"]]]
+        assert 0.5 < len(due_dates) / len(records) < 0.7
+        assert all(ANCHOR - timedelta(days=61) <= due <= ANCHOR + timedelta(days=121) for due in due_dates)
+        assert all(record[column["created_at"]] <= record[column["updated_at"]] <= ANCHOR for record in records)
+
+    def test_ids_start_after_existing_rows(self):
+        plan = make_plan(offsets={"users": 10, "task_lists": 20, "tasks": 30})
+
+        task = plan.task_records(0, 1)[0]
+        assert task[0] == 31
+        assert task[TASK_COLUMNS.index("task_list_id")] > 20
+        assert plan.user_records(0, 1)[0][0] == 11
+        assert plan.task_list_records(0, 1)[0][0] == 21
+
+
+def test_asyncpg_dsn_strips_driver():
+    assert asyncpg_dsn("postgresql+asyncpg://u:p@h/db") == "postgresql://u:p@h/db"
@@ -0,0 +1,168 @@
+import asyncio
+from contextvars import copy_context
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from src.application.use_cases.task_list.task_list_service import TaskListService
+from src.application.utils import single_flight
+from src.application.utils.single_flight import SingleFlight
+from src.domain.entities.task_list import TaskList
+from src.domain.exceptions.concurrency_exceptions import CoalescedReadTimeoutException
+from src.infrastructure.database.write_tracking import has_uncommitted_writes
+from src.infrastructure.observability.metrics import metrics
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        group = SingleFlight(timeout=1)
+        release = asyncio.Event()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "result"
+
+        tasks = [asyncio.create_task(group.do("key", fetch, "test_share")) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(*tasks)
+
+        assert results == ["result"] * 5
+        assert calls == 1
+        assert metrics.counter("singleflight_coalesced_total", method="test_share").value == 4
+        assert group.in_flight() == 0
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_are_not_coalesced(self):
+        group = SingleFlight(timeout=1)
+        fetch = AsyncMock(return_value=1)
+
+        await group.do("key", fetch)
+        await group.do("key", fetch)
+
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_to_every_waiter(self):
+        group = SingleFlight(timeout=1)
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            raise ValueError("Task list not found")
+
+        tasks = [asyncio.create_task(group.do("key", fetch)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(result, ValueError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_waiter_timeout_does_not_cancel_leader(self):
+        group = SingleFlight(timeout=0.01)
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "late"
+
+        leader = asyncio.create_task(group.do("key", fetch, "test_timeout"))
+        await asyncio.sleep(0)
+
+        with pytest.raises(CoalescedReadTimeoutException):
+            await group.do("key", fetch, "test_timeout")
+
+        release.set()
+        assert await leader == "late"
+        assert metrics.counter("singleflight_timeouts_total", method="test_timeout").value == 1
+
+    @pytest.mark.asyncio
+    async def test_waiter_takes_over_when_leader_is_cancelled(self):
+        group = SingleFlight(timeout=1)
+        leader_started = asyncio.Event()
+
+        async def slow():
+            leader_started.set()
+            await asyncio.sleep(10)
+
+        leader = asyncio.create_task(group.do("key", slow))
+        await leader_started.wait()
+        waiter = asyncio.create_task(group.do("key", AsyncMock(return_value="fresh")))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+
+        assert await waiter == "fresh"
+
+
+class TestCoalescedServiceMethods:
+    @pytest.mark.asyncio
+    async def test_identical_reads_hit_repository_once(self):
+        release = asyncio.Event()
+        repository = Mock()
+
+        async def get_by_id(task_list_id):
+            await release.wait()
+            return TaskList(id=task_list_id, title="Hot list")
+
+        repository.get_by_id = AsyncMock(side_effect=get_by_id)
+        services = [TaskListService(repository, Mock(), Mock()) for _ in range(3)]
+
+        tasks = [asyncio.create_task(service.get(42)) for service in services]
+        tasks.append(asyncio.create_task(services[0].get(task_list_id=43)))
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(*tasks)
+
+        assert [result.id for result in results] == [42, 42, 42, 43]
+        assert repository.get_by_id.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_reads_inside_a_write_transaction_are_not_shared(self, monkeypatch):
+        monkeypatch.setattr(single_flight, "has_uncommitted_writes", lambda: True)
+        release = asyncio.Event()
+        repository = Mock()
+
+        async def get_by_id(task_list_id):
+            await release.wait()
+            return TaskList(id=task_list_id, title="Hot list")
+
+        repository.get_by_id = AsyncMock(side_effect=get_by_id)
+        services = [TaskListService(repository, Mock(), Mock()) for _ in range(2)]
+
+        tasks = [asyncio.create_task(service.get(42)) for service in services]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(*tasks)
+
+        assert repository.get_by_id.await_count == 2
+
+
+def test_write_tracking_follows_the_transaction():
+    items = Table("items", MetaData(), Column("id", Integer, primary_key=True))
+    engine = create_engine("sqlite://")
+    items.metadata.create_all(engine)
+
+    def run():
+        with Session(engine) as session:
+            session.execute(select(items))
+            assert not has_uncommitted_writes()
+            session.execute(insert(items).values(id=1))
+            assert has_uncommitted_writes()
+            session.commit()
+            assert not has_uncommitted_writes()
+            session.execute(insert(items).values(id=2))
+            session.rollback()
+            assert not has_uncommitted_writes()
+
+    copy_context().run(run)
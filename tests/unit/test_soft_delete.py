@@ -0,0 +1,158 @@
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.domain.entities.task import Task, TaskStatus
+from src.domain.entities.task_list import TaskList
+from src.domain.entities.user import User
+from src.infrastructure.repositories.in_memory_store import InMemoryStore
+from src.infrastructure.repositories.in_memory_task_list_repository import InMemoryTaskListRepository
+from src.infrastructure.repositories.in_memory_task_repository import InMemoryTaskRepository
+from src.infrastructure.repositories.in_memory_user_repository import InMemoryUserRepository
+from src.infrastructure.repositories.sqlalchemy_task_list_repository import SQLAlchemyTaskListRepository
+from src.infrastructure.repositories.sqlalchemy_task_repository import SQLAlchemyTaskRepository
+from src.infrastructure.retention.purger import SoftDeletePurger
+
+
+def compile_sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+@pytest.fixture
+def store():
+    return InMemoryStore()
+
+
+@pytest.fixture
+def task_repository(store):
+    return InMemoryTaskRepository(store)
+
+
+@pytest.fixture
+def task_list_repository(store):
+    return InMemoryTaskListRepository(store)
+
+
+@pytest.fixture
+async def task_list(task_list_repository):
+    return await task_list_repository.create(TaskList(title="List"))
+
+
+@pytest.mark.asyncio
+async def test_deleted_task_is_kept_but_hidden_from_every_read(store, task_repository, task_list):
+    user = await InMemoryUserRepository(store).create(User(email="a@example.com", username="a"))
+    kept = await task_repository.create(Task(title="Keep invoice", task_list_id=task_list.id, assigned_user_id=user.id))
+    deleted = await task_repository.create(
+        Task(title="Drop invoice", task_list_id=task_list.id, assigned_user_id=user.id, due_date=datetime(2000, 1, 1))
+    )
+
+    assert await task_repository.delete(deleted.id) is True
+
+    assert store.tasks[deleted.id].is_active is False
+    assert await task_repository.get_by_id(deleted.id) is None
+    assert [task.id for task in await task_repository.list_all()] == [kept.id]
+    assert [task.id for task in await task_repository.get_by_task_list_id(task_list.id)] == [kept.id]
+    assert [task.id for task in await task_repository.get_tasks_by_filters(status=TaskStatus.PENDING)] == [kept.id]
+    assert [hit.task.id for hit in await task_repository.search("invoice")] == [kept.id]
+    assert [task.id for task in await task_repository.get_assigned(user.id)] == [kept.id]
+    assert await task_repository.get_overdue() == []
+
+
+@pytest.mark.asyncio
+async def test_deleted_task_cannot_be_deleted_or_updated_again(task_repository, task_list):
+    task = await task_repository.create(Task(title="Task", task_list_id=task_list.id))
+    await task_repository.delete(task.id)
+
+    assert await task_repository.delete(task.id) is False
+    with pytest.raises(ValueError):
+        await task_repository.update(task)
+
+
+@pytest.mark.asyncio
+async def test_list_whose_tasks_are_all_deleted_can_be_deleted(store, task_repository, task_list_repository, task_list):
+    task = await task_repository.create(Task(title="Task", task_list_id=task_list.id))
+    await task_repository.delete(task.id)
+
+    assert await task_list_repository.delete(task_list.id) is True
+
+    assert store.task_lists[task_list.id].is_active is False
+    assert await task_list_repository.get_by_id(task_list.id) is None
+    assert await task_list_repository.list_all() == []
+    assert await task_list_repository.list_page() == []
+
+
+def test_task_soft_delete_is_a_single_guarded_update():
+    sql = compile_sql(SQLAlchemyTaskRepository.soft_delete_statement(7))
+
+    assert sql.startswith("UPDATE tasks SET is_active=%(is_active)s, updated_at=%(updated_at)s")
+    assert "WHERE tasks.id = %(id_1)s AND tasks.is_active RETURNING" in sql
+
+
+def test_task_list_soft_delete_skips_lists_with_active_tasks():
+    sql = compile_sql(SQLAlchemyTaskListRepository.soft_delete_statement(7))
+
+    assert sql.startswith("UPDATE task_lists SET is_active")
+    assert "AND task_lists.is_active AND NOT (EXISTS (SELECT * \nFROM tasks \nWHERE tasks.task_list_id = task_lists.id AND tasks.is_active))" in sql
+
+
+def test_reads_filter_active_rows():
+    sql = compile_sql(SQLAlchemyTaskRepository.assigned_statement(1))
+
+    assert "tasks.is_active" in sql
+
+
+def test_purge_statement_walks_inactive_rows_in_keyset_order():
+    cutoff = datetime(2026, 1, 1)
+
+    first = compile_sql(SQLAlchemyTaskRepository.purge_statement(cutoff, limit=100))
+    later = compile_sql(SQLAlchemyTaskRepository.purge_statement(cutoff, datetime(2025, 6, 1), 42, 100))
+
+    assert first.startswith("DELETE FROM tasks WHERE tasks.id IN (SELECT tasks.id \nFROM tasks \nWHERE NOT tasks.is_active")
+    assert "ORDER BY tasks.updated_at, tasks.id \n LIMIT %(param_1)s) AND NOT tasks.is_active" in first
+    assert "(tasks.updated_at, tasks.id) > (%(param_1)s, %(param_2)s)" in later
+
+
+def test_task_list_purge_leaves_referenced_lists():
+    sql = compile_sql(SQLAlchemyTaskListRepository.purge_statement(datetime(2026, 1, 1)))
+
+    assert "NOT task_lists.is_active AND task_lists.updated_at < %(updated_at_1)s AND NOT (EXISTS" in sql
+
+
+class FakeSessionFactory:
+    """Hands out sessions whose DELETEs return the queued batches in turn."""
+
+    def __init__(self, batches):
+        self.batches = list(batches)
+        self.statements = []
+
+    def __call__(self):
+        session = MagicMock()
+        session.__aenter__ = AsyncMock(return_value=session)
+        session.__aexit__ = AsyncMock(return_value=False)
+        session.commit = AsyncMock()
+
+        async def execute(statement):
+            self.statements.append(statement)
+            result = MagicMock()
+            result.all.return_value = self.batches.pop(0)
+            return result
+
+        session.execute = execute
+        return session
+
+
+@pytest.mark.asyncio
+async def test_purger_resumes_each_batch_after_the_newest_purged_key():
+    older, newer = datetime(2025, 1, 1), datetime(2025, 1, 2)
+    # Tasks: one full batch (RETURNING order is arbitrary), then a short one; lists: nothing
+    session_factory = FakeSessionFactory([[(newer, 3), (older, 9)], [(newer, 5)], []])
+    purger = SoftDeletePurger(session_factory, retention=timedelta(days=30), batch_size=2, batch_sleep=0)
+
+    assert await purger.purge_once() == {"tasks": 3, "task_lists": 0}
+
+    assert len(session_factory.statements) == 3
+    resumed = session_factory.statements[1].compile().params
+    assert newer in resumed.values() and 3 in resumed.values()
+    assert compile_sql(session_factory.statements[2]).startswith("DELETE FROM task_lists")
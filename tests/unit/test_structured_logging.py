@@ -0,0 +1,159 @@
+import io
+import json
+import logging
+import queue
+import random
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from src.infrastructure.observability.metrics import metrics
+from src.infrastructure.observability.structured_logging import (
+    JsonFormatter,
+    NonBlockingQueueHandler,
+    RequestContextFilter,
+    SamplingFilter,
+    bind_request_id,
+    configure_logging,
+    reset_request_id,
+    shutdown_logging,
+)
+from src.infrastructure.observability.tracing import InMemorySpanExporter, tracer
+from src.presentation.rest.middleware.request_context import RequestContextMiddleware
+
+
+def make_record(name="app.tasks", level=logging.INFO, msg="hello %s", args=("world",), **extra):
+    record = logging.LogRecord(name, level, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+@pytest.fixture
+def output():
+    stream = io.StringIO()
+    root_level = logging.getLogger().level
+    configure_logging(level="DEBUG", log_format="json", levels={"app.noisy": "WARNING"}, sampling={}, queue_size=100, stream=stream)
+    yield stream
+    shutdown_logging()
+    logging.getLogger().setLevel(root_level)
+    logging.getLogger("app.noisy").setLevel(logging.NOTSET)
+
+
+def lines(stream):
+    shutdown_logging()
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_json_formatter_emits_message_ids_and_extra_fields():
+    record = make_record(task_id=7, request_id="req-1", trace_id=None, span_id=None)
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry["message"] == "hello world"
+    assert entry["level"] == "INFO"
+    assert entry["logger"] == "app.tasks"
+    assert entry["request_id"] == "req-1"
+    assert entry["task_id"] == 7
+    assert "trace_id" not in entry
+
+
+def test_configured_logging_writes_json_lines_with_request_id(output):
+    token = bind_request_id("req-42")
+    try:
+        logging.getLogger("app.tasks").info("Task %d created", 5, extra={"task_id": 5})
+    finally:
+        reset_request_id(token)
+
+    (entry,) = lines(output)
+    assert entry["message"] == "Task 5 created"
+    assert entry["request_id"] == "req-42"
+    assert entry["task_id"] == 5
+
+
+def test_per_logger_levels_apply(output):
+    logging.getLogger("app.noisy.child").info("dropped")
+    logging.getLogger("app.noisy.child").warning("kept")
+    logging.getLogger("app.other").debug("debug kept")
+
+    assert [entry["message"] for entry in lines(output)] == ["kept", "debug kept"]
+
+
+def test_exception_text_is_kept_separate_from_message(output):
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        logging.getLogger("app.tasks").exception("Task failed")
+
+    (entry,) = lines(output)
+    assert entry["message"] == "Task failed"
+    assert "RuntimeError: boom" in entry["exc_info"]
+
+
+def test_trace_ids_come_from_the_current_span():
+    previous = (tracer.enabled, tracer.sample_rate, tracer.exporter)
+    tracer.enabled, tracer.sample_rate, tracer.exporter = True, 1.0, InMemorySpanExporter()
+    try:
+        with tracer.start_span("request") as span:
+            record = make_record()
+            RequestContextFilter().filter(record)
+    finally:
+        tracer.enabled, tracer.sample_rate, tracer.exporter = previous
+
+    assert record.trace_id == span.trace_id
+    assert record.span_id == span.span_id
+
+
+def test_sampling_uses_longest_prefix_and_always_keeps_warnings():
+    sampler = SamplingFilter({"app": 1.0, "app.access": 0.0}, rng=random.Random(0))
+
+    assert sampler.filter(make_record(name="app.tasks"))
+    assert not sampler.filter(make_record(name="app.access.http"))
+    assert sampler.filter(make_record(name="app.access.http", level=logging.WARNING))
+    assert sampler.rate_for("application") == 1.0
+
+
+def test_sampling_keeps_roughly_the_configured_fraction():
+    sampler = SamplingFilter({"app.access": 0.1}, rng=random.Random(1))
+
+    kept = sum(sampler.filter(make_record(name="app.access")) for _ in range(10000))
+
+    assert 800 < kept < 1200
+
+
+def test_full_queue_drops_records_instead_of_blocking():
+    handler = NonBlockingQueueHandler(queue.Queue(1))
+    dropped = metrics.counter("log_records_dropped_total")
+    before = dropped.value
+
+    handler.handle(make_record())
+    handler.handle(make_record())
+
+    assert handler.queue.qsize() == 1
+    assert dropped.value == before + 1
+
+
+@pytest.mark.asyncio
+async def test_request_context_middleware_echoes_or_generates_request_id(output):
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        logging.getLogger("app.handler").info("handling")
+        return {"ok": True}
+
+    app.add_middleware(RequestContextMiddleware)
+    async with httpx.AsyncClient(app=app, base_url="http://test") as client:
+        supplied = await client.get("/ping", headers={"X-Request-ID": "abc-123"})
+        generated = await client.get("/ping", headers={"X-Request-ID": "not valid!"})
+
+    assert supplied.headers["x-request-id"] == "abc-123"
+    assert generated.headers["x-request-id"] not in ("", "not valid!")
+
+    entries = lines(output)
+    handling = [entry for entry in entries if entry["message"] == "handling"]
+    access = [entry for entry in entries if entry["logger"] == "src.presentation.rest.access"]
+    assert [entry["request_id"] for entry in handling] == ["abc-123", generated.headers["x-request-id"]]
+    assert access[0]["http_status"] == 200
+    assert access[0]["http_path"] == "/ping"
+    assert access[0]["request_id"] == "abc-123"
@@ -0,0 +1,120 @@
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.application.dtos.sync_dto import SyncCursor, SyncWatermark
+from src.application.use_cases.sync.sync_service import SyncService
+from src.domain.entities.task import Task
+from src.domain.entities.task_list import TaskList
+from src.domain.entities.tombstone import SyncEntityType, Tombstone
+from src.domain.exceptions.sync_exceptions import InvalidWatermarkException
+from src.infrastructure.utils.datetime_utils import utc_now
+
+
+@pytest.fixture
+def mock_repository():
+    repository = Mock()
+    repository.get_tasks_changed_since = AsyncMock(return_value=[])
+    repository.get_task_lists_changed_since = AsyncMock(return_value=[])
+    repository.get_tombstones_since = AsyncMock(return_value=[])
+    return repository
+
+
+@pytest.fixture
+def sync_service(mock_repository):
+    return SyncService(mock_repository)
+
+
+class TestSyncService:
+    @pytest.mark.asyncio
+    async def test_full_snapshot_without_watermark(self, sync_service, mock_repository):
+        updated_at = datetime(2026, 1, 1, 12, 0, 0)
+        mock_repository.get_tasks_changed_since.return_value = [Task(id=7, title="Task", task_list_id=1, updated_at=updated_at)]
+
+        result = await sync_service.get_changes(None, limit=10)
+
+        mock_repository.get_tasks_changed_since.assert_called_once_with(None, 0, 10)
+        assert len(result.tasks) == 1
+        assert result.has_more is False
+
+        watermark = SyncService.decode_watermark(result.watermark)
+        assert watermark.tasks == SyncCursor(updated_at, 7)
+        assert watermark.task_lists == SyncCursor()
+
+    @pytest.mark.asyncio
+    async def test_resumes_from_watermark(self, sync_service, mock_repository):
+        since = SyncService.encode_watermark(
+            SyncWatermark(
+                tasks=SyncCursor(datetime(2026, 1, 1), 3),
+                task_lists=SyncCursor(datetime(2026, 1, 2), 4),
+                tombstones=SyncCursor(datetime(2026, 1, 3), 5),
+            )
+        )
+
+        await sync_service.get_changes(since, limit=50)
+
+        mock_repository.get_tasks_changed_since.assert_called_once_with(datetime(2026, 1, 1), 3, 50)
+        mock_repository.get_task_lists_changed_since.assert_called_once_with(datetime(2026, 1, 2), 4, 50)
+        mock_repository.get_tombstones_since.assert_called_once_with(datetime(2026, 1, 3), 5, 50)
+
+    @pytest.mark.asyncio
+    async def test_has_more_when_a_page_is_full(self, sync_service, mock_repository):
+        deleted_at = datetime(2026, 1, 1)
+        mock_repository.get_task_lists_changed_since.return_value = [TaskList(id=1, title="List", updated_at=deleted_at)]
+        mock_repository.get_tombstones_since.return_value = [
+            Tombstone(id=9, entity_type=SyncEntityType.TASK, entity_id=2, deleted_at=deleted_at),
+        ]
+
+        result = await sync_service.get_changes(None, limit=1)
+
+        assert result.has_more is True
+        assert SyncService.decode_watermark(result.watermark).tombstones == SyncCursor(deleted_at, 9)
+
+    @pytest.mark.asyncio
+    async def test_invalid_watermark(self, sync_service):
+        with pytest.raises(InvalidWatermarkException):
+            await sync_service.get_changes("not-a-watermark")
+
+    @pytest.mark.asyncio
+    async def test_caught_up_stream_rescans_the_window_before_the_run_began(self, mock_repository):
+        service = SyncService(mock_repository, rescan_seconds=5)
+        recent = utc_now()
+        mock_repository.get_tasks_changed_since.return_value = [Task(id=7, title="Task", task_list_id=1, updated_at=recent)]
+
+        result = await service.get_changes(None, limit=10)
+
+        watermark = SyncService.decode_watermark(result.watermark)
+        # A write stamped just before this call may commit after it; the next call reads the window again
+        assert watermark.tasks.id == 0
+        assert recent - timedelta(seconds=5) <= watermark.tasks.timestamp < recent - timedelta(seconds=4)
+        assert watermark.scan_started is None
+
+        await service.get_changes(result.watermark, limit=10)
+
+        assert mock_repository.get_tasks_changed_since.call_args.args[:2] == (watermark.tasks.timestamp, 0)
+
+    @pytest.mark.asyncio
+    async def test_rescan_covers_every_page_of_a_run(self, mock_repository):
+        service = SyncService(mock_repository, rescan_seconds=5)
+        run_started = utc_now() - timedelta(minutes=1)
+        since = SyncService.encode_watermark(SyncWatermark(tasks=SyncCursor(run_started, 3), scan_started=run_started))
+        mock_repository.get_tasks_changed_since.return_value = [Task(id=8, title="Last", task_list_id=1, updated_at=utc_now())]
+
+        result = await service.get_changes(since, limit=10)
+
+        # The rows paged past a minute ago are read again, not just the window before the last page
+        assert SyncService.decode_watermark(result.watermark).tasks == SyncCursor(run_started - timedelta(seconds=5), 0)
+
+    @pytest.mark.asyncio
+    async def test_full_pages_carry_the_run_start_and_keep_paging(self, mock_repository):
+        service = SyncService(mock_repository, rescan_seconds=5)
+        recent = utc_now()
+        mock_repository.get_tasks_changed_since.return_value = [Task(id=7, title="Task", task_list_id=1, updated_at=recent)]
+
+        result = await service.get_changes(None, limit=1)
+
+        watermark = SyncService.decode_watermark(result.watermark)
+        assert result.has_more is True
+        assert watermark.tasks == SyncCursor(recent, 7)
+        assert watermark.scan_started is not None
@@ -0,0 +1,133 @@
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.application.dtos.task_dto import TaskFiltersDTO
+from src.application.use_cases.task.task_service import TaskService
+from src.domain.entities.notification import NotificationType
+from src.domain.entities.task import Task, TaskChanges, TaskPriority, TaskStatus
+from src.domain.entities.task_list import TaskList
+from src.domain.entities.user import User
+from src.domain.exceptions.task_exceptions import InvalidTaskListException, InvalidUserException
+from src.infrastructure.repositories.in_memory_store import InMemoryStore
+from src.infrastructure.repositories.in_memory_task_list_repository import InMemoryTaskListRepository
+from src.infrastructure.repositories.in_memory_task_repository import InMemoryTaskRepository
+from src.infrastructure.repositories.in_memory_user_repository import InMemoryUserRepository
+from src.infrastructure.repositories.sqlalchemy_task_repository import SQLAlchemyTaskRepository
+
+
+@pytest.fixture
+def store():
+    return InMemoryStore()
+
+
+@pytest.fixture
+def notifier():
+    return Mock()
+
+
+@pytest.fixture
+def service(store, notifier):
+    return TaskService(InMemoryTaskRepository(store), notifier=notifier)
+
+
+@pytest.fixture
+async def setup(store):
+    lists = InMemoryTaskListRepository(store)
+    source, target = [await lists.create(TaskList(title=title)) for title in ("Backlog", "Sprint")]
+    user = await InMemoryUserRepository(store).create(User(email="ann@example.com", username="ann"))
+    tasks = InMemoryTaskRepository(store)
+    created = [
+        await tasks.create(Task(title="One", task_list_id=source.id, assigned_user_id=user.id)),
+        await tasks.create(Task(title="Two", task_list_id=source.id, priority=TaskPriority.HIGH)),
+        await tasks.create(Task(title="Three", task_list_id=source.id, status=TaskStatus.COMPLETED)),
+    ]
+    return source, target, user, created
+
+
+@pytest.mark.asyncio
+async def test_bulk_move_by_ids(store, service, setup):
+    source, target, _, tasks = setup
+
+    moved = await service.bulk_update(TaskChanges(task_list_id=target.id), [tasks[2].id, tasks[0].id])
+
+    assert [task.id for task in moved] == [tasks[0].id, tasks[2].id]
+    assert {task.task_list_id for task in moved} == {target.id}
+    assert [task.title for task in await InMemoryTaskRepository(store).get_by_task_list_id(source.id)] == ["Two"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_by_filter_skips_tasks_already_matching(service, setup):
+    source, _, _, tasks = setup
+
+    changed = await service.bulk_update(TaskChanges(priority=TaskPriority.HIGH), filters=TaskFiltersDTO(task_list_id=source.id))
+
+    assert [task.id for task in changed] == [tasks[0].id, tasks[2].id]
+    assert await service.bulk_update(TaskChanges(priority=TaskPriority.HIGH), filters=TaskFiltersDTO(task_list_id=source.id)) == []
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_notifies_each_changed_task(service, notifier, setup):
+    source, _, user, tasks = setup
+
+    await service.bulk_update(TaskChanges(status=TaskStatus.IN_PROGRESS, assigned_user_id=user.id), [task.id for task in tasks])
+
+    notifications = [call.args[0] for call in notifier.publish.call_args_list]
+    # Task one was already assigned to the user, so it only changed status
+    assert [(notification.task_id, notification.type) for notification in notifications] == [
+        (tasks[0].id, NotificationType.TASK_STATUS_CHANGED),
+        (tasks[1].id, NotificationType.TASK_ASSIGNED),
+        (tasks[2].id, NotificationType.TASK_ASSIGNED),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bulk_unassign_and_clear_due_date(store, service, notifier, setup):
+    source, _, user, tasks = setup
+    await service.bulk_update(TaskChanges(assigned_user_id=user.id, due_date=datetime(2026, 3, 1)), [task.id for task in tasks])
+    notifier.reset_mock()
+
+    cleared = await service.bulk_update(TaskChanges(assigned_user_id=None, due_date=None), filters=TaskFiltersDTO(task_list_id=source.id))
+
+    assert [task.id for task in cleared] == [task.id for task in tasks]
+    for task in tasks:
+        stored = await InMemoryTaskRepository(store).get_by_id(task.id)
+        assert (stored.assigned_user_id, stored.due_date) == (None, None)
+    # Nobody is left to notify about an unassignment
+    notifier.publish.assert_not_called()
+    # Leaving a field out still keeps it
+    assert await service.bulk_update(TaskChanges(due_date=None), [tasks[0].id]) == []
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_rejects_unknown_references_before_touching_rows(store, service, setup):
+    _, _, _, tasks = setup
+
+    with pytest.raises(InvalidTaskListException):
+        await service.bulk_update(TaskChanges(task_list_id=999), [tasks[0].id])
+    with pytest.raises(InvalidUserException):
+        await service.bulk_update(TaskChanges(assigned_user_id=999, status=TaskStatus.COMPLETED), [tasks[0].id])
+
+    assert (await InMemoryTaskRepository(store).get_by_id(tasks[0].id)).status == TaskStatus.PENDING
+
+
+def test_bulk_update_is_one_update_over_an_id_array():
+    statement = SQLAlchemyTaskRepository.bulk_update_statement(TaskChanges(status=TaskStatus.COMPLETED), task_ids=[3, 1, 2], task_list_id=7)
+    compiled = statement.compile(dialect=postgresql.dialect())
+    sql = str(compiled)
+
+    assert sql.startswith("UPDATE tasks SET status=%(status)s, updated_at=%(updated_at)s FROM (SELECT tasks.id AS id")
+    assert "tasks.task_list_id = %(task_list_id_1)s AND tasks.id = ANY (%(task_ids)s::INTEGER[])" in sql
+    assert "tasks.status IS DISTINCT FROM %(status_1)s" in sql
+    assert "ORDER BY tasks.id FOR UPDATE) AS previous WHERE tasks.id = previous.id RETURNING" in sql
+    assert "previous.status AS previous_status" in sql
+    assert compiled.params["task_ids"] == [3, 1, 2]
+
+
+def test_bulk_unassign_sets_null_only_on_assigned_rows():
+    sql = str(SQLAlchemyTaskRepository.bulk_update_statement(TaskChanges(assigned_user_id=None), task_ids=[1]).compile(dialect=postgresql.dialect()))
+
+    assert sql.startswith("UPDATE tasks SET assigned_user_id=%(assigned_user_id)s, updated_at=%(updated_at)s")
+    assert "tasks.assigned_user_id IS DISTINCT FROM NULL" in sql
@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.domain.entities.task import Task, TaskPriority, TaskStatus
+from src.domain.entities.task_list import TaskList
+from src.domain.entities.user import User
+from src.domain.exceptions.task_exceptions import InvalidUserException
+from src.infrastructure.repositories.in_memory_store import InMemoryStore
+from src.infrastructure.repositories.in_memory_task_list_repository import InMemoryTaskListRepository
+from src.infrastructure.repositories.in_memory_task_repository import InMemoryTaskRepository
+from src.infrastructure.repositories.in_memory_user_repository import InMemoryUserRepository
+from src.infrastructure.repositories.sqlalchemy_task_repository import SQLAlchemyTaskRepository
+
+
+@pytest.fixture
+def store():
+    return InMemoryStore()
+
+
+@pytest.fixture
+def repository(store):
+    return InMemoryTaskRepository(store)
+
+
+@pytest.fixture
+async def task_list_id(store):
+    return (await InMemoryTaskListRepository(store).create(TaskList(title="Queue"))).id
+
+
+@pytest.fixture
+async def user_id(store):
+    return (await InMemoryUserRepository(store).create(User(email="a@example.com", username="a"))).id
+
+
+async def create(repository, task_list_id, priority=TaskPriority.MEDIUM, status=TaskStatus.PENDING):
+    return await repository.create(Task(title="Task", task_list_id=task_list_id, priority=priority, status=status))
+
+
+@pytest.mark.asyncio
+async def test_claims_highest_priority_then_oldest_pending(repository, task_list_id, user_id):
+    old_medium = await create(repository, task_list_id)
+    await create(repository, task_list_id, TaskPriority.HIGH, status=TaskStatus.COMPLETED)
+    high = await create(repository, task_list_id, TaskPriority.HIGH)
+    await create(repository, task_list_id)
+
+    claimed = await repository.claim(task_list_id, user_id, 2)
+
+    assert [task.id for task in claimed] == [high.id, old_medium.id]
+    assert all(task.status == TaskStatus.IN_PROGRESS and task.assigned_user_id == user_id for task in claimed)
+    assert (await repository.get_by_id(high.id)).status == TaskStatus.IN_PROGRESS
+
+
+@pytest.mark.asyncio
+async def test_concurrent_claims_are_disjoint_and_drain_the_list(repository, task_list_id, user_id):
+    created = [await create(repository, task_list_id) for _ in range(10)]
+
+    batches = await asyncio.gather(*(repository.claim(task_list_id, user_id, 3) for _ in range(5)))
+
+    claimed = [task.id for batch in batches for task in batch]
+    assert sorted(claimed) == [task.id for task in created]
+    assert await repository.claim(task_list_id, user_id) == []
+
+
+@pytest.mark.asyncio
+async def test_claim_for_unknown_user_is_rejected(repository, task_list_id):
+    await create(repository, task_list_id)
+
+    with pytest.raises(InvalidUserException):
+        await repository.claim(task_list_id, 999)
+
+
+def test_claim_statement_skips_locked_rows_and_matches_the_queue_index():
+    sql = str(SQLAlchemyTaskRepository.claim_statement(3, 9, 5).compile(dialect=postgresql.dialect()))
+
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert "tasks.status = 'PENDING' AND tasks.is_active" in sql
+    assert "ORDER BY tasks.priority DESC, tasks.created_at, tasks.id" in sql
+    assert "SKIP LOCKED" not in str(SQLAlchemyTaskRepository.claim_statement(3, 9, 5, skip_locked=False).compile(dialect=postgresql.dialect()))
@@ -0,0 +1,113 @@
+from dataclasses import fields
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.application.use_cases.task_list.task_list_service import TaskListService
+from src.domain.entities.task import Task, TaskPriority, TaskStatus
+from src.domain.entities.task_list import TaskList
+from src.domain.entities.user import User
+from src.domain.exceptions.task_list_exceptions import InvalidUserException
+from src.infrastructure.repositories.in_memory_store import InMemoryStore
+from src.infrastructure.repositories.in_memory_task_list_repository import InMemoryTaskListRepository
+from src.infrastructure.repositories.in_memory_task_repository import InMemoryTaskRepository
+from src.infrastructure.repositories.in_memory_user_repository import InMemoryUserRepository
+from src.infrastructure.repositories.sqlalchemy_task_list_repository import SQLAlchemyTaskListRepository
+
+DUE = datetime(2026, 3, 1, 9, 0)
+
+
+@pytest.fixture
+def store():
+    return InMemoryStore()
+
+
+@pytest.fixture
+def service(store):
+    return TaskListService(InMemoryTaskListRepository(store), InMemoryTaskRepository(store), InMemoryUserRepository(store))
+
+
+@pytest.fixture
+async def users(store):
+    repository = InMemoryUserRepository(store)
+    return [await repository.create(User(email=f"{name}@example.com", username=name)) for name in ("ann", "bob")]
+
+
+@pytest.fixture
+async def template(store, users):
+    task_list = await InMemoryTaskListRepository(store).create(TaskList(title="Template", description="Onboarding", user_id=users[0].id))
+    tasks = InMemoryTaskRepository(store)
+    await tasks.create(Task(title="Done", task_list_id=task_list.id, status=TaskStatus.COMPLETED, assigned_user_id=users[0].id, due_date=DUE))
+    await tasks.create(Task(title="Open", task_list_id=task_list.id, priority=TaskPriority.HIGH))
+    deleted = await tasks.create(Task(title="Deleted", task_list_id=task_list.id))
+    await tasks.delete(deleted.id)
+    return task_list
+
+
+async def copied_tasks(store, task_list_id):
+    return await InMemoryTaskRepository(store).get_by_task_list_id(task_list_id)
+
+
+@pytest.mark.asyncio
+async def test_clone_copies_list_and_active_tasks(store, service, template):
+    result = await service.clone(template.id, TaskList(title=None))
+
+    assert result.tasks_copied == 2
+    assert result.task_list.id != template.id
+    assert (result.task_list.title, result.task_list.description, result.task_list.user_id) == ("Template", "Onboarding", template.user_id)
+    copies = await copied_tasks(store, result.task_list.id)
+    assert [(task.title, task.status, task.priority, task.due_date) for task in copies] == [
+        ("Done", TaskStatus.COMPLETED, TaskPriority.MEDIUM, DUE),
+        ("Open", TaskStatus.PENDING, TaskPriority.HIGH, None),
+    ]
+    assert len(await copied_tasks(store, template.id)) == 2
+
+
+@pytest.mark.asyncio
+async def test_clone_options_reset_shift_and_reassign(store, service, template, users):
+    result = await service.clone(
+        template.id,
+        TaskList(title="Sprint 12", user_id=users[1].id),
+        reset_status=True,
+        due_date_shift=timedelta(days=7),
+        assigned_user_id=users[1].id,
+    )
+
+    assert (result.task_list.title, result.task_list.user_id) == ("Sprint 12", users[1].id)
+    copies = await copied_tasks(store, result.task_list.id)
+    assert {task.status for task in copies} == {TaskStatus.PENDING}
+    assert {task.assigned_user_id for task in copies} == {users[1].id}
+    assert copies[0].due_date == DUE + timedelta(days=7)
+    assert copies[1].due_date is None
+
+
+@pytest.mark.asyncio
+async def test_clone_can_unassign(store, service, template):
+    result = await service.clone(template.id, TaskList(title=None), unassign=True)
+
+    assert {task.assigned_user_id for task in await copied_tasks(store, result.task_list.id)} == {None}
+
+
+@pytest.mark.asyncio
+async def test_clone_of_missing_list_and_unknown_users(service, template):
+    assert await service.clone(template.id + 100, TaskList(title=None)) is None
+    with pytest.raises(InvalidUserException):
+        await service.clone(template.id, TaskList(title=None), assigned_user_id=999)
+    with pytest.raises(InvalidUserException):
+        await service.clone(template.id, TaskList(title=None, user_id=999))
+
+
+def test_clone_is_one_statement_with_outbox_events():
+    statement = SQLAlchemyTaskListRepository.clone_statement(1, TaskList(title=None), reset_status=True, due_date_shift=timedelta(days=1))
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+
+    assert sql.startswith("WITH new_list AS \n(INSERT INTO task_lists")
+    assert "copied AS \n(INSERT INTO tasks" in sql
+    assert "FROM tasks, new_list \nWHERE tasks.task_list_id = %(task_list_id_1)s AND tasks.is_active" in sql
+    assert "CAST('PENDING' AS taskstatus)" in sql
+    assert "tasks.due_date + %(param_" in sql
+    assert sql.count("INSERT INTO outbox") == 2
+    # The payload built by PostgreSQL has the same keys as event_payload()
+    for field in fields(Task):
+        assert f"'{field.name}', copied.{field.name}" in sql or f"'{field.name}', lower(CAST(copied.{field.name} AS VARCHAR))" in sql
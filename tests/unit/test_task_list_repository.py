@@ -1,10 +1,10 @@
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from sqlalchemy.exc import IntegrityError
 
 from src.domain.entities.task_list import TaskList
 from src.domain.exceptions.task_list_exceptions import TaskListHasTasksException
+from src.infrastructure.database.mappers import TASK_LIST_COLUMNS
 from src.infrastructure.database.models.task_list_model import TaskListModel
 from src.infrastructure.repositories.sqlalchemy_task_list_repository import (
     SQLAlchemyTaskListRepository,
@@ -95,20 +95,25 @@ class TestSQLAlchemyTaskListRepository:
     @pytest.mark.asyncio
     async def test_delete_task_list_success(self, repository, mock_session, sample_task_list_model):
         mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = sample_task_list_model
+        mock_result.first.return_value = tuple(getattr(sample_task_list_model, column.key) for column in TASK_LIST_COLUMNS)
         mock_session.execute = AsyncMock(return_value=mock_result)
         mock_session.delete = AsyncMock()
+        mock_session.add = MagicMock()
         mock_session.flush = AsyncMock()
 
         result = await repository.delete(1)
 
         assert result is True
-        mock_session.delete.assert_called_once_with(sample_task_list_model)
+        sql = str(mock_session.execute.call_args_list[0].args[0])
+        assert sql.startswith("UPDATE task_lists SET is_active")
+        mock_session.delete.assert_not_called()
+        mock_session.add.assert_called_once()
         mock_session.flush.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_delete_task_list_not_found(self, repository, mock_session):
         mock_result = MagicMock()
+        mock_result.first.return_value = None
         mock_result.scalar_one_or_none.return_value = None
         mock_session.execute = AsyncMock(return_value=mock_result)
 
@@ -117,19 +122,18 @@ class TestSQLAlchemyTaskListRepository:
         assert result is False
 
     @pytest.mark.asyncio
-    async def test_delete_task_list_with_foreign_key_constraint(self, repository, mock_session, sample_task_list_model):
+    async def test_delete_task_list_with_active_tasks(self, repository, mock_session, sample_task_list_model):
+        # The UPDATE matches nothing, yet the list exists: it still holds active tasks
         mock_result = MagicMock()
+        mock_result.first.return_value = None
         mock_result.scalar_one_or_none.return_value = sample_task_list_model
         mock_session.execute = AsyncMock(return_value=mock_result)
-        mock_session.delete = AsyncMock()
-        mock_session.flush = AsyncMock(side_effect=IntegrityError("", "", "foreign key constraint fails"))
-        mock_session.rollback = AsyncMock()
 
         with pytest.raises(TaskListHasTasksException) as exc_info:
             await repository.delete(1)
 
         assert exc_info.value.task_list_id == 1
-        mock_session.rollback.assert_called_once()
+        assert mock_session.execute.await_count == 2
 
     @pytest.mark.asyncio
     async def test_list_all_task_lists(self, repository, mock_session, sample_task_list_model):
@@ -0,0 +1,78 @@
+import pytest
+
+from src.application.use_cases.task_list.task_list_service import TaskListService
+from src.domain.entities.task import Task
+from src.domain.entities.task_list import TaskList
+from src.domain.entities.user import User
+from src.domain.exceptions.task_list_exceptions import InvalidTaskListCursorException
+from src.infrastructure.repositories.in_memory_store import InMemoryStore
+from src.infrastructure.repositories.in_memory_task_list_repository import InMemoryTaskListRepository
+from src.infrastructure.repositories.in_memory_task_repository import InMemoryTaskRepository
+from src.infrastructure.repositories.in_memory_user_repository import InMemoryUserRepository
+
+
+@pytest.fixture
+def store():
+    return InMemoryStore()
+
+
+@pytest.fixture
+def repository(store):
+    return InMemoryTaskListRepository(store)
+
+
+@pytest.fixture
+async def users(store):
+    user_repository = InMemoryUserRepository(store)
+    return [(await user_repository.create(User(email=f"{name}@example.com", username=name))).id for name in ("ann", "bob")]
+
+
+@pytest.mark.asyncio
+async def test_user_sees_owned_and_assigned_active_lists_only(store, repository, users):
+    ann, bob = users
+    owned = await repository.create(TaskList(title="Ann's", user_id=ann))
+    archived = await repository.create(TaskList(title="Ann's old", user_id=ann))
+    archived.is_active = False
+    await repository.update(archived)
+    shared = await repository.create(TaskList(title="Bob's shared", user_id=bob))
+    await repository.create(TaskList(title="Bob's private", user_id=bob))
+    await repository.create(TaskList(title="Unowned"))
+    await InMemoryTaskRepository(store).create(Task(title="For Ann", task_list_id=shared.id, assigned_user_id=ann))
+
+    assert [task_list.id for task_list in await repository.list_for_user(ann)] == [owned.id, shared.id]
+
+
+@pytest.mark.asyncio
+async def test_admin_listing_pages_through_every_list(store, repository, users):
+    created = [await repository.create(TaskList(title=f"List {index}", user_id=users[index % 2])) for index in range(5)]
+    service = TaskListService(repository, InMemoryTaskRepository(store), InMemoryUserRepository(store))
+
+    seen = []
+    cursor = None
+    while True:
+        page = await service.list_page(cursor, limit=2)
+        seen.extend(task_list.id for task_list in page.task_lists)
+        if not page.has_more:
+            break
+        cursor = page.next_cursor
+
+    assert seen == [task_list.id for task_list in created]
+    assert page.next_cursor is None
+
+
+@pytest.mark.parametrize("token", ["not-base64!", "WyJ4Il0", "e30"])
+def test_invalid_page_cursor_is_rejected(token):
+    with pytest.raises(InvalidTaskListCursorException):
+        TaskListService.decode_page_cursor(token)
+
+
+@pytest.mark.asyncio
+async def test_get_by_ids_for_a_user_hides_lists_owned_by_others(store, repository, users):
+    ann, bob = users
+    anns = await repository.create(TaskList(title="Ann's", user_id=ann))
+    bobs = await repository.create(TaskList(title="Bob's", user_id=bob))
+    service = TaskListService(repository, InMemoryTaskRepository(store), InMemoryUserRepository(store))
+
+    scoped = await service.get_by_ids([bobs.id, 99, anns.id], user_id=ann)
+    assert [task_list.id if task_list else None for task_list in scoped] == [None, None, anns.id]
+    assert [task_list.id for task_list in await service.get_by_ids([bobs.id, anns.id])] == [bobs.id, anns.id]
@@ -5,6 +5,7 @@ from sqlalchemy.exc import IntegrityError
 
 from src.domain.entities.task import Task, TaskPriority, TaskStatus
 from src.domain.exceptions.task_exceptions import InvalidTaskListException
+from src.infrastructure.database.mappers import TASK_COLUMNS
 from src.infrastructure.database.models.task_model import TaskModel
 from src.infrastructure.repositories.sqlalchemy_task_repository import (
     SQLAlchemyTaskRepository,
@@ -108,21 +109,26 @@ class TestSQLAlchemyTaskRepository:
     @pytest.mark.asyncio
     async def test_delete_task_success(self, repository, mock_session, sample_task_model):
         mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = sample_task_model
+        mock_result.first.return_value = tuple(getattr(sample_task_model, column.key) for column in TASK_COLUMNS)
         mock_session.execute = AsyncMock(return_value=mock_result)
         mock_session.delete = AsyncMock()
+        mock_session.add = MagicMock()
         mock_session.flush = AsyncMock()
 
         result = await repository.delete(1)
 
         assert result is True
-        mock_session.delete.assert_called_once_with(sample_task_model)
+        # Soft delete: one UPDATE, the row stays until the purge job removes it
+        sql = str(mock_session.execute.call_args_list[0].args[0])
+        assert sql.startswith("UPDATE tasks SET is_active")
+        mock_session.delete.assert_not_called()
+        mock_session.add.assert_called_once()
         mock_session.flush.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_delete_task_not_found(self, repository, mock_session):
         mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
+        mock_result.first.return_value = None
         mock_session.execute = AsyncMock(return_value=mock_result)
 
         result = await repository.delete(999)
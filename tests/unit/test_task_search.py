@@ -0,0 +1,111 @@
+import pytest
+
+from src.application.dtos.task_dto import TaskFiltersDTO
+from src.application.use_cases.task.task_service import TaskService
+from src.domain.entities.task import Task, TaskStatus
+from src.domain.entities.task_list import TaskList
+from src.domain.exceptions.task_exceptions import InvalidSearchCursorException
+from src.infrastructure.repositories.in_memory_store import InMemoryStore
+from src.infrastructure.repositories.in_memory_task_list_repository import InMemoryTaskListRepository
+from src.infrastructure.repositories.in_memory_task_repository import InMemoryTaskRepository
+from src.infrastructure.utils.text_search import prefix_tsquery, search_terms, trigram_similarity
+
+
+def test_search_terms_drop_tsquery_syntax():
+    assert search_terms("Fix: the (API) & !deploy_v2") == ["fix", "the", "api", "deploy", "v2"]
+    assert prefix_tsquery(["fix", "repo"]) == "fix:* & repo:*"
+
+
+def test_trigram_similarity_matches_pg_trgm():
+    # SELECT similarity('word', 'two words') = 0.36363637
+    assert trigram_similarity("word", "two words") == pytest.approx(0.363636, abs=1e-6)
+    assert trigram_similarity("dashboard", "dashbord") > 0.5
+    assert trigram_similarity("", "anything") == 0.0
+
+
+@pytest.fixture
+def store():
+    return InMemoryStore()
+
+
+@pytest.fixture
+def repository(store):
+    return InMemoryTaskRepository(store)
+
+
+@pytest.fixture
+async def task_list_id(store):
+    return (await InMemoryTaskListRepository(store).create(TaskList(title="List"))).id
+
+
+async def create(repository, task_list_id, title, description=None, status=TaskStatus.PENDING):
+    return await repository.create(Task(title=title, task_list_id=task_list_id, description=description, status=status))
+
+
+@pytest.mark.asyncio
+async def test_title_matches_rank_above_description_matches(repository, task_list_id):
+    in_description = await create(repository, task_list_id, "Quarterly numbers", description="Send the report to finance")
+    in_title = await create(repository, task_list_id, "Write report")
+    await create(repository, task_list_id, "Unrelated chore")
+
+    hits = await repository.search("report")
+
+    assert [hit.task.id for hit in hits] == [in_title.id, in_description.id]
+    assert hits[0].rank > hits[1].rank
+
+
+@pytest.mark.asyncio
+async def test_every_term_must_match_and_the_last_may_be_a_prefix(repository, task_list_id):
+    match = await create(repository, task_list_id, "Deploy release notes")
+    await create(repository, task_list_id, "Deploy dashboard to staging servers")
+
+    assert [hit.task.id for hit in await repository.search("deploy rel")] == [match.id]
+
+
+@pytest.mark.asyncio
+async def test_misspelled_title_matches_fuzzily(repository, task_list_id):
+    task = await create(repository, task_list_id, "Dashboard")
+
+    assert [hit.task.id for hit in await repository.search("dashbord")] == [task.id]
+
+
+@pytest.mark.asyncio
+async def test_filters_apply_to_search(repository, task_list_id):
+    await create(repository, task_list_id, "Fix invoice")
+    completed = await create(repository, task_list_id, "Fix invoice totals", status=TaskStatus.COMPLETED)
+
+    hits = await repository.search("invoice", status=TaskStatus.COMPLETED)
+
+    assert [hit.task.id for hit in hits] == [completed.id]
+    assert await repository.search("invoice", task_list_id=task_list_id + 1) == []
+
+
+@pytest.mark.asyncio
+async def test_service_pages_through_hits_with_a_cursor(repository, task_list_id):
+    created = [await create(repository, task_list_id, f"Review budget {index}") for index in range(5)]
+    service = TaskService(repository)
+
+    seen = []
+    cursor = None
+    while True:
+        page = await service.search("budget", TaskFiltersDTO(), cursor, limit=2)
+        seen.extend(hit.task.id for hit in page.hits)
+        if not page.has_more:
+            break
+        cursor = page.next_cursor
+
+    assert sorted(seen) == [task.id for task in created]
+    assert len(seen) == len(set(seen))
+    assert page.next_cursor is None
+
+
+def test_search_cursor_round_trips_exactly():
+    rank = 0.0607927106320858
+
+    assert TaskService.decode_search_cursor(TaskService.encode_search_cursor(rank, 42)) == (rank, 42)
+
+
+@pytest.mark.parametrize("token", ["not-base64!", "bm90IGpzb24", "WzFd"])
+def test_invalid_search_cursor_is_rejected(token):
+    with pytest.raises(InvalidSearchCursorException):
+        TaskService.decode_search_cursor(token)
@@ -4,6 +4,7 @@ import pytest
 
 from src.application.dtos.task_dto import TaskFiltersDTO
 from src.application.use_cases.task.task_service import TaskService
+from src.domain.entities.notification import NotificationType
 from src.domain.entities.task import Task, TaskPriority, TaskStatus
 
 
@@ -82,7 +83,7 @@ class TestTaskService:
         result = await task_service.get_by_filters(filters)
 
         assert result == tasks
-        mock_repository.get_tasks_by_filters.assert_called_once_with(123, TaskStatus.PENDING, None)
+        mock_repository.get_tasks_by_filters.assert_called_once_with(123, TaskStatus.PENDING, None, None, None, False)
 
     @pytest.mark.asyncio
     async def test_calculate_completion_percentage_with_tasks(self, task_service, mock_repository):
@@ -107,3 +108,57 @@ class TestTaskService:
 
         assert result == 0.0
         mock_repository.get_by_task_list_id.assert_called_once_with(123)
+
+
+class TestTaskServiceNotifications:
+    @pytest.fixture
+    def notifier(self):
+        return Mock()
+
+    @pytest.fixture
+    def notifying_service(self, mock_repository, notifier):
+        return TaskService(mock_repository, notifier=notifier)
+
+    @pytest.mark.asyncio
+    async def test_create_with_assignee_publishes_assignment(self, notifying_service, mock_repository, notifier):
+        created = Task(id=5, title="Assigned", task_list_id=1, assigned_user_id=9)
+        mock_repository.create = AsyncMock(return_value=created)
+
+        await notifying_service.create(created)
+
+        notification = notifier.publish.call_args.args[0]
+        assert notification.type == NotificationType.TASK_ASSIGNED
+        assert notification.recipient_user_id == 9
+        assert notification.task_id == 5
+
+    @pytest.mark.asyncio
+    async def test_create_without_assignee_publishes_nothing(self, notifying_service, mock_repository, notifier, sample_task):
+        mock_repository.create = AsyncMock(return_value=sample_task)
+
+        await notifying_service.create(sample_task)
+
+        notifier.publish.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_change_status_publishes_status_change(self, notifying_service, mock_repository, notifier):
+        task = Task(id=5, title="Assigned", task_list_id=1, assigned_user_id=9)
+        mock_repository.get_by_id = AsyncMock(return_value=task)
+        mock_repository.update = AsyncMock(side_effect=lambda updated: updated)
+
+        await notifying_service.change_status(5, TaskStatus.COMPLETED)
+
+        notification = notifier.publish.call_args.args[0]
+        assert notification.type == NotificationType.TASK_STATUS_CHANGED
+        assert notification.status == TaskStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_update_reassignment_publishes_assignment(self, notifying_service, mock_repository, notifier):
+        current = Task(id=5, title="Assigned", task_list_id=1, assigned_user_id=9)
+        mock_repository.get_by_id = AsyncMock(return_value=current)
+        mock_repository.update = AsyncMock(side_effect=lambda updated: updated)
+
+        await notifying_service.update(5, Task(title=None, task_list_id=None, status=None, priority=None, assigned_user_id=11))
+
+        notification = notifier.publish.call_args.args[0]
+        assert notification.type == NotificationType.TASK_ASSIGNED
+        assert notification.recipient_user_id == 11
@@ -0,0 +1,246 @@
+import asyncio
+import json
+import random
+import threading
+
+import httpx
+import pytest
+import strawberry
+from fastapi import FastAPI
+
+from src.infrastructure.observability.metrics import metrics
+from src.infrastructure.observability.tracing import (
+    STATUS_ERROR,
+    InMemorySpanExporter,
+    OTLPJsonFileExporter,
+    current_span,
+    parse_traceparent,
+    trace_methods,
+    traced,
+    tracer,
+)
+from src.presentation.graphql.tracing import TracingExtension
+from src.presentation.rest.middleware.tracing import TracingMiddleware
+
+REMOTE_TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+REMOTE_SPAN_ID = "00f067aa0ba902b7"
+
+
+@pytest.fixture
+def exporter():
+    exporter = InMemorySpanExporter()
+    previous = (tracer.enabled, tracer.sample_rate, tracer.exporter)
+    tracer.enabled, tracer.sample_rate, tracer.exporter = True, 1.0, exporter
+    yield exporter
+    tracer.enabled, tracer.sample_rate, tracer.exporter = previous
+
+
+@trace_methods
+class Repository:
+    async def get(self, item_id):
+        return item_id
+
+    def _private(self):
+        return current_span()
+
+
+@trace_methods
+class Service:
+    def __init__(self):
+        self.repository = Repository()
+
+    async def get(self, item_id):
+        return await self.repository.get(item_id)
+
+    async def fail(self):
+        raise ValueError("boom")
+
+
+class TestTraceparent:
+    def test_parses_valid_header(self):
+        assert parse_traceparent(f"00-{REMOTE_TRACE_ID}-{REMOTE_SPAN_ID}-01") == (REMOTE_TRACE_ID, REMOTE_SPAN_ID, True)
+        assert parse_traceparent(f"00-{REMOTE_TRACE_ID}-{REMOTE_SPAN_ID}-00")[2] is False
+
+    def test_rejects_invalid_headers(self):
+        assert parse_traceparent(None) is None
+        assert parse_traceparent("garbage") is None
+        assert parse_traceparent(f"00-{'0' * 32}-{REMOTE_SPAN_ID}-01") is None
+
+
+class TestTracer:
+    @pytest.mark.asyncio
+    async def test_nested_spans_share_trace(self, exporter):
+        assert await Service().get(3) == 3
+
+        assert exporter.names() == ["Repository.get", "Service.get"]
+        child, root = exporter.spans
+        assert child.trace_id == root.trace_id
+        assert child.parent_id == root.span_id
+        assert root.parent_id is None
+        assert Repository._private.__qualname__ == "Repository._private"
+
+    @pytest.mark.asyncio
+    async def test_exception_marks_span_as_error(self, exporter):
+        with pytest.raises(ValueError):
+            await Service().fail()
+
+        assert exporter.spans[0].status == STATUS_ERROR
+        assert exporter.spans[0].attributes["exception.type"] == "ValueError"
+
+    @pytest.mark.asyncio
+    async def test_unsampled_trace_records_nothing(self, exporter):
+        tracer.sample_rate = 0.0
+
+        with tracer.start_span("root") as root:
+            assert not root.recording
+            await Service().get(1)
+            assert current_span() is root
+
+        assert exporter.spans == []
+
+    @pytest.mark.asyncio
+    async def test_disabled_tracer_is_transparent(self, exporter):
+        tracer.enabled = False
+
+        assert await Service().get(1) == 1
+        assert exporter.spans == []
+        assert current_span() is None
+
+    @pytest.mark.asyncio
+    async def test_remote_parent_continues_trace(self, exporter):
+        with tracer.start_span("server", remote_parent=(REMOTE_TRACE_ID, REMOTE_SPAN_ID, True)):
+            await Service().get(1)
+
+        assert {span.trace_id for span in exporter.spans} == {REMOTE_TRACE_ID}
+        assert exporter.spans[-1].parent_id == REMOTE_SPAN_ID
+
+    @pytest.mark.asyncio
+    async def test_concurrent_tasks_keep_separate_parents(self, exporter):
+        @traced("leaf")
+        async def leaf():
+            await asyncio.sleep(0)
+
+        async def branch(name):
+            with tracer.start_span(name):
+                await leaf()
+
+        with tracer.start_span("root"):
+            await asyncio.gather(branch("a"), branch("b"))
+
+        spans = {span.span_id: span for span in exporter.spans}
+        leaves = [span for span in exporter.spans if span.name == "leaf"]
+        assert sorted(spans[span.parent_id].name for span in leaves) == ["a", "b"]
+
+    def test_sampling_rate_is_applied_per_trace(self, exporter):
+        tracer.sample_rate = 0.25
+        tracer._rng = random.Random(3)
+
+        for _ in range(400):
+            with tracer.start_span("root"):
+                with tracer.start_span("child"):
+                    pass
+
+        roots = exporter.names().count("root")
+        assert 60 < roots < 140
+        assert exporter.names().count("child") == roots
+
+
+def test_otlp_file_exporter_writes_resource_spans(tmp_path, exporter):
+    path = tmp_path / "traces.jsonl"
+    tracer.exporter = OTLPJsonFileExporter(str(path), "test-service", batch_size=100)
+
+    with tracer.start_span("root", attributes={"http.status_code": 200}):
+        pass
+    assert not path.exists()
+    tracer.shutdown()
+
+    request = json.loads(path.read_text().splitlines()[0])
+    resource_spans = request["resourceSpans"][0]
+    span = resource_spans["scopeSpans"][0]["spans"][0]
+    assert resource_spans["resource"]["attributes"][0] == {"key": "service.name", "value": {"stringValue": "test-service"}}
+    assert span["name"] == "root"
+    assert len(span["traceId"]) == 32 and len(span["spanId"]) == 16
+    assert span["attributes"] == [{"key": "http.status_code", "value": {"intValue": "200"}}]
+
+
+def test_otlp_file_exporter_writes_on_its_own_thread(tmp_path, exporter):
+    path = tmp_path / "traces.jsonl"
+    file_exporter = tracer.exporter = OTLPJsonFileExporter(str(path), "test-service", batch_size=1, max_queued_batches=1)
+    started, release, writers = threading.Event(), threading.Event(), []
+    write = file_exporter._write
+
+    def blocked_write(spans):
+        writers.append(threading.current_thread().name)
+        started.set()
+        release.wait(5)
+        write(spans)
+
+    file_exporter._write = blocked_write
+    dropped = metrics.counter("tracing_spans_dropped_total").value
+
+    with tracer.start_span("first"):
+        pass
+    assert started.wait(5)
+    # The writer is stuck on the first batch: the second waits in the queue, the third is dropped
+    for name in ("second", "third"):
+        with tracer.start_span(name):
+            pass
+    assert not path.exists()
+    assert metrics.counter("tracing_spans_dropped_total").value == dropped + 1
+
+    release.set()
+    tracer.shutdown()
+    requests = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [request["resourceSpans"][0]["scopeSpans"][0]["spans"][0]["name"] for request in requests] == ["first", "second"]
+    assert writers == ["span-file-writer", "span-file-writer"]
+
+
+class TestTracingMiddleware:
+    @staticmethod
+    def make_client():
+        app = FastAPI()
+
+        @app.get("/items/{item_id}")
+        async def get_item(item_id: int):
+            return {"id": await Service().get(item_id)}
+
+        return httpx.AsyncClient(app=TracingMiddleware(app), base_url="http://test")
+
+    @pytest.mark.asyncio
+    async def test_server_span_continues_incoming_traceparent(self, exporter):
+        async with self.make_client() as client:
+            response = await client.get("/items/1", headers={"traceparent": f"00-{REMOTE_TRACE_ID}-{REMOTE_SPAN_ID}-01"})
+
+        assert exporter.names() == ["Repository.get", "Service.get", "GET /items/1"]
+        server = exporter.spans[-1]
+        assert server.trace_id == REMOTE_TRACE_ID
+        assert server.parent_id == REMOTE_SPAN_ID
+        assert server.attributes["http.status_code"] == 200
+        assert response.headers["traceparent"] == server.traceparent
+
+    @pytest.mark.asyncio
+    async def test_unsampled_incoming_trace_is_respected(self, exporter):
+        async with self.make_client() as client:
+            response = await client.get("/items/1", headers={"traceparent": f"00-{REMOTE_TRACE_ID}-{REMOTE_SPAN_ID}-00"})
+
+        assert exporter.spans == []
+        assert response.headers["traceparent"].endswith("-00")
+
+
+@pytest.mark.asyncio
+async def test_graphql_extension_wraps_resolvers(exporter):
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        @traced()
+        async def item(self, id: int) -> int:
+            return await Service().get(id)
+
+    schema = strawberry.Schema(query=Query, extensions=[TracingExtension])
+    result = await schema.execute("query ItemQuery { item(id: 2) }", operation_name="ItemQuery")
+
+    assert result.data == {"item": 2}
+    assert exporter.names()[-1] == "graphql.operation"
+    assert exporter.spans[-1].attributes["graphql.operation.name"] == "ItemQuery"
+    assert {span.trace_id for span in exporter.spans} == {exporter.spans[-1].trace_id}
+    assert "Service.get" in exporter.names()